@@ -215,6 +215,48 @@ else:
         DATABASES['default']['OPTIONS'].setdefault('keepalives_interval', 10)
         DATABASES['default']['OPTIONS'].setdefault('keepalives_count', 5)
 
+# Cache profiles:
+# - local: per-process LocMemCache (tests, single-process development).
+# - single-host: in-process LRU over a file-based cache shared by the gunicorn workers on one machine.
+# - database: in-process LRU over the core_shared_cache table, shared by every worker and
+#   serverless instance. The table is created by migrations.
+# Cooldowns, dedupe keys, alert guards and provider budgets only hold across workers with a shared profile.
+CACHE_PROFILE = os.environ.get("CACHE_PROFILE", "").strip().lower() or (
+    "local" if USE_SQLITE_FOR_TESTS else "database"
+)
+cache_local_options = {
+    "LOCAL_TIMEOUT": float(os.environ.get("CACHE_LOCAL_TIMEOUT_SECONDS", "5")),
+    "LOCAL_MAX_ENTRIES": int(os.environ.get("CACHE_LOCAL_MAX_ENTRIES", "1000")),
+}
+cache_shared_options = {"MAX_ENTRIES": int(os.environ.get("CACHE_SHARED_MAX_ENTRIES", "20000"))}
+if CACHE_PROFILE == "local":
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+elif CACHE_PROFILE in {"single-host", "database"}:
+    CACHES = {
+        "default": {
+            "BACKEND": "core.shared_cache.TwoTierCache",
+            "LOCATION": "shared",
+            "OPTIONS": cache_local_options,
+        },
+        "shared": (
+            {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": os.environ.get("CACHE_FILE_DIR", "/tmp/bondroom-cache").strip(),
+                "OPTIONS": cache_shared_options,
+            }
+            if CACHE_PROFILE == "single-host"
+            else {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "core_shared_cache",
+                "OPTIONS": cache_shared_options,
+            }
+        ),
+    }
+else:
+    raise RuntimeError("CACHE_PROFILE must be one of: local, single-host, database.")
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -277,6 +319,10 @@ S3_MEDIA_CUSTOM_DOMAIN = (
 S3_PRESIGNED_UPLOAD_EXPIRES_SECONDS = max(
     60, int(os.environ.get("S3_PRESIGNED_UPLOAD_EXPIRES_SECONDS", "900"))
 )
+S3_MULTIPART_PART_SIZE_MB = max(5, int(os.environ.get("S3_MULTIPART_PART_SIZE_MB", "16")))
+S3_MULTIPART_SIGN_BATCH_SIZE = min(
+    1000, max(1, int(os.environ.get("S3_MULTIPART_SIGN_BATCH_SIZE", "100")))
+)
 USE_S3_MEDIA = bool(S3_MEDIA_BUCKET_NAME)
 
 # Safety: on Vercel/serverless we often don't have AWS credentials. If a bucket name is
@@ -349,9 +395,14 @@ WHITENOISE_USE_FINDERS = True
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Stateless auth trusts role/profile claims and only checks a cached token version per request.
+JWT_STATELESS_AUTH = os.environ.get("JWT_STATELESS_AUTH", "true").strip().lower() in {"1", "true", "yes"}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.StatelessJWTAuthentication'
+        if JWT_STATELESS_AUTH
+        else 'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_SCHEMA_CLASS': 'core.schema.BondRoomAutoSchema',
 }
@@ -6,6 +6,8 @@ import urllib.error
 
 from django.conf import settings
 
+from . import provider_health, provider_http, provider_limits
+
 
 DEFAULT_ABUSE_TERMS = (
     "idiot",
@@ -286,7 +288,9 @@ def _classify_abuse_with_openai(text):
         },
     )
     try:
-        with urllib.request.urlopen(request, timeout=12) as response:
+        with provider_http.urlopen(
+            request, timeout=12, model=body["model"], priority=provider_limits.PRIORITY_MODERATION
+        ) as response:
             payload = json.loads(response.read().decode("utf-8"))
     except Exception:
         return None
@@ -364,7 +368,9 @@ def _classify_bad_language_with_openai(text):
         },
     )
     try:
-        with urllib.request.urlopen(request, timeout=10) as response:
+        with provider_http.urlopen(
+            request, timeout=10, model=body["model"], priority=provider_limits.PRIORITY_MODERATION
+        ) as response:
             payload = json.loads(response.read().decode("utf-8"))
     except Exception:
         return None
@@ -589,6 +595,143 @@ def _openrouter_message_text(message):
     return ""
 
 
+VIDEO_FRAME_INSTRUCTION = (
+    "You are a realtime meeting safety classifier for a student mentoring call. "
+    "Analyze the image and determine if it shows prohibited visual behavior such as "
+    "inappropriate hand signal/gesture, inappropriate attire, sexual content, harassment, "
+    "or unsafe environment. Be conservative: if the evidence is not clear, return flagged=false. "
+    "Do not guess from ambiguous pose, low light, blur, or normal clothing. "
+    "Return strict JSON only with keys: "
+    "flagged(boolean), incident_type(string), labels(array of short strings), confidence_score(number 0-1), notes(string). "
+    "incident_type must be one of: inappropriate_gesture, inappropriate_attire, sexual_content, harassment, unsafe_environment, unknown."
+)
+
+
+def _openrouter_vision_text(api_key, frame_value, note):
+    """JSON text from OpenRouter, trying each candidate model and body shape; returns ``(text, error)``."""
+    raw_models = [
+        os.environ.get("OPENROUTER_VISION_MODERATION_MODEL", ""),
+        os.environ.get("OPENROUTER_MODEL", ""),
+        "openai/gpt-4o-mini",
+    ]
+    model_candidates = []
+    for item in raw_models:
+        value = str(item or "").strip()
+        if value and value not in model_candidates:
+            model_candidates.append(value)
+    base_messages = [
+        {"role": "system", "content": VIDEO_FRAME_INSTRUCTION},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": str(note or "Frame from ongoing video meeting.")},
+                {"type": "image_url", "image_url": {"url": frame_value}},
+            ],
+        },
+    ]
+    alt_messages = [
+        {"role": "system", "content": VIDEO_FRAME_INSTRUCTION},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": str(note or "Frame from ongoing video meeting.")},
+                {"type": "image_url", "image_url": frame_value},
+            ],
+        },
+    ]
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    def _request_openrouter(request_body):
+        request = urllib.request.Request(
+            "https://openrouter.ai/api/v1/chat/completions",
+            data=json.dumps(request_body).encode("utf-8"),
+            headers=headers,
+        )
+        with provider_http.urlopen(
+            request, timeout=20, model=request_body["model"], priority=provider_limits.PRIORITY_MODERATION
+        ) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    payload = None
+    raw_text = ""
+    last_error = ""
+    for model in model_candidates:
+        body_variants = [
+            {"model": model, "response_format": {"type": "json_object"}, "messages": base_messages},
+            {"model": model, "messages": base_messages},
+            {"model": model, "response_format": {"type": "json_object"}, "messages": alt_messages},
+            {"model": model, "messages": alt_messages},
+        ]
+        for attempt_body in body_variants:
+            try:
+                payload = _request_openrouter(attempt_body)
+                choices = payload.get("choices") if isinstance(payload, dict) else []
+                message = (choices[0] or {}).get("message", {}) if isinstance(choices, list) and choices else {}
+                raw_text = _extract_json_text(_openrouter_message_text(message))
+                if raw_text:
+                    break
+                last_error = f"empty_response:{model}"
+            except urllib.error.HTTPError as exc:
+                detail = ""
+                try:
+                    detail = exc.read().decode("utf-8", errors="ignore").strip()
+                except Exception:
+                    detail = ""
+                last_error = f"HTTP{exc.code}:{model}:{detail[:220]}".strip()
+            except (urllib.error.URLError, TimeoutError, ValueError) as exc:
+                last_error = f"{model}:{exc.__class__.__name__}:{str(exc)[:200]}"
+        if raw_text:
+            break
+    return raw_text, last_error
+
+
+def _openai_vision_text(api_key, frame_value, note):
+    """JSON text from the OpenAI Responses API; returns ``(text, error)``."""
+    body = {
+        "model": OPENAI_VISION_MODERATION_MODEL or "gpt-4.1-mini",
+        "text": {"format": {"type": "json_object"}},
+        "input": [
+            {
+                "role": "system",
+                "content": [{"type": "input_text", "text": VIDEO_FRAME_INSTRUCTION}],
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": str(note or "Frame from ongoing video meeting."),
+                    },
+                    {
+                        "type": "input_image",
+                        "image_url": frame_value,
+                    },
+                ],
+            },
+        ],
+    }
+    request = urllib.request.Request(
+        "https://api.openai.com/v1/responses",
+        data=json.dumps(body).encode("utf-8"),
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+    )
+    try:
+        with provider_http.urlopen(
+            request, timeout=20, model=body["model"], priority=provider_limits.PRIORITY_MODERATION
+        ) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+    except (urllib.error.URLError, TimeoutError, ValueError) as exc:
+        return "", f"{body['model']}:{exc.__class__.__name__}:{str(exc)[:200]}"
+    raw_text = _extract_response_text(payload)
+    return raw_text, "" if raw_text else f"empty_response:{body['model']}"
+
+
 def classify_video_behavior_frame(*, frame_data_url, note=""):
     frame_value = str(frame_data_url or "").strip()
     if not frame_value.startswith("data:image/"):
@@ -601,12 +744,19 @@ def classify_video_behavior_frame(*, frame_data_url, note=""):
             "matched_terms": [],
             "reason": "invalid_image_data",
         }
-    provider = _ai_provider()
-    if provider == "openrouter":
-        api_key = str(os.environ.get("OPENROUTER_API_KEY", "") or "").strip()
-    else:
-        api_key = str(getattr(settings, "OPENAI_API_KEY", "") or "").strip()
-    if not api_key:
+    provider_order = provider_health.failover_order(
+        _ai_provider(),
+        {
+            "openai": OPENAI_VISION_MODERATION_MODEL or "gpt-4.1-mini",
+            "openrouter": str(
+                os.environ.get("OPENROUTER_VISION_MODERATION_MODEL", "")
+                or os.environ.get("OPENROUTER_MODEL", "")
+                or "openai/gpt-4o-mini"
+            ).strip(),
+        },
+    )
+    if not provider_order:
+        # Every vision provider circuit is open; skip the frame instead of waiting on timeouts.
         return {
             "flagged": False,
             "incident_type": "unknown",
@@ -614,152 +764,45 @@ def classify_video_behavior_frame(*, frame_data_url, note=""):
             "recommended_action": "none",
             "confidence_score": 0.0,
             "matched_terms": [],
-            "reason": "missing_api_key",
+            "reason": "provider_circuit_open",
         }
-
-    instruction = (
-        "You are a realtime meeting safety classifier for a student mentoring call. "
-        "Analyze the image and determine if it shows prohibited visual behavior such as "
-        "inappropriate hand signal/gesture, inappropriate attire, sexual content, harassment, "
-        "or unsafe environment. Be conservative: if the evidence is not clear, return flagged=false. "
-        "Do not guess from ambiguous pose, low light, blur, or normal clothing. "
-        "Return strict JSON only with keys: "
-        "flagged(boolean), incident_type(string), labels(array of short strings), confidence_score(number 0-1), notes(string). "
-        "incident_type must be one of: inappropriate_gesture, inappropriate_attire, sexual_content, harassment, unsafe_environment, unknown."
-    )
-
-    if provider == "openrouter":
-        raw_models = [
-            os.environ.get("OPENROUTER_VISION_MODERATION_MODEL", ""),
-            os.environ.get("OPENROUTER_MODEL", ""),
-            "openai/gpt-4o-mini",
-        ]
-        model_candidates = []
-        for item in raw_models:
-            value = str(item or "").strip()
-            if value and value not in model_candidates:
-                model_candidates.append(value)
-        base_messages = [
-            {"role": "system", "content": instruction},
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": str(note or "Frame from ongoing video meeting.")},
-                    {"type": "image_url", "image_url": {"url": frame_value}},
-                ],
-            },
-        ]
-        alt_messages = [
-            {"role": "system", "content": instruction},
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": str(note or "Frame from ongoing video meeting.")},
-                    {"type": "image_url", "image_url": frame_value},
-                ],
-            },
-        ]
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
+    # Try each provider in failover order; provider_http records every failure with the breaker.
+    raw_text = ""
+    last_error = ""
+    missing_keys = 0
+    for provider in provider_order:
+        if provider == "openrouter":
+            api_key = str(os.environ.get("OPENROUTER_API_KEY", "") or "").strip()
+        else:
+            api_key = str(getattr(settings, "OPENAI_API_KEY", "") or "").strip()
+        if not api_key:
+            missing_keys += 1
+            continue
+        fetch_text = _openrouter_vision_text if provider == "openrouter" else _openai_vision_text
+        raw_text, last_error = fetch_text(api_key, frame_value, note)
+        if raw_text:
+            break
+    if not raw_text and missing_keys == len(provider_order):
+        return {
+            "flagged": False,
+            "incident_type": "unknown",
+            "severity": "low",
+            "recommended_action": "none",
+            "confidence_score": 0.0,
+            "matched_terms": [],
+            "reason": "missing_api_key",
         }
-
-        def _request_openrouter(request_body):
-            request = urllib.request.Request(
-                "https://openrouter.ai/api/v1/chat/completions",
-                data=json.dumps(request_body).encode("utf-8"),
-                headers=headers,
-            )
-            with urllib.request.urlopen(request, timeout=20) as response:
-                return json.loads(response.read().decode("utf-8"))
-
-        payload = None
-        raw_text = ""
-        last_error = ""
-        for model in model_candidates:
-            body_variants = [
-                {"model": model, "response_format": {"type": "json_object"}, "messages": base_messages},
-                {"model": model, "messages": base_messages},
-                {"model": model, "response_format": {"type": "json_object"}, "messages": alt_messages},
-                {"model": model, "messages": alt_messages},
-            ]
-            for attempt_body in body_variants:
-                try:
-                    payload = _request_openrouter(attempt_body)
-                    choices = payload.get("choices") if isinstance(payload, dict) else []
-                    message = (choices[0] or {}).get("message", {}) if isinstance(choices, list) and choices else {}
-                    raw_text = _extract_json_text(_openrouter_message_text(message))
-                    if raw_text:
-                        break
-                    last_error = f"empty_response:{model}"
-                except urllib.error.HTTPError as exc:
-                    detail = ""
-                    try:
-                        detail = exc.read().decode("utf-8", errors="ignore").strip()
-                    except Exception:
-                        detail = ""
-                    last_error = f"HTTP{exc.code}:{model}:{detail[:220]}".strip()
-                except (urllib.error.URLError, TimeoutError, ValueError) as exc:
-                    last_error = f"{model}:{exc.__class__.__name__}:{str(exc)[:200]}"
-            if raw_text:
-                break
-        if not raw_text:
-            return {
-                "flagged": False,
-                "incident_type": "unknown",
-                "severity": "low",
-                "recommended_action": "none",
-                "confidence_score": 0.0,
-                "matched_terms": [],
-                "reason": "vision_request_failed",
-                "reason_detail": last_error[:280],
-            }
-    else:
-        body = {
-            "model": OPENAI_VISION_MODERATION_MODEL or "gpt-4.1-mini",
-            "text": {"format": {"type": "json_object"}},
-            "input": [
-                {
-                    "role": "system",
-                    "content": [{"type": "input_text", "text": instruction}],
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": str(note or "Frame from ongoing video meeting."),
-                        },
-                        {
-                            "type": "input_image",
-                            "image_url": frame_value,
-                        },
-                    ],
-                },
-            ],
+    if not raw_text:
+        return {
+            "flagged": False,
+            "incident_type": "unknown",
+            "severity": "low",
+            "recommended_action": "none",
+            "confidence_score": 0.0,
+            "matched_terms": [],
+            "reason": "vision_request_failed",
+            "reason_detail": last_error[:280],
         }
-        request = urllib.request.Request(
-            "https://api.openai.com/v1/responses",
-            data=json.dumps(body).encode("utf-8"),
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-        )
-        try:
-            with urllib.request.urlopen(request, timeout=20) as response:
-                payload = json.loads(response.read().decode("utf-8"))
-        except (urllib.error.URLError, TimeoutError, ValueError):
-            return {
-                "flagged": False,
-                "incident_type": "unknown",
-                "severity": "low",
-                "recommended_action": "none",
-                "confidence_score": 0.0,
-                "matched_terms": [],
-                "reason": "vision_request_failed",
-            }
-        raw_text = _extract_response_text(payload)
 
     parsed = {}
     if raw_text:
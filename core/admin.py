@@ -3,13 +3,17 @@ import json
 import os
 import urllib.error
 import urllib.request
+from decimal import Decimal
 
 from django import forms
 from django.conf import settings
 from django.contrib import admin, messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin as DjangoUserAdmin
+from django.db import transaction
 
+from . import provider_http, provider_limits
+from .identity_documents import IDENTITY_DOCUMENT_FIELDS, capture_document_metadata, find_duplicate_documents
 from .matching_logic import filter_mentors, score_mentors
 from .models import (
     AdminAccount,
@@ -36,11 +40,15 @@ from .models import (
     SessionAbuseIncident,
     SessionMeetingSignal,
     SessionRecording,
+    SessionSummaryJob,
     TrainingModule,
+    TrainingQuizQuestionBank,
     UserProfile,
     VolunteerEvent,
     VolunteerEventRegistration,
+    WalletLedgerEntry,
 )
+from .wallet_ledger import BALANCE_FIELDS as WALLET_BALANCE_FIELDS, record_wallet_adjustment
 
 User = get_user_model()
 
@@ -263,6 +271,42 @@ class MentorWalletAdmin(admin.ModelAdmin):
     )
     search_fields = ('mentor__first_name', 'mentor__last_name', 'mentor__email')
 
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            previous = dict.fromkeys(WALLET_BALANCE_FIELDS, Decimal('0.00'))
+            wallet = obj
+            if change:
+                # obj was loaded before the lock; apply only the edited fields to the locked row.
+                wallet = MentorWallet.objects.select_for_update().get(pk=obj.pk)
+                previous = {field_name: getattr(wallet, field_name) for field_name in WALLET_BALANCE_FIELDS}
+                for field_name in form.changed_data:
+                    setattr(wallet, field_name, getattr(obj, field_name))
+            super().save_model(request, wallet, form, change)
+            record_wallet_adjustment(wallet, previous, note=f'Edited in admin by {request.user}.')
+        if wallet is not obj:
+            obj.refresh_from_db()
+
+
+@admin.register(WalletLedgerEntry)
+class WalletLedgerEntryAdmin(admin.ModelAdmin):
+    list_display = (
+        'id',
+        'mentor',
+        'entry_type',
+        'pending_payout_delta',
+        'total_claimed_delta',
+        'total_donated_delta',
+        'created_at',
+    )
+    list_filter = ('entry_type',)
+    search_fields = ('mentor__first_name', 'mentor__last_name', 'mentor__email')
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(PayoutTransaction)
 class PayoutTransactionAdmin(admin.ModelAdmin):
@@ -300,6 +344,13 @@ class SessionRecordingAdmin(admin.ModelAdmin):
     search_fields = ('session__id', 'session__mentee__email', 'session__mentor__email')
 
 
+@admin.register(SessionSummaryJob)
+class SessionSummaryJobAdmin(admin.ModelAdmin):
+    list_display = ('session', 'status', 'trigger', 'attempts', 'next_attempt_at', 'finished_at')
+    list_filter = ('status', 'trigger')
+    search_fields = ('session__id', 'last_error')
+
+
 @admin.register(SessionMeetingSignal)
 class SessionMeetingSignalAdmin(admin.ModelAdmin):
     list_display = ('id', 'session', 'sender_role', 'signal_type', 'created_at')
@@ -336,7 +387,7 @@ class UserProfileAdmin(admin.ModelAdmin):
             headers={"Authorization": f"Bearer {api_key}"},
         )
         try:
-            with urllib.request.urlopen(req, timeout=10) as resp:
+            with provider_http.urlopen(req, timeout=10) as resp:
                 payload = json.loads(resp.read().decode("utf-8"))
             model_count = len(payload.get("data", []))
             self.message_user(
@@ -373,6 +424,7 @@ class MentorIdentityVerificationAdmin(admin.ModelAdmin):
         'aadhaar_front_size',
         'aadhaar_back_size',
         'professional_certificate_document_size',
+        'duplicate_documents',
         'submitted_at',
         'reviewed_at',
         'updated_at',
@@ -426,6 +478,7 @@ class MentorIdentityVerificationAdmin(admin.ModelAdmin):
                 'fields': (
                     'document_review_status',
                     'document_review_comments',
+                    'duplicate_documents',
                 )
             },
         ),
@@ -452,37 +505,59 @@ class MentorIdentityVerificationAdmin(admin.ModelAdmin):
             return f"{int(size)} {units[unit_index]}"
         return f"{size:.2f} {units[unit_index]}"
 
-    def _file_size_label(self, field_file):
-        if not field_file:
+    def _file_size_label(self, obj, field_name):
+        if not getattr(obj, field_name, None):
             return '-'
-        try:
-            return self._human_file_size(field_file.size)
-        except Exception:
-            return 'Unavailable'
+        # Sizes are captured at upload time; reading field_file.size here would be a storage HEAD per document.
+        metadata = obj.document_metadata if isinstance(obj.document_metadata, dict) else {}
+        entry = metadata.get(field_name)
+        if not isinstance(entry, dict) or entry.get('name') != getattr(obj, field_name).name:
+            return 'Not captured (run capture_identity_document_metadata)'
+        label = self._human_file_size(entry.get('size'))
+        if entry.get('width') and entry.get('height'):
+            label = f"{label}, {entry['width']}x{entry['height']}"
+        return label
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        changed_documents = [name for name in IDENTITY_DOCUMENT_FIELDS if name in form.changed_data]
+        if changed_documents:
+            capture_document_metadata(obj, changed_documents, uploaded_files=request.FILES)
+
+    @admin.display(description='Duplicate Documents')
+    def duplicate_documents(self, obj):
+        metadata = obj.document_metadata if isinstance(obj.document_metadata, dict) else {}
+        matches = []
+        for field_name, entry in metadata.items():
+            if not isinstance(entry, dict) or not entry.get('sha256'):
+                continue
+            for other, other_field in find_duplicate_documents(obj, entry['sha256']):
+                matches.append(f"{field_name} matches {other.mentor} ({other_field})")
+        return '; '.join(matches) or '-'
 
     @admin.display(description='ID Proof File Size')
     def id_proof_document_size(self, obj):
-        return self._file_size_label(getattr(obj, 'id_proof_document', None))
+        return self._file_size_label(obj, 'id_proof_document')
 
     @admin.display(description='Passport/License File Size')
     def passport_or_license_size(self, obj):
-        return self._file_size_label(getattr(obj, 'passport_or_license', None))
+        return self._file_size_label(obj, 'passport_or_license')
 
     @admin.display(description='Address Proof File Size')
     def address_proof_document_size(self, obj):
-        return self._file_size_label(getattr(obj, 'address_proof_document', None))
+        return self._file_size_label(obj, 'address_proof_document')
 
     @admin.display(description='Aadhaar Front File Size')
     def aadhaar_front_size(self, obj):
-        return self._file_size_label(getattr(obj, 'aadhaar_front', None))
+        return self._file_size_label(obj, 'aadhaar_front')
 
     @admin.display(description='Aadhaar Back File Size')
     def aadhaar_back_size(self, obj):
-        return self._file_size_label(getattr(obj, 'aadhaar_back', None))
+        return self._file_size_label(obj, 'aadhaar_back')
 
     @admin.display(description='Professional Certificate File Size')
     def professional_certificate_document_size(self, obj):
-        return self._file_size_label(getattr(obj, 'professional_certificate_document', None))
+        return self._file_size_label(obj, 'professional_certificate_document')
 
 
 @admin.register(MentorContactVerification)
@@ -553,6 +628,13 @@ class MentorTrainingQuizAttemptAdmin(admin.ModelAdmin):
     search_fields = ("mentor__first_name", "mentor__last_name", "mentor__email")
 
 
+@admin.register(TrainingQuizQuestionBank)
+class TrainingQuizQuestionBankAdmin(admin.ModelAdmin):
+    list_display = ("id", "content_hash", "question_count", "generated_by", "created_at")
+    search_fields = ("content_hash",)
+    readonly_fields = ("content_hash", "module_ids", "question_count", "created_at", "updated_at")
+
+
 @admin.register(ParentConsentVerification)
 class ParentConsentVerificationAdmin(admin.ModelAdmin):
     list_display = ('mentee', 'parent_mobile', 'status', 'otp_sent_at', 'verified_at')
@@ -568,8 +650,8 @@ class MenteePreferencesAdmin(admin.ModelAdmin):
 
 @admin.register(MentorAvailabilitySlot)
 class MentorAvailabilitySlotAdmin(admin.ModelAdmin):
-    list_display = ('mentor', 'start_time', 'end_time', 'timezone', 'is_available')
-    list_filter = ('is_available', 'timezone')
+    list_display = ('mentor', 'start_time', 'end_time', 'timezone', 'is_available', 'source')
+    list_filter = ('is_available', 'source', 'timezone')
     search_fields = ('mentor__first_name', 'mentor__last_name', 'mentor__email')
 
 
@@ -769,7 +851,9 @@ class MenteeRequestAdmin(admin.ModelAdmin):
                 headers=req_headers,
             )
             try:
-                with urllib.request.urlopen(req_obj, timeout=20) as resp:
+                with provider_http.urlopen(
+                    req_obj, timeout=20, model=payload["model"], priority=provider_limits.PRIORITY_RECOMMENDATIONS
+                ) as resp:
                     body = json.loads(resp.read().decode("utf-8"))
                 response_id = body.get("id", "")
                 output_text = ""
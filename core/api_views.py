@@ -1,11 +1,13 @@
 import json
+import logging
 import os
 import time
 import uuid
 import hashlib
 import hmac
 import base64
-from datetime import timedelta
+import io
+from datetime import datetime, timedelta
 from decimal import Decimal
 import re
 import urllib.request
@@ -14,11 +16,13 @@ import urllib.error
 from django.contrib.auth import get_user_model
 from django.conf import settings
 from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db import IntegrityError, transaction
-from django.db.models import Avg, Count, Q, Sum
+from django.db.models import Avg, Count, F, Q, Sum
+from django.http import StreamingHttpResponse
 from django.contrib.auth.models import update_last_login
 from django.utils import timezone
-from django.utils.dateparse import parse_datetime
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -31,7 +35,21 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from . import audio_vad, provider_health, provider_http, provider_limits
+from .authentication import add_identity_claims
+from .availability import BOOKED_SESSION_STATUSES, find_free_slots
+from .booking import (
+    VACATED_SESSION_STATUSES,
+    hold_slot,
+    release_booked_slot,
+    release_slot_hold,
+    reserve_booking,
+)
+from .exports import EXPORT_DATASETS, EXPORT_FORMATS, export_queryset, stream_export
+from .identity_documents import IDENTITY_DOCUMENT_FIELDS, capture_document_metadata
+from .local_cache import TTLLRUCache
 from .location_catalog import get_cities_for_state, get_states
+from .media_access import media_s3_client, presigned_url, s3_available
 from .models import (
     AdminAccount,
     ContactOtpRequest,
@@ -63,10 +81,12 @@ from .models import (
     UserProfile,
     VolunteerEvent,
     VolunteerEventRegistration,
+    WalletLedgerEntry,
 )
 from .onboarding import (
     sync_mentor_onboarding_training_status,
 )
+from .payouts import SETTLEABLE_STATUSES, lock_wallets, payout_entry, settle_payouts
 from .permissions import (
     ROLE_ADMIN,
     ROLE_MENTEE,
@@ -104,6 +124,8 @@ from .serializers import (
     ParentConsentVerificationSerializer,
     ParentOtpSendSerializer,
     ParentOtpVerifySerializer,
+    PayoutSettlementReportSerializer,
+    PayoutSettlementRequestSerializer,
     PayoutTransactionSerializer,
     SessionDispositionActionSerializer,
     SessionDispositionSerializer,
@@ -126,12 +148,23 @@ from .serializers import (
     otp_expiry,
 )
 from .quiz import (
+    QuestionBankUnavailable,
+    assemble_quiz_from_bank,
     clean_question_text,
     evaluate_quiz_attempt,
     generate_training_quiz_questions,
 )
 from .abuse_monitoring import classify_abuse, classify_behavior_signal, classify_video_behavior_frame
+from .session_summaries import run_summary_pass, store_session_summary
+from .shared_cache import acquire_guard, incr_counter
 from .signals import generate_recommendations_for_request
+from .text_index import BM25Index
+from .wallet_ledger import (
+    BALANCE_FIELDS as WALLET_BALANCE_FIELDS,
+    post_wallet_entries,
+    record_wallet_adjustment,
+    wallet_balance,
+)
 from .emails import (
     send_admin_safety_alert_email,
     send_contact_otp_email,
@@ -140,17 +173,12 @@ from .emails import (
     send_volunteer_registration_confirmation_email,
 )
 
-try:
-    import boto3
-except Exception:
-    boto3 = None
-
-try:
-    from botocore.config import Config as BotoConfig
-except Exception:
-    BotoConfig = None
+logger = logging.getLogger(__name__)
 
 TRAINING_QUIZ_PASS_MARK = 7
+# Provider order first; rows from before ranks existed fall back to score.
+RECOMMENDATION_ORDERING = (F("rank").asc(nulls_last=True), "-score")
+
 User = get_user_model()
 
 class SixPerPagePagination(PageNumberPagination):
@@ -168,12 +196,18 @@ class SessionRecordsPagination(PageNumberPagination):
 def current_mentee_id(request):
     if not request.user.is_authenticated:
         return None
+    claimed = getattr(request.user, "mentee_id", None)
+    if claimed:
+        return claimed
     return Mentee.objects.filter(email=request.user.email).values_list("id", flat=True).first()
 
 
 def current_mentor_id(request):
     if not request.user.is_authenticated:
         return None
+    claimed = getattr(request.user, "mentor_id", None)
+    if claimed:
+        return claimed
     return Mentor.objects.filter(email=request.user.email).values_list("id", flat=True).first()
 
 
@@ -250,6 +284,72 @@ def build_s3_object_url(*, bucket: str, key: str, region: str, custom_domain: st
     return f"https://{normalized_bucket}.s3.{normalized_region}.amazonaws.com/{normalized_key}"
 
 
+def recording_s3_config() -> dict:
+    return {
+        "bucket": str(getattr(settings, "S3_MEDIA_BUCKET_NAME", "") or "").strip(),
+        "region": str(getattr(settings, "AWS_S3_REGION_NAME", "") or "").strip() or "us-east-1",
+        "endpoint_url": str(getattr(settings, "AWS_S3_ENDPOINT_URL", "") or "").strip(),
+        "custom_domain": str(getattr(settings, "S3_MEDIA_CUSTOM_DOMAIN", "") or "").strip(),
+        "expires_seconds": max(60, int(getattr(settings, "S3_PRESIGNED_UPLOAD_EXPIRES_SECONDS", 900) or 900)),
+        "recordings_prefix": str(
+            getattr(settings, "S3_MEDIA_RECORDINGS_PREFIX", "session_recordings") or "session_recordings"
+        ).strip().strip("/"),
+    }
+
+
+def build_recording_s3_client(config: dict):
+    return media_s3_client(region=config["region"], endpoint_url=config["endpoint_url"])
+
+
+def build_recording_object_key(config: dict, session_id: int, file_name: str) -> str:
+    file_ext = os.path.splitext(str(file_name or ""))[1].lower()
+    if not file_ext or len(file_ext) > 10:
+        file_ext = ".webm"
+    if not file_ext.startswith("."):
+        file_ext = f".{file_ext}"
+    key_parts = [part for part in [config["recordings_prefix"], f"session-{session_id}"] if part]
+    key_prefix = "/".join(key_parts)
+    return f"{key_prefix}/{int(time.time())}-{uuid.uuid4().hex}{file_ext}"
+
+
+S3_MULTIPART_MIN_PART_BYTES = 5 * 1024 * 1024
+S3_MULTIPART_MAX_PARTS = 10000
+
+
+def recording_multipart_part_size(file_size_bytes=None) -> int:
+    configured_mb = int(getattr(settings, "S3_MULTIPART_PART_SIZE_MB", 16) or 16)
+    part_size = max(S3_MULTIPART_MIN_PART_BYTES, configured_mb * 1024 * 1024)
+    if file_size_bytes:
+        # S3 caps an upload at 10,000 parts; grow the part size for very large files.
+        min_for_file = -(-int(file_size_bytes) // S3_MULTIPART_MAX_PARTS)
+        part_size = max(part_size, min_for_file)
+    return part_size
+
+
+def list_recording_upload_parts(s3_client, *, bucket: str, key: str, upload_id: str) -> list:
+    parts = []
+    marker = 0
+    while True:
+        page = s3_client.list_parts(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MaxParts=1000,
+            PartNumberMarker=marker,
+        )
+        for item in page.get("Parts") or []:
+            parts.append(
+                {
+                    "part_number": int(item["PartNumber"]),
+                    "etag": item.get("ETag", ""),
+                    "size": int(item.get("Size") or 0),
+                }
+            )
+        if not page.get("IsTruncated"):
+            return parts
+        marker = int(page.get("NextPartNumberMarker") or 0)
+
+
 SITE_SETTING_DONATE_LINK_ENABLED_KEY = "donate_link_enabled"
 
 
@@ -300,7 +400,7 @@ def enforce_session_warning_policy(*, session, speaker_role, reason="", incident
     )
     if warning_count >= admin_alert_threshold:
         alert_guard_key = f"session:{session.id}:warning-alert:{role_value}:{warning_count}"
-        if not cache.get(alert_guard_key):
+        if acquire_guard(alert_guard_key, timeout=24 * 60 * 60):
             description = (
                 f"Safety warnings reached {warning_count} for {role_value} "
                 f"(alert threshold {admin_alert_threshold})."
@@ -322,7 +422,6 @@ def enforce_session_warning_policy(*, session, speaker_role, reason="", incident
                 disconnect_on_warning=disconnect_on_warning,
                 reason=reason,
             )
-            cache.set(alert_guard_key, 1, timeout=24 * 60 * 60)
 
     return {
         "warning_count": warning_count,
@@ -333,18 +432,61 @@ def enforce_session_warning_policy(*, session, speaker_role, reason="", incident
     }
 
 
-def transcribe_audio_chunk_with_openai(uploaded_file):
+def transcribe_audio_chunk_with_openai(uploaded_file, *, session_id=None, speaker_role="", flush=False):
+    """
+    Transcribe one recorder chunk, skipping silence and batching short chunks.
+
+    PCM/WAV chunks go through an energy VAD first; silent ones return
+    ``("", "silent_audio_chunk")`` without an upload. With ``session_id`` they
+    are also buffered per speaker and ``("", "buffered_audio_chunk")`` is
+    returned until enough audio has accumulated (or ``flush`` is set).
+    ``flush`` without a file sends whatever the speaker still has buffered.
+    """
     api_key = str(getattr(settings, "OPENAI_API_KEY", "") or "").strip()
+    if api_key and not uploaded_file and flush and session_id is not None:
+        combined = audio_vad.flush_coalesced(session_id, speaker_role)
+        if combined is None:
+            return "", "empty_audio_chunk"
+        uploaded_file = SimpleUploadedFile("chunk.wav", combined, content_type="audio/wav")
+        session_id = None
     if not api_key or not uploaded_file:
         return "", "missing_api_key_or_file"
 
+    filename = str(getattr(uploaded_file, "name", "") or "chunk.webm").strip() or "chunk.webm"
+    content_type = str(getattr(uploaded_file, "content_type", "") or "").strip() or "audio/webm"
     try:
-        audio_bytes = uploaded_file.read()
+        size = getattr(uploaded_file, "size", None)
+        if size is None:
+            uploaded_file.seek(0, os.SEEK_END)
+            size = uploaded_file.tell()
+        uploaded_file.seek(0)
     except Exception:
         return "", "unable_to_read_audio_chunk"
-    if not audio_bytes:
+    if not size:
         return "", "empty_audio_chunk"
 
+    audio_file = uploaded_file
+    decoded = None
+    # Only PCM is decodable without ffmpeg; compressed chunks are streamed as-is.
+    if audio_vad.may_be_pcm(content_type, uploaded_file.read(4)):
+        uploaded_file.seek(0)
+        decoded = audio_vad.decode_pcm(uploaded_file.read(), content_type)
+    uploaded_file.seek(0)
+    if decoded is not None:
+        pcm_bytes, shape = decoded
+        silent = audio_vad.is_silent(pcm_bytes, shape)
+        if session_id is None and silent:
+            return "", "silent_audio_chunk"
+        if session_id is not None:
+            combined = audio_vad.coalesce_chunk(
+                session_id, speaker_role, b"" if silent else pcm_bytes, shape, flush=flush
+            )
+            if combined is None:
+                return "", "silent_audio_chunk" if silent else "buffered_audio_chunk"
+            audio_file = io.BytesIO(combined)
+            filename = f"{os.path.splitext(filename)[0] or 'chunk'}.wav"
+            content_type = "audio/wav"
+
     preferred_model = (
         os.environ.get("OPENAI_REALTIME_TRANSCRIPTION_MODEL")
         or os.environ.get("OPENAI_TRANSCRIPTION_MODEL")
@@ -355,48 +497,30 @@ def transcribe_audio_chunk_with_openai(uploaded_file):
         candidate = str(item or "").strip()
         if candidate and candidate not in model_candidates:
             model_candidates.append(candidate)
-    filename = str(getattr(uploaded_file, "name", "") or "chunk.webm").strip() or "chunk.webm"
-    content_type = str(getattr(uploaded_file, "content_type", "") or "").strip() or "audio/webm"
-    boundary = f"----BondRoomBoundary{int(time.time() * 1000)}"
-
-    def _field(name, value):
-        return (
-            f"--{boundary}\r\n"
-            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
-            f"{value}\r\n"
-        ).encode("utf-8")
-
-    file_header = (
-        f"--{boundary}\r\n"
-        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
-        f"Content-Type: {content_type}\r\n\r\n"
-    ).encode("utf-8")
-    file_tail = b"\r\n"
-    end_marker = f"--{boundary}--\r\n".encode("utf-8")
 
     last_error = "transcription_failed"
     for model in model_candidates:
-        body = b"".join(
-            [
-                _field("model", model),
-                _field("response_format", "json"),
-                _field("language", "en"),
-                file_header,
-                audio_bytes,
-                file_tail,
-                end_marker,
-            ]
+        audio_file.seek(0)
+        body = provider_http.MultipartBody(
+            {"model": model, "response_format": "json", "language": "en"},
+            file_field="file",
+            fileobj=audio_file,
+            filename=filename,
+            content_type=content_type,
         )
         request = urllib.request.Request(
             "https://api.openai.com/v1/audio/transcriptions",
             data=body,
             headers={
                 "Authorization": f"Bearer {api_key}",
-                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Type": body.content_type,
+                "Content-Length": str(body.length),
             },
         )
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
+            with provider_http.urlopen(
+                request, timeout=30, model=model, priority=provider_limits.PRIORITY_MODERATION
+            ) as response:
                 payload = json.loads(response.read().decode("utf-8"))
             text = str(payload.get("text", "") if isinstance(payload, dict) else "").strip()
             if text:
@@ -411,10 +535,12 @@ def transcribe_audio_chunk_with_openai(uploaded_file):
             if len(detail) > 280:
                 detail = detail[:280]
             last_error = f"{model}:HTTP{getattr(exc, 'code', 'ERR')}:{detail or exc.__class__.__name__}"
-            continue
+            if exc.code not in {400, 404}:
+                # Only a rejected model is worth retrying with the next candidate.
+                break
         except Exception as exc:
             last_error = f"{model}:{exc.__class__.__name__}:{str(exc)[:180]}"
-            continue
+            break
     return "", last_error
 
 
@@ -503,23 +629,107 @@ def _build_transcript_from_session_signals(session: Session) -> str:
     return "\n".join(deduped).strip()
 
 
-def generate_meeting_summary_with_ai(session, transcript):
-    provider = _meeting_summary_provider()
-    transcript_text = str(transcript or "").strip()
-    transcript_from_signals = _build_transcript_from_session_signals(session)
-    if transcript_text and transcript_from_signals:
-        if transcript_text in transcript_from_signals:
-            transcript_text = transcript_from_signals
-        elif transcript_from_signals in transcript_text:
-            transcript_text = transcript_text
-        else:
-            transcript_text = f"{transcript_from_signals}\n\nAdditional notes:\n{transcript_text}"
-    elif transcript_from_signals:
-        transcript_text = transcript_from_signals
+def _meeting_summary_model(provider: str) -> str:
+    if provider == "openrouter":
+        return (
+            str(os.environ.get("OPENROUTER_MEETING_SUMMARY_MODEL", "") or "").strip()
+            or str(os.environ.get("OPENROUTER_MODEL", "") or "").strip()
+            or "openai/gpt-4o-mini"
+        )
+    return (
+        os.environ.get("OPENAI_MEETING_SUMMARY_MODEL")
+        or os.environ.get("OPENAI_MODEL")
+        or "gpt-4o-mini"
+    )
 
-    if not transcript_text:
-        raise RuntimeError("Transcript is required for summary generation.")
 
+MEETING_SUMMARY_PROMPT_VERSION = "v1"
+MEETING_SUMMARY_SYSTEM_PROMPT = (
+    "You summarize mentoring sessions. "
+    "Return strict JSON only with keys summary, highlights, and action_items. "
+    "Do not include markdown."
+)
+MEETING_SUMMARY_REDUCE_PROMPT = (
+    "You merge partial summaries of consecutive parts of one mentoring session. "
+    "Return strict JSON only with keys summary, highlights, and action_items. "
+    "Drop duplicate highlights and action items. Do not include markdown."
+)
+
+
+def _meeting_summary_chunk_chars() -> int:
+    return max(2000, int(os.environ.get("MEETING_SUMMARY_CHUNK_CHARS", "12000")))
+
+
+def _split_transcript_chunks(transcript_text: str, max_chars: int) -> list:
+    """
+    Pack whole speaker turns into chunks of at most ``max_chars``.
+
+    Chunks are filled greedily from the start of the transcript, so appending
+    new lines only changes the last chunk and earlier chunk hashes stay stable.
+    """
+    chunks = []
+    current = []
+    current_size = 0
+    for line in str(transcript_text or "").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        pieces = [line]
+        if len(line) > max_chars:
+            speaker, separator, text = line.partition(": ")
+            prefix = f"{speaker}: " if separator and len(speaker) <= 20 else ""
+            body = text if prefix else line
+            step = max_chars - len(prefix)
+            pieces = [f"{prefix}{body[start : start + step]}" for start in range(0, len(body), step)]
+        for piece in pieces:
+            if current and current_size + len(piece) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                current = []
+                current_size = 0
+            current.append(piece)
+            current_size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _meeting_summary_cache_key(stage: str, text: str) -> str:
+    digest = hashlib.sha256(f"{MEETING_SUMMARY_PROMPT_VERSION}:{stage}:{text}".encode("utf-8")).hexdigest()
+    return f"meeting-summary:{stage}:{digest}"
+
+
+def _meeting_summary_session_context(session) -> dict:
+    return {
+        "id": session.id,
+        "scheduled_start": session.scheduled_start.isoformat() if session.scheduled_start else "",
+        "scheduled_end": session.scheduled_end.isoformat() if session.scheduled_end else "",
+        "mentor_id": session.mentor_id,
+        "mentee_id": session.mentee_id,
+    }
+
+
+def _parse_meeting_summary_output(output_text: str) -> dict:
+    json_text = _extract_json_text(output_text)
+    try:
+        parsed = json.loads(json_text) if json_text else {}
+    except json.JSONDecodeError:
+        parsed = {"summary": output_text}
+    if not isinstance(parsed, dict):
+        parsed = {}
+    highlights = parsed.get("highlights")
+    action_items = parsed.get("action_items")
+    return {
+        "summary": str(parsed.get("summary", "")).strip(),
+        "highlights": highlights if isinstance(highlights, list) else [],
+        "action_items": action_items if isinstance(action_items, list) else [],
+    }
+
+
+def _request_meeting_summary(provider: str, system_prompt: str, prompt_payload: dict) -> dict:
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": json.dumps(prompt_payload)},
+    ]
     if provider == "openrouter":
         api_key = str(os.environ.get("OPENROUTER_API_KEY", "") or "").strip()
         if not api_key:
@@ -533,37 +743,6 @@ def generate_meeting_summary_with_ai(session, transcript):
             candidate = str(item or "").strip()
             if candidate and candidate not in model_candidates:
                 model_candidates.append(candidate)
-        transcript_excerpt = transcript_text[:120000]
-        prompt_payload = {
-            "session": {
-                "id": session.id,
-                "scheduled_start": session.scheduled_start.isoformat() if session.scheduled_start else "",
-                "scheduled_end": session.scheduled_end.isoformat() if session.scheduled_end else "",
-                "mentor_id": session.mentor_id,
-                "mentee_id": session.mentee_id,
-            },
-            "requirements": {
-                "language": "English",
-                "summary_length": "short",
-                "include_action_items": True,
-                "include_key_highlights": True,
-            },
-            "transcript": transcript_excerpt,
-            "output_schema": {
-                "summary": "string",
-                "highlights": ["string"],
-                "action_items": ["string"],
-            },
-        }
-        system_prompt = (
-            "You summarize mentoring sessions. "
-            "Return strict JSON only with keys summary, highlights, and action_items. "
-            "Do not include markdown."
-        )
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(prompt_payload)},
-        ]
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
@@ -575,7 +754,9 @@ def generate_meeting_summary_with_ai(session, transcript):
                 data=json.dumps(payload).encode("utf-8"),
                 headers=headers,
             )
-            with urllib.request.urlopen(request, timeout=30) as response:
+            with provider_http.urlopen(
+                request, timeout=30, model=payload["model"], priority=provider_limits.PRIORITY_SUMMARIES
+            ) as response:
                 return json.loads(response.read().decode("utf-8"))
 
         last_error = ""
@@ -592,26 +773,11 @@ def generate_meeting_summary_with_ai(session, transcript):
                     if not output_text:
                         last_error = f"empty_response:{model}"
                         continue
-                    json_text = _extract_json_text(output_text)
-                    parsed = {}
-                    try:
-                        parsed = json.loads(json_text) if json_text else {}
-                    except json.JSONDecodeError:
-                        parsed = {"summary": output_text}
-
-                    summary = str(parsed.get("summary", "")).strip()
-                    if not summary:
+                    parsed = _parse_meeting_summary_output(output_text)
+                    if not parsed["summary"]:
                         last_error = f"missing_summary:{model}"
                         continue
-                    highlights = parsed.get("highlights")
-                    action_items = parsed.get("action_items")
-                    return {
-                        "summary": summary,
-                        "highlights": highlights if isinstance(highlights, list) else [],
-                        "action_items": action_items if isinstance(action_items, list) else [],
-                        "model": model,
-                        "source": "openrouter",
-                    }
+                    return {**parsed, "model": model, "source": "openrouter"}
                 except urllib.error.HTTPError as exc:
                     detail = ""
                     try:
@@ -628,52 +794,11 @@ def generate_meeting_summary_with_ai(session, transcript):
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY is not configured.")
 
-    model = (
-        os.environ.get("OPENAI_MEETING_SUMMARY_MODEL")
-        or os.environ.get("OPENAI_MODEL")
-        or "gpt-4o-mini"
-    )
-    transcript_excerpt = transcript_text[:120000]
-    prompt_payload = {
-        "session": {
-            "id": session.id,
-            "scheduled_start": session.scheduled_start.isoformat()
-            if session.scheduled_start
-            else "",
-            "scheduled_end": session.scheduled_end.isoformat() if session.scheduled_end else "",
-            "mentor_id": session.mentor_id,
-            "mentee_id": session.mentee_id,
-        },
-        "requirements": {
-            "language": "English",
-            "summary_length": "short",
-            "include_action_items": True,
-            "include_key_highlights": True,
-        },
-        "transcript": transcript_excerpt,
-        "output_schema": {
-            "summary": "string",
-            "highlights": ["string"],
-            "action_items": ["string"],
-        },
-    }
+    model = _meeting_summary_model("openai")
     body = {
         "model": model,
         "text": {"format": {"type": "json_object"}},
-        "input": [
-            {
-                "role": "system",
-                "content": (
-                    "You summarize mentoring sessions. "
-                    "Return strict JSON only with keys summary, highlights, and action_items. "
-                    "Do not include markdown."
-                ),
-            },
-            {
-                "role": "user",
-                "content": json.dumps(prompt_payload),
-            },
-        ],
+        "input": messages,
     }
     request = urllib.request.Request(
         "https://api.openai.com/v1/responses",
@@ -683,7 +808,9 @@ def generate_meeting_summary_with_ai(session, transcript):
             "Content-Type": "application/json",
         },
     )
-    with urllib.request.urlopen(request, timeout=30) as response:
+    with provider_http.urlopen(
+        request, timeout=30, model=model, priority=provider_limits.PRIORITY_SUMMARIES
+    ) as response:
         payload = json.loads(response.read().decode("utf-8"))
 
     output_text = payload.get("output_text", "") or ""
@@ -695,27 +822,152 @@ def generate_meeting_summary_with_ai(session, transcript):
                     parts.append(content.get("text", ""))
         output_text = "".join(parts).strip()
 
-    parsed = {}
-    if output_text:
-        try:
-            parsed = json.loads(output_text)
-        except json.JSONDecodeError:
-            parsed = {"summary": output_text}
-
-    summary = str(parsed.get("summary", "")).strip()
-    if not summary:
+    parsed = _parse_meeting_summary_output(output_text) if output_text else {"summary": ""}
+    if not parsed["summary"]:
         raise RuntimeError("OpenAI did not return a valid summary.")
-    highlights = parsed.get("highlights")
-    action_items = parsed.get("action_items")
+    return {**parsed, "model": model, "source": "openai"}
+
+
+def _cached_meeting_summary(provider: str, stage: str, text: str, system_prompt: str, prompt_payload: dict) -> dict:
+    cache_key = _meeting_summary_cache_key(stage, text)
+    cached = cache.get(cache_key)
+    if isinstance(cached, dict):
+        return cached
+    result = _request_meeting_summary(provider, system_prompt, prompt_payload)
+    cache.set(cache_key, result, timeout=int(os.environ.get("MEETING_SUMMARY_CACHE_SECONDS", str(7 * 24 * 3600))))
+    return result
+
+
+def _reduce_meeting_summaries(provider: str, session_context: dict, partials: list, max_chars: int) -> dict:
+    # Merge partial summaries in groups that fit one prompt until a single summary is left.
+    while len(partials) > 1:
+        groups = []
+        current = []
+        current_size = 0
+        for partial in partials:
+            size = len(json.dumps(partial))
+            if current and current_size + size > max_chars:
+                groups.append(current)
+                current = []
+                current_size = 0
+            current.append(partial)
+            current_size += size
+        if current:
+            groups.append(current)
+        if len(groups) == len(partials):
+            groups = [partials[index : index + 2] for index in range(0, len(partials), 2)]
+
+        merged = []
+        for group in groups:
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            parts = [
+                {key: item.get(key) for key in ("summary", "highlights", "action_items")} for item in group
+            ]
+            merged.append(
+                _cached_meeting_summary(
+                    provider,
+                    "reduce",
+                    json.dumps(parts, sort_keys=True),
+                    MEETING_SUMMARY_REDUCE_PROMPT,
+                    {
+                        "session": session_context,
+                        "requirements": {
+                            "language": "English",
+                            "summary_length": "short",
+                            "include_action_items": True,
+                            "include_key_highlights": True,
+                        },
+                        "partial_summaries": parts,
+                        "output_schema": {
+                            "summary": "string",
+                            "highlights": ["string"],
+                            "action_items": ["string"],
+                        },
+                    },
+                )
+            )
+        partials = merged
+    return partials[0]
+
+
+def _summarize_meeting_chunks(provider, session_context, chunks, max_chars):
+    # Map: summarize each speaker-aware chunk once, keyed by its content hash.
+    partials = [
+        _cached_meeting_summary(
+            provider,
+            "chunk",
+            chunk,
+            MEETING_SUMMARY_SYSTEM_PROMPT,
+            {
+                "session": session_context,
+                "requirements": {
+                    "language": "English",
+                    "summary_length": "short",
+                    "include_action_items": True,
+                    "include_key_highlights": True,
+                },
+                "transcript": chunk,
+                "output_schema": {
+                    "summary": "string",
+                    "highlights": ["string"],
+                    "action_items": ["string"],
+                },
+            },
+        )
+        for chunk in chunks
+    ]
+    # Reduce: merge chunk summaries into the final summary/highlights/action_items.
+    result = _reduce_meeting_summaries(provider, session_context, partials, max_chars)
     return {
-        "summary": summary,
-        "highlights": highlights if isinstance(highlights, list) else [],
-        "action_items": action_items if isinstance(action_items, list) else [],
-        "model": model,
-        "source": "openai",
+        "summary": result["summary"],
+        "highlights": result["highlights"],
+        "action_items": result["action_items"],
+        "model": result.get("model", ""),
+        "source": result.get("source", provider),
+        "chunk_count": len(partials),
     }
 
 
+def generate_meeting_summary_with_ai(session, transcript):
+    provider_order = provider_health.failover_order(
+        _meeting_summary_provider(),
+        {provider: _meeting_summary_model(provider) for provider in provider_health.LLM_PROVIDERS},
+    )
+    if not provider_order:
+        raise RuntimeError("Meeting summary providers are temporarily unavailable (circuit open).")
+    transcript_text = str(transcript or "").strip()
+    transcript_from_signals = _build_transcript_from_session_signals(session)
+    if transcript_text and transcript_from_signals:
+        if transcript_text in transcript_from_signals:
+            transcript_text = transcript_from_signals
+        elif transcript_from_signals in transcript_text:
+            transcript_text = transcript_text
+        else:
+            transcript_text = f"{transcript_from_signals}\n\nAdditional notes:\n{transcript_text}"
+    elif transcript_from_signals:
+        transcript_text = transcript_from_signals
+
+    if not transcript_text:
+        raise RuntimeError("Transcript is required for summary generation.")
+
+    max_chars = _meeting_summary_chunk_chars()
+    chunks = _split_transcript_chunks(transcript_text, max_chars)
+    if not chunks:
+        raise RuntimeError("Transcript is required for summary generation.")
+    session_context = _meeting_summary_session_context(session)
+
+    # Fail over to the next provider; provider_http records each failure with the breaker.
+    last_error = None
+    for provider in provider_order:
+        try:
+            return _summarize_meeting_chunks(provider, session_context, chunks, max_chars)
+        except Exception as exc:
+            last_error = exc
+    raise last_error
+
+
 CHATBOT_FAQ_ANSWERS = [
     (
         "Is Bond Room really free for Teens?",
@@ -744,6 +996,15 @@ CHATBOT_FAQ_ANSWERS = [
 ]
 
 
+# Built once per process; the FAQ is static so the index never needs rebuilding.
+CHATBOT_FAQ_INDEX = BM25Index([f"{question} {question} {answer}" for question, answer in CHATBOT_FAQ_ANSWERS])
+
+CHATBOT_ANSWER_CACHE = TTLLRUCache(
+    max_entries=int(os.environ.get("CHATBOT_ANSWER_CACHE_MAX_ENTRIES", "512")),
+    ttl_seconds=int(os.environ.get("CHATBOT_ANSWER_CACHE_TTL_SECONDS", "21600")),
+)
+
+
 def _normalize_chatbot_question(value: str) -> str:
     text = str(value or "").strip().lower()
     text = re.sub(r"[^a-z0-9\s]", " ", text)
@@ -766,7 +1027,18 @@ def _find_faq_chatbot_answer(question: str) -> str:
     for required_keywords, answer in keyword_sets:
         if required_keywords.issubset(words):
             return answer
-    return ""
+
+    matches = CHATBOT_FAQ_INDEX.search(normalized, limit=2)
+    if not matches:
+        return ""
+    best_index, best_score, coverage = matches[0]
+    min_coverage = float(os.environ.get("CHATBOT_FAQ_MIN_COVERAGE", "0.75"))
+    if coverage < min_coverage:
+        return ""
+    # Require a clear winner so ambiguous questions still go to the model.
+    if len(matches) > 1 and matches[1][1] >= best_score * 0.8:
+        return ""
+    return CHATBOT_FAQ_ANSWERS[best_index][1]
 
 
 def _chatbot_provider() -> str:
@@ -775,6 +1047,20 @@ def _chatbot_provider() -> str:
     return "openai" if use_openai else "openrouter"
 
 
+def _chatbot_model(provider: str) -> str:
+    if provider == "openrouter":
+        return (
+            str(os.environ.get("OPENROUTER_CHATBOT_MODEL", "") or "").strip()
+            or str(os.environ.get("OPENROUTER_MODEL", "") or "").strip()
+            or "openai/gpt-4o-mini"
+        )
+    return (
+        str(os.environ.get("OPENAI_CHATBOT_MODEL", "") or "").strip()
+        or str(os.environ.get("OPENAI_MODEL", "") or "").strip()
+        or "gpt-4o-mini"
+    )
+
+
 def _chatbot_system_prompt() -> str:
     faq_lines = "\n".join([f"- {q} => {a}" for q, a in CHATBOT_FAQ_ANSWERS])
     return (
@@ -786,16 +1072,18 @@ def _chatbot_system_prompt() -> str:
     )
 
 
-def _openai_chatbot_reply(*, message: str, history: list) -> dict:
-    api_key = str(getattr(settings, "OPENAI_API_KEY", "") or "").strip()
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY is not configured.")
+CHATBOT_COMPLETION_URLS = {
+    "openai": "https://api.openai.com/v1/chat/completions",
+    "openrouter": "https://openrouter.ai/api/v1/chat/completions",
+}
 
-    model = (
-        str(os.environ.get("OPENAI_CHATBOT_MODEL", "") or "").strip()
-        or str(os.environ.get("OPENAI_MODEL", "") or "").strip()
-        or "gpt-4o-mini"
-    )
+CHATBOT_FALLBACK_ANSWER = (
+    "I can help with Bond Room questions about pricing, mentor verification, session safety, "
+    "mentor matching, age group, and session duration."
+)
+
+
+def _chatbot_messages(message: str, history: list) -> list:
     messages = [{"role": "system", "content": _chatbot_system_prompt()}]
     for item in history[-6:]:
         role = str((item or {}).get("role", "")).strip().lower()
@@ -803,17 +1091,126 @@ def _openai_chatbot_reply(*, message: str, history: list) -> dict:
         if role in {"user", "assistant"} and content:
             messages.append({"role": role, "content": content})
     messages.append({"role": "user", "content": message})
+    return messages
+
 
-    body = {"model": model, "messages": messages, "temperature": 0.4}
+def _chatbot_api_key(provider: str) -> str:
+    if provider == "openrouter":
+        return str(os.environ.get("OPENROUTER_API_KEY", "") or "").strip()
+    return str(getattr(settings, "OPENAI_API_KEY", "") or "").strip()
+
+
+def _stream_chatbot_reply(provider: str, *, message: str, history: list):
+    api_key = _chatbot_api_key(provider)
+    if not api_key:
+        raise RuntimeError(f"{'OPENROUTER' if provider == 'openrouter' else 'OPENAI'}_API_KEY is not configured.")
+
+    model = _chatbot_model(provider)
+    body = {
+        "model": model,
+        "messages": _chatbot_messages(message, history),
+        "temperature": 0.4,
+        "stream": True,
+    }
     request = urllib.request.Request(
-        "https://api.openai.com/v1/chat/completions",
+        CHATBOT_COMPLETION_URLS[provider],
         data=json.dumps(body).encode("utf-8"),
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
     )
-    with urllib.request.urlopen(request, timeout=30) as response:
+    lines = provider_http.stream_lines(
+        request, timeout=30, model=model, priority=provider_limits.PRIORITY_CHATBOT
+    )
+    for line in lines:
+        # Both providers speak OpenAI-style SSE; OpenRouter also sends ": keep-alive" comments.
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data or data == "[DONE]":
+            continue
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        if chunk.get("error"):
+            raise RuntimeError(f"{provider} stream error: {str(chunk['error'])[:200]}")
+        choices = chunk.get("choices") or []
+        delta = ((choices[0] or {}).get("delta") or {}).get("content") if choices else ""
+        if delta:
+            yield delta
+
+
+def _sse_event(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+def _chatbot_single_answer_stream(payload: dict):
+    yield _sse_event("token", {"text": payload["answer"]})
+    yield _sse_event("done", {key: value for key, value in payload.items() if key != "answer"})
+
+
+def _chatbot_event_stream(*, question: str, history: list, provider_order: list, cache_key: str):
+    started = time.monotonic()
+    for provider in provider_order:
+        model = _chatbot_model(provider)
+        parts = []
+        first_token_ms = None
+        try:
+            for delta in _stream_chatbot_reply(provider, message=question, history=history):
+                if first_token_ms is None:
+                    first_token_ms = (time.monotonic() - started) * 1000
+                parts.append(delta)
+                yield _sse_event("token", {"text": delta})
+        except Exception as exc:
+            if not parts:
+                logger.warning("chatbot_stream provider=%s failed before first token: %s", provider, exc)
+                continue
+            # Tokens already reached the client, so switching providers would garble the answer.
+            logger.warning("chatbot_stream provider=%s interrupted: %s", provider, exc)
+            yield _sse_event("error", {"detail": "The answer was interrupted. Please try again."})
+            yield _sse_event("done", {"provider": provider, "model": model, "interrupted": True})
+            return
+        answer = "".join(parts).strip()
+        if not answer:
+            continue
+        logger.info(
+            "chatbot_stream provider=%s model=%s ttft_ms=%.0f total_ms=%.0f chars=%s",
+            provider,
+            model,
+            first_token_ms or 0,
+            (time.monotonic() - started) * 1000,
+            len(answer),
+        )
+        if cache_key:
+            CHATBOT_ANSWER_CACHE.set(cache_key, {"answer": answer, "provider": provider, "model": model})
+        yield _sse_event("done", {"provider": provider, "model": model})
+        return
+
+    yield from _chatbot_single_answer_stream(
+        {"answer": CHATBOT_FALLBACK_ANSWER, "provider": "fallback", "model": "fallback"}
+    )
+
+
+def _openai_chatbot_reply(*, message: str, history: list) -> dict:
+    api_key = str(getattr(settings, "OPENAI_API_KEY", "") or "").strip()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is not configured.")
+
+    model = _chatbot_model("openai")
+    body = {"model": model, "messages": _chatbot_messages(message, history), "temperature": 0.4}
+    request = urllib.request.Request(
+        CHATBOT_COMPLETION_URLS["openai"],
+        data=json.dumps(body).encode("utf-8"),
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+    )
+    with provider_http.urlopen(
+        request, timeout=30, model=model, priority=provider_limits.PRIORITY_CHATBOT
+    ) as response:
         payload = json.loads(response.read().decode("utf-8"))
     choices = payload.get("choices") or []
     content = str((((choices[0] or {}).get("message") or {}).get("content") or "")).strip() if choices else ""
@@ -827,29 +1224,19 @@ def _openrouter_chatbot_reply(*, message: str, history: list) -> dict:
     if not api_key:
         raise RuntimeError("OPENROUTER_API_KEY is not configured.")
 
-    model = (
-        str(os.environ.get("OPENROUTER_CHATBOT_MODEL", "") or "").strip()
-        or str(os.environ.get("OPENROUTER_MODEL", "") or "").strip()
-        or "openai/gpt-4o-mini"
-    )
-    messages = [{"role": "system", "content": _chatbot_system_prompt()}]
-    for item in history[-6:]:
-        role = str((item or {}).get("role", "")).strip().lower()
-        content = str((item or {}).get("content", "")).strip()
-        if role in {"user", "assistant"} and content:
-            messages.append({"role": role, "content": content})
-    messages.append({"role": "user", "content": message})
-
-    body = {"model": model, "messages": messages, "temperature": 0.4}
+    model = _chatbot_model("openrouter")
+    body = {"model": model, "messages": _chatbot_messages(message, history), "temperature": 0.4}
     request = urllib.request.Request(
-        "https://openrouter.ai/api/v1/chat/completions",
+        CHATBOT_COMPLETION_URLS["openrouter"],
         data=json.dumps(body).encode("utf-8"),
         headers={
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         },
     )
-    with urllib.request.urlopen(request, timeout=30) as response:
+    with provider_http.urlopen(
+        request, timeout=30, model=model, priority=provider_limits.PRIORITY_CHATBOT
+    ) as response:
         payload = json.loads(response.read().decode("utf-8"))
     choices = payload.get("choices") or []
     message_payload = (choices[0] or {}).get("message", {}) if choices else {}
@@ -863,46 +1250,70 @@ class BondRoomChatbotView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
 
+    def _respond(self, payload: dict, stream: bool):
+        if stream:
+            return self._event_stream_response(_chatbot_single_answer_stream(payload))
+        return Response(payload, status=status.HTTP_200_OK)
+
+    def _event_stream_response(self, events):
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
     def post(self, request):
         question = str(request.data.get("message", "")).strip()
         history = request.data.get("history", [])
         if not isinstance(history, list):
             history = []
+        stream = parse_bool(request.data.get("stream")) or parse_bool(request.query_params.get("stream"))
 
         if not question:
-            fallback = (
-                "I can help with Bond Room questions about pricing, mentor verification, session safety, "
-                "mentor matching, age group, and session duration."
-            )
-            return Response(
-                {"answer": fallback, "provider": "fallback", "model": "fallback"},
-                status=status.HTTP_200_OK,
+            return self._respond(
+                {"answer": CHATBOT_FALLBACK_ANSWER, "provider": "fallback", "model": "fallback"}, stream
             )
 
         faq_answer = _find_faq_chatbot_answer(question)
         if faq_answer:
-            return Response(
-                {"answer": faq_answer, "provider": "faq", "model": "faq"},
-                status=status.HTTP_200_OK,
-            )
+            return self._respond({"answer": faq_answer, "provider": "faq", "model": "faq"}, stream)
 
-        provider = _chatbot_provider()
-        try:
-            if provider == "openrouter":
-                ai_response = _openrouter_chatbot_reply(message=question, history=history)
-            else:
-                ai_response = _openai_chatbot_reply(message=question, history=history)
-            return Response(ai_response, status=status.HTTP_200_OK)
-        except Exception as exc:
-            fallback = (
-                "I can help with Bond Room questions about pricing, mentor verification, session safety, "
-                "mentor matching, age group, and session duration."
+        # Follow-up turns depend on the conversation, so only first questions are cached.
+        cache_key = _normalize_chatbot_question(question) if not history else ""
+        cached_response = CHATBOT_ANSWER_CACHE.get(cache_key) if cache_key else None
+        if cached_response:
+            return self._respond({**cached_response, "cached": True}, stream)
+
+        provider_order = provider_health.failover_order(
+            _chatbot_provider(),
+            {provider: _chatbot_model(provider) for provider in provider_health.LLM_PROVIDERS},
+        )
+        if stream:
+            return self._event_stream_response(
+                _chatbot_event_stream(
+                    question=question,
+                    history=history,
+                    provider_order=provider_order,
+                    cache_key=cache_key,
+                )
             )
-            payload = {"answer": fallback, "provider": "fallback", "model": "fallback"}
-            if settings.DEBUG:
-                payload["debug_error"] = str(exc)
-                payload["debug_error_type"] = exc.__class__.__name__
-            return Response(payload, status=status.HTTP_200_OK)
+        last_error = None
+        for provider in provider_order:
+            try:
+                if provider == "openrouter":
+                    ai_response = _openrouter_chatbot_reply(message=question, history=history)
+                else:
+                    ai_response = _openai_chatbot_reply(message=question, history=history)
+                if cache_key:
+                    CHATBOT_ANSWER_CACHE.set(cache_key, ai_response)
+                return Response(ai_response, status=status.HTTP_200_OK)
+            except Exception as exc:
+                last_error = exc
+
+        payload = {"answer": CHATBOT_FALLBACK_ANSWER, "provider": "fallback", "model": "fallback"}
+        if settings.DEBUG:
+            payload["debug_error"] = str(last_error) if last_error else "provider_circuit_open"
+            payload["debug_error_type"] = last_error.__class__.__name__ if last_error else "ProviderUnavailable"
+        return Response(payload, status=status.HTTP_200_OK)
 
 
 def normalize_mobile(value):
@@ -933,12 +1344,8 @@ def get_user_role_value(user):
 
 def build_auth_token_payload(user):
     role = get_user_role_value(user)
-    refresh = RefreshToken.for_user(user)
-    refresh["role"] = role
-    refresh["email"] = user.email
+    refresh = add_identity_claims(RefreshToken.for_user(user), user, role=role)
     access = refresh.access_token
-    access["role"] = role
-    access["email"] = user.email
     if api_settings.UPDATE_LAST_LOGIN:
         update_last_login(None, user)
     return {
@@ -1219,6 +1626,100 @@ class AdminDonateLinkSettingView(APIView):
         return self._update(request)
 
 
+class ProviderUsageView(APIView):
+    permission_classes = [IsAuthenticatedWithAppRole]
+
+    def get(self, request):
+        require_role(request, {ROLE_ADMIN})
+        budgets = provider_limits.usage_snapshot()
+        for row in budgets:
+            row["circuit_state"] = provider_health.circuit_state(row["provider"], row["model"])
+        return Response(
+            {
+                "budgets": budgets,
+                "priority_shares": provider_limits.PRIORITY_SHARES,
+                "latency": provider_http.latency_snapshot(),
+            }
+        )
+
+
+class SummaryJobsCronView(APIView):
+    """
+    One summary job pass per Vercel cron tick (the ``crons`` entry in ``vercel.json``).
+
+    Vercel sends ``CRON_SECRET`` as a bearer token; without it set, every call is refused.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        secret = str(os.environ.get("CRON_SECRET", "")).strip()
+        supplied = str(request.headers.get("Authorization", ""))
+        if not secret or not hmac.compare_digest(supplied, f"Bearer {secret}"):
+            raise PermissionDenied("Cron secret is missing or does not match.")
+        try:
+            limit = max(1, int(os.environ.get("SESSION_SUMMARY_CRON_LIMIT", "3")))
+        except ValueError:
+            limit = 3
+        # Keep each tick inside the function's time limit; later ticks drain the rest.
+        counts = run_summary_pass(limit=limit, stale_after=timedelta(minutes=15))
+        return Response(counts)
+
+
+def parse_export_bound(raw_value: str, *, param: str, end: bool = False):
+    raw_value = str(raw_value or "").strip()
+    if not raw_value:
+        return None
+    try:
+        day = parse_date(raw_value)
+        value = parse_datetime(raw_value) if day is None else None
+    except ValueError:
+        day = value = None
+    if day is not None:
+        # A bare end date includes that whole day.
+        value = datetime.combine(day + timedelta(days=1) if end else day, datetime.min.time())
+    if value is None:
+        raise ValidationError({param: "Use an ISO 8601 date or datetime."})
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+class AdminExportView(APIView):
+    permission_classes = [IsAdminRole]
+
+    def get(self, request, dataset):
+        spec = EXPORT_DATASETS.get(dataset)
+        if spec is None:
+            return Response(
+                {"detail": f"Unknown export. Choose one of: {', '.join(sorted(EXPORT_DATASETS))}."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        export_format = str(request.query_params.get("output") or "csv").strip().lower()
+        if export_format not in EXPORT_FORMATS:
+            return Response({"detail": "output must be csv or jsonl."}, status=status.HTTP_400_BAD_REQUEST)
+        statuses = [
+            value.strip() for value in str(request.query_params.get("status") or "").split(",") if value.strip()
+        ]
+        queryset = export_queryset(
+            spec,
+            date_from=parse_export_bound(request.query_params.get("from"), param="from"),
+            date_to=parse_export_bound(request.query_params.get("to"), param="to", end=True),
+            statuses=statuses,
+        )
+        compress = parse_bool(request.query_params.get("gzip"))
+        filename = f"{dataset}-{timezone.now():%Y%m%d-%H%M%S}.{export_format}{'.gz' if compress else ''}"
+        response = StreamingHttpResponse(
+            stream_export(spec, queryset, export_format=export_format, compress=compress),
+            content_type="application/gzip" if compress else f"{EXPORT_FORMATS[export_format]}; charset=utf-8",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Cache-Control"] = "no-store"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
 def razorpay_creds():
     key_id = str(os.environ.get("RAZORPAY_KEY_ID", "")).strip()
     key_secret = str(os.environ.get("RAZORPAY_KEY_SECRET", "")).strip()
@@ -1305,7 +1806,7 @@ class RazorpayDonationOrderView(APIView):
             method="POST",
         )
         try:
-            with urllib.request.urlopen(request_obj, timeout=30) as resp:
+            with provider_http.urlopen(request_obj, timeout=30) as resp:
                 order_payload = json.loads(resp.read().decode("utf-8"))
         except urllib.error.HTTPError as exc:
             detail = ""
@@ -1852,7 +2353,7 @@ class MenteeViewSet(viewsets.ModelViewSet):
                     mentor__onboarding_status__current_status="completed",
                 )
                 .select_related("mentor")
-                .order_by("-score")[:10]
+                .order_by(*RECOMMENDATION_ORDERING)[:10]
             )
             recommendations = MatchRecommendationSerializer(
                 rec_qs,
@@ -1964,7 +2465,7 @@ class MentorViewSet(viewsets.ModelViewSet):
                 mentor__onboarding_status__current_status="completed",
             )
             .select_related("mentor")
-            .order_by("-score")
+            .order_by(*RECOMMENDATION_ORDERING)
         )
         serialized_recs = MatchRecommendationSerializer(
             recs,
@@ -2245,7 +2746,7 @@ class MenteeRequestViewSet(viewsets.ModelViewSet):
                 mentor__onboarding_status__current_status="completed",
             )
             .select_related("mentor")
-            .order_by("-score")
+            .order_by(*RECOMMENDATION_ORDERING)
         )
         return Response(
             MatchRecommendationSerializer(
@@ -2466,6 +2967,10 @@ class MenteePreferencesViewSet(viewsets.ModelViewSet):
         serializer.save()
 
 
+FREE_SLOT_MAX_WINDOW = timedelta(days=31)
+FREE_SLOT_MAX_RESULTS = 500
+
+
 class MentorAvailabilitySlotViewSet(viewsets.ModelViewSet):
     queryset = MentorAvailabilitySlot.objects.all().order_by("start_time", "id")
     serializer_class = MentorAvailabilitySlotSerializer
@@ -2492,6 +2997,90 @@ class MentorAvailabilitySlotViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(start_time__gte=start_from)
         return queryset
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # Schema generation builds the serializer without a request.
+        if self.request is not None and user_role(self.request.user) == ROLE_MENTEE:
+            context["viewer_mentee_id"] = current_mentee_id(self.request)
+        return context
+
+    @action(detail=False, methods=["get"], url_path="free-slots")
+    def free_slots(self, request):
+        window_start = parse_export_bound(request.query_params.get("start"), param="start")
+        window_end = parse_export_bound(request.query_params.get("end"), param="end", end=True)
+        if window_start is None or window_end is None:
+            raise ValidationError({"start": "start and end are required."})
+        if window_end <= window_start:
+            raise ValidationError({"end": "end must be after start."})
+        if window_end - window_start > FREE_SLOT_MAX_WINDOW:
+            raise ValidationError({"end": f"The search window cannot exceed {FREE_SLOT_MAX_WINDOW.days} days."})
+        try:
+            duration_minutes = int(request.query_params.get("duration_minutes") or 30)
+            limit = int(request.query_params.get("limit") or 200)
+        except ValueError:
+            raise ValidationError({"detail": "duration_minutes and limit must be integers."})
+        if duration_minutes < 1:
+            raise ValidationError({"duration_minutes": "Must be at least 1."})
+
+        mentor_ids = None
+        role = user_role(request.user)
+        if role == ROLE_MENTOR:
+            my_id = current_mentor_id(request)
+            mentor_ids = [my_id] if my_id else []
+        elif role not in {ROLE_ADMIN, ROLE_MENTEE}:
+            mentor_ids = []
+        mentor_id = request.query_params.get("mentor_id")
+        if mentor_id:
+            if not str(mentor_id).isdigit():
+                raise ValidationError({"mentor_id": "Must be an integer."})
+            mentor_ids = [int(mentor_id)] if mentor_ids is None or int(mentor_id) in mentor_ids else []
+
+        results = find_free_slots(
+            window_start,
+            window_end,
+            duration_minutes=duration_minutes,
+            mentor_ids=mentor_ids,
+            limit=max(1, min(limit, FREE_SLOT_MAX_RESULTS)),
+        )
+        return Response(
+            {
+                "start": window_start,
+                "end": window_end,
+                "duration_minutes": duration_minutes,
+                "count": len(results),
+                "results": results,
+            }
+        )
+
+    def _hold_mentee_id(self, request):
+        role = user_role(request.user)
+        if role == ROLE_MENTEE:
+            mentee_id = current_mentee_id(request)
+            if not mentee_id:
+                raise PermissionDenied("Mentee profile not found for this user.")
+            return mentee_id
+        if role == ROLE_ADMIN:
+            return request.data.get("mentee")
+        raise PermissionDenied("Only mentee or admin can hold availability slots.")
+
+    @action(detail=True, methods=["post"], url_path="hold")
+    def hold(self, request, pk=None):
+        slot = self.get_object()
+        mentee_id = self._hold_mentee_id(request)
+        if not str(mentee_id or "").isdigit() or not Mentee.objects.filter(id=mentee_id).exists():
+            raise ValidationError({"mentee": ["A valid mentee is required."]})
+        held_until = hold_slot(slot.id, int(mentee_id))
+        return Response({"id": slot.id, "held_by": int(mentee_id), "held_until": held_until})
+
+    @action(detail=True, methods=["post"], url_path="release")
+    def release(self, request, pk=None):
+        slot = self.get_object()
+        mentee_id = self._hold_mentee_id(request)
+        if user_role(request.user) == ROLE_ADMIN:
+            # Admins can clear any hold.
+            mentee_id = None
+        return Response({"id": slot.id, "released": release_slot_hold(slot.id, mentee_id)})
+
     def perform_create(self, serializer):
         role = user_role(self.request.user)
         if role == ROLE_MENTEE:
@@ -2653,22 +3242,64 @@ class SessionViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         role = user_role(self.request.user)
+        data = serializer.validated_data
         if role == ROLE_MENTEE:
             mentee_id = current_mentee_id(self.request)
             if not mentee_id:
                 raise PermissionDenied("Mentee profile not found for this user.")
-            session = serializer.save(mentee_id=mentee_id)
+            save_kwargs = {"mentee_id": mentee_id}
         elif role == ROLE_ADMIN:
-            if not serializer.validated_data.get("mentee"):
+            if not data.get("mentee"):
                 raise ValidationError({"mentee": ["This field is required."]})
-            session = serializer.save()
+            mentee_id = data["mentee"].id
+            save_kwargs = {}
         else:
             raise PermissionDenied("Only mentee or admin can create sessions.")
-        if session.availability_slot_id:
-            MentorAvailabilitySlot.objects.filter(id=session.availability_slot_id).update(is_available=False)
+        slot = data.get("availability_slot")
+        if slot and slot.mentor_id != data["mentor"].id:
+            raise ValidationError({"availability_slot": ["This slot belongs to a different mentor."]})
+        with transaction.atomic():
+            if data.get("status", "requested") in BOOKED_SESSION_STATUSES:
+                reserve_booking(
+                    mentor_id=data["mentor"].id,
+                    start=data["scheduled_start"],
+                    end=data["scheduled_end"],
+                    mentee_id=mentee_id,
+                    slot_id=slot.id if slot else None,
+                )
+            elif slot:
+                MentorAvailabilitySlot.objects.filter(id=slot.id).update(is_available=False)
+            serializer.save(**save_kwargs)
 
     def perform_update(self, serializer):
-        serializer.save()
+        session = serializer.instance
+        data = serializer.validated_data
+        rebooked = any(
+            name in data and data[name] != getattr(session, name)
+            for name in ("mentor", "scheduled_start", "scheduled_end", "availability_slot")
+        ) or (session.status not in BOOKED_SESSION_STATUSES and data.get("status") in BOOKED_SESSION_STATUSES)
+        next_status = data.get("status", session.status)
+        new_slot = data.get("availability_slot", session.availability_slot)
+        slot_changed = getattr(new_slot, "id", None) != session.availability_slot_id
+        with transaction.atomic():
+            if rebooked and next_status in BOOKED_SESSION_STATUSES:
+                # A session revived from a vacated status has to claim its slot again.
+                reclaim = slot_changed or session.status in VACATED_SESSION_STATUSES
+                reserve_booking(
+                    mentor_id=data.get("mentor", session.mentor).id,
+                    start=data.get("scheduled_start", session.scheduled_start),
+                    end=data.get("scheduled_end", session.scheduled_end),
+                    mentee_id=session.mentee_id,
+                    slot_id=new_slot.id if new_slot and reclaim else None,
+                    session_id=session.id,
+                )
+            elif new_slot and slot_changed and next_status not in VACATED_SESSION_STATUSES:
+                # Same as create: a slot set on an unbooked session is taken without the booking checks.
+                MentorAvailabilitySlot.objects.filter(id=new_slot.id).update(is_available=False)
+            if session.availability_slot_id and (slot_changed or next_status in VACATED_SESSION_STATUSES):
+                # Moving off a slot, or cancelling, gives its time back to the mentor's calendar.
+                release_booked_slot(session.availability_slot_id, session_id=session.id)
+            serializer.save()
 
     @action(detail=True, methods=["post"], url_path="join-link")
     def join_link(self, request, pk=None):
@@ -2725,6 +3356,8 @@ class SessionViewSet(viewsets.ModelViewSet):
             payload=payload,
         )
         Session.objects.filter(id=session.id).update(status="canceled")
+        if session.availability_slot_id:
+            release_booked_slot(session.availability_slot_id, session_id=session.id)
         SessionIssueReport.objects.update_or_create(
             session=session,
             defaults={
@@ -2896,6 +3529,18 @@ class SessionViewSet(viewsets.ModelViewSet):
                 or ""
             ).strip(),
         )[:1200]
+        source = "web_speech_api"
+        audio_chunk = request.FILES.get("audio_chunk")
+        # final=true marks the end of a recording and flushes any audio still being coalesced.
+        final = parse_bool(request.data.get("final"))
+        if not transcript_excerpt and (audio_chunk or final):
+            text, reason = transcribe_audio_chunk_with_openai(
+                audio_chunk, session_id=session.id, speaker_role=participant_role, flush=final
+            )
+            transcript_excerpt = re.sub(r"\s+", " ", str(text or "").strip())[:1200]
+            if not transcript_excerpt:
+                return Response({"transcript_excerpt": "", "signal": None, "reason": reason})
+            source = "openai_transcription"
         if not transcript_excerpt:
             return Response({"detail": "transcript_excerpt is required."}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -2905,7 +3550,7 @@ class SessionViewSet(viewsets.ModelViewSet):
                 "speaker_role": participant_role,
                 "transcript_excerpt": transcript_excerpt,
                 "created_at": str(request.data.get("created_at", "")).strip() or timezone.now().isoformat(),
-                "source": "web_speech_api",
+                "source": source,
             }
         )
         signal = SessionMeetingSignal.objects.create(
@@ -2926,39 +3571,9 @@ class SessionViewSet(viewsets.ModelViewSet):
     def recording(self, request, pk=None):
         session = self.get_object()
         resolve_session_participant_role(request, session)
-        role = user_role(request.user)
         recording, _ = SessionRecording.objects.get_or_create(session=session)
         if request.method == "GET":
-            metadata = recording.metadata if isinstance(recording.metadata, dict) else {}
-            existing_summary = str(metadata.get("meeting_summary", "")).strip()
-            should_attempt_summary = (
-                not existing_summary
-                and role in {ROLE_MENTOR, ROLE_ADMIN}
-                and str(session.status or "").strip().lower() in {"completed", "approved", "in_progress"}
-            )
-            if should_attempt_summary:
-                try:
-                    summary_payload = generate_meeting_summary_with_ai(session, "")
-                    merged_metadata = dict(metadata)
-                    merged_metadata.update(
-                        {
-                            "meeting_summary": summary_payload.get("summary", ""),
-                            "meeting_highlights": summary_payload.get("highlights", []),
-                            "meeting_action_items": summary_payload.get("action_items", []),
-                            "summary_generated_at": timezone.now().isoformat(),
-                            "summary_model": summary_payload.get("model", ""),
-                            "summary_source": summary_payload.get("source", ""),
-                        }
-                    )
-                    recording.metadata = merged_metadata
-                    recording.save(update_fields=["metadata", "updated_at"])
-                except Exception as exc:
-                    # Keep endpoint non-blocking; expose latest error in metadata for debugging.
-                    merged_metadata = dict(metadata)
-                    merged_metadata["summary_error"] = str(exc)[:600]
-                    merged_metadata["summary_error_at"] = timezone.now().isoformat()
-                    recording.metadata = merged_metadata
-                    recording.save(update_fields=["metadata", "updated_at"])
+            # Read-only: summaries are produced by the post-session job, never by this view.
             return Response(SessionRecordingSerializer(recording, context={"request": request}).data)
 
         require_role(request, {ROLE_MENTOR, ROLE_ADMIN})
@@ -3068,16 +3683,8 @@ class SessionViewSet(viewsets.ModelViewSet):
         resolve_session_participant_role(request, session)
         require_role(request, {ROLE_MENTOR, ROLE_ADMIN})
 
-        s3_bucket = str(getattr(settings, "S3_MEDIA_BUCKET_NAME", "") or "").strip()
-        s3_region = str(getattr(settings, "AWS_S3_REGION_NAME", "") or "").strip() or "us-east-1"
-        s3_endpoint_url = str(getattr(settings, "AWS_S3_ENDPOINT_URL", "") or "").strip()
-        s3_custom_domain = str(getattr(settings, "S3_MEDIA_CUSTOM_DOMAIN", "") or "").strip()
-        expires_seconds = max(60, int(getattr(settings, "S3_PRESIGNED_UPLOAD_EXPIRES_SECONDS", 900) or 900))
-        recordings_prefix = str(
-            getattr(settings, "S3_MEDIA_RECORDINGS_PREFIX", "session_recordings") or "session_recordings"
-        ).strip().strip("/")
-
-        if not s3_bucket or not boto3:
+        s3_config = recording_s3_config()
+        if not s3_config["bucket"] or not s3_available():
             return Response(
                 {"detail": "S3 upload signing is not configured on backend."},
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -3085,36 +3692,16 @@ class SessionViewSet(viewsets.ModelViewSet):
 
         file_name = str(request.data.get("file_name", "") or "").strip()
         content_type = str(request.data.get("content_type", "") or "").strip() or "video/webm"
-        file_ext = os.path.splitext(file_name)[1].lower()
-        if not file_ext or len(file_ext) > 10:
-            file_ext = ".webm"
-        if not file_ext.startswith("."):
-            file_ext = f".{file_ext}"
-
-        key_parts = [part for part in [recordings_prefix, f"session-{session.id}"] if part]
-        key_prefix = "/".join(key_parts)
-        object_key = f"{key_prefix}/{int(time.time())}-{uuid.uuid4().hex}{file_ext}"
+        object_key = build_recording_object_key(s3_config, session.id, file_name)
         params = {
-            "Bucket": s3_bucket,
+            "Bucket": s3_config["bucket"],
             "Key": object_key,
             "ContentType": content_type,
         }
-        client_kwargs = {"region_name": s3_region}
-        if s3_endpoint_url:
-            client_kwargs["endpoint_url"] = s3_endpoint_url
-        if BotoConfig:
-            client_kwargs["config"] = BotoConfig(signature_version="s3v4")
-        aws_access_key_id = str(getattr(settings, "AWS_ACCESS_KEY_ID", "") or "").strip()
-        aws_secret_access_key = str(getattr(settings, "AWS_SECRET_ACCESS_KEY", "") or "").strip()
-        aws_session_token = str(getattr(settings, "AWS_SESSION_TOKEN", "") or "").strip()
-        if aws_access_key_id and aws_secret_access_key:
-            client_kwargs["aws_access_key_id"] = aws_access_key_id
-            client_kwargs["aws_secret_access_key"] = aws_secret_access_key
-        if aws_session_token:
-            client_kwargs["aws_session_token"] = aws_session_token
+        expires_seconds = s3_config["expires_seconds"]
 
         try:
-            s3_client = boto3.client("s3", **client_kwargs)
+            s3_client = build_recording_s3_client(s3_config)
             upload_url = s3_client.generate_presigned_url(
                 "put_object",
                 Params=params,
@@ -3130,10 +3717,10 @@ class SessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
         recording_url = build_s3_object_url(
-            bucket=s3_bucket,
+            bucket=s3_config["bucket"],
             key=object_key,
-            region=s3_region,
-            custom_domain=s3_custom_domain,
+            region=s3_config["region"],
+            custom_domain=s3_config["custom_domain"],
         )
 
         return Response(
@@ -3148,6 +3735,280 @@ class SessionViewSet(viewsets.ModelViewSet):
             }
         )
 
+    def _multipart_context(self, request, pk):
+        session = self.get_object()
+        resolve_session_participant_role(request, session)
+        require_role(request, {ROLE_MENTOR, ROLE_ADMIN})
+        s3_config = recording_s3_config()
+        if not s3_config["bucket"] or not s3_available():
+            return session, None, None, Response(
+                {"detail": "S3 upload signing is not configured on backend."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        recording, _ = SessionRecording.objects.get_or_create(session=session)
+        return session, s3_config, recording, None
+
+    def _active_multipart_upload(self, request, recording):
+        upload_id = str(
+            request.data.get("upload_id", "") or request.query_params.get("upload_id", "") or ""
+        ).strip()
+        metadata = recording.metadata if isinstance(recording.metadata, dict) else {}
+        upload = metadata.get("multipart_upload")
+        if not upload_id:
+            return None, Response({"detail": "upload_id is required."}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(upload, dict) or upload.get("upload_id") != upload_id:
+            return None, Response(
+                {"detail": "No active multipart upload with this upload_id for the session."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return upload, None
+
+    def _s3_error_response(self, message, exc):
+        return Response(
+            {
+                "detail": message,
+                "error": str(exc) if settings.DEBUG else "Check S3 configuration.",
+            },
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    @action(detail=True, methods=["post"], url_path="recording-multipart/initiate")
+    def recording_multipart_initiate(self, request, pk=None):
+        session, s3_config, recording, error_response = self._multipart_context(request, pk)
+        if error_response:
+            return error_response
+
+        file_name = str(request.data.get("file_name", "") or "").strip()
+        content_type = str(request.data.get("content_type", "") or "").strip() or "video/webm"
+        file_size = request.data.get("file_size_bytes")
+        try:
+            file_size = int(file_size) if file_size not in (None, "") else None
+        except (TypeError, ValueError):
+            return Response({"detail": "file_size_bytes must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        object_key = build_recording_object_key(s3_config, session.id, file_name)
+        part_size = recording_multipart_part_size(file_size)
+        metadata = dict(recording.metadata) if isinstance(recording.metadata, dict) else {}
+        previous = metadata.get("multipart_upload")
+
+        try:
+            s3_client = build_recording_s3_client(s3_config)
+            if isinstance(previous, dict) and previous.get("upload_id"):
+                # Starting over replaces the active upload; abort it so its parts are not billed forever.
+                try:
+                    s3_client.abort_multipart_upload(
+                        Bucket=s3_config["bucket"],
+                        Key=previous["storage_key"],
+                        UploadId=previous["upload_id"],
+                    )
+                except Exception as exc:
+                    if getattr(exc, "response", {}).get("Error", {}).get("Code") != "NoSuchUpload":
+                        raise
+            created = s3_client.create_multipart_upload(
+                Bucket=s3_config["bucket"],
+                Key=object_key,
+                ContentType=content_type,
+            )
+        except Exception as exc:
+            return self._s3_error_response("Unable to start S3 multipart upload.", exc)
+
+        upload = {
+            "upload_id": created["UploadId"],
+            "storage_key": object_key,
+            "content_type": content_type,
+            "part_size": part_size,
+            "started_at": timezone.now().isoformat(),
+        }
+        metadata["multipart_upload"] = upload
+        recording.metadata = metadata
+        if recording.status in {"not_started", "failed"}:
+            recording.status = "recording"
+            recording.started_at = recording.started_at or timezone.now()
+        recording.save()
+        return Response(
+            {
+                "provider": "s3",
+                "upload_id": upload["upload_id"],
+                "storage_key": object_key,
+                "part_size": part_size,
+                "part_count": -(-file_size // part_size) if file_size else None,
+                "max_parts": S3_MULTIPART_MAX_PARTS,
+                "sign_batch_size": int(getattr(settings, "S3_MULTIPART_SIGN_BATCH_SIZE", 100) or 100),
+            }
+        )
+
+    @action(detail=True, methods=["post"], url_path="recording-multipart/sign-parts")
+    def recording_multipart_sign_parts(self, request, pk=None):
+        _, s3_config, recording, error_response = self._multipart_context(request, pk)
+        if error_response:
+            return error_response
+        upload, error_response = self._active_multipart_upload(request, recording)
+        if error_response:
+            return error_response
+
+        raw_numbers = request.data.get("part_numbers")
+        if raw_numbers in (None, ""):
+            try:
+                start = int(request.data.get("start_part", 1))
+                count = int(request.data.get("count", 1))
+            except (TypeError, ValueError):
+                return Response({"detail": "start_part and count must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+            raw_numbers = list(range(start, start + count))
+        if not isinstance(raw_numbers, list):
+            return Response({"detail": "part_numbers must be a list."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            part_numbers = sorted({int(value) for value in raw_numbers})
+        except (TypeError, ValueError):
+            return Response({"detail": "part_numbers must contain integers."}, status=status.HTTP_400_BAD_REQUEST)
+        batch_limit = int(getattr(settings, "S3_MULTIPART_SIGN_BATCH_SIZE", 100) or 100)
+        if not part_numbers or len(part_numbers) > batch_limit:
+            return Response(
+                {"detail": f"Request between 1 and {batch_limit} part numbers per call."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if part_numbers[0] < 1 or part_numbers[-1] > S3_MULTIPART_MAX_PARTS:
+            return Response(
+                {"detail": f"Part numbers must be between 1 and {S3_MULTIPART_MAX_PARTS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        expires_seconds = s3_config["expires_seconds"]
+        try:
+            s3_client = build_recording_s3_client(s3_config)
+            urls = [
+                {
+                    "part_number": part_number,
+                    "upload_url": presigned_url(
+                        s3_client,
+                        "upload_part",
+                        {
+                            "Bucket": s3_config["bucket"],
+                            "Key": upload["storage_key"],
+                            "UploadId": upload["upload_id"],
+                            "PartNumber": part_number,
+                        },
+                        expires_in=expires_seconds,
+                        http_method="PUT",
+                    ),
+                }
+                for part_number in part_numbers
+            ]
+        except Exception as exc:
+            return self._s3_error_response("Unable to sign S3 upload parts.", exc)
+        return Response({"upload_id": upload["upload_id"], "method": "PUT", "expires_in": expires_seconds, "parts": urls})
+
+    @action(detail=True, methods=["get"], url_path="recording-multipart/parts")
+    def recording_multipart_parts(self, request, pk=None):
+        _, s3_config, recording, error_response = self._multipart_context(request, pk)
+        if error_response:
+            return error_response
+        upload, error_response = self._active_multipart_upload(request, recording)
+        if error_response:
+            return error_response
+        try:
+            parts = list_recording_upload_parts(
+                build_recording_s3_client(s3_config),
+                bucket=s3_config["bucket"],
+                key=upload["storage_key"],
+                upload_id=upload["upload_id"],
+            )
+        except Exception as exc:
+            return self._s3_error_response("Unable to list S3 upload parts.", exc)
+        return Response(
+            {
+                "upload_id": upload["upload_id"],
+                "storage_key": upload["storage_key"],
+                "part_size": upload.get("part_size"),
+                "parts": parts,
+            }
+        )
+
+    @action(detail=True, methods=["post"], url_path="recording-multipart/complete")
+    def recording_multipart_complete(self, request, pk=None):
+        _, s3_config, recording, error_response = self._multipart_context(request, pk)
+        if error_response:
+            return error_response
+        upload, error_response = self._active_multipart_upload(request, recording)
+        if error_response:
+            return error_response
+        try:
+            part_count = int(request.data.get("part_count"))
+        except (TypeError, ValueError):
+            return Response({"detail": "part_count must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= part_count <= S3_MULTIPART_MAX_PARTS:
+            return Response(
+                {"detail": f"part_count must be between 1 and {S3_MULTIPART_MAX_PARTS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            s3_client = build_recording_s3_client(s3_config)
+            # S3's own part list is authoritative; client-reported ETags are not trusted.
+            parts = list_recording_upload_parts(
+                s3_client,
+                bucket=s3_config["bucket"],
+                key=upload["storage_key"],
+                upload_id=upload["upload_id"],
+            )
+            # S3 would happily stitch a gap into a truncated object, so insist on exactly parts 1..N.
+            uploaded = {item["part_number"] for item in parts}
+            if uploaded != set(range(1, part_count + 1)):
+                return Response(
+                    {
+                        "detail": "The uploaded parts do not match part_count.",
+                        "missing_parts": sorted(set(range(1, part_count + 1)) - uploaded)[:100],
+                        "unexpected_parts": sorted(uploaded - set(range(1, part_count + 1)))[:100],
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+            s3_client.complete_multipart_upload(
+                Bucket=s3_config["bucket"],
+                Key=upload["storage_key"],
+                UploadId=upload["upload_id"],
+                MultipartUpload={
+                    "Parts": [{"PartNumber": item["part_number"], "ETag": item["etag"]} for item in parts]
+                },
+            )
+        except Exception as exc:
+            return self._s3_error_response("Unable to complete S3 multipart upload.", exc)
+
+        metadata = dict(recording.metadata) if isinstance(recording.metadata, dict) else {}
+        metadata.pop("multipart_upload", None)
+        recording.metadata = metadata
+        recording.storage_key = upload["storage_key"]
+        recording.recording_url = build_s3_object_url(
+            bucket=s3_config["bucket"],
+            key=upload["storage_key"],
+            region=s3_config["region"],
+            custom_domain=s3_config["custom_domain"],
+        )
+        recording.file_size_bytes = sum(item["size"] for item in parts)
+        recording.status = "uploaded"
+        recording.ended_at = recording.ended_at or timezone.now()
+        recording.save()
+        return Response(SessionRecordingSerializer(recording, context={"request": request}).data)
+
+    @action(detail=True, methods=["post"], url_path="recording-multipart/abort")
+    def recording_multipart_abort(self, request, pk=None):
+        _, s3_config, recording, error_response = self._multipart_context(request, pk)
+        if error_response:
+            return error_response
+        upload, error_response = self._active_multipart_upload(request, recording)
+        if error_response:
+            return error_response
+        try:
+            build_recording_s3_client(s3_config).abort_multipart_upload(
+                Bucket=s3_config["bucket"],
+                Key=upload["storage_key"],
+                UploadId=upload["upload_id"],
+            )
+        except Exception as exc:
+            return self._s3_error_response("Unable to abort S3 multipart upload.", exc)
+        metadata = dict(recording.metadata) if isinstance(recording.metadata, dict) else {}
+        metadata.pop("multipart_upload", None)
+        recording.metadata = metadata
+        recording.save(update_fields=["metadata", "updated_at"])
+        return Response({"upload_id": upload["upload_id"], "aborted": True})
+
     @action(detail=True, methods=["post"], url_path="analyze-transcript")
     def analyze_transcript(self, request, pk=None):
         session = self.get_object()
@@ -3236,20 +4097,7 @@ class SessionViewSet(viewsets.ModelViewSet):
         if generate_summary:
             try:
                 summary_payload = generate_meeting_summary_with_ai(session, transcript)
-                recording, _ = SessionRecording.objects.get_or_create(session=session)
-                merged_metadata = dict(recording.metadata or {})
-                merged_metadata.update(
-                    {
-                        "meeting_summary": summary_payload.get("summary", ""),
-                        "meeting_highlights": summary_payload.get("highlights", []),
-                        "meeting_action_items": summary_payload.get("action_items", []),
-                        "summary_generated_at": timezone.now().isoformat(),
-                        "summary_model": summary_payload.get("model", ""),
-                        "summary_source": summary_payload.get("source", ""),
-                    }
-                )
-                recording.metadata = merged_metadata
-                recording.save(update_fields=["metadata", "updated_at"])
+                store_session_summary(session, summary_payload)
             except Exception as exc:
                 summary_error = str(exc)
 
@@ -3443,6 +4291,19 @@ class SessionViewSet(viewsets.ModelViewSet):
         # Frame hash for short-term duplicate suppression after incident creation.
         frame_hash = hashlib.sha1(frame_data_url[:4000].encode("utf-8")).hexdigest()
         dedupe_key = f"session:{session.id}:vision:{speaker_role}:{frame_hash}"
+        if cache.get(dedupe_key):
+            # Same frame already produced an incident in this window; skip the vision call entirely.
+            return Response(
+                {
+                    "flagged": False,
+                    "suppressed": True,
+                    "reason": "duplicate_frame",
+                    "incident_type": "unknown",
+                    "severity": "low",
+                    "recommended_action": "none",
+                    "confidence_score": 0.0,
+                }
+            )
 
         analysis = classify_video_behavior_frame(
             frame_data_url=frame_data_url,
@@ -3531,8 +4392,8 @@ class SessionViewSet(viewsets.ModelViewSet):
             1, consecutive_required_map.get(incident_type, global_consecutive_required)
         )
         streak_key = f"session:{session.id}:vision-streak:{speaker_role}:{incident_type}"
-        streak_count = int(cache.get(streak_key, 0) or 0) + 1
-        cache.set(streak_key, streak_count, timeout=40)
+        streak_count = incr_counter(streak_key, timeout=40)
+        cache.touch(streak_key, 40)
         if streak_count < consecutive_required:
             return Response(
                 {
@@ -3551,7 +4412,8 @@ class SessionViewSet(viewsets.ModelViewSet):
 
         cooldown_seconds = max(2, int(os.environ.get("VISION_ALERT_COOLDOWN_SECONDS", "8")))
         cooldown_key = f"session:{session.id}:vision-cooldown:{speaker_role}:{incident_type}"
-        if cache.get(cooldown_key):
+        # Claiming the cooldown atomically means only one worker turns a detection into an incident.
+        if not acquire_guard(cooldown_key, timeout=cooldown_seconds):
             return Response(
                 {
                     "flagged": False,
@@ -3563,19 +4425,6 @@ class SessionViewSet(viewsets.ModelViewSet):
                     "confidence_score": confidence_score,
                 }
             )
-        duplicate_window_seconds = max(1, int(os.environ.get("VISION_FRAME_DEDUP_SECONDS", "1")))
-        if cache.get(dedupe_key):
-            return Response(
-                {
-                    "flagged": False,
-                    "suppressed": True,
-                    "reason": "duplicate_frame",
-                    "incident_type": incident_type,
-                    "severity": analysis.get("severity", "low"),
-                    "recommended_action": analysis.get("recommended_action", "none"),
-                    "confidence_score": confidence_score,
-                }
-            )
 
         if speaker_role == "mentee":
             snapshot = mentee_snapshot_for_incident(session)
@@ -3636,7 +4485,7 @@ class SessionViewSet(viewsets.ModelViewSet):
                 },
             )
 
-        cache.set(cooldown_key, 1, timeout=cooldown_seconds)
+        duplicate_window_seconds = max(1, int(os.environ.get("VISION_FRAME_DEDUP_SECONDS", "1")))
         cache.set(dedupe_key, 1, timeout=duplicate_window_seconds)
         return Response(
             {
@@ -3730,13 +4579,8 @@ class SessionViewSet(viewsets.ModelViewSet):
                     "note": note,
                 },
             )
-            wallet, _ = MentorWallet.objects.get_or_create(mentor=session.mentor)
-
             if action_name == "claim":
-                wallet.pending_payout += amount
-                wallet.total_claimed += amount
-                wallet.save(update_fields=["pending_payout", "total_claimed", "updated_at"])
-                PayoutTransaction.objects.create(
+                payout_tx = PayoutTransaction.objects.create(
                     mentor=session.mentor,
                     session=session,
                     transaction_type="session_claim",
@@ -3744,9 +4588,29 @@ class SessionViewSet(viewsets.ModelViewSet):
                     amount=amount,
                     note=note,
                 )
+                post_wallet_entries(
+                    [
+                        WalletLedgerEntry(
+                            mentor_id=session.mentor_id,
+                            entry_type="claim",
+                            pending_payout_delta=amount,
+                            total_claimed_delta=amount,
+                            session=session,
+                            payout_transaction=payout_tx,
+                        )
+                    ]
+                )
             elif action_name == "donate":
-                wallet.total_donated += amount
-                wallet.save(update_fields=["total_donated", "updated_at"])
+                post_wallet_entries(
+                    [
+                        WalletLedgerEntry(
+                            mentor_id=session.mentor_id,
+                            entry_type="donation",
+                            total_donated_delta=amount,
+                            session=session,
+                        )
+                    ]
+                )
                 DonationTransaction.objects.update_or_create(
                     session=session,
                     defaults={
@@ -3841,9 +4705,16 @@ class MentorIdentityVerificationViewSet(viewsets.ModelViewSet):
         if role != ROLE_ADMIN and self._request_has_review_control_fields():
             raise PermissionDenied("Only admins can update document review decisions.")
         if role == ROLE_MENTOR:
-            serializer.save(mentor_id=current_mentor_id(self.request))
-            return
-        serializer.save()
+            verification = serializer.save(mentor_id=current_mentor_id(self.request))
+        else:
+            verification = serializer.save()
+        self._capture_document_metadata(verification)
+
+    def _capture_document_metadata(self, verification):
+        uploaded_files = getattr(self.request, "FILES", None) or {}
+        field_names = [name for name in IDENTITY_DOCUMENT_FIELDS if name in uploaded_files]
+        if field_names:
+            capture_document_metadata(verification, field_names, uploaded_files=uploaded_files)
 
     def _request_has_review_control_fields(self):
         request_data = getattr(self.request, "data", {}) or {}
@@ -3982,6 +4853,7 @@ class MentorIdentityVerificationViewSet(viewsets.ModelViewSet):
             }
 
         verification = serializer.save()
+        self._capture_document_metadata(verification)
         if role == ROLE_MENTOR:
             self._reset_review_for_mentor_resubmission(
                 verification,
@@ -4233,21 +5105,30 @@ class TrainingModuleViewSet(viewsets.ReadOnlyModelViewSet):
             if latest_resolved_attempt
             else None
         )
-        generated_by = "openai"
+        generated_by = "question_bank"
         questions = []
         try:
-            for _ in range(3):
-                questions, generated_by = generate_training_quiz_questions(
-                    modules, total_questions=total_questions
-                )
-                if not latest_signature or quiz_questions_signature(questions) != latest_signature:
-                    break
-        except Exception as exc:
-            payload = {"detail": "Unable to generate quiz from OpenAI right now. Please try again."}
-            if settings.DEBUG:
-                payload["debug_error"] = str(exc)
-                payload["debug_error_type"] = exc.__class__.__name__
-            return Response(payload, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            # Pre-generated pool: assembled locally with no overlap with the last attempt.
+            questions = assemble_quiz_from_bank(
+                modules,
+                total_questions=total_questions,
+                exclude_questions=latest_resolved_attempt.questions if latest_resolved_attempt else None,
+            )
+        except QuestionBankUnavailable:
+            generated_by = "openai"
+            try:
+                for _ in range(3):
+                    questions, generated_by = generate_training_quiz_questions(
+                        modules, total_questions=total_questions
+                    )
+                    if not latest_signature or quiz_questions_signature(questions) != latest_signature:
+                        break
+            except Exception as exc:
+                payload = {"detail": "Unable to generate quiz from OpenAI right now. Please try again."}
+                if settings.DEBUG:
+                    payload["debug_error"] = str(exc)
+                    payload["debug_error_type"] = exc.__class__.__name__
+                return Response(payload, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
         if latest_signature and quiz_questions_signature(questions) == latest_signature:
             return Response(
@@ -4535,6 +5416,27 @@ class MentorWalletViewSet(
             queryset = queryset.filter(mentor_id=mentor_id)
         return queryset
 
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            locked = MentorWallet.objects.select_for_update().get(pk=serializer.instance.pk)
+            previous = {field_name: getattr(locked, field_name) for field_name in WALLET_BALANCE_FIELDS}
+            # Save onto the locked copy so only the edited fields change; a stale row would undo concurrent postings.
+            serializer.instance = locked
+            wallet = serializer.save()
+            record_wallet_adjustment(wallet, previous, note="Updated through the wallet API.")
+
+    @action(detail=True, methods=["get"], url_path="balance")
+    def balance(self, request, pk=None):
+        wallet = self.get_object()
+        raw_as_of = str(request.query_params.get("as_of") or "").strip()
+        as_of = parse_datetime(raw_as_of) if raw_as_of else None
+        if raw_as_of and as_of is None:
+            return Response({"detail": "as_of must be an ISO 8601 datetime."}, status=status.HTTP_400_BAD_REQUEST)
+        if as_of is not None and timezone.is_naive(as_of):
+            as_of = timezone.make_aware(as_of)
+        balances = wallet_balance(wallet.mentor_id, as_of=as_of)
+        return Response({"mentor": wallet.mentor_id, "as_of": as_of or timezone.now(), **balances})
+
 
 class PayoutTransactionViewSet(viewsets.ModelViewSet):
     queryset = PayoutTransaction.objects.all().select_related("mentor", "session").order_by("-created_at")
@@ -4566,25 +5468,26 @@ class PayoutTransactionViewSet(viewsets.ModelViewSet):
     def _sync_wallet_pending_payout(self, payout_tx, previous_status, next_status):
         if previous_status == next_status:
             return
-        wallet, _ = MentorWallet.objects.get_or_create(mentor=payout_tx.mentor)
         amount = payout_tx.amount or Decimal("0.00")
 
         if previous_status != "paid" and next_status == "paid":
+            wallet = lock_wallets([payout_tx.mentor_id])[payout_tx.mentor_id]
             if wallet.pending_payout < amount:
                 raise ValidationError("Pending payout is lower than the payout transaction amount.")
-            wallet.pending_payout -= amount
-            wallet.save(update_fields=["pending_payout", "updated_at"])
+            post_wallet_entries([payout_entry(payout_tx, "payout_settled")])
             return
 
         if previous_status == "paid" and next_status != "paid":
-            wallet.pending_payout += amount
-            wallet.save(update_fields=["pending_payout", "updated_at"])
+            lock_wallets([payout_tx.mentor_id])
+            post_wallet_entries([payout_entry(payout_tx, "payout_reopened")])
 
     def perform_update(self, serializer):
-        existing = self.get_object()
-        previous_status = existing.status
-
         with transaction.atomic():
+            # Lock the payout before its wallet, in settle_payouts' order, and take the status
+            # from the locked row so racing PATCHes or settlement runs cannot both settle it.
+            locked = PayoutTransaction.objects.select_for_update().get(pk=serializer.instance.pk)
+            previous_status = locked.status
+            serializer.instance = locked
             payout_tx = serializer.save()
             self._sync_wallet_pending_payout(payout_tx, previous_status, payout_tx.status)
             if previous_status != "paid" and payout_tx.status == "paid" and not payout_tx.processed_at:
@@ -4600,24 +5503,40 @@ class PayoutTransactionViewSet(viewsets.ModelViewSet):
         if payout_tx.status == "paid":
             return Response(self.get_serializer(payout_tx).data)
 
-        reference_id = str(request.data.get("reference_id") or "").strip()
-        note = request.data.get("note")
-
-        with transaction.atomic():
-            self._sync_wallet_pending_payout(payout_tx, payout_tx.status, "paid")
-            payout_tx.status = "paid"
-            payout_tx.processed_at = timezone.now()
-            update_fields = ["status", "processed_at", "updated_at"]
-            if reference_id:
-                payout_tx.reference_id = reference_id
-                update_fields.append("reference_id")
-            if note is not None:
-                payout_tx.note = str(note)
-                update_fields.append("note")
-            payout_tx.save(update_fields=update_fields)
-
+        report = settle_payouts(
+            payout_ids=[payout_tx.id],
+            reference_id=request.data.get("reference_id"),
+            note=request.data.get("note"),
+        )
+        if report["skipped"]:
+            raise ValidationError(report["skipped"][0]["reason"])
+        payout_tx.refresh_from_db()
         return Response(self.get_serializer(payout_tx).data)
 
+    @action(detail=False, methods=["post"], url_path="settle")
+    def settle(self, request):
+        require_role(request, {ROLE_ADMIN})
+        serializer = PayoutSettlementRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        queryset = PayoutTransaction.objects.all()
+        if data.get("statuses") or not data.get("payout_ids"):
+            queryset = queryset.filter(status__in=data.get("statuses") or SETTLEABLE_STATUSES)
+        if data.get("mentor_id"):
+            queryset = queryset.filter(mentor_id=data["mentor_id"])
+        if data.get("transaction_type"):
+            queryset = queryset.filter(transaction_type=data["transaction_type"])
+        if data.get("created_before"):
+            queryset = queryset.filter(created_at__lt=data["created_before"])
+        report = settle_payouts(
+            queryset,
+            payout_ids=data.get("payout_ids"),
+            reference_id=data.get("reference_id", ""),
+            note=data.get("note"),
+            dry_run=data.get("dry_run", False),
+        )
+        return Response(PayoutSettlementReportSerializer(report).data)
+
 
 class DonationTransactionViewSet(viewsets.ModelViewSet):
     queryset = DonationTransaction.objects.all().select_related("mentor", "session").order_by("-created_at")
@@ -0,0 +1,169 @@
+"""
+Audio pre-processing ahead of speech-to-text uploads.
+
+A cheap energy-based voice activity check drops silent chunks before they cost
+a transcription round trip, and short consecutive chunks from the same session
+speaker are coalesced into one larger upload; the realtime transcript endpoint
+flushes what is left when the client sends ``final``. Only PCM audio (WAV or raw L16)
+can be decoded with the standard library; compressed formats such as webm/opus
+pass through untouched.
+"""
+import io
+import math
+import os
+import time
+import wave
+from array import array
+
+from django.core.cache import cache
+
+PCM_CONTENT_TYPES = {"audio/wav", "audio/x-wav", "audio/wave", "audio/vnd.wave"}
+RAW_PCM_CONTENT_TYPES = {"audio/l16", "audio/pcm"}
+SAMPLE_TYPECODES = {1: "b", 2: "h", 4: "i"}
+
+
+def _env_float(env_key: str, default: float) -> float:
+    try:
+        return float(os.environ.get(env_key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _content_type_params(content_type: str):
+    base, *params = [part.strip() for part in str(content_type or "").lower().split(";")]
+    values = {}
+    for param in params:
+        key, _, value = param.partition("=")
+        values[key.strip()] = value.strip()
+    return base, values
+
+
+def may_be_pcm(content_type: str, head: bytes = b"") -> bool:
+    base, _ = _content_type_params(content_type)
+    return base in PCM_CONTENT_TYPES or base in RAW_PCM_CONTENT_TYPES or head[:4] == b"RIFF"
+
+
+def decode_pcm(audio_bytes: bytes, content_type: str = ""):
+    """
+    Return ``(pcm_bytes, (channels, sample_width, frame_rate))`` or ``None``.
+
+    ``None`` means the format cannot be decoded here and the caller should
+    upload the chunk as-is.
+    """
+    base, params = _content_type_params(content_type)
+    if base in RAW_PCM_CONTENT_TYPES:
+        try:
+            frame_rate = int(params.get("rate", 16000))
+            channels = int(params.get("channels", 1))
+        except ValueError:
+            return None
+        return audio_bytes, (channels, 2, frame_rate)
+    if base in PCM_CONTENT_TYPES or audio_bytes[:4] == b"RIFF":
+        try:
+            with wave.open(io.BytesIO(audio_bytes), "rb") as reader:
+                shape = (reader.getnchannels(), reader.getsampwidth(), reader.getframerate())
+                return reader.readframes(reader.getnframes()), shape
+        except (wave.Error, EOFError):
+            return None
+    return None
+
+
+def encode_wav(pcm_bytes: bytes, shape) -> bytes:
+    channels, sample_width, frame_rate = shape
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(frame_rate)
+        writer.writeframes(pcm_bytes)
+    return buffer.getvalue()
+
+
+def pcm_duration_seconds(pcm_bytes: bytes, shape) -> float:
+    channels, sample_width, frame_rate = shape
+    bytes_per_second = channels * sample_width * frame_rate
+    return len(pcm_bytes) / bytes_per_second if bytes_per_second else 0.0
+
+
+def speech_ratio(pcm_bytes: bytes, shape, *, frame_ms: int = 30) -> float:
+    """Share of ``frame_ms`` frames whose RMS energy is above the speech threshold."""
+    channels, sample_width, frame_rate = shape
+    typecode = SAMPLE_TYPECODES.get(sample_width)
+    if not typecode or not frame_rate:
+        return 1.0
+    usable = len(pcm_bytes) - len(pcm_bytes) % sample_width
+    samples = array(typecode, pcm_bytes[:usable])
+    if sample_width == 1:
+        # 8-bit WAV is unsigned; re-centre around zero.
+        samples = array("h", (sample + 128 if sample < 0 else sample - 128 for sample in samples))
+        full_scale = 128.0
+    else:
+        full_scale = float(2 ** (8 * sample_width - 1))
+
+    threshold_dbfs = _env_float("AUDIO_VAD_THRESHOLD_DBFS", -45.0)
+    threshold = full_scale * (10 ** (threshold_dbfs / 20))
+    frame_size = max(1, int(frame_rate * frame_ms / 1000) * channels)
+    frames = 0
+    voiced = 0
+    for start in range(0, len(samples), frame_size):
+        window = samples[start : start + frame_size]
+        if not window:
+            continue
+        frames += 1
+        rms = math.sqrt(sum(value * value for value in window) / len(window))
+        if rms >= threshold:
+            voiced += 1
+    return voiced / frames if frames else 0.0
+
+
+def is_silent(pcm_bytes: bytes, shape) -> bool:
+    return speech_ratio(pcm_bytes, shape) < _env_float("AUDIO_VAD_MIN_SPEECH_RATIO", 0.05)
+
+
+def _buffer_key(session_id, speaker_role: str) -> str:
+    return f"audio-coalesce:{session_id}:{speaker_role or 'unknown'}"
+
+
+def coalesce_chunk(session_id, speaker_role: str, pcm_bytes: bytes, shape, *, flush: bool = False):
+    """
+    Buffer short voiced chunks per session speaker.
+
+    Returns the WAV bytes to upload once the buffer holds at least
+    ``AUDIO_COALESCE_MIN_SECONDS`` of audio (or on ``flush``), else ``None``.
+    """
+    min_seconds = _env_float("AUDIO_COALESCE_MIN_SECONDS", 8.0)
+    max_age = _env_float("AUDIO_COALESCE_MAX_AGE_SECONDS", 30.0)
+    buffer_key = _buffer_key(session_id, speaker_role)
+    buffered = cache.get(buffer_key)
+    now = time.time()
+    if isinstance(buffered, dict) and tuple(buffered.get("shape") or ()) != tuple(shape):
+        # The recorder changed format mid-session; send what we have and start over.
+        cache.set(buffer_key, {"shape": tuple(shape), "pcm": pcm_bytes, "started_at": now}, timeout=int(max_age * 2) or 60)
+        return encode_wav(buffered["pcm"], buffered["shape"])
+    if not isinstance(buffered, dict):
+        buffered = {"shape": tuple(shape), "pcm": b"", "started_at": now}
+    buffered["pcm"] += pcm_bytes
+    if not buffered["pcm"]:
+        cache.delete(buffer_key)
+        return None
+
+    ready = (
+        flush
+        or pcm_duration_seconds(buffered["pcm"], shape) >= min_seconds
+        or now - buffered["started_at"] >= max_age
+    )
+    if not ready:
+        cache.set(buffer_key, buffered, timeout=int(max_age * 2) or 60)
+        return None
+    cache.delete(buffer_key)
+    return encode_wav(buffered["pcm"], shape)
+
+
+def flush_coalesced(session_id, speaker_role: str):
+    """WAV bytes of whatever is still buffered for the session speaker, or ``None``; clears the buffer."""
+    buffer_key = _buffer_key(session_id, speaker_role)
+    buffered = cache.get(buffer_key)
+    cache.delete(buffer_key)
+    if not isinstance(buffered, dict) or not buffered.get("pcm"):
+        return None
+    return encode_wav(buffered["pcm"], buffered["shape"])
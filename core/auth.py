@@ -5,6 +5,7 @@ from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from .authentication import add_identity_claims
 from .models import AdminAccount, UserProfile
 
 
@@ -25,9 +26,7 @@ class BondRoomTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
-        token['role'] = cls.get_user_role(user)
-        token['email'] = user.email
-        return token
+        return add_identity_claims(token, user, role=cls.get_user_role(user))
 
     @staticmethod
     def get_user_role(user):
@@ -0,0 +1,154 @@
+"""
+Stateless JWT authentication.
+
+Issued tokens carry the user's role, mentee/mentor profile ids and a token
+version, so API requests are authorised from signed claims instead of loading
+the user, profile and admin account rows on every call. Bumping the user's
+``UserTokenVersion`` (on a role change, an admin account change or removal,
+deactivation or an explicit ``revoke_user_tokens``) invalidates every token
+issued before it. The version lives in its own row rather than on
+``UserProfile`` because admins that exist only as an ``AdminAccount`` have no
+profile.
+"""
+import os
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils.functional import cached_property
+from rest_framework import exceptions
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import Mentee, Mentor, UserTokenVersion
+
+TOKEN_VERSION_CLAIM = "tv"
+
+
+def _token_version_cache_key(user_id) -> str:
+    return f"auth:token-version:{user_id}"
+
+
+def load_token_version(user_id):
+    """Current token version from the DB, or ``None`` when the user is gone or inactive."""
+    rows = list(
+        get_user_model()
+        .objects.filter(pk=user_id, is_active=True)
+        .values_list("token_version__version", flat=True)[:1]
+    )
+    if not rows:
+        return None
+    return rows[0] or 0
+
+
+def current_token_version(user_id, *, claimed=None):
+    """
+    Cached token version for ``user_id``.
+
+    A cached value that disagrees with ``claimed`` is re-read from the DB, so a
+    stale entry never rejects a valid token; revocations reach the cache through
+    ``forget_token_version``.
+    """
+    cache_key = _token_version_cache_key(user_id)
+    version = cache.get(cache_key)
+    if version is not None and (claimed is None or version == claimed):
+        return version
+    version = load_token_version(user_id)
+    if version is not None:
+        cache.set(cache_key, version, timeout=int(os.environ.get("JWT_TOKEN_VERSION_CACHE_SECONDS", "300")))
+    return version
+
+
+def forget_token_version(user_id):
+    # Drop the cached copy only once the change is visible to other connections.
+    transaction.on_commit(lambda: cache.delete(_token_version_cache_key(user_id)))
+
+
+def bump_token_version(user_id):
+    """Advance ``user_id``'s token version, creating its row on first use."""
+    if not UserTokenVersion.objects.filter(user_id=user_id).update(version=F("version") + 1):
+        version, created = UserTokenVersion.objects.get_or_create(user_id=user_id, defaults={"version": 1})
+        if not created:
+            # Another writer created the row between the update and the insert.
+            UserTokenVersion.objects.filter(pk=version.pk).update(version=F("version") + 1)
+    forget_token_version(user_id)
+
+
+def revoke_user_tokens(user):
+    """Invalidate every access and refresh token already issued to ``user``."""
+    bump_token_version(user.pk)
+
+
+def add_identity_claims(token, user, role):
+    """
+    Embed what request handling needs to skip the auth DB round trips.
+
+    Profile ids are looked up by email, matching ``current_mentee_id`` and
+    ``current_mentor_id``; a missing id is left out so it is resolved per request.
+    Superusers always get the admin role, as ``user_role`` gives them.
+    """
+    token["role"] = "admin" if user.is_superuser else role
+    token["email"] = user.email
+    token[TOKEN_VERSION_CLAIM] = load_token_version(user.pk) or 0
+    mentee_id = Mentee.objects.filter(email=user.email).values_list("id", flat=True).first()
+    mentor_id = Mentor.objects.filter(email=user.email).values_list("id", flat=True).first()
+    if mentee_id:
+        token["mentee_id"] = mentee_id
+    if mentor_id:
+        token["mentor_id"] = mentor_id
+    return token
+
+
+class ClaimsUser(TokenUser):
+    """Request user rebuilt from signed claims; never loaded from the DB."""
+
+    @cached_property
+    def email(self) -> str:
+        return self.token.get("email", "")
+
+    @cached_property
+    def role(self):
+        return self.token.get("role") or None
+
+    @cached_property
+    def mentee_id(self):
+        return self.token.get("mentee_id")
+
+    @cached_property
+    def mentor_id(self):
+        return self.token.get("mentor_id")
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    Trust role and profile-id claims instead of loading the user on every request.
+
+    The only per-request lookup is the user's token version, served from the
+    cache, so a role change or ``revoke_user_tokens`` call takes effect within
+    the cache's local TTL. Tokens issued before the claims existed, and admin
+    writes, still go through the full DB path.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        if TOKEN_VERSION_CLAIM not in validated_token:
+            return self.get_user(validated_token), validated_token
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        sensitive = validated_token.get("role") == "admin" and request.method not in SAFE_METHODS
+        claimed = validated_token[TOKEN_VERSION_CLAIM]
+        version = load_token_version(user_id) if sensitive else current_token_version(user_id, claimed=claimed)
+        if version is None or version != claimed:
+            raise exceptions.AuthenticationFailed("Token has been revoked.", code="token_revoked")
+        if sensitive:
+            return self.get_user(validated_token), validated_token
+        return ClaimsUser(validated_token), validated_token
@@ -0,0 +1,318 @@
+"""
+Availability search across mentors.
+
+Concrete ``MentorAvailabilitySlot`` rows carry an interval index: the UTC day
+of ``start_time`` plus start/end minutes from that midnight. Slots are capped at
+``MAX_SLOT_LENGTH``, so any slot overlapping a window starts on one of the
+window's days or the day before. A window search is then a bounded range scan
+on ``(start_day, start_minute)`` instead of a walk over every slot.
+``Mentor.availability`` JSON is normalized once into ``MentorWeeklyAvailability``
+rows (weekday plus minutes in the mentor's timezone) whenever it changes, so
+recurring availability can be filtered in SQL instead of re-parsing
+``"HH:MM"`` strings per request. ``materialize_recurring_slots`` expands those
+rows into concrete ``source="recurring"`` slots for a rolling horizon, so
+bookable recurring time is plain rows in the slot table.
+"""
+import os
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import MentorAvailabilitySlot, MentorWeeklyAvailability, Session
+
+MAX_SLOT_LENGTH = timedelta(hours=24)
+BOOKED_SESSION_STATUSES = ("requested", "approved", "scheduled")
+MINUTES_PER_DAY = 24 * 60
+MATERIALIZE_BATCH_SIZE = 500
+
+_WEEKDAY_LOOKUP = {}
+for _index, _name in enumerate(MentorWeeklyAvailability.WEEKDAYS):
+    _WEEKDAY_LOOKUP[_name.lower()] = _index
+    _WEEKDAY_LOOKUP[_name[:3].lower()] = _index
+
+
+def parse_hhmm(value):
+    """Minutes after midnight for ``"HH:MM"`` (``"24:00"`` allowed), or ``None``."""
+    try:
+        hour, minute = str(value or "").strip().split(":")[:2]
+        minutes = int(hour) * 60 + int(minute)
+    except (TypeError, ValueError):
+        return None
+    if not 0 <= int(minute) < 60 or not 0 <= minutes <= MINUTES_PER_DAY:
+        return None
+    return minutes
+
+
+def normalize_weekly_availability(entries) -> list:
+    """
+    ``[(weekday, start_minute, end_minute), ...]`` from ``Mentor.availability`` JSON.
+
+    Accepts ``start``/``end`` or ``from``/``to`` keys and full or three-letter
+    day names; overlapping or touching ranges on the same day are merged and
+    invalid entries dropped.
+    """
+    ranges = defaultdict(list)
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        weekday = _WEEKDAY_LOOKUP.get(str(entry.get("day") or "").strip().lower())
+        start = parse_hhmm(entry.get("start", entry.get("from")))
+        end = parse_hhmm(entry.get("end", entry.get("to")))
+        if weekday is None or start is None or end is None or end <= start:
+            continue
+        ranges[weekday].append((start, end))
+
+    normalized = []
+    for weekday in sorted(ranges):
+        merged = []
+        for start, end in sorted(ranges[weekday]):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        normalized.extend((weekday, start, end) for start, end in merged)
+    return normalized
+
+
+def sync_weekly_availability(mentor) -> bool:
+    """Rebuild ``mentor``'s weekly rows from its JSON; returns whether anything changed."""
+    wanted = {(weekday, start, end, mentor.timezone or "") for weekday, start, end in normalize_weekly_availability(mentor.availability)}
+    existing = set(
+        MentorWeeklyAvailability.objects.filter(mentor_id=mentor.pk).values_list(
+            "weekday", "start_minute", "end_minute", "timezone"
+        )
+    )
+    if wanted == existing:
+        return False
+    with transaction.atomic():
+        MentorWeeklyAvailability.objects.filter(mentor_id=mentor.pk).delete()
+        MentorWeeklyAvailability.objects.bulk_create(
+            [
+                MentorWeeklyAvailability(
+                    mentor_id=mentor.pk,
+                    weekday=weekday,
+                    start_minute=start,
+                    end_minute=end,
+                    timezone=timezone_name,
+                )
+                for weekday, start, end, timezone_name in sorted(wanted)
+            ]
+        )
+    return True
+
+
+def weekly_available_mentor_ids(weekday: int, start_minute: int, end_minute: int):
+    """Mentors whose recurring availability covers ``[start_minute, end_minute)`` on ``weekday`` (mentor-local)."""
+    return (
+        MentorWeeklyAvailability.objects.filter(
+            weekday=weekday,
+            start_minute__lte=start_minute,
+            end_minute__gte=end_minute,
+        )
+        .values_list("mentor_id", flat=True)
+        .distinct()
+    )
+
+
+def overlapping_slots(window_start, window_end, *, mentor_ids=None):
+    """Open, unheld slots overlapping ``[window_start, window_end)``, found through the day-bucket index."""
+    first_day = (window_start.astimezone(dt_timezone.utc) - MAX_SLOT_LENGTH).date()
+    last_day = window_end.astimezone(dt_timezone.utc).date()
+    now = timezone.now()
+    queryset = MentorAvailabilitySlot.objects.filter(
+        start_day__range=(first_day, last_day),
+        is_available=True,
+        start_time__lt=window_end,
+        end_time__gt=window_start,
+    ).filter(Q(held_until__isnull=True) | Q(held_until__lte=now))
+    if mentor_ids is not None:
+        queryset = queryset.filter(mentor_id__in=list(mentor_ids))
+    return queryset
+
+
+def booked_intervals(mentor_ids, window_start, window_end) -> dict:
+    """``{mentor_id: [(start, end), ...]}`` for sessions that hold time inside the window."""
+    booked = defaultdict(list)
+    sessions = Session.objects.filter(
+        mentor_id__in=list(mentor_ids),
+        status__in=BOOKED_SESSION_STATUSES,
+        scheduled_start__lt=window_end,
+        scheduled_end__gt=window_start,
+    ).values_list("mentor_id", "scheduled_start", "scheduled_end")
+    for mentor_id, start, end in sessions:
+        booked[mentor_id].append((start, end))
+    for intervals in booked.values():
+        intervals.sort()
+    return booked
+
+
+def _free_gaps(start, end, busy, minimum: timedelta):
+    cursor = start
+    for busy_start, busy_end in busy:
+        if busy_end <= cursor:
+            continue
+        if busy_start >= end:
+            break
+        if busy_start - cursor >= minimum:
+            yield cursor, busy_start
+        cursor = max(cursor, busy_end)
+    if end - cursor >= minimum:
+        yield cursor, end
+
+
+def find_free_slots(window_start: datetime, window_end: datetime, *, duration_minutes: int, mentor_ids=None, limit: int = 200) -> list:
+    """
+    Open time inside ``[window_start, window_end)`` of at least ``duration_minutes``.
+
+    Each result is a dict with the slot, its mentor and one free ``start``/``end``
+    range clipped to the window with booked sessions cut out. A slot split by a
+    session can yield several ranges. Results are ordered by start time.
+    """
+    minimum = timedelta(minutes=max(1, int(duration_minutes)))
+    slots = list(
+        overlapping_slots(window_start, window_end, mentor_ids=mentor_ids)
+        .order_by("start_time", "id")
+        .values_list("id", "mentor_id", "start_time", "end_time", "timezone")
+    )
+    busy = booked_intervals({slot[1] for slot in slots}, window_start, window_end) if slots else {}
+
+    results = []
+    for slot_id, mentor_id, start_time, end_time, timezone_name in slots:
+        clipped_start = max(start_time, window_start)
+        clipped_end = min(end_time, window_end)
+        for free_start, free_end in _free_gaps(clipped_start, clipped_end, busy.get(mentor_id, ()), minimum):
+            results.append(
+                {
+                    "slot_id": slot_id,
+                    "mentor_id": mentor_id,
+                    "start": free_start,
+                    "end": free_end,
+                    "timezone": timezone_name,
+                }
+            )
+    results.sort(key=lambda item: (item["start"], item["mentor_id"], item["slot_id"]))
+    return results[:limit]
+
+
+def materialization_horizon() -> timedelta:
+    return timedelta(days=int(os.environ.get("AVAILABILITY_HORIZON_DAYS", "28")))
+
+
+def _zone(name: str):
+    try:
+        return ZoneInfo(name) if name else timezone.get_default_timezone()
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.get_default_timezone()
+
+
+def expand_weekly_windows(windows, timezone_name: str, window_start: datetime, window_end: datetime):
+    """
+    Concrete UTC ``(start, end)`` pairs for ``[(weekday, start_minute, end_minute), ...]``.
+
+    Windows are read as wall-clock times in ``timezone_name``; only occurrences
+    overlapping ``[window_start, window_end)`` are returned.
+    """
+    zone = _zone(timezone_name)
+    by_weekday = defaultdict(list)
+    for weekday, start_minute, end_minute in windows:
+        by_weekday[weekday].append((start_minute, end_minute))
+    day = window_start.astimezone(zone).date() - timedelta(days=1)
+    last_day = window_end.astimezone(zone).date()
+    occurrences = []
+    while day <= last_day:
+        midnight = datetime.combine(day, time.min)
+        for start_minute, end_minute in by_weekday.get(day.weekday(), ()):
+            start = (midnight + timedelta(minutes=start_minute)).replace(tzinfo=zone).astimezone(dt_timezone.utc)
+            end = (midnight + timedelta(minutes=end_minute)).replace(tzinfo=zone).astimezone(dt_timezone.utc)
+            if start < window_end and end > window_start:
+                occurrences.append((start, end))
+        day += timedelta(days=1)
+    return occurrences
+
+
+def materialize_recurring_slots(mentor_ids, *, now=None, horizon: timedelta = None) -> dict:
+    """
+    Bring each mentor's recurring slots up to date from now to the horizon.
+
+    Missing occurrences are bulk-created, slots whose timezone label changed are
+    bulk-updated, and recurring slots that no longer match a weekly window are
+    deleted in batches unless they are booked, held or referenced by a session.
+    A manual slot with the same times counts as already present. Returns counts.
+    """
+    now = now or timezone.now()
+    horizon_end = now + (horizon if horizon is not None else materialization_horizon())
+    mentor_ids = sorted(set(mentor_ids))
+    counts = {"created": 0, "updated": 0, "deleted": 0}
+    if not mentor_ids:
+        return counts
+
+    windows = defaultdict(list)
+    zones = {}
+    rows = MentorWeeklyAvailability.objects.filter(mentor_id__in=mentor_ids).values_list(
+        "mentor_id", "weekday", "start_minute", "end_minute", "timezone"
+    )
+    for mentor_id, weekday, start_minute, end_minute, timezone_name in rows:
+        windows[mentor_id].append((weekday, start_minute, end_minute))
+        zones[mentor_id] = timezone_name
+    wanted = {}
+    for mentor_id, mentor_windows in windows.items():
+        for start, end in expand_weekly_windows(mentor_windows, zones[mentor_id], now, horizon_end):
+            wanted[(mentor_id, start, end)] = zones[mentor_id]
+
+    existing = MentorAvailabilitySlot.objects.filter(
+        mentor_id__in=mentor_ids,
+        start_time__lt=horizon_end,
+        end_time__gt=now,
+    ).values_list("id", "mentor_id", "start_time", "end_time", "timezone", "source", "is_available", "held_until")
+    present = set()
+    to_update = []
+    stale = []
+    for slot_id, mentor_id, start, end, timezone_name, source, is_available, held_until in existing:
+        key = (mentor_id, start, end)
+        present.add(key)
+        if source != "recurring":
+            continue
+        if key in wanted:
+            if timezone_name != wanted[key]:
+                to_update.append(MentorAvailabilitySlot(id=slot_id, timezone=wanted[key]))
+        elif is_available and not (held_until and held_until > now):
+            stale.append(slot_id)
+
+    to_create = []
+    for (mentor_id, start, end), timezone_name in sorted(wanted.items()):
+        if (mentor_id, start, end) in present:
+            continue
+        slot = MentorAvailabilitySlot(
+            mentor_id=mentor_id,
+            start_time=start,
+            end_time=end,
+            timezone=timezone_name,
+            source="recurring",
+        )
+        # bulk_create skips save(), so fill the interval index here.
+        slot.sync_buckets()
+        to_create.append(slot)
+
+    with transaction.atomic():
+        if stale:
+            referenced = set(
+                Session.objects.filter(availability_slot_id__in=stale).values_list("availability_slot_id", flat=True)
+            )
+            stale = [slot_id for slot_id in stale if slot_id not in referenced]
+        for start in range(0, len(stale), MATERIALIZE_BATCH_SIZE):
+            counts["deleted"] += MentorAvailabilitySlot.objects.filter(
+                id__in=stale[start : start + MATERIALIZE_BATCH_SIZE],
+                source="recurring",
+                is_available=True,
+            ).delete()[0]
+        if to_update:
+            MentorAvailabilitySlot.objects.bulk_update(to_update, ["timezone"], batch_size=MATERIALIZE_BATCH_SIZE)
+        MentorAvailabilitySlot.objects.bulk_create(to_create, batch_size=MATERIALIZE_BATCH_SIZE)
+    counts["created"] = len(to_create)
+    counts["updated"] = len(to_update)
+    return counts
@@ -0,0 +1,121 @@
+"""
+Session booking with slot claims and mentor conflict checks.
+
+Booking runs in one transaction: the mentor row is locked first so concurrent
+bookings for the same mentor queue up instead of both passing the overlap
+check, the mentor's active sessions are checked for overlap with an indexed
+range query, and the availability slot is claimed with a conditional UPDATE
+that only succeeds while the slot is still open. A losing request gets a 409
+straight away instead of a duplicate session. Mentees can also take a
+short-lived hold on a slot while they fill in the booking form; an expired
+hold is simply ignored, so nothing has to sweep them up.
+"""
+import os
+from datetime import timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .availability import BOOKED_SESSION_STATUSES
+from .models import Mentor, MentorAvailabilitySlot, Session
+
+MAX_REPORTED_CONFLICTS = 5
+# Statuses that give the session's slot back; in-progress and completed sessions keep theirs.
+VACATED_SESSION_STATUSES = ("canceled", "no_show")
+
+
+class BookingConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "This time is no longer available."
+    default_code = "booking_conflict"
+
+
+def slot_hold_duration() -> timedelta:
+    return timedelta(seconds=int(os.environ.get("SESSION_SLOT_HOLD_SECONDS", "600")))
+
+
+def _open_for(mentee_id, now):
+    """Slots that are unheld, whose hold has lapsed, or that ``mentee_id`` already holds."""
+    condition = Q(held_by__isnull=True) | Q(held_until__isnull=True) | Q(held_until__lte=now)
+    if mentee_id:
+        condition |= Q(held_by_id=mentee_id)
+    return condition
+
+
+def hold_slot(slot_id: int, mentee_id: int, *, now=None):
+    """Reserve an open slot for ``mentee_id``; returns the hold expiry or raises ``BookingConflict``."""
+    now = now or timezone.now()
+    held_until = now + slot_hold_duration()
+    claimed = (
+        MentorAvailabilitySlot.objects.filter(id=slot_id, is_available=True, end_time__gt=now)
+        .filter(_open_for(mentee_id, now))
+        .update(held_by_id=mentee_id, held_until=held_until)
+    )
+    if not claimed:
+        raise BookingConflict("This slot is already booked or held by someone else.")
+    return held_until
+
+
+def release_slot_hold(slot_id: int, mentee_id=None) -> bool:
+    """Drop a hold; ``mentee_id=None`` releases whoever holds it (admin)."""
+    queryset = MentorAvailabilitySlot.objects.filter(id=slot_id, held_by__isnull=False)
+    if mentee_id is not None:
+        queryset = queryset.filter(held_by_id=mentee_id)
+    return bool(queryset.update(held_by=None, held_until=None))
+
+
+def release_booked_slot(slot_id: int, *, session_id=None) -> bool:
+    """Make a slot bookable again unless another active session still sits in it."""
+    others = Session.objects.filter(availability_slot_id=slot_id, status__in=BOOKED_SESSION_STATUSES)
+    if session_id is not None:
+        others = others.exclude(id=session_id)
+    if others.exists():
+        return False
+    return bool(
+        MentorAvailabilitySlot.objects.filter(id=slot_id, is_available=False).update(
+            is_available=True, held_by=None, held_until=None
+        )
+    )
+
+
+def mentor_conflicts(mentor_id: int, start, end, *, exclude_session_id=None) -> list:
+    """Ids of the mentor's active sessions overlapping ``[start, end)``."""
+    queryset = Session.objects.filter(
+        mentor_id=mentor_id,
+        scheduled_start__lt=end,
+        scheduled_end__gt=start,
+        status__in=BOOKED_SESSION_STATUSES,
+    )
+    if exclude_session_id is not None:
+        queryset = queryset.exclude(id=exclude_session_id)
+    return list(queryset.order_by("scheduled_start").values_list("id", flat=True)[:MAX_REPORTED_CONFLICTS])
+
+
+def reserve_booking(*, mentor_id: int, start, end, mentee_id=None, slot_id=None, session_id=None, now=None):
+    """
+    Lock the mentor, reject overlapping sessions and claim ``slot_id``.
+
+    Must run inside the caller's transaction, before the session row is
+    written, so a conflict rolls everything back. Raises ``BookingConflict``.
+    """
+    now = now or timezone.now()
+    Mentor.objects.select_for_update().filter(id=mentor_id).values_list("id", flat=True).first()
+    conflicts = mentor_conflicts(mentor_id, start, end, exclude_session_id=session_id)
+    if conflicts:
+        raise BookingConflict(
+            {
+                "detail": "The mentor already has a session at this time.",
+                "conflicting_session_ids": conflicts,
+            }
+        )
+    if slot_id is None:
+        return
+    claimed = (
+        MentorAvailabilitySlot.objects.filter(id=slot_id, mentor_id=mentor_id, is_available=True)
+        .filter(_open_for(mentee_id, now))
+        .update(is_available=False, held_by=None, held_until=None)
+    )
+    if not claimed:
+        raise BookingConflict("This slot is already booked or held by someone else.")
@@ -0,0 +1,121 @@
+"""
+Stored metadata for mentor identity documents.
+
+Size, content type, image dimensions and a SHA-256 checksum are captured once
+when a document is uploaded and kept in ``MentorIdentityVerification.document_metadata``
+keyed by field name, so admin and API views never issue a storage ``size`` call
+(a remote HEAD on S3) per document per row. The checksum doubles as a cheap
+duplicate-document check across mentors.
+"""
+import hashlib
+import mimetypes
+
+from PIL import Image, UnidentifiedImageError
+
+from .models import MentorIdentityVerification
+
+IDENTITY_DOCUMENT_FIELDS = (
+    "id_proof_document",
+    "passport_or_license",
+    "address_proof_document",
+    "aadhaar_front",
+    "aadhaar_back",
+    "professional_certificate_document",
+)
+
+
+def _image_dimensions(file_obj):
+    try:
+        file_obj.seek(0)
+        with Image.open(file_obj) as image:
+            return image.size
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError, ValueError):
+        return None, None
+
+
+def describe_document(file_obj, *, name: str, content_type: str = "") -> dict:
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in file_obj.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    content_type = str(content_type or "").strip() or mimetypes.guess_type(name)[0] or "application/octet-stream"
+    width, height = _image_dimensions(file_obj) if content_type.startswith("image/") else (None, None)
+    return {
+        "name": name,
+        "size": size,
+        "content_type": content_type,
+        "width": width,
+        "height": height,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def find_duplicate_documents(verification, checksum: str):
+    """Other verifications holding a document with the same checksum, as ``(verification, field_name)`` pairs."""
+    if not checksum:
+        return []
+    candidates = (
+        MentorIdentityVerification.objects.exclude(pk=verification.pk)
+        .filter(document_metadata__icontains=checksum)
+        .select_related("mentor")
+    )
+    matches = []
+    for candidate in candidates:
+        metadata = candidate.document_metadata if isinstance(candidate.document_metadata, dict) else {}
+        for field_name, entry in metadata.items():
+            if isinstance(entry, dict) and entry.get("sha256") == checksum:
+                matches.append((candidate, field_name))
+    return matches
+
+
+def _flag_duplicates(matches):
+    # Mark the earlier copies too, so the flag does not depend on which upload came first.
+    for candidate, field_name in matches:
+        metadata = dict(candidate.document_metadata)
+        if metadata[field_name].get("duplicate"):
+            continue
+        metadata[field_name] = {**metadata[field_name], "duplicate": True}
+        MentorIdentityVerification.objects.filter(pk=candidate.pk).update(document_metadata=metadata)
+        candidate.document_metadata = metadata
+
+
+def capture_document_metadata(verification, field_names=None, *, uploaded_files=None, force: bool = False) -> int:
+    """
+    Refresh ``document_metadata`` for ``field_names`` (default: every document field).
+
+    Freshly uploaded files are hashed from ``uploaded_files`` (the request's
+    ``FILES``); anything else is read back from storage once. Entries whose
+    ``name`` still matches the stored file are kept unless ``force`` is set.
+    Returns the number of documents described.
+    """
+    uploaded_files = uploaded_files or {}
+    current = verification.document_metadata if isinstance(verification.document_metadata, dict) else {}
+    metadata = dict(current)
+    described = 0
+    for field_name in field_names or IDENTITY_DOCUMENT_FIELDS:
+        field_file = getattr(verification, field_name, None)
+        name = str(getattr(field_file, "name", "") or "")
+        if not name:
+            metadata.pop(field_name, None)
+            continue
+        entry = current.get(field_name)
+        if not force and isinstance(entry, dict) and entry.get("name") == name:
+            continue
+        uploaded = uploaded_files.get(field_name)
+        if uploaded is not None:
+            metadata[field_name] = describe_document(
+                uploaded, name=name, content_type=getattr(uploaded, "content_type", "")
+            )
+        else:
+            with field_file.storage.open(name, "rb") as stored:
+                metadata[field_name] = describe_document(stored, name=name)
+        matches = find_duplicate_documents(verification, metadata[field_name]["sha256"])
+        metadata[field_name]["duplicate"] = bool(matches)
+        _flag_duplicates(matches)
+        described += 1
+
+    if metadata != current:
+        verification.document_metadata = metadata
+        MentorIdentityVerification.objects.filter(pk=verification.pk).update(document_metadata=metadata)
+    return described
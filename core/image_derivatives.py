@@ -0,0 +1,266 @@
+"""
+Resized derivatives for uploaded images.
+
+Avatars, mentor profile photos and volunteer event images arrive as
+multi-megabyte phone photos but are mostly shown as thumbnails. Each upload
+gets thumb/medium/large renditions stored next to the original, re-encoded as
+WebP (JPEG when Pillow lacks WebP support) without EXIF. The stored names live
+in the owning row's ``media_derivatives`` JSON, keyed by source field (and by
+storage name for gallery images), together with the ``source`` they were
+rendered from so a replaced file is detected without touching storage.
+
+Serializers keep returning the original's URL, so the original itself is
+stripped: the first time a source is seen its EXIF/XMP block is dropped and
+the file is rewritten in place (rotated upright first when EXIF carried an
+orientation), so GPS tags and camera metadata never reach other users.
+
+Both happen in the upload request (the post_save receiver), since the
+deploy has no worker to hand them to. An upload whose rendering fails keeps
+a stale ``source``; ``build_image_derivatives`` is the backfill for those
+and for rows that predate derivatives, and only visits rows whose entries
+are missing or stale. Derivative files that no longer belong to a current
+source (replaced image, removed gallery image, forced re-render) are
+deleted from storage whenever the entries are refreshed.
+"""
+import io
+import logging
+import os
+from pathlib import PurePosixPath
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.db.models.fields.json import KT
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from .media_access import s3_bucket_key_from_url
+from .models import Mentee, MentorProfile, VolunteerEvent
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_SIZES = {"thumb": 160, "medium": 640, "large": 1280}
+IMAGE_FILE_FIELDS = {
+    Mentee: ("avatar",),
+    MentorProfile: ("profile_photo",),
+    VolunteerEvent: ("image_file",),
+}
+IMAGE_SOURCE_FIELDS = {
+    Mentee: {"avatar"},
+    MentorProfile: {"profile_photo"},
+    VolunteerEvent: {"image_file", "gallery_images"},
+}
+# Formats whose metadata Pillow can drop on a same-format rewrite.
+STRIPPABLE_FORMATS = {"JPEG", "PNG", "WEBP"}
+EXIF_ORIENTATION_TAG = 0x0112
+
+
+def _quality() -> int:
+    try:
+        value = int(os.environ.get("IMAGE_DERIVATIVE_QUALITY", "80"))
+    except ValueError:
+        return 80
+    return min(95, max(30, value))
+
+
+def _output_format():
+    return ("WEBP", ".webp") if features.check("webp") else ("JPEG", ".jpg")
+
+
+def _derivative_name(source_name: str, label: str, extension: str) -> str:
+    source = PurePosixPath(source_name)
+    return str(source.with_name(f"{source.stem}__{label}{extension}"))
+
+
+def storage_name_from_url(url: str) -> str:
+    """Map a stored gallery URL back to its default storage name ("" when it is not ours)."""
+    value = str(url or "").strip()
+    if not value:
+        return ""
+    bucket, key = s3_bucket_key_from_url(value)
+    if bucket:
+        if bucket != str(getattr(settings, "S3_MEDIA_BUCKET_NAME", "") or "").strip():
+            return ""
+        prefix = str(getattr(settings, "S3_MEDIA_PREFIX", "") or "").strip("/")
+        if prefix and key.startswith(f"{prefix}/"):
+            key = key[len(prefix) + 1 :]
+        return key
+    media_path = urlparse(str(settings.MEDIA_URL or "/media/")).path or "/media/"
+    path = unquote(urlparse(value).path or "")
+    if not path.startswith(media_path):
+        return ""
+    return path[len(media_path) :].lstrip("/")
+
+
+def generate_image_derivatives(source_name: str) -> dict:
+    """
+    Render every size in ``DERIVATIVE_SIZES`` for a stored image.
+
+    Returns ``{"source": source_name, "thumb": name, ...}``. Files Pillow
+    cannot decode return just ``{"source": source_name}`` so they are not
+    retried on every save.
+    """
+    entry = {"source": source_name}
+    largest_edge = max(DERIVATIVE_SIZES.values())
+    try:
+        with default_storage.open(source_name, "rb") as handle:
+            image = Image.open(handle)
+            # JPEG can decode straight to a power-of-two downscale, which avoids
+            # materialising the full 12MP frame just to shrink it.
+            image.draft("RGB", (largest_edge, largest_edge))
+            image = ImageOps.exif_transpose(image)
+            image.load()
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError, ValueError):
+        return entry
+
+    image_format, extension = _output_format()
+    has_alpha = image.mode in {"RGBA", "LA"} or (image.mode == "P" and "transparency" in image.info)
+    image = image.convert("RGBA" if has_alpha and image_format == "WEBP" else "RGB")
+    save_kwargs = {"format": image_format, "quality": _quality()}
+    if image_format == "JPEG":
+        save_kwargs.update({"optimize": True, "progressive": True})
+    else:
+        save_kwargs["method"] = 4
+
+    previous_label = ""
+    for label, edge in sorted(DERIVATIVE_SIZES.items(), key=lambda item: item[1]):
+        if previous_label and max(image.size) <= DERIVATIVE_SIZES[previous_label]:
+            # The source is already smaller than the previous size; larger renditions would be identical.
+            entry[label] = entry[previous_label]
+            continue
+        rendition = image.copy()
+        rendition.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        rendition.save(buffer, **save_kwargs)
+        entry[label] = default_storage.save(
+            _derivative_name(source_name, label, extension),
+            ContentFile(buffer.getvalue()),
+        )
+        previous_label = label
+    return entry
+
+
+def strip_image_metadata(source_name: str) -> bool:
+    """
+    Rewrite a stored original without EXIF/XMP; returns whether it changed.
+
+    JPEGs without an orientation tag keep their quantisation tables, so the
+    rewrite is visually lossless. Files Pillow cannot decode, and formats
+    outside ``STRIPPABLE_FORMATS``, are left alone.
+    """
+    try:
+        with default_storage.open(source_name, "rb") as handle:
+            image = Image.open(handle)
+            image_format = image.format
+            exif = image.getexif()
+            if image_format not in STRIPPABLE_FORMATS or not (
+                exif or image.info.get("exif") or image.info.get("xmp") or image.info.get("XML:com.adobe.xmp")
+            ):
+                return False
+            icc_profile = image.info.get("icc_profile")
+            rotate = exif.get(EXIF_ORIENTATION_TAG, 1) != 1
+            image.load()
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError, ValueError):
+        return False
+
+    save_kwargs = {"format": image_format}
+    if icc_profile:
+        save_kwargs["icc_profile"] = icc_profile
+    if rotate:
+        image = ImageOps.exif_transpose(image)
+    if image_format == "JPEG":
+        save_kwargs.update({"quality": 95} if rotate else {"quality": "keep", "subsampling": "keep"})
+    elif image_format == "WEBP":
+        save_kwargs["quality"] = 90
+    buffer = io.BytesIO()
+    image.save(buffer, **save_kwargs)
+    # Overwrite under the same name so the stored URL stays valid.
+    with default_storage.open(source_name, "wb") as handle:
+        handle.write(buffer.getvalue())
+    return True
+
+
+def _current_entry(entries: dict, key: str, source_name: str, force: bool):
+    entry = entries.get(key)
+    recorded = isinstance(entry, dict) and entry.get("source") == source_name
+    if recorded and not force:
+        return entry, False
+    if not recorded:
+        strip_image_metadata(source_name)
+    return generate_image_derivatives(source_name), True
+
+
+def _derivative_names(entries: dict) -> set:
+    entry_list = [entry for key, entry in entries.items() if key != "gallery"]
+    gallery = entries.get("gallery")
+    if isinstance(gallery, dict):
+        entry_list.extend(gallery.values())
+    return {
+        str(entry.get(label) or "")
+        for entry in entry_list
+        if isinstance(entry, dict)
+        for label in DERIVATIVE_SIZES
+        if entry.get(label)
+    }
+
+
+def rows_needing_derivatives(model):
+    """
+    Rows of ``model`` whose image entries are missing or were rendered from another file.
+
+    Gallery entries are keyed by storage name and cannot be compared in SQL,
+    so events with a gallery are always included; their current entries are
+    skipped without touching storage.
+    """
+    stale = Q()
+    for field_name in IMAGE_FILE_FIELDS[model]:
+        has_file = ~Q(**{field_name: ""}) & Q(**{f"{field_name}__isnull": False})
+        source_key = f"media_derivatives__{field_name}__source"
+        # A missing entry compares as NULL, which a negated equality would drop, so it is matched on its own.
+        missing = Q(**{f"{source_key}__isnull": True})
+        stale |= has_file & (missing | ~Q(**{field_name: KT(source_key)}))
+    if model is VolunteerEvent:
+        stale |= ~Q(gallery_images=[])
+    return model.objects.filter(stale)
+
+
+def refresh_image_derivatives(instance, *, force: bool = False) -> int:
+    """
+    Bring ``instance.media_derivatives`` in line with its image fields; returns renditions generated.
+
+    New sources are stripped of metadata before rendering. Derivatives left
+    without a current source are deleted from storage.
+    """
+    current = instance.media_derivatives if isinstance(instance.media_derivatives, dict) else {}
+    updated = {}
+    generated = 0
+    for field_name in IMAGE_FILE_FIELDS.get(type(instance), ()):
+        source_name = str(getattr(getattr(instance, field_name), "name", "") or "")
+        if not source_name:
+            continue
+        updated[field_name], created = _current_entry(current, field_name, source_name, force)
+        generated += int(created)
+
+    if isinstance(instance, VolunteerEvent):
+        previous_gallery = current.get("gallery") if isinstance(current.get("gallery"), dict) else {}
+        gallery = {}
+        for url in instance.gallery_images if isinstance(instance.gallery_images, list) else []:
+            source_name = storage_name_from_url(url)
+            if not source_name or source_name in gallery:
+                continue
+            gallery[source_name], created = _current_entry(previous_gallery, source_name, source_name, force)
+            generated += int(created)
+        if gallery:
+            updated["gallery"] = gallery
+
+    if updated != current:
+        # A queryset update keeps this out of post_save and leaves updated_at alone.
+        type(instance).objects.filter(pk=instance.pk).update(media_derivatives=updated)
+        instance.media_derivatives = updated
+        for name in sorted(_derivative_names(current) - _derivative_names(updated)):
+            try:
+                default_storage.delete(name)
+            except Exception:
+                logger.warning("Could not delete stale image derivative %s", name, exc_info=True)
+    return generated
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from core.image_derivatives import refresh_image_derivatives, rows_needing_derivatives
+from core.models import Mentee, MentorProfile, VolunteerEvent
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill resized, EXIF-free derivatives for avatars, profile photos and event images "
+        "that are missing them or were rendered from a replaced file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Rows fetched per batch (default: 100).",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-render every row's derivatives, even current ones.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        querysets = [
+            model.objects.all() if options["force"] else rows_needing_derivatives(model)
+            for model in (Mentee, MentorProfile, VolunteerEvent)
+        ]
+        for queryset in querysets:
+            label = queryset.model.__name__
+            processed = 0
+            generated = 0
+            failed = 0
+            for instance in queryset.order_by("id").iterator(chunk_size=batch_size):
+                processed += 1
+                try:
+                    generated += refresh_image_derivatives(instance, force=options["force"])
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f"{label} {instance.pk}: {exc}")
+            self.stdout.write(f"{label}: {processed} rows, {generated} images rendered, {failed} failed.")
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import TrainingModule, TrainingQuizQuestionBank
+from core.quiz import build_quiz_question_bank, training_modules_content_hash
+
+
+class Command(BaseCommand):
+    help = "Pre-generate the mentor training quiz question bank for the active modules."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=60,
+            help="Target number of questions in the bank (default: 60).",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate even if a bank already exists for the current module content.",
+        )
+
+    def handle(self, *args, **options):
+        modules = list(TrainingModule.objects.filter(is_active=True).order_by("order", "id"))
+        if not modules:
+            raise CommandError("No active training modules.")
+
+        content_hash = training_modules_content_hash(modules)
+        existing = TrainingQuizQuestionBank.objects.filter(content_hash=content_hash).first()
+        if existing and not options["force"]:
+            self.stdout.write(
+                f"Question bank {content_hash[:12]} is current ({existing.question_count} questions)."
+            )
+            return
+
+        try:
+            bank = build_quiz_question_bank(modules, bank_size=max(15, options["size"]))
+        except Exception as exc:
+            raise CommandError(f"Question bank generation failed: {exc}") from exc
+        self.stdout.write(
+            self.style.SUCCESS(f"Stored question bank {bank.content_hash[:12]} with {bank.question_count} questions.")
+        )
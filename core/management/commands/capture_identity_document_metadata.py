@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from core.identity_documents import capture_document_metadata
+from core.models import MentorIdentityVerification
+
+
+class Command(BaseCommand):
+    help = "Record size, content type, dimensions and SHA-256 for stored mentor identity documents."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Rows fetched per batch (default: 100).",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-read documents even when metadata is already captured.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        processed = 0
+        described = 0
+        failed = 0
+        queryset = MentorIdentityVerification.objects.order_by("id")
+        for verification in queryset.iterator(chunk_size=batch_size):
+            processed += 1
+            try:
+                described += capture_document_metadata(verification, force=options["force"])
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"Verification {verification.pk}: {exc}")
+        self.stdout.write(f"Identity verifications: {processed} rows, {described} documents described, {failed} failed.")
@@ -0,0 +1,64 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.availability import materialization_horizon, materialize_recurring_slots
+from core.models import MentorAvailabilitySlot, MentorWeeklyAvailability
+
+
+class Command(BaseCommand):
+    help = "Expand mentors' weekly availability into concrete slots for the rolling booking horizon."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mentor-id",
+            type=int,
+            action="append",
+            dest="mentor_ids",
+            help="Only materialize this mentor (repeatable).",
+        )
+        parser.add_argument(
+            "--horizon-days",
+            type=int,
+            help="Days ahead to keep filled (default: AVAILABILITY_HORIZON_DAYS or 28).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Mentors processed per transaction (default: 200).",
+        )
+
+    def handle(self, *args, **options):
+        if options["horizon_days"] is not None and options["horizon_days"] < 1:
+            raise CommandError("--horizon-days must be at least 1.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        horizon = (
+            timedelta(days=options["horizon_days"]) if options["horizon_days"] is not None else materialization_horizon()
+        )
+        now = timezone.now()
+
+        mentor_ids = options["mentor_ids"]
+        if not mentor_ids:
+            # Mentors whose weekly availability was cleared still need their future slots removed.
+            mentor_ids = set(MentorWeeklyAvailability.objects.values_list("mentor_id", flat=True))
+            mentor_ids.update(
+                MentorAvailabilitySlot.objects.filter(source="recurring", end_time__gt=now).values_list(
+                    "mentor_id", flat=True
+                )
+            )
+        mentor_ids = sorted(set(mentor_ids))
+
+        totals = {"created": 0, "updated": 0, "deleted": 0}
+        batch_size = options["batch_size"]
+        for start in range(0, len(mentor_ids), batch_size):
+            counts = materialize_recurring_slots(mentor_ids[start : start + batch_size], now=now, horizon=horizon)
+            for key, value in counts.items():
+                totals[key] += value
+
+        self.stdout.write(
+            f"Recurring slots for {len(mentor_ids)} mentors over {horizon.days} days: "
+            f"{totals['created']} created, {totals['updated']} updated, {totals['deleted']} deleted."
+        )
@@ -0,0 +1,57 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.session_summaries import enqueue_missing_summaries, run_summary_pass
+
+
+class Command(BaseCommand):
+    help = "Generate pending post-session meeting summaries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Maximum jobs to run per pass (default: 20).",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for due jobs instead of running a single pass.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=15.0,
+            help="Seconds to sleep between passes in --loop mode (default: 15).",
+        )
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Queue completed sessions that have no summary job yet before processing.",
+        )
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=15,
+            help="Requeue jobs stuck in running for longer than this (default: 15).",
+        )
+
+    def handle(self, *args, **options):
+        limit = max(1, options["limit"])
+        stale_after = timedelta(minutes=max(1, options["stale_minutes"]))
+        if options["backfill"]:
+            queued = enqueue_missing_summaries()
+            self.stdout.write(f"Queued {queued} completed sessions for summaries.")
+        while True:
+            counts = run_summary_pass(limit=limit, stale_after=stale_after)
+            if counts["requeued"] or counts["claimed"] or not options["loop"]:
+                self.stdout.write(
+                    f"Summary jobs: {counts['succeeded']} succeeded, {counts['failed']} failed, "
+                    f"{counts['requeued']} requeued."
+                )
+            if not options["loop"]:
+                return
+            time.sleep(max(1.0, options["interval"]))
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.mentor_index import INDEX_BATCH_SIZE, rebuild_mentor_index, refresh_mentor_text, reindex_mentors
+from core.models import Mentor
+
+
+class Command(BaseCommand):
+    help = "Rebuild the mentor candidate index and profile text vectors used for recommendations."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mentor-id",
+            type=int,
+            action="append",
+            dest="mentor_ids",
+            help="Only reindex this mentor (repeatable).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=INDEX_BATCH_SIZE,
+            help=f"Mentors reindexed per transaction (default: {INDEX_BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        if options["mentor_ids"]:
+            changed = reindex_mentors(options["mentor_ids"])
+            mentor_ids = options["mentor_ids"]
+        else:
+            changed = rebuild_mentor_index(batch_size=options["batch_size"])
+            mentor_ids = list(Mentor.objects.values_list("id", flat=True))
+        vectors = refresh_mentor_text(mentor_ids)
+        self.stdout.write(f"Mentor index: {changed} terms added or removed, {vectors} text vectors rewritten.")
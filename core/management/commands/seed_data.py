@@ -1,13 +1,163 @@
 import random
+import time
+from contextlib import contextmanager
 from datetime import date, timedelta
+from decimal import Decimal
 
-from django.core.management.base import BaseCommand
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.utils import timezone
 
-from core.models import MatchRecommendation, Mentee, MenteeRequest, Mentor, UserProfile
+from core import signals as core_signals
+from core.mentor_index import refresh_mentor_text, reindex_mentors
+from core.models import (
+    MatchRecommendation,
+    Mentee,
+    MenteeRequest,
+    Mentor,
+    MentorOnboardingStatus,
+    MentorProfile,
+    MentorTrainingProgress,
+    MentorTrainingQuizAttempt,
+    Session,
+    SessionAbuseIncident,
+    SessionFeedback,
+    SessionMeetingSignal,
+    SessionRecording,
+    UserProfile,
+    VolunteerEvent,
+)
 from django.contrib.auth import get_user_model
 
 
+FIRST_NAMES = ["Priya", "Rahul", "Ananya", "Karthik", "Meera", "Arjun", "Nila", "Vikram"]
+LAST_NAMES = ["Sharma", "Iyer", "Patel", "Rao", "Menon", "Gupta", "Nair", "Singh"]
+GRADES = ["10th Grade", "11th Grade", "12th Grade"]
+GENDERS = ["Female", "Male"]
+LANGUAGES = ["Tamil", "English", "Telugu", "Kannada", "Malayalam", "Hindi"]
+CARE_AREAS = ["Anxiety", "Relationships", "Academic Stress"]
+TOPICS = ["Anxiety", "Study Skills", "Math", "Career Chat", "Academic Stress"]
+FEELINGS = ["Burnt Out", "Anxious", "Confused", "Lonely", "Hopeful", "Other"]
+CAUSES = [
+    "Exam Pressure",
+    "Parent Expectations",
+    "Friend Issues",
+    "Future Anxiety (Career/College)",
+    "Concentration Struggles",
+    "Study Struggles",
+    "Others",
+]
+SUPPORTS = [
+    "Someone to Listen",
+    "Study Guidance / Tips",
+    "Motivation",
+    "Stress Relief Strategies",
+    "Life Advice / Perspective",
+    "I'm Not Sure",
+]
+COMFORTS = [
+    "Very Uncomfortable",
+    "Somewhat Uncomfortable",
+    "Neutral",
+    "Comfortable",
+    "Very Comfortable",
+]
+FORMATS = ["1:1", "Group", "Drop-in", "Workshop"]
+CITIES = [
+    "Chennai, Tamil Nadu",
+    "Bengaluru, Karnataka",
+    "Hyderabad, Telangana",
+    "Mumbai, Maharashtra",
+    "Delhi, India",
+]
+MENTOR_BIOS = [
+    "I support students through exam anxiety using practical routines, reflection prompts, and calm planning techniques tailored to their weekly schedule.",
+    "My mentoring focuses on confidence-building, communication, and consistent study habits so students can perform better without burnout.",
+    "I help learners break big goals into manageable steps, improve focus, and stay motivated during high-pressure academic periods.",
+    "With years of guidance experience, I work with students on emotional balance, parent-pressure conversations, and healthy productivity systems.",
+    "I specialize in helping students handle uncertainty about careers and academics with structured thinking, clarity exercises, and action plans.",
+    "My sessions combine empathetic listening and practical strategy so students feel understood and leave with clear next steps.",
+]
+AVATAR_URLS = [
+    "https://images.pexels.com/photos/220453/pexels-photo-220453.jpeg",
+    "https://images.pexels.com/photos/774909/pexels-photo-774909.jpeg",
+    "https://images.pexels.com/photos/415829/pexels-photo-415829.jpeg",
+    "https://images.pexels.com/photos/614810/pexels-photo-614810.jpeg",
+    "https://images.pexels.com/photos/733872/pexels-photo-733872.jpeg",
+    "https://images.pexels.com/photos/91227/pexels-photo-91227.jpeg",
+]
+TIMEZONES = ["Asia/Kolkata", "Asia/Dubai", "Asia/Singapore"]
+ACCESS_NEEDS = [
+    "",
+    "Needs larger text and clear audio.",
+    "Prefers short sessions with breaks.",
+]
+SAFETY_NOTES = [
+    "",
+    "Student gets anxious before exams; gentle pacing preferred.",
+    "Parent wants weekly progress updates.",
+]
+
+AVAILABILITY_POOL = [
+    {"day": "Monday", "start": "17:00", "end": "19:00"},
+    {"day": "Wednesday", "start": "16:00", "end": "18:00"},
+    {"day": "Friday", "start": "18:00", "end": "20:00"},
+    {"day": "Saturday", "start": "10:00", "end": "12:00"},
+    {"day": "Sunday", "start": "15:00", "end": "17:00"},
+]
+
+SESSION_STATUS_WEIGHTS = [
+    ("completed", 55),
+    ("scheduled", 15),
+    ("requested", 10),
+    ("approved", 5),
+    ("canceled", 10),
+    ("no_show", 5),
+]
+FEEDBACK_COMMENTS = [
+    "Very helpful session, felt heard.",
+    "Got a clear study plan for the week.",
+    "Good conversation, would like a follow-up.",
+    "",
+]
+INCIDENT_SAMPLES = [
+    ("verbal_abuse", "transcript", "medium", "warn"),
+    ("harassment", "manual_report", "high", "escalate_review"),
+    ("inappropriate_gesture", "ai_vision", "high", "terminate_session"),
+    ("unsafe_environment", "client_signal", "low", "none"),
+]
+
+MUTED_RECEIVERS = [
+    (post_save, core_signals.auto_recommend_on_request, MenteeRequest),
+    (post_save, core_signals.auto_sync_training_status_on_progress_save, MentorTrainingProgress),
+    (post_delete, core_signals.auto_sync_training_status_on_progress_delete, MentorTrainingProgress),
+    (post_save, core_signals.auto_sync_training_status_on_quiz_save, MentorTrainingQuizAttempt),
+    (post_delete, core_signals.auto_sync_training_status_on_quiz_delete, MentorTrainingQuizAttempt),
+    (post_save, core_signals.enqueue_summary_on_session_complete, Session),
+    (post_save, core_signals.enqueue_summary_on_recording_stop, SessionRecording),
+    (post_save, core_signals.refresh_image_derivatives_on_upload, Mentee),
+    (post_save, core_signals.refresh_image_derivatives_on_upload, MentorProfile),
+    (post_save, core_signals.refresh_image_derivatives_on_upload, VolunteerEvent),
+    (post_save, core_signals.reindex_mentor_on_onboarding_change, MentorOnboardingStatus),
+    (post_delete, core_signals.reindex_mentor_on_onboarding_change, MentorOnboardingStatus),
+]
+
+
+@contextmanager
+def muted_signals():
+    # bulk_create never sends post_save, but the cleanup deletes and any stray
+    # save() must not fan out into recommendation or onboarding work either.
+    for signal, handler, sender in MUTED_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
+    try:
+        yield
+    finally:
+        for signal, handler, sender in MUTED_RECEIVERS:
+            signal.connect(handler, sender=sender)
+
+
 class Command(BaseCommand):
     help = "Seed sample mentees, mentors, requests, and match recommendations."
 
@@ -18,12 +168,35 @@ class Command(BaseCommand):
             default=10,
             help="Number of mentees and mentors to create (default: 10).",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help=(
+                "High-volume mode for load testing: bulk_create in batches with signals "
+                "disabled, plus sessions, feedback, meeting signals and incidents."
+            ),
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Random seed; the same seed and count always produce the same rows (default: 42).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Rows per bulk_create batch in --bulk mode (default: 2000).",
+        )
+        parser.add_argument(
+            "--sessions-per-mentee",
+            type=int,
+            default=2,
+            help="Sessions generated per mentee in --bulk mode (default: 2).",
+        )
 
-    def handle(self, *args, **options):
-        count = options["count"]
+    def _clear_seeded_rows(self):
         User = get_user_model()
-        random.seed(42)
-
         test_domain = "bondroom.local"
         UserProfile.objects.filter(user__email__endswith=f"@{test_domain}").delete()
         MatchRecommendation.objects.filter(
@@ -34,101 +207,46 @@ class Command(BaseCommand):
         Mentor.objects.filter(email__endswith=f"@{test_domain}").delete()
         User.objects.filter(email__endswith=f"@{test_domain}").delete()
 
-        first_names = ["Priya", "Rahul", "Ananya", "Karthik", "Meera", "Arjun", "Nila", "Vikram"]
-        last_names = ["Sharma", "Iyer", "Patel", "Rao", "Menon", "Gupta", "Nair", "Singh"]
-        grades = ["10th Grade", "11th Grade", "12th Grade"]
-        genders = ["Female", "Male"]
-        languages = ["Tamil", "English", "Telugu", "Kannada", "Malayalam", "Hindi"]
-        care_areas = ["Anxiety", "Relationships", "Academic Stress"]
-        topics = ["Anxiety", "Study Skills", "Math", "Career Chat", "Academic Stress"]
-        feelings = ["Burnt Out", "Anxious", "Confused", "Lonely", "Hopeful", "Other"]
-        causes = [
-            "Exam Pressure",
-            "Parent Expectations",
-            "Friend Issues",
-            "Future Anxiety (Career/College)",
-            "Concentration Struggles",
-            "Study Struggles",
-            "Others",
-        ]
-        supports = [
-            "Someone to Listen",
-            "Study Guidance / Tips",
-            "Motivation",
-            "Stress Relief Strategies",
-            "Life Advice / Perspective",
-            "I'm Not Sure",
-        ]
-        comforts = [
-            "Very Uncomfortable",
-            "Somewhat Uncomfortable",
-            "Neutral",
-            "Comfortable",
-            "Very Comfortable",
-        ]
-        formats = ["1:1", "Group", "Drop-in", "Workshop"]
-        cities = [
-            "Chennai, Tamil Nadu",
-            "Bengaluru, Karnataka",
-            "Hyderabad, Telangana",
-            "Mumbai, Maharashtra",
-            "Delhi, India",
-        ]
-        mentor_bios = [
-            "I support students through exam anxiety using practical routines, reflection prompts, and calm planning techniques tailored to their weekly schedule.",
-            "My mentoring focuses on confidence-building, communication, and consistent study habits so students can perform better without burnout.",
-            "I help learners break big goals into manageable steps, improve focus, and stay motivated during high-pressure academic periods.",
-            "With years of guidance experience, I work with students on emotional balance, parent-pressure conversations, and healthy productivity systems.",
-            "I specialize in helping students handle uncertainty about careers and academics with structured thinking, clarity exercises, and action plans.",
-            "My sessions combine empathetic listening and practical strategy so students feel understood and leave with clear next steps.",
-        ]
-        avatar_urls = [
-            "https://images.pexels.com/photos/220453/pexels-photo-220453.jpeg",
-            "https://images.pexels.com/photos/774909/pexels-photo-774909.jpeg",
-            "https://images.pexels.com/photos/415829/pexels-photo-415829.jpeg",
-            "https://images.pexels.com/photos/614810/pexels-photo-614810.jpeg",
-            "https://images.pexels.com/photos/733872/pexels-photo-733872.jpeg",
-            "https://images.pexels.com/photos/91227/pexels-photo-91227.jpeg",
-        ]
-        timezones = ["Asia/Kolkata", "Asia/Dubai", "Asia/Singapore"]
-        access_needs = [
-            "",
-            "Needs larger text and clear audio.",
-            "Prefers short sessions with breaks.",
-        ]
-        safety_notes = [
-            "",
-            "Student gets anxious before exams; gentle pacing preferred.",
-            "Parent wants weekly progress updates.",
-        ]
-
-        availability_pool = [
-            {"day": "Monday", "start": "17:00", "end": "19:00"},
-            {"day": "Wednesday", "start": "16:00", "end": "18:00"},
-            {"day": "Friday", "start": "18:00", "end": "20:00"},
-            {"day": "Saturday", "start": "10:00", "end": "12:00"},
-            {"day": "Sunday", "start": "15:00", "end": "17:00"},
-        ]
+    def handle(self, *args, **options):
+        count = options["count"]
+        if options["bulk"]:
+            if count < 1 or options["batch_size"] < 1 or options["sessions_per_mentee"] < 0:
+                raise CommandError(
+                    "--count and --batch-size must be positive and --sessions-per-mentee non-negative."
+                )
+            with muted_signals():
+                self._clear_seeded_rows()
+                self._seed_bulk(
+                    count=count,
+                    seed=options["seed"],
+                    batch_size=options["batch_size"],
+                    sessions_per_mentee=options["sessions_per_mentee"],
+                )
+            return
+
+        User = get_user_model()
+        random.seed(options["seed"])
+        self._clear_seeded_rows()
 
         mentees = []
         mentors = []
 
         for i in range(count):
-            fn = random.choice(first_names)
-            ln = random.choice(last_names)
+            fn = random.choice(FIRST_NAMES)
+            ln = random.choice(LAST_NAMES)
             email = f"mentee{i+1}@bondroom.local"
             user = User.objects.create_user(username=email, email=email, password="password123")
             UserProfile.objects.create(user=user, role="mentee")
 
-            city = random.choice(cities)
-            tz = random.choice(timezones)
+            city = random.choice(CITIES)
+            tz = random.choice(TIMEZONES)
             mentee = Mentee.objects.create(
                 first_name=fn,
                 last_name=ln,
-                grade=random.choice(grades),
+                grade=random.choice(GRADES),
                 email=email,
                 dob=date.today() - timedelta(days=365 * random.randint(13, 17)),
-                gender=random.choice(genders),
+                gender=random.choice(GENDERS),
                 city_state=city,
                 timezone=tz,
                 parent_guardian_consent=True,
@@ -138,29 +256,29 @@ class Command(BaseCommand):
             mentees.append(mentee)
 
         for i in range(count):
-            fn = random.choice(first_names)
-            ln = random.choice(last_names)
+            fn = random.choice(FIRST_NAMES)
+            ln = random.choice(LAST_NAMES)
             email = f"mentor{i+1}@bondroom.local"
             user = User.objects.create_user(username=email, email=email, password="password123")
             UserProfile.objects.create(user=user, role="mentor")
 
-            mentor_city = random.choice(cities)
+            mentor_city = random.choice(CITIES)
             mentor = Mentor.objects.create(
                 first_name=fn,
                 last_name=ln,
                 email=email,
                 mobile="+91 90000 00000",
                 dob=date.today() - timedelta(days=365 * random.randint(60, 75)),
-                gender=random.choice(genders),
+                gender=random.choice(GENDERS),
                 city_state=mentor_city,
-                languages=random.sample(languages, k=random.randint(1, 2)),
-                care_areas=random.sample(care_areas, k=random.randint(1, 2)),
-                preferred_formats=random.sample(formats, k=random.randint(1, 2)),
-                availability=random.sample(availability_pool, k=2),
-                timezone=random.choice(timezones),
+                languages=random.sample(LANGUAGES, k=random.randint(1, 2)),
+                care_areas=random.sample(CARE_AREAS, k=random.randint(1, 2)),
+                preferred_formats=random.sample(FORMATS, k=random.randint(1, 2)),
+                availability=random.sample(AVAILABILITY_POOL, k=2),
+                timezone=random.choice(TIMEZONES),
                 qualification="Retired Teacher",
-                bio=random.choice(mentor_bios),
-                avatar=random.choice(avatar_urls),
+                bio=random.choice(MENTOR_BIOS),
+                avatar=random.choice(AVATAR_URLS),
                 average_rating=round(random.uniform(4.0, 5.0), 2),
                 response_time_minutes=random.randint(30, 180),
                 consent=True,
@@ -173,21 +291,21 @@ class Command(BaseCommand):
             return list(a_set.intersection(b_set))
 
         for mentee in mentees:
-            preferred_times = random.sample(availability_pool, k=2)
+            preferred_times = random.sample(AVAILABILITY_POOL, k=2)
             req = MenteeRequest.objects.create(
                 mentee=mentee,
-                feeling=random.choice(feelings),
-                feeling_cause=random.choice(causes),
-                support_type=random.choice(supports),
-                comfort_level=random.choice(comforts),
-                topics=random.sample(topics, k=random.randint(1, 3)),
+                feeling=random.choice(FEELINGS),
+                feeling_cause=random.choice(CAUSES),
+                support_type=random.choice(SUPPORTS),
+                comfort_level=random.choice(COMFORTS),
+                topics=random.sample(TOPICS, k=random.randint(1, 3)),
                 free_text="Looking for guidance and support.",
                 preferred_times=preferred_times,
-                preferred_format=random.choice(formats),
-                language=random.choice(languages),
-                timezone=mentee.timezone or random.choice(timezones),
-                access_needs=random.choice(access_needs),
-                safety_notes=random.choice(safety_notes),
+                preferred_format=random.choice(FORMATS),
+                language=random.choice(LANGUAGES),
+                timezone=mentee.timezone or random.choice(TIMEZONES),
+                access_needs=random.choice(ACCESS_NEEDS),
+                safety_notes=random.choice(SAFETY_NOTES),
                 session_mode=random.choice(["online", "in_person"]),
                 allow_auto_match=True,
                 safety_flag=random.choice([False, False, False, True]),
@@ -243,3 +361,223 @@ class Command(BaseCommand):
                 )
 
         self.stdout.write(self.style.SUCCESS("Seed data created successfully."))
+
+    def _bulk_insert(self, model, rows, batch_size):
+        started = time.monotonic()
+        created = model.objects.bulk_create(rows, batch_size=batch_size)
+        self.stdout.write(
+            f"  {model.__name__}: {len(created)} rows in {time.monotonic() - started:.1f}s"
+        )
+        return created
+
+    def _seed_bulk(self, *, count, seed, batch_size, sessions_per_mentee):
+        User = get_user_model()
+        rng = random.Random(seed)
+        started = time.monotonic()
+        today = date.today()
+        now = timezone.now()
+        # Hashing once keeps 2 * count users from paying the password hasher per row.
+        password_hash = make_password("password123")
+        statuses = [status for status, _ in SESSION_STATUS_WEIGHTS]
+        status_weights = [weight for _, weight in SESSION_STATUS_WEIGHTS]
+
+        with transaction.atomic():
+            users = []
+            for role in ("mentee", "mentor"):
+                for i in range(count):
+                    email = f"{role}{i+1}@bondroom.local"
+                    users.append(User(username=email, email=email, password=password_hash))
+            users = self._bulk_insert(User, users, batch_size)
+            self._bulk_insert(
+                UserProfile,
+                [
+                    UserProfile(user=user, role="mentee" if idx < count else "mentor")
+                    for idx, user in enumerate(users)
+                ],
+                batch_size,
+            )
+
+            mentees = self._bulk_insert(
+                Mentee,
+                [
+                    Mentee(
+                        first_name=rng.choice(FIRST_NAMES),
+                        last_name=rng.choice(LAST_NAMES),
+                        grade=rng.choice(GRADES),
+                        email=f"mentee{i+1}@bondroom.local",
+                        dob=today - timedelta(days=365 * rng.randint(13, 17)),
+                        gender=rng.choice(GENDERS),
+                        city_state=rng.choice(CITIES),
+                        timezone=rng.choice(TIMEZONES),
+                        parent_guardian_consent=True,
+                        parent_mobile=f"98{i:08d}",
+                        record_consent=True,
+                    )
+                    for i in range(count)
+                ],
+                batch_size,
+            )
+
+            mentors = self._bulk_insert(
+                Mentor,
+                [
+                    Mentor(
+                        first_name=rng.choice(FIRST_NAMES),
+                        last_name=rng.choice(LAST_NAMES),
+                        email=f"mentor{i+1}@bondroom.local",
+                        mobile=f"+91 9{i:09d}",
+                        dob=today - timedelta(days=365 * rng.randint(30, 64)),
+                        gender=rng.choice(GENDERS),
+                        city_state=rng.choice(CITIES),
+                        languages=rng.sample(LANGUAGES, k=rng.randint(1, 3)),
+                        care_areas=rng.sample(CARE_AREAS, k=rng.randint(1, 2)),
+                        preferred_formats=rng.sample(FORMATS, k=rng.randint(1, 2)),
+                        availability=rng.sample(AVAILABILITY_POOL, k=rng.randint(1, 3)),
+                        timezone=rng.choice(TIMEZONES),
+                        qualification="Retired Teacher",
+                        bio=rng.choice(MENTOR_BIOS),
+                        avatar=rng.choice(AVATAR_URLS),
+                        average_rating=Decimal(str(round(rng.uniform(3.0, 5.0), 2))),
+                        response_time_minutes=rng.randint(15, 240),
+                        consent=True,
+                    )
+                    for i in range(count)
+                ],
+                batch_size,
+            )
+
+            onboarding_rows = []
+            for mentor in mentors:
+                # Roughly 70% of mentors are fully onboarded and eligible for matching.
+                identity_status = "completed" if rng.random() < 0.7 else rng.choice(["pending", "in_review"])
+                training_status = "completed" if identity_status == "completed" else "pending"
+                onboarding_rows.append(
+                    MentorOnboardingStatus(
+                        mentor=mentor,
+                        application_status="completed",
+                        identity_status=identity_status,
+                        contact_status="completed",
+                        training_status=training_status,
+                        # bulk_create skips save(), so derive the status here.
+                        current_status=MentorOnboardingStatus.derive_current_status(
+                            application_status="completed",
+                            identity_status=identity_status,
+                            contact_status="completed",
+                            training_status=training_status,
+                        ),
+                    )
+                )
+            self._bulk_insert(MentorOnboardingStatus, onboarding_rows, batch_size)
+            # The candidate and text indexes are signal-maintained, which bulk_create bypasses.
+            reindex_mentors([mentor.id for mentor in mentors])
+            refresh_mentor_text([mentor.id for mentor in mentors])
+
+            self._bulk_insert(
+                MenteeRequest,
+                [
+                    MenteeRequest(
+                        mentee=mentee,
+                        feeling=rng.choice(FEELINGS),
+                        feeling_cause=rng.choice(CAUSES),
+                        support_type=rng.choice(SUPPORTS),
+                        comfort_level=rng.choice(COMFORTS),
+                        topics=rng.sample(TOPICS, k=rng.randint(1, 3)),
+                        free_text="Looking for guidance and support.",
+                        preferred_times=rng.sample(AVAILABILITY_POOL, k=2),
+                        preferred_format=rng.choice(FORMATS),
+                        language=rng.choice(LANGUAGES),
+                        timezone=mentee.timezone,
+                        access_needs=rng.choice(ACCESS_NEEDS),
+                        safety_notes=rng.choice(SAFETY_NOTES),
+                        session_mode=rng.choice(["online", "in_person"]),
+                        allow_auto_match=True,
+                        safety_flag=rng.random() < 0.05,
+                    )
+                    for mentee in mentees
+                ],
+                batch_size,
+            )
+
+            session_rows = []
+            for mentee in mentees:
+                for _ in range(sessions_per_mentee):
+                    status = rng.choices(statuses, weights=status_weights)[0]
+                    if status in {"completed", "canceled", "no_show"}:
+                        start = now - timedelta(days=rng.randint(1, 365), minutes=rng.randint(0, 1439))
+                    else:
+                        start = now + timedelta(days=rng.randint(1, 60), minutes=rng.randint(0, 1439))
+                    duration = rng.choice([30, 45, 60])
+                    session_rows.append(
+                        Session(
+                            mentee=mentee,
+                            mentor=rng.choice(mentors),
+                            scheduled_start=start,
+                            scheduled_end=start + timedelta(minutes=duration),
+                            duration_minutes=duration,
+                            timezone=mentee.timezone,
+                            mode=rng.choice(["online", "online", "in_person"]),
+                            status=status,
+                            topic_tags=rng.sample(TOPICS, k=rng.randint(1, 2)),
+                        )
+                    )
+            sessions = self._bulk_insert(Session, session_rows, batch_size)
+            del session_rows
+
+            completed_sessions = [session for session in sessions if session.status == "completed"]
+            self._bulk_insert(
+                SessionFeedback,
+                [
+                    SessionFeedback(
+                        session=session,
+                        rating=rng.choices([1, 2, 3, 4, 5], weights=[2, 3, 10, 35, 50])[0],
+                        topics_discussed=session.topic_tags,
+                        comments=rng.choice(FEEDBACK_COMMENTS),
+                    )
+                    for session in completed_sessions
+                    if rng.random() < 0.8
+                ],
+                batch_size,
+            )
+
+            signal_rows = []
+            incident_rows = []
+            for session in completed_sessions:
+                signal_rows.extend(
+                    [
+                        SessionMeetingSignal(
+                            session=session, sender_role="mentor", signal_type="offer", payload={"sdp": "seeded"}
+                        ),
+                        SessionMeetingSignal(
+                            session=session, sender_role="mentee", signal_type="answer", payload={"sdp": "seeded"}
+                        ),
+                        SessionMeetingSignal(
+                            session=session,
+                            sender_role=rng.choice(["mentor", "mentee"]),
+                            signal_type="bye",
+                            payload={},
+                        ),
+                    ]
+                )
+                if rng.random() < 0.03:
+                    incident_type, source, severity, action = rng.choice(INCIDENT_SAMPLES)
+                    incident_rows.append(
+                        SessionAbuseIncident(
+                            session=session,
+                            incident_type=incident_type,
+                            detection_source=source,
+                            speaker_role=rng.choice(["mentor", "mentee"]),
+                            transcript_snippet="Seeded incident for load testing.",
+                            severity=severity,
+                            confidence_score=Decimal(str(round(rng.uniform(0.5, 0.99), 2))),
+                            recommended_action=action,
+                            event_timestamp=session.scheduled_start,
+                        )
+                    )
+            self._bulk_insert(SessionMeetingSignal, signal_rows, batch_size)
+            self._bulk_insert(SessionAbuseIncident, incident_rows, batch_size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Bulk seed data created successfully in {time.monotonic() - started:.1f}s."
+            )
+        )
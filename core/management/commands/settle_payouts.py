@@ -0,0 +1,72 @@
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from core.models import PayoutTransaction
+from core.payouts import SETTLEABLE_STATUSES, settle_payouts
+
+
+class Command(BaseCommand):
+    help = "Mark pending payout transactions as paid in bulk and reconcile mentor wallets."
+
+    def add_arguments(self, parser):
+        parser.add_argument("payout_ids", nargs="*", type=int, help="Payout transaction ids to settle.")
+        parser.add_argument("--mentor-id", type=int, help="Only settle payouts for this mentor.")
+        parser.add_argument(
+            "--transaction-type",
+            choices=[choice for choice, _ in PayoutTransaction.TYPE_CHOICES],
+            help="Only settle payouts of this type.",
+        )
+        parser.add_argument(
+            "--created-before",
+            help="Only settle payouts created before this date or datetime (ISO 8601).",
+        )
+        parser.add_argument("--reference-id", default="", help="Bank reference stored on every settled payout.")
+        parser.add_argument("--note", help="Note stored on every settled payout.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be settled without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        payout_ids = options["payout_ids"] or None
+        queryset = PayoutTransaction.objects.all()
+        if payout_ids is None:
+            queryset = queryset.filter(status__in=SETTLEABLE_STATUSES)
+        if options["mentor_id"]:
+            queryset = queryset.filter(mentor_id=options["mentor_id"])
+        if options["transaction_type"]:
+            queryset = queryset.filter(transaction_type=options["transaction_type"])
+        if options["created_before"]:
+            raw_value = options["created_before"]
+            cutoff = parse_datetime(raw_value)
+            if cutoff is None and parse_date(raw_value) is not None:
+                cutoff = datetime.combine(parse_date(raw_value), time.min)
+            if cutoff is None:
+                raise CommandError(f"Invalid --created-before value: {raw_value}")
+            if timezone.is_naive(cutoff):
+                cutoff = timezone.make_aware(cutoff)
+            queryset = queryset.filter(created_at__lt=cutoff)
+        if payout_ids is None and not any(
+            options[key] for key in ("mentor_id", "transaction_type", "created_before")
+        ):
+            raise CommandError("Pass payout ids or at least one filter.")
+
+        report = settle_payouts(
+            queryset,
+            payout_ids=payout_ids,
+            reference_id=options["reference_id"],
+            note=options["note"],
+            dry_run=options["dry_run"],
+        )
+        for skipped in report["skipped"]:
+            self.stderr.write(f"Payout {skipped['id']}: {skipped['reason']}")
+        prefix = "Dry run: " if report["dry_run"] else ""
+        self.stdout.write(
+            f"{prefix}{report['settled_count']} payouts settled for {len(report['mentors'])} mentors "
+            f"({report['settled_amount']}), {report['already_paid_count']} already paid, "
+            f"{len(report['skipped'])} skipped."
+        )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from core.wallet_ledger import take_wallet_snapshots
+
+
+class Command(BaseCommand):
+    help = "Fold settled wallet ledger entries into per-mentor balance snapshots."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--mentor-id",
+            type=int,
+            action="append",
+            dest="mentor_ids",
+            help="Only snapshot this mentor (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        written = take_wallet_snapshots(options["mentor_ids"])
+        self.stdout.write(f"Wallet snapshots: {written} written.")
@@ -3,8 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List, Tuple
 
+from .mentor_index import mentor_text_scores
 from .models import MenteeRequest, Mentor
 
+# Points for a perfect free-text match against a mentor profile; one shared topic is worth 20.
+TEXT_MATCH_WEIGHT = 20
+
 
 @dataclass
 class ScoredMentor:
@@ -56,6 +60,8 @@ def filter_mentors(req: MenteeRequest, mentors: Iterable[Mentor]) -> List[Mentor
 
 def score_mentors(req: MenteeRequest, mentors: Iterable[Mentor]) -> List[ScoredMentor]:
     results: List[ScoredMentor] = []
+    mentors = list(mentors)
+    text_scores = mentor_text_scores(req, [mentor.id for mentor in mentors]) if mentors else {}
     for mentor in mentors:
         matched_topics = list(set(req.topics).intersection(set(mentor.care_areas or [])))
         overlap_slots = availability_overlap(req.preferred_times, mentor.availability)
@@ -78,11 +84,16 @@ def score_mentors(req: MenteeRequest, mentors: Iterable[Mentor]) -> List[ScoredM
             if mentee_city and mentor_city:
                 local_boost = 10 if mentee_city == mentor_city else -10
 
-        score = 40 + topic_score + rating_boost + response_boost + availability_boost + local_boost
+        text_relevance = text_scores.get(mentor.id, 0.0)
+        text_boost = TEXT_MATCH_WEIGHT * text_relevance
+
+        score = 40 + topic_score + rating_boost + response_boost + availability_boost + local_boost + text_boost
 
         explanation_bits = []
         if matched_topics:
             explanation_bits.append("topic overlap")
+        if text_relevance >= 0.5:
+            explanation_bits.append("profile matches your description")
         if overlap_slots:
             explanation_bits.append("availability match")
         if rating_score and rating_score >= 4.5:
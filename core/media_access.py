@@ -0,0 +1,136 @@
+"""
+Shared S3 access for media and recording uploads.
+
+Building a boto3 client loads endpoint data, resolves credentials and parses
+botocore models, which costs milliseconds of CPU per call. Clients are thread
+safe, so one is kept per region/endpoint/credential set for the life of the
+process. Presigned URLs are cached for half of their validity, so a URL handed
+out from the cache always has at least half its lifetime left and list endpoints
+that render the same avatar or gallery image on many rows only sign it once.
+"""
+import hashlib
+import os
+import re
+import threading
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+
+from .local_cache import TTLLRUCache
+
+try:
+    import boto3
+except Exception:  # pragma: no cover - optional dependency in some local setups
+    boto3 = None
+
+try:
+    from botocore.config import Config as BotoConfig
+except Exception:  # pragma: no cover
+    BotoConfig = None
+
+S3_MAX_PRESIGN_SECONDS = 604800
+
+_client_lock = threading.Lock()
+_clients = {}
+PRESIGNED_URL_CACHE = TTLLRUCache(
+    max_entries=int(os.environ.get("S3_PRESIGN_CACHE_MAX_ENTRIES", "4096")),
+    ttl_seconds=1800,
+)
+
+
+def s3_available() -> bool:
+    return boto3 is not None
+
+
+def _settings_credentials() -> dict:
+    return {
+        "access_key": str(getattr(settings, "AWS_ACCESS_KEY_ID", "") or "").strip(),
+        "secret_key": str(getattr(settings, "AWS_SECRET_ACCESS_KEY", "") or "").strip(),
+        "session_token": str(getattr(settings, "AWS_SESSION_TOKEN", "") or "").strip(),
+    }
+
+
+def s3_client(*, region: str = "", endpoint_url: str = "", access_key: str = "", secret_key: str = "", session_token: str = ""):
+    region = str(region or "").strip() or "us-east-1"
+    endpoint_url = str(endpoint_url or "").strip()
+    # Key on a digest so secrets never sit in the dict keys in plain text.
+    secret_digest = hashlib.sha256(f"{secret_key}:{session_token}".encode("utf-8")).hexdigest()
+    client_key = (region, endpoint_url, access_key, secret_digest)
+    client = _clients.get(client_key)
+    if client is not None:
+        return client
+    with _client_lock:
+        client = _clients.get(client_key)
+        if client is not None:
+            return client
+        client_kwargs = {"region_name": region}
+        if endpoint_url:
+            client_kwargs["endpoint_url"] = endpoint_url
+        if BotoConfig is not None:
+            client_kwargs["config"] = BotoConfig(signature_version="s3v4")
+        if access_key and secret_key:
+            client_kwargs["aws_access_key_id"] = access_key
+            client_kwargs["aws_secret_access_key"] = secret_key
+        if session_token:
+            client_kwargs["aws_session_token"] = session_token
+        client = boto3.client("s3", **client_kwargs)
+        _clients[client_key] = client
+        return client
+
+
+def media_s3_client(*, region: str = "", endpoint_url: str = ""):
+    return s3_client(
+        region=region or str(getattr(settings, "AWS_S3_REGION_NAME", "") or ""),
+        endpoint_url=endpoint_url or str(getattr(settings, "AWS_S3_ENDPOINT_URL", "") or ""),
+        **_settings_credentials(),
+    )
+
+
+def s3_bucket_key_from_url(raw_url: str):
+    parsed = urlparse(str(raw_url or "").strip())
+    if parsed.scheme not in {"http", "https"}:
+        return None, None
+
+    host = (parsed.netloc or "").split(":")[0].lower()
+    path = (parsed.path or "").lstrip("/")
+    if not host or not path:
+        return None, None
+
+    configured_bucket = str(getattr(settings, "S3_MEDIA_BUCKET_NAME", "") or "").strip()
+    custom_domain = str(getattr(settings, "S3_MEDIA_CUSTOM_DOMAIN", "") or "").strip().lower()
+    if custom_domain and host == custom_domain and configured_bucket:
+        return configured_bucket, unquote(path)
+
+    virtual_match = re.match(
+        r"^(?P<bucket>[^.]+)\.s3(?:[.-][a-z0-9-]+)*\.amazonaws\.com$",
+        host,
+    )
+    if virtual_match:
+        return virtual_match.group("bucket"), unquote(path)
+
+    if host == "s3.amazonaws.com" or host.startswith("s3.") or host.startswith("s3-"):
+        parts = path.split("/", 1)
+        if len(parts) == 2 and parts[0] and parts[1]:
+            return parts[0], unquote(parts[1])
+
+    return None, None
+
+
+def presigned_url(client, operation: str, params: dict, *, expires_in: int, http_method: str = "") -> str:
+    expires_in = max(1, min(int(expires_in), S3_MAX_PRESIGN_SECONDS))
+    cache_key = (id(client), operation, http_method, expires_in, tuple(sorted(params.items())))
+    cached = PRESIGNED_URL_CACHE.get(cache_key)
+    if cached:
+        return cached
+    kwargs = {"Params": params, "ExpiresIn": expires_in}
+    if http_method:
+        kwargs["HttpMethod"] = http_method
+    url = client.generate_presigned_url(operation, **kwargs)
+    PRESIGNED_URL_CACHE.set(cache_key, url, ttl_seconds=expires_in // 2)
+    return url
+
+
+def clear_caches():
+    with _client_lock:
+        _clients.clear()
+    PRESIGNED_URL_CACHE.clear()
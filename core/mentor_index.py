@@ -0,0 +1,262 @@
+"""
+Inverted candidate index for mentor matching.
+
+Each match-eligible mentor (onboarding completed) is broken into
+``MentorSearchTerm`` rows: one ``pool`` row plus one row per language,
+preferred format, care area, timezone and normalized city. The
+``(facet, value, mentor)`` index turns every filter into a posting-list range
+scan, so candidate generation intersects the request's hard filters
+(language, format, timezone) and ranks by care-area and city hits in SQL,
+picking the best N from the whole pool instead of the first 25 rows.
+The table is a plain side table, so the same queries run on PostgreSQL and
+SQLite. Rows are rewritten by signals whenever a mentor's indexed fields or
+onboarding status change.
+
+Free-text similarity uses ``MentorTextVector`` rows: term counts of each
+mentor's bio, qualification, specialization and care areas, rewritten when
+those change. Every process keeps an in-memory BM25 index with postings
+built from these rows and applies only the rows changed since its last sync,
+prompted by a version key in the shared cache, so scoring a request reads
+only the postings of its own terms.
+"""
+import threading
+from collections import Counter
+from datetime import timedelta
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Q, Value
+from django.utils import timezone
+
+from .models import Mentor, MentorOnboardingStatus, MentorSearchTerm, MentorTextVector
+from .text_index import IncrementalBM25Index, tokenize
+
+INDEXED_MENTOR_FIELDS = ("languages", "preferred_formats", "care_areas", "timezone", "city_state")
+TEXT_MENTOR_FIELDS = ("bio", "qualification", "care_areas")
+TEXT_INDEX_VERSION_KEY = "matching:mentor-text:version"
+# Re-read rows this far behind the last sync so a transaction that committed late is not missed.
+TEXT_SYNC_OVERLAP = timedelta(seconds=60)
+# BM25 score that maps to a relevance of 0.5.
+TEXT_SCORE_MIDPOINT = 1.0
+INDEX_BATCH_SIZE = 500
+POOL_TERM = ("pool", "active")
+
+
+def normalize_term(value) -> str:
+    return " ".join(str(value or "").split()).lower()
+
+
+def mentor_terms(mentor) -> set:
+    """``{(facet, value), ...}`` for ``mentor``; a blank timezone is indexed as ``""`` (matches any)."""
+    terms = {POOL_TERM, ("timezone", normalize_term(mentor.timezone))}
+    for facet, values in (
+        ("language", mentor.languages),
+        ("format", mentor.preferred_formats),
+        ("care_area", mentor.care_areas),
+    ):
+        for value in values if isinstance(values, list) else []:
+            if normalize_term(value):
+                terms.add((facet, normalize_term(value)))
+    city = normalize_term(mentor.city_state)
+    if city:
+        terms.add(("city", city))
+    return terms
+
+
+def reindex_mentors(mentor_ids) -> int:
+    """Rewrite the posting rows of ``mentor_ids``; returns the number of rows added or removed."""
+    mentor_ids = sorted(set(mentor_ids))
+    changed = 0
+    for start in range(0, len(mentor_ids), INDEX_BATCH_SIZE):
+        chunk = mentor_ids[start : start + INDEX_BATCH_SIZE]
+        eligible = Mentor.objects.filter(id__in=chunk, onboarding_status__current_status="completed").only(
+            "id", *INDEXED_MENTOR_FIELDS
+        )
+        wanted = {(mentor.id, facet, value) for mentor in eligible for facet, value in mentor_terms(mentor)}
+        existing = {
+            row[1:]: row[0]
+            for row in MentorSearchTerm.objects.filter(mentor_id__in=chunk).values_list("id", "mentor_id", "facet", "value")
+        }
+        stale = [term_id for key, term_id in existing.items() if key not in wanted]
+        missing = [
+            MentorSearchTerm(mentor_id=mentor_id, facet=facet, value=value)
+            for mentor_id, facet, value in sorted(wanted - set(existing))
+        ]
+        with transaction.atomic():
+            if stale:
+                MentorSearchTerm.objects.filter(id__in=stale).delete()
+            MentorSearchTerm.objects.bulk_create(missing, ignore_conflicts=True)
+        changed += len(stale) + len(missing)
+    return changed
+
+
+def _posting(facet: str, values) -> Exists:
+    return Exists(MentorSearchTerm.objects.filter(mentor_id=OuterRef("pk"), facet=facet, value__in=list(values)))
+
+
+def request_filters(req) -> list:
+    """Hard filters from ``req`` as ``[(facet, values), ...]``, mirroring ``filter_mentors``."""
+    filters = []
+    if req.language:
+        filters.append(("language", [normalize_term(req.language)]))
+    if req.preferred_format:
+        filters.append(("format", [normalize_term(req.preferred_format)]))
+    if req.timezone:
+        filters.append(("timezone", [normalize_term(req.timezone), ""]))
+    return filters
+
+
+def candidate_mentors(req, *, limit: int, accept=None) -> list:
+    """
+    Best ``limit`` eligible mentors for ``req``.
+
+    Mentors passing every hard filter come first, ranked by matching care
+    areas plus a same-city hit for in-person requests, then rating. When no
+    mentor passes the filters the whole pool is ranked the same way, matching
+    the old fall back to the unfiltered pool.
+
+    ``accept`` narrows a page of ranked mentors to those that can take the
+    request on checks the index cannot express, such as availability. Pages
+    are read until ``limit`` mentors are accepted, so strong matches that fail
+    it do not push valid mentors past the cut. If nobody is accepted, the first
+    page is returned as is.
+    """
+    boost = Q()
+    topics = [normalize_term(topic) for topic in req.topics or [] if normalize_term(topic)]
+    if topics:
+        boost |= Q(search_terms__facet="care_area", search_terms__value__in=topics)
+    if req.session_mode == "in_person" and req.mentee_id and normalize_term(req.mentee.city_state):
+        boost |= Q(search_terms__facet="city", search_terms__value=normalize_term(req.mentee.city_state))
+    pool = Mentor.objects.filter(_posting(POOL_TERM[0], [POOL_TERM[1]]))
+
+    def ranked(queryset, accept):
+        term_hits = Count("search_terms", filter=boost) if boost else Value(0)
+        ordered = queryset.annotate(term_hits=term_hits).order_by(
+            "-term_hits", F("average_rating").desc(nulls_last=True), "id"
+        )
+        first_page = list(ordered[:limit])
+        if accept is None or limit <= 0:
+            return first_page
+        page, start, accepted = first_page, 0, []
+        while page:
+            accepted.extend(accept(page))
+            if len(accepted) >= limit or len(page) < limit:
+                break
+            start += limit
+            page = list(ordered[start : start + limit])
+        return accepted[:limit] or first_page
+
+    filters = request_filters(req)
+    if not filters:
+        return ranked(pool, accept)
+    # The unfiltered fall back fails the hard filters anyway, so ``accept`` would only scan it all.
+    return ranked(pool.filter(*[_posting(facet, values) for facet, values in filters]), accept) or ranked(pool, None)
+
+
+def rebuild_mentor_index(*, batch_size: int = INDEX_BATCH_SIZE) -> int:
+    """Reindex every mentor that is eligible or still has rows; returns rows changed."""
+    mentor_ids = set(
+        MentorOnboardingStatus.objects.filter(current_status="completed").values_list("mentor_id", flat=True)
+    )
+    mentor_ids.update(MentorSearchTerm.objects.values_list("mentor_id", flat=True).distinct())
+    mentor_ids = sorted(mentor_ids)
+    return sum(
+        reindex_mentors(mentor_ids[start : start + batch_size]) for start in range(0, len(mentor_ids), batch_size)
+    )
+
+
+def mentor_document(mentor, specialization: str = "") -> str:
+    care_areas = mentor.care_areas if isinstance(mentor.care_areas, list) else []
+    return " ".join([mentor.bio or "", mentor.qualification or "", specialization or "", *map(str, care_areas)])
+
+
+def request_document(req) -> str:
+    topics = req.topics if isinstance(req.topics, list) else []
+    return " ".join(
+        [req.free_text or "", req.feeling_cause or "", req.support_type or "", req.feeling or "", *map(str, topics)]
+    )
+
+
+def _bump_text_version():
+    cache.set(TEXT_INDEX_VERSION_KEY, uuid4().hex, None)
+
+
+def refresh_mentor_text(mentor_ids) -> int:
+    """Rewrite the stored term counts of ``mentor_ids``; returns how many rows changed."""
+    mentor_ids = sorted(set(mentor_ids))
+    changed = 0
+    for start in range(0, len(mentor_ids), INDEX_BATCH_SIZE):
+        chunk = mentor_ids[start : start + INDEX_BATCH_SIZE]
+        specializations = dict(Mentor.objects.filter(id__in=chunk).values_list("id", "profile__specialization"))
+        existing = {vector.mentor_id: vector for vector in MentorTextVector.objects.filter(mentor_id__in=chunk)}
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        for mentor in Mentor.objects.filter(id__in=chunk).only("id", *TEXT_MENTOR_FIELDS):
+            terms = dict(Counter(tokenize(mentor_document(mentor, specializations.get(mentor.id) or ""))))
+            vector = existing.get(mentor.id)
+            if vector is None:
+                to_create.append(MentorTextVector(mentor_id=mentor.id, terms=terms, length=sum(terms.values())))
+            elif vector.terms != terms:
+                vector.terms = terms
+                vector.length = sum(terms.values())
+                # bulk_update skips auto_now.
+                vector.updated_at = now
+                to_update.append(vector)
+        MentorTextVector.objects.bulk_create(to_create, batch_size=INDEX_BATCH_SIZE, ignore_conflicts=True)
+        MentorTextVector.objects.bulk_update(to_update, ["terms", "length", "updated_at"], batch_size=INDEX_BATCH_SIZE)
+        changed += len(to_create) + len(to_update)
+    if changed:
+        # Bump now for this process and again after commit for everyone else.
+        _bump_text_version()
+        transaction.on_commit(_bump_text_version)
+    return changed
+
+
+class _MentorTextIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = IncrementalBM25Index()
+        self._version = None
+        self._synced_until = None
+
+    def _load(self, rows, index):
+        for mentor_id, terms in rows.values_list("mentor_id", "terms").iterator():
+            index.set(mentor_id, terms or {})
+
+    def current(self) -> IncrementalBM25Index:
+        version = cache.get(TEXT_INDEX_VERSION_KEY)
+        with self._lock:
+            if self._synced_until is not None and version == self._version:
+                return self._index
+            started = timezone.now()
+            if self._synced_until is None:
+                self._load(MentorTextVector.objects.all(), self._index)
+            else:
+                self._load(
+                    MentorTextVector.objects.filter(updated_at__gte=self._synced_until - TEXT_SYNC_OVERLAP),
+                    self._index,
+                )
+                if MentorTextVector.objects.count() != len(self._index):
+                    # Rows were deleted; postings cannot be diffed, so rebuild.
+                    self._index = IncrementalBM25Index()
+                    self._load(MentorTextVector.objects.all(), self._index)
+            self._version = version
+            self._synced_until = started
+            return self._index
+
+
+MENTOR_TEXT_INDEX = _MentorTextIndex()
+
+
+def mentor_text_scores(req, mentor_ids) -> dict:
+    """
+    ``{mentor_id: relevance}`` in ``[0, 1)`` for ``req``'s free text against mentor profiles.
+
+    The BM25 score is squashed as ``score / (score + TEXT_SCORE_MIDPOINT)``, so
+    relevance does not depend on which other mentors are being compared;
+    mentors with no shared term are left out.
+    """
+    results = MENTOR_TEXT_INDEX.current().search(request_document(req), mentor_ids)
+    return {mentor_id: score / (score + TEXT_SCORE_MIDPOINT) for mentor_id, (score, _coverage) in results.items()}
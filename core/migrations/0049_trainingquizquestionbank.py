@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-18 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0048_sessionsummaryjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrainingQuizQuestionBank',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('module_ids', models.JSONField(blank=True, default=list)),
+                ('questions', models.JSONField(blank=True, default=list)),
+                ('question_count', models.PositiveIntegerField(default=0)),
+                ('generated_by', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_trainingquizquestionbank'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentee',
+            name='media_derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='mentorprofile',
+            name='media_derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='volunteerevent',
+            name='media_derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0050_mentee_media_derivatives_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentoridentityverification',
+            name='document_metadata',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
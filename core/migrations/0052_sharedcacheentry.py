@@ -0,0 +1,24 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0051_mentoridentityverification_document_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SharedCacheEntry',
+            fields=[
+                ('cache_key', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('value', models.TextField()),
+                ('expires', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'db_table': 'core_shared_cache',
+            },
+        ),
+    ]
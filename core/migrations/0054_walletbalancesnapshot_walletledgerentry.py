@@ -0,0 +1,72 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:22
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+def record_opening_balances(apps, schema_editor):
+    MentorWallet = apps.get_model("core", "MentorWallet")
+    WalletLedgerEntry = apps.get_model("core", "WalletLedgerEntry")
+    entries = [
+        WalletLedgerEntry(
+            mentor_id=wallet.mentor_id,
+            entry_type="opening",
+            current_balance_delta=wallet.current_balance,
+            pending_payout_delta=wallet.pending_payout,
+            total_claimed_delta=wallet.total_claimed,
+            total_donated_delta=wallet.total_donated,
+            note="Balance carried over from MentorWallet.",
+        )
+        for wallet in MentorWallet.objects.order_by("mentor_id").iterator()
+    ]
+    WalletLedgerEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0053_userprofile_token_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletBalanceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_entry_id', models.BigIntegerField()),
+                ('covered_until', models.DateTimeField()),
+                ('current_balance', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('pending_payout', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('total_claimed', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('total_donated', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('mentor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='wallet_snapshots', to='core.mentor')),
+            ],
+            options={
+                'ordering': ['-covered_until', '-id'],
+                'indexes': [models.Index(fields=['mentor', '-covered_until'], name='core_wallet_mentor__7e9f28_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='WalletLedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entry_type', models.CharField(choices=[('opening', 'Opening Balance'), ('claim', 'Session Claim'), ('donation', 'Session Donation'), ('payout_settled', 'Payout Settled'), ('payout_reopened', 'Payout Reopened'), ('adjustment', 'Adjustment')], max_length=20)),
+                ('current_balance_delta', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('pending_payout_delta', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('total_claimed_delta', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('total_donated_delta', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('note', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('mentor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='wallet_entries', to='core.mentor')),
+                ('payout_transaction', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='wallet_entries', to='core.payouttransaction')),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='wallet_entries', to='core.session')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['mentor', 'id'], name='core_wallet_mentor__93426e_idx')],
+            },
+        ),
+        migrations.RunPython(record_opening_balances, migrations.RunPython.noop),
+    ]
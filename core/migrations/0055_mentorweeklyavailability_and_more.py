@@ -0,0 +1,95 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:28
+
+import django.db.models.deletion
+import math
+from datetime import timezone as dt_timezone
+
+from django.db import migrations, models
+
+from core.availability import normalize_weekly_availability
+
+
+def backfill_availability_index(apps, schema_editor):
+    MentorAvailabilitySlot = apps.get_model("core", "MentorAvailabilitySlot")
+    MentorWeeklyAvailability = apps.get_model("core", "MentorWeeklyAvailability")
+    Mentor = apps.get_model("core", "Mentor")
+
+    slots = []
+    for slot in MentorAvailabilitySlot.objects.order_by("id").iterator():
+        start_utc = slot.start_time.astimezone(dt_timezone.utc)
+        midnight = start_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+        slot.start_day = start_utc.date()
+        slot.start_minute = int((start_utc - midnight).total_seconds() // 60)
+        end_minute = math.ceil((slot.end_time.astimezone(dt_timezone.utc) - midnight).total_seconds() / 60)
+        slot.end_minute = max(slot.start_minute, int(end_minute))
+        slots.append(slot)
+    MentorAvailabilitySlot.objects.bulk_update(slots, ["start_day", "start_minute", "end_minute"], batch_size=500)
+
+    rows = [
+        MentorWeeklyAvailability(
+            mentor_id=mentor.id,
+            weekday=weekday,
+            start_minute=start,
+            end_minute=end,
+            timezone=mentor.timezone or "",
+        )
+        for mentor in Mentor.objects.order_by("id").only("id", "availability", "timezone").iterator()
+        for weekday, start, end in normalize_weekly_availability(mentor.availability)
+    ]
+    MentorWeeklyAvailability.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0054_walletbalancesnapshot_walletledgerentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MentorWeeklyAvailability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField()),
+                ('start_minute', models.PositiveSmallIntegerField()),
+                ('end_minute', models.PositiveSmallIntegerField()),
+                ('timezone', models.CharField(blank=True, max_length=50)),
+            ],
+            options={
+                'ordering': ['mentor_id', 'weekday', 'start_minute'],
+            },
+        ),
+        migrations.AddField(
+            model_name='mentoravailabilityslot',
+            name='end_minute',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='mentoravailabilityslot',
+            name='start_day',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mentoravailabilityslot',
+            name='start_minute',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='mentoravailabilityslot',
+            index=models.Index(fields=['start_day', 'start_minute'], name='core_slot_day_bucket_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mentoravailabilityslot',
+            index=models.Index(fields=['mentor', 'start_time'], name='core_slot_mentor_start_idx'),
+        ),
+        migrations.AddField(
+            model_name='mentorweeklyavailability',
+            name='mentor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_availability', to='core.mentor'),
+        ),
+        migrations.AddIndex(
+            model_name='mentorweeklyavailability',
+            index=models.Index(fields=['weekday', 'start_minute', 'end_minute'], name='core_weekly_window_idx'),
+        ),
+        migrations.RunPython(backfill_availability_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0055_mentorweeklyavailability_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentoravailabilityslot',
+            name='held_by',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='slot_holds', to='core.mentee'),
+        ),
+        migrations.AddField(
+            model_name='mentoravailabilityslot',
+            name='held_until',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentor', 'scheduled_start'], name='core_session_mentor_start_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0056_mentoravailabilityslot_held_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mentoravailabilityslot',
+            name='source',
+            field=models.CharField(choices=[('manual', 'Manual'), ('recurring', 'Recurring')], default='manual', editable=False, max_length=20),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from core.mentor_index import mentor_terms
+
+
+def build_mentor_index(apps, schema_editor):
+    Mentor = apps.get_model("core", "Mentor")
+    MentorSearchTerm = apps.get_model("core", "MentorSearchTerm")
+    mentors = Mentor.objects.filter(onboarding_status__current_status="completed").order_by("id")
+    rows = [
+        MentorSearchTerm(mentor_id=mentor.id, facet=facet, value=value)
+        for mentor in mentors.iterator()
+        for facet, value in sorted(mentor_terms(mentor))
+    ]
+    MentorSearchTerm.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0057_mentoravailabilityslot_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MentorSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(choices=[('pool', 'Pool'), ('language', 'Language'), ('format', 'Format'), ('care_area', 'Care area'), ('timezone', 'Timezone'), ('city', 'City')], max_length=20)),
+                ('value', models.CharField(blank=True, max_length=150)),
+                ('mentor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='core.mentor')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['facet', 'value', 'mentor'], name='core_search_term_posting_idx')],
+                'constraints': [models.UniqueConstraint(fields=('mentor', 'facet', 'value'), name='core_mentor_search_term_unique')],
+            },
+        ),
+        migrations.RunPython(build_mentor_index, migrations.RunPython.noop),
+    ]
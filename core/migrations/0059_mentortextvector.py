@@ -0,0 +1,41 @@
+# Generated by Django 5.2.11 on 2026-10-18 21:40
+
+import django.db.models.deletion
+from collections import Counter
+
+from django.db import migrations, models
+
+from core.mentor_index import mentor_document
+from core.text_index import tokenize
+
+
+def build_mentor_text_vectors(apps, schema_editor):
+    Mentor = apps.get_model("core", "Mentor")
+    MentorTextVector = apps.get_model("core", "MentorTextVector")
+    specializations = dict(Mentor.objects.values_list("id", "profile__specialization"))
+    rows = []
+    for mentor in Mentor.objects.order_by("id").iterator():
+        terms = dict(Counter(tokenize(mentor_document(mentor, specializations.get(mentor.id) or ""))))
+        rows.append(MentorTextVector(mentor_id=mentor.id, terms=terms, length=sum(terms.values())))
+    MentorTextVector.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0058_mentorsearchterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MentorTextVector',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('terms', models.JSONField(blank=True, default=dict)),
+                ('length', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('mentor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='text_vector', to='core.mentor')),
+            ],
+        ),
+        migrations.RunPython(build_mentor_text_vectors, migrations.RunPython.noop),
+    ]
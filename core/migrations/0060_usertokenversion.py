@@ -0,0 +1,46 @@
+# Generated by Django 5.2.11 on 2026-10-18 22:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_profile_token_versions(apps, schema_editor):
+    UserProfile = apps.get_model('core', 'UserProfile')
+    UserTokenVersion = apps.get_model('core', 'UserTokenVersion')
+    UserTokenVersion.objects.bulk_create(
+        [
+            UserTokenVersion(user_id=user_id, version=version)
+            for user_id, version in UserProfile.objects.filter(token_version__gt=0).values_list('user_id', 'token_version')
+        ]
+    )
+
+
+def copy_token_versions_back(apps, schema_editor):
+    UserProfile = apps.get_model('core', 'UserProfile')
+    UserTokenVersion = apps.get_model('core', 'UserTokenVersion')
+    for user_id, version in UserTokenVersion.objects.values_list('user_id', 'version'):
+        UserProfile.objects.filter(user_id=user_id).update(token_version=version)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0059_mentortextvector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTokenVersion',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='token_version', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('version', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(copy_profile_token_versions, copy_token_versions_back),
+        migrations.RemoveField(
+            model_name='userprofile',
+            name='token_version',
+        ),
+    ]
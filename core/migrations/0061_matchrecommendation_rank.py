@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-18 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0060_usertokenversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='matchrecommendation',
+            name='rank',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
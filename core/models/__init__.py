@@ -1,6 +1,7 @@
 from .mentee import Mentee
 from .mentee_flow import (
     MentorAvailabilitySlot,
+    MentorWeeklyAvailability,
     MenteePreferences,
     ParentConsentVerification,
     Session,
@@ -8,6 +9,7 @@ from .mentee_flow import (
     SessionFeedback,
     SessionMeetingSignal,
     SessionRecording,
+    SessionSummaryJob,
 )
 from .mentor import Mentor
 from .mentor_finance import (
@@ -17,6 +19,8 @@ from .mentor_finance import (
     PayoutTransaction,
     SessionDisposition,
     SessionIssueReport,
+    WalletBalanceSnapshot,
+    WalletLedgerEntry,
 )
 from .mentor_onboarding import (
     MentorContactVerification,
@@ -25,28 +29,34 @@ from .mentor_onboarding import (
     MentorTrainingQuizAttempt,
     MentorTrainingProgress,
     TrainingModule,
+    TrainingQuizQuestionBank,
 )
 from .contact_otp import ContactOtpRequest
-from .matching import MatchRecommendation, MenteeRequest
+from .matching import MatchRecommendation, MenteeRequest, MentorSearchTerm, MentorTextVector
 from .admin_account import AdminAccount
-from .user_profile import UserProfile
+from .user_profile import UserProfile, UserTokenVersion
 from .volunteer import VolunteerEvent, VolunteerEventRegistration
 from .site_setting import SiteSetting
+from .shared_cache import SharedCacheEntry
 
 __all__ = [
     'Mentee',
     'ParentConsentVerification',
     'MenteePreferences',
     'MentorAvailabilitySlot',
+    'MentorWeeklyAvailability',
     'Session',
     'SessionFeedback',
     'SessionRecording',
+    'SessionSummaryJob',
     'SessionMeetingSignal',
     'SessionAbuseIncident',
     'Mentor',
     'MentorProfile',
     'SessionDisposition',
     'MentorWallet',
+    'WalletLedgerEntry',
+    'WalletBalanceSnapshot',
     'PayoutTransaction',
     'DonationTransaction',
     'SessionIssueReport',
@@ -57,11 +67,16 @@ __all__ = [
     'TrainingModule',
     'MentorTrainingProgress',
     'MentorTrainingQuizAttempt',
+    'TrainingQuizQuestionBank',
     'MenteeRequest',
     'MatchRecommendation',
+    'MentorSearchTerm',
+    'MentorTextVector',
     'AdminAccount',
     'UserProfile',
+    'UserTokenVersion',
     'VolunteerEvent',
     'VolunteerEventRegistration',
     'SiteSetting',
+    'SharedCacheEntry',
 ]
@@ -98,6 +98,9 @@ class MatchRecommendation(models.Model):
     )
     mentor = models.ForeignKey(Mentor, on_delete=models.CASCADE, related_name='recommendations')
     score = models.DecimalField(max_digits=5, decimal_places=2)
+    # 1 = best; the order the provider (or the local fallback) ranked this mentor in, while
+    # ``score`` stays the mentor's own score. Empty on rows created before ranks existed.
+    rank = models.PositiveSmallIntegerField(null=True, blank=True)
     explanation = models.TextField(blank=True)
     matched_topics = models.JSONField(default=list, blank=True)
     availability_overlap = models.JSONField(default=list, blank=True)
@@ -113,3 +116,43 @@ class MatchRecommendation(models.Model):
 
     def __str__(self) -> str:
         return f"Rec #{self.id} (req {self.mentee_request_id} → mentor {self.mentor_id})"
+
+
+class MentorSearchTerm(models.Model):
+    """Posting-list row of the mentor candidate index; only match-eligible mentors have rows."""
+
+    FACET_CHOICES = [
+        ('pool', 'Pool'),
+        ('language', 'Language'),
+        ('format', 'Format'),
+        ('care_area', 'Care area'),
+        ('timezone', 'Timezone'),
+        ('city', 'City'),
+    ]
+
+    mentor = models.ForeignKey(Mentor, on_delete=models.CASCADE, related_name='search_terms')
+    facet = models.CharField(max_length=20, choices=FACET_CHOICES)
+    value = models.CharField(max_length=150, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['mentor', 'facet', 'value'], name='core_mentor_search_term_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['facet', 'value', 'mentor'], name='core_search_term_posting_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.facet}={self.value} (mentor {self.mentor_id})"
+
+
+class MentorTextVector(models.Model):
+    """Term counts of a mentor's profile text; the BM25 ranker is loaded from these rows."""
+
+    mentor = models.OneToOneField(Mentor, on_delete=models.CASCADE, related_name='text_vector')
+    terms = models.JSONField(default=dict, blank=True)
+    length = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"Text vector for mentor {self.mentor_id}"
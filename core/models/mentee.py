@@ -40,6 +40,7 @@ class Mentee(models.Model):
     signup_source = models.CharField(max_length=20, choices=SIGNUP_SOURCE_CHOICES, default=SIGNUP_SOURCE_REGULAR)
     mentee_program_enabled = models.BooleanField(default=True)
     avatar = models.FileField(upload_to='mentee/avatar/', null=True, blank=True)
+    media_derivatives = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
@@ -1,3 +1,6 @@
+import math
+from datetime import timezone as dt_timezone
+
 from django.db import models
 
 from .mentee import Mentee
@@ -50,6 +53,12 @@ class MenteePreferences(models.Model):
 
 
 class MentorAvailabilitySlot(models.Model):
+    BUCKET_FIELDS = ("start_day", "start_minute", "end_minute")
+    SOURCE_CHOICES = [
+        ("manual", "Manual"),
+        ("recurring", "Recurring"),
+    ]
+
     mentor = models.ForeignKey(
         Mentor, on_delete=models.CASCADE, related_name="availability_slots"
     )
@@ -57,15 +66,78 @@ class MentorAvailabilitySlot(models.Model):
     end_time = models.DateTimeField()
     timezone = models.CharField(max_length=50, blank=True)
     is_available = models.BooleanField(default=True)
+    # Recurring slots are generated from Mentor.availability and replaced when it changes.
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES, default="manual", editable=False)
+    # Interval index: UTC day of start_time plus minutes from that midnight.
+    # end_minute can pass 1440 when a slot crosses midnight.
+    start_day = models.DateField(null=True, blank=True, editable=False)
+    start_minute = models.PositiveSmallIntegerField(default=0, editable=False)
+    end_minute = models.PositiveIntegerField(default=0, editable=False)
+    # Short-lived reservation taken while a mentee completes a booking.
+    held_by = models.ForeignKey(
+        Mentee,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="slot_holds",
+    )
+    held_until = models.DateTimeField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
 
     class Meta:
         ordering = ["start_time", "id"]
+        indexes = [
+            models.Index(fields=["start_day", "start_minute"], name="core_slot_day_bucket_idx"),
+            models.Index(fields=["mentor", "start_time"], name="core_slot_mentor_start_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Slot {self.start_time} - {self.end_time} (mentor {self.mentor_id})"
 
+    def sync_buckets(self):
+        if not self.start_time or not self.end_time:
+            return
+        start_utc = self.start_time.astimezone(dt_timezone.utc)
+        midnight = start_utc.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.start_day = start_utc.date()
+        self.start_minute = int((start_utc - midnight).total_seconds() // 60)
+        self.end_minute = max(
+            self.start_minute,
+            int(math.ceil((self.end_time.astimezone(dt_timezone.utc) - midnight).total_seconds() / 60)),
+        )
+
+    def save(self, *args, **kwargs):
+        self.sync_buckets()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"start_time", "end_time"} & set(update_fields):
+            kwargs["update_fields"] = [*update_fields, *self.BUCKET_FIELDS]
+        return super().save(*args, **kwargs)
+
+
+class MentorWeeklyAvailability(models.Model):
+    """Normalized copy of ``Mentor.availability``; rebuilt whenever that JSON changes."""
+
+    WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+    mentor = models.ForeignKey(
+        Mentor, on_delete=models.CASCADE, related_name="weekly_availability"
+    )
+    weekday = models.PositiveSmallIntegerField()
+    start_minute = models.PositiveSmallIntegerField()
+    end_minute = models.PositiveSmallIntegerField()
+    timezone = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        ordering = ["mentor_id", "weekday", "start_minute"]
+        indexes = [
+            models.Index(fields=["weekday", "start_minute", "end_minute"], name="core_weekly_window_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.WEEKDAYS[self.weekday]} {self.start_minute}-{self.end_minute} (mentor {self.mentor_id})"
+
 
 class Session(models.Model):
     STATUS_CHOICES = [
@@ -114,6 +186,9 @@ class Session(models.Model):
 
     class Meta:
         ordering = ["-scheduled_start", "-id"]
+        indexes = [
+            models.Index(fields=["mentor", "scheduled_start"], name="core_session_mentor_start_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Session {self.id} ({self.mentee_id} -> {self.mentor_id})"
@@ -160,6 +235,34 @@ class SessionRecording(models.Model):
         return f"Recording for session {self.session_id}"
 
 
+class SessionSummaryJob(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    session = models.OneToOneField(
+        Session, on_delete=models.CASCADE, related_name="summary_job"
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    trigger = models.CharField(max_length=40, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    last_error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self) -> str:
+        return f"Summary job for session {self.session_id} ({self.status})"
+
+
 class SessionMeetingSignal(models.Model):
     SIGNAL_TYPE_CHOICES = [
         ("offer", "Offer"),
@@ -18,6 +18,7 @@ class MentorProfile(models.Model):
         null=True,
         blank=True,
     )
+    media_derivatives = models.JSONField(default=dict, blank=True)
     is_active = models.BooleanField(default=True)
     sessions_completed = models.PositiveIntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
@@ -79,6 +80,89 @@ class MentorWallet(models.Model):
         return f"Wallet for mentor {self.mentor_id}"
 
 
+class WalletLedgerEntry(models.Model):
+    """Append-only change to a mentor's wallet balances; ``MentorWallet`` is their running sum."""
+
+    TYPE_CHOICES = [
+        ("opening", "Opening Balance"),
+        ("claim", "Session Claim"),
+        ("donation", "Session Donation"),
+        ("payout_settled", "Payout Settled"),
+        ("payout_reopened", "Payout Reopened"),
+        ("adjustment", "Adjustment"),
+    ]
+
+    mentor = models.ForeignKey(
+        Mentor, on_delete=models.CASCADE, related_name="wallet_entries"
+    )
+    entry_type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    current_balance_delta = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    pending_payout_delta = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    total_claimed_delta = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    total_donated_delta = models.DecimalField(
+        max_digits=10, decimal_places=2, default=Decimal("0.00")
+    )
+    session = models.ForeignKey(
+        Session,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="wallet_entries",
+    )
+    payout_transaction = models.ForeignKey(
+        "PayoutTransaction",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="wallet_entries",
+    )
+    note = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [models.Index(fields=["mentor", "id"])]
+
+    def __str__(self) -> str:
+        return f"Wallet entry {self.id} ({self.entry_type}) for mentor {self.mentor_id}"
+
+
+class WalletBalanceSnapshot(models.Model):
+    """Cumulative wallet balances over every ledger entry up to ``last_entry_id``."""
+
+    mentor = models.ForeignKey(
+        Mentor, on_delete=models.CASCADE, related_name="wallet_snapshots"
+    )
+    last_entry_id = models.BigIntegerField()
+    covered_until = models.DateTimeField()
+    current_balance = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0.00")
+    )
+    pending_payout = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0.00")
+    )
+    total_claimed = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0.00")
+    )
+    total_donated = models.DecimalField(
+        max_digits=12, decimal_places=2, default=Decimal("0.00")
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-covered_until", "-id"]
+        indexes = [models.Index(fields=["mentor", "-covered_until"])]
+
+    def __str__(self) -> str:
+        return f"Wallet snapshot for mentor {self.mentor_id} at {self.covered_until}"
+
+
 class PayoutTransaction(models.Model):
     TYPE_CHOICES = [
         ("session_claim", "Session Claim"),
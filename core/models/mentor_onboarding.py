@@ -57,6 +57,7 @@ class MentorIdentityVerification(models.Model):
     )
     document_review_status = models.JSONField(default=dict, blank=True)
     document_review_comments = models.JSONField(default=dict, blank=True)
+    document_metadata = models.JSONField(default=dict, blank=True)
     additional_notes = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     submitted_at = models.DateTimeField(auto_now_add=True)
@@ -239,3 +240,19 @@ class MentorTrainingQuizAttempt(models.Model):
 
     def __str__(self) -> str:
         return f"Mentor {self.mentor_id} quiz attempt #{self.id} ({self.status})"
+
+
+class TrainingQuizQuestionBank(models.Model):
+    content_hash = models.CharField(max_length=64, unique=True)
+    module_ids = models.JSONField(default=list, blank=True)
+    questions = models.JSONField(default=list, blank=True)
+    question_count = models.PositiveIntegerField(default=0)
+    generated_by = models.CharField(max_length=100, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+
+    def __str__(self) -> str:
+        return f"Quiz question bank {self.content_hash[:12]} ({self.question_count} questions)"
@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class SharedCacheEntry(models.Model):
+    """
+    Backing table for the shared cache tier (``django.core.cache.backends.db.DatabaseCache``).
+
+    The columns mirror what ``createcachetable`` would create, so the table ships
+    with regular migrations instead of a separate deploy step.
+    """
+
+    cache_key = models.CharField(max_length=255, primary_key=True)
+    value = models.TextField()
+    expires = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = "core_shared_cache"
+
+    def __str__(self) -> str:
+        return self.cache_key
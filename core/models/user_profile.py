@@ -16,3 +16,18 @@ class UserProfile(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user.username} ({self.role})"
+
+
+class UserTokenVersion(models.Model):
+    # Embedded in issued JWTs; bumping it revokes every outstanding token for the user.
+    # Kept off UserProfile because admins that exist only as an AdminAccount have no profile.
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="token_version",
+    )
+    version = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.user_id} v{self.version}"
@@ -29,6 +29,7 @@ class VolunteerEvent(models.Model):
     joined_count = models.PositiveIntegerField(default=0)
     completion_brief = models.TextField(blank=True)
     gallery_images = models.JSONField(default=list, blank=True)
+    media_derivatives = models.JSONField(default=dict, blank=True)
     available_roles = models.JSONField(default=list, blank=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -0,0 +1,124 @@
+"""
+Batched payout settlement.
+
+Settling a payout moves its amount out of the mentor's ``pending_payout``.
+Monthly runs settle thousands of claims at once, so instead of one wallet
+read-modify-write per payout, ``settle_payouts`` locks the payout rows and
+then the affected wallets (both in primary-key order, so concurrent runs and
+the single-payout endpoints queue up instead of deadlocking), posts one
+ledger entry per payout, which moves each wallet by its aggregated total in
+one F-expression UPDATE, and writes every payout with ``bulk_update``. A mentor whose wallet cannot cover the batch total is
+skipped as a whole and reported, rather than failing the entire run.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import MentorWallet, PayoutTransaction, WalletLedgerEntry
+from .wallet_ledger import ensure_wallets, post_wallet_entries
+
+SETTLEABLE_STATUSES = ("pending", "processing")
+UPDATE_BATCH_SIZE = 500
+
+
+def lock_wallets(mentor_ids) -> dict:
+    """Create any missing wallets, then lock them in mentor order; returns ``{mentor_id: wallet}``."""
+    mentor_ids = sorted(set(mentor_ids))
+    if not mentor_ids:
+        return {}
+    ensure_wallets(mentor_ids)
+    wallets = MentorWallet.objects.select_for_update().filter(mentor_id__in=mentor_ids).order_by("mentor_id")
+    return {wallet.mentor_id: wallet for wallet in wallets}
+
+
+def payout_entry(payout, entry_type: str) -> WalletLedgerEntry:
+    amount = payout.amount or Decimal("0.00")
+    return WalletLedgerEntry(
+        mentor_id=payout.mentor_id,
+        entry_type=entry_type,
+        pending_payout_delta=-amount if entry_type == "payout_settled" else amount,
+        session_id=payout.session_id,
+        payout_transaction=payout,
+    )
+
+
+def settle_payouts(queryset=None, *, payout_ids=None, reference_id: str = "", note=None, dry_run: bool = False) -> dict:
+    """
+    Mark unpaid payouts from ``payout_ids`` and/or ``queryset`` as paid.
+
+    Returns a settlement report with settled/skipped counts, the settled total
+    and a per-mentor breakdown. ``dry_run`` computes the report under the same
+    locks but writes nothing.
+    """
+    if queryset is None:
+        queryset = PayoutTransaction.objects.all()
+    if payout_ids is not None:
+        queryset = queryset.filter(id__in=list(payout_ids))
+    reference_id = str(reference_id or "").strip()
+    now = timezone.now()
+    report = {
+        "dry_run": dry_run,
+        "settled_count": 0,
+        "settled_amount": Decimal("0.00"),
+        "already_paid_count": 0,
+        "skipped": [],
+        "mentors": [],
+    }
+
+    with transaction.atomic():
+        payouts = list(
+            PayoutTransaction.objects.select_for_update()
+            .filter(id__in=queryset.values("id"))
+            .order_by("id")
+        )
+        by_mentor = defaultdict(list)
+        for payout in payouts:
+            if payout.status == "paid":
+                report["already_paid_count"] += 1
+            elif payout.status not in SETTLEABLE_STATUSES:
+                report["skipped"].append({"id": payout.id, "reason": f"Status '{payout.status}' cannot be settled."})
+            else:
+                by_mentor[payout.mentor_id].append(payout)
+
+        wallets = lock_wallets(by_mentor)
+        settled = []
+        for mentor_id, mentor_payouts in sorted(by_mentor.items()):
+            total = sum((payout.amount or Decimal("0.00") for payout in mentor_payouts), Decimal("0.00"))
+            pending = wallets[mentor_id].pending_payout
+            if pending < total:
+                reason = f"Pending payout is lower than the payout total ({pending} < {total})."
+                report["skipped"].extend({"id": payout.id, "reason": reason} for payout in mentor_payouts)
+                continue
+            settled.extend(mentor_payouts)
+            report["mentors"].append(
+                {
+                    "mentor_id": mentor_id,
+                    "payout_count": len(mentor_payouts),
+                    "amount": total,
+                    "pending_payout": pending - total,
+                }
+            )
+            report["settled_amount"] += total
+        report["settled_count"] = len(settled)
+
+        if dry_run or not settled:
+            return report
+
+        update_fields = ["status", "processed_at", "updated_at"]
+        if reference_id:
+            update_fields.append("reference_id")
+        if note is not None:
+            update_fields.append("note")
+        for payout in settled:
+            payout.status = "paid"
+            payout.processed_at = payout.processed_at or now
+            payout.updated_at = now
+            if reference_id:
+                payout.reference_id = reference_id
+            if note is not None:
+                payout.note = str(note)
+        post_wallet_entries([payout_entry(payout, "payout_settled") for payout in settled])
+        PayoutTransaction.objects.bulk_update(settled, update_fields, batch_size=UPDATE_BATCH_SIZE)
+    return report
@@ -13,6 +13,9 @@ def user_role(user):
         return None
     if user.is_superuser:
         return ROLE_ADMIN
+    if getattr(user, "token", None) is not None:
+        # Stateless JWT user: the role claim was checked against the token version.
+        return getattr(user, "role", None)
     try:
         return user.userprofile.role
     except Exception:
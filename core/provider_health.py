@@ -0,0 +1,163 @@
+"""
+Circuit breakers for outbound LLM providers.
+
+Breaker state lives in the Django cache so every worker sharing the cache sees
+the same open/closed decision: per-window call and failure counters, plus a
+state key that exists only while the circuit is open. ``provider_http.urlopen`` consults and updates
+the breaker for each call; feature code uses ``failover_order`` to pick between
+the OpenAI and OpenRouter paths and falls back locally when both are open.
+"""
+import os
+import time
+import urllib.error
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .shared_cache import incr_counter
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+LLM_PROVIDERS = ("openai", "openrouter")
+
+
+class ProviderUnavailable(urllib.error.URLError):
+    def __init__(self, provider: str, model: str = ""):
+        self.provider = provider
+        self.model = model
+        label = f"{provider}:{model}" if model else provider
+        super().__init__(f"circuit_open:{label}")
+
+
+def _env_float(env_key: str, default: float) -> float:
+    try:
+        value = float(os.environ.get(env_key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _thresholds():
+    return {
+        "failure_rate": _env_float("PROVIDER_BREAKER_FAILURE_RATE", 0.5),
+        "min_requests": int(_env_float("PROVIDER_BREAKER_MIN_REQUESTS", 5)),
+        "slow_call_ms": _env_float("PROVIDER_BREAKER_SLOW_CALL_MS", 15000),
+        "window_seconds": _env_float("PROVIDER_BREAKER_WINDOW_SECONDS", 60),
+        "open_seconds": _env_float("PROVIDER_BREAKER_OPEN_SECONDS", 30),
+    }
+
+
+def breaker_cache_key(provider: str, model: str = "") -> str:
+    return f"provider-health:{provider}:{model or '*'}"
+
+
+def _window_keys(provider: str, model: str, now: float, window_seconds: float):
+    window = int(now // window_seconds)
+    base = breaker_cache_key(provider, model)
+    return f"{base}:calls:{window}", f"{base}:failures:{window}"
+
+
+def _opened_at(provider: str, model: str):
+    """When the circuit opened, or ``None`` while it is closed."""
+    state = cache.get(breaker_cache_key(provider, model))
+    return state.get("opened_at") if isinstance(state, dict) else None
+
+
+def _open_circuit(provider: str, model: str, now: float, *, replace: bool = False) -> bool:
+    limits = _thresholds()
+    ttl = int(max(limits["window_seconds"], limits["open_seconds"]) * 10)
+    state = {"state": OPEN, "opened_at": now}
+    if replace:
+        cache.set(breaker_cache_key(provider, model), state, timeout=ttl)
+        return True
+    return cache.add(breaker_cache_key(provider, model), state, timeout=ttl)
+
+
+def circuit_state(provider: str, model: str = "") -> str:
+    opened_at = _opened_at(provider, model)
+    if opened_at is None:
+        return CLOSED
+    if time.time() - opened_at >= _thresholds()["open_seconds"]:
+        return HALF_OPEN
+    return OPEN
+
+
+def is_open(provider: str, model: str = "") -> bool:
+    return circuit_state(provider, model) == OPEN
+
+
+def allow_request(provider: str, model: str = "") -> bool:
+    state = circuit_state(provider, model)
+    if state == CLOSED:
+        return True
+    if state == OPEN:
+        return False
+    # Half-open: a single worker wins the probe slot; everyone else keeps failing fast.
+    probe_key = f"{breaker_cache_key(provider, model)}:probe"
+    return cache.add(probe_key, 1, timeout=max(1, int(_thresholds()["open_seconds"])))
+
+
+def record_result(provider: str, model: str = "", *, ok: bool, elapsed_ms: float = 0.0):
+    """
+    Count one call against the breaker.
+
+    Calls and failures are per-window counters bumped with ``cache.incr``, so
+    concurrent workers never overwrite each other's counts. The state key is
+    only written on a transition: the trip to open goes through ``cache.add``
+    (one worker wins), and only the half-open probe's result re-opens or
+    closes the circuit.
+    """
+    now = time.time()
+    limits = _thresholds()
+    failed = not ok or elapsed_ms >= limits["slow_call_ms"]
+    state = circuit_state(provider, model)
+
+    if state == HALF_OPEN:
+        cache.delete(f"{breaker_cache_key(provider, model)}:probe")
+        if failed:
+            _open_circuit(provider, model, now, replace=True)
+        else:
+            reset_circuit(provider, model)
+        return
+
+    if state == OPEN:
+        return
+
+    window_seconds = limits["window_seconds"]
+    calls_key, failures_key = _window_keys(provider, model, now, window_seconds)
+    counter_ttl = max(1, int(window_seconds * 2))
+    calls = incr_counter(calls_key, timeout=counter_ttl)
+    failures = incr_counter(failures_key, timeout=counter_ttl) if failed else int(cache.get(failures_key) or 0)
+    if calls >= limits["min_requests"] and failures / calls >= limits["failure_rate"]:
+        _open_circuit(provider, model, now)
+
+
+def reset_circuit(provider: str, model: str = ""):
+    base = breaker_cache_key(provider, model)
+    window_keys = _window_keys(provider, model, time.time(), _thresholds()["window_seconds"])
+    cache.delete_many([base, f"{base}:probe", *window_keys])
+
+
+def provider_configured(provider: str) -> bool:
+    if provider == "openai":
+        return bool(str(getattr(settings, "OPENAI_API_KEY", "") or "").strip())
+    if provider == "openrouter":
+        return bool(str(os.environ.get("OPENROUTER_API_KEY", "") or "").strip())
+    return False
+
+
+def failover_order(preferred: str, models: dict) -> list:
+    """
+    Providers to try, preferred first, skipping any whose circuit is open.
+
+    ``models`` maps provider -> model name for the feature. Alternates are only
+    included when their API key is configured; an empty list means every
+    candidate circuit is open and the caller should use its local fallback.
+    """
+    order = [preferred] + [
+        provider for provider in models if provider != preferred and provider_configured(provider)
+    ]
+    return [provider for provider in order if not is_open(provider, models.get(provider, ""))]
+
@@ -0,0 +1,482 @@
+"""
+Shared outbound HTTP client for OpenAI, OpenRouter and Razorpay calls.
+
+``urlopen`` is a drop-in for ``urllib.request.urlopen`` as used across core: it
+takes a ``urllib.request.Request``, returns an object with ``read()`` usable as
+a context manager, and raises ``urllib.error.HTTPError`` / ``URLError`` the same
+way. Connections are kept alive in small per-host pools so repeated provider
+calls skip the TCP and TLS handshakes. OpenAI and OpenRouter calls also pass
+through the circuit breakers in ``provider_health`` and, when ``priority=`` is
+given, the per-minute budgets in ``provider_limits``; pass ``model=`` so both
+are tracked per model.
+"""
+import gzip
+import http.client
+import io
+import logging
+import os
+import socket
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+
+from . import provider_health, provider_limits
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_HOSTS = {
+    "api.openai.com": "openai",
+    "openrouter.ai": "openrouter",
+    "api.razorpay.com": "razorpay",
+}
+
+# Errors raised when the server already dropped an idle keep-alive connection.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+_pool_lock = threading.Lock()
+_idle_connections = {}
+_metrics_lock = threading.Lock()
+_metrics = {}
+_ssl_context = None
+
+
+def _env_flag(env_key: str, default: bool) -> bool:
+    raw = os.environ.get(env_key, "")
+    if not raw:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_float(env_key: str, default: float) -> float:
+    try:
+        value = float(os.environ.get(env_key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _env_int(env_key: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(env_key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value >= 0 else default
+
+
+def connect_timeout_seconds() -> float:
+    return _env_float("PROVIDER_HTTP_CONNECT_TIMEOUT_SECONDS", 5.0)
+
+
+def read_timeout_seconds(timeout: float | None = None) -> float:
+    """The caller's ``timeout`` when given; ``PROVIDER_HTTP_READ_TIMEOUT_SECONDS`` (30 s) only fills in when it is not."""
+    if timeout and timeout > 0:
+        return timeout
+    return _env_float("PROVIDER_HTTP_READ_TIMEOUT_SECONDS", 30.0)
+
+
+def provider_for_host(host: str) -> str:
+    host = str(host or "").lower()
+    return PROVIDER_HOSTS.get(host, host or "unknown")
+
+
+def _get_ssl_context():
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+def _pool_key(parsed):
+    scheme = parsed.scheme.lower()
+    port = parsed.port or (443 if scheme == "https" else 80)
+    return scheme, parsed.hostname, port
+
+
+def _new_connection(key):
+    scheme, host, port = key
+    if scheme == "https":
+        return http.client.HTTPSConnection(
+            host, port, timeout=connect_timeout_seconds(), context=_get_ssl_context()
+        )
+    return http.client.HTTPConnection(host, port, timeout=connect_timeout_seconds())
+
+
+def _checkout_connection(key):
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return idle.pop(), True
+    return _new_connection(key), False
+
+
+def _release_connection(key, conn):
+    max_idle = _env_int("PROVIDER_HTTP_POOL_MAXSIZE", 8)
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < max_idle:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def close_idle_connections():
+    with _pool_lock:
+        pools = list(_idle_connections.values())
+        _idle_connections.clear()
+    for idle in pools:
+        for conn in idle:
+            conn.close()
+
+
+def _record_latency(provider: str, elapsed_ms: float, *, ok: bool, reused: bool):
+    with _metrics_lock:
+        entry = _metrics.setdefault(
+            provider,
+            {
+                "requests": 0,
+                "errors": 0,
+                "reused_connections": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "last_ms": 0.0,
+            },
+        )
+        entry["requests"] += 1
+        entry["errors"] += 0 if ok else 1
+        entry["reused_connections"] += 1 if reused else 0
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["last_ms"] = elapsed_ms
+
+
+def latency_snapshot() -> dict:
+    with _metrics_lock:
+        snapshot = {provider: dict(entry) for provider, entry in _metrics.items()}
+    for entry in snapshot.values():
+        entry["avg_ms"] = round(entry["total_ms"] / entry["requests"], 2) if entry["requests"] else 0.0
+        entry["total_ms"] = round(entry["total_ms"], 2)
+        entry["max_ms"] = round(entry["max_ms"], 2)
+        entry["last_ms"] = round(entry["last_ms"], 2)
+    return snapshot
+
+
+def reset_latency_metrics():
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def _decode_body(raw: bytes, content_encoding: str) -> bytes:
+    encoding = str(content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(raw)
+        except zlib.error:
+            return zlib.decompress(raw, -zlib.MAX_WBITS)
+    return raw
+
+
+class ProviderResponse:
+    def __init__(self, url: str, status: int, reason: str, headers, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = io.BytesIO(body)
+
+    def read(self, amt=None) -> bytes:
+        return self._body.read() if amt is None else self._body.read(amt)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def close(self):
+        self._body.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _record_failure(provider: str, model: str, started: float, *, reused: bool, guarded: bool):
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _record_latency(provider, elapsed_ms, ok=False, reused=reused)
+    if guarded:
+        provider_health.record_result(provider, model, ok=False, elapsed_ms=elapsed_ms)
+
+
+class MultipartBody(io.RawIOBase):
+    """
+    Read-only ``multipart/form-data`` stream over text fields and one file.
+
+    ``http.client`` sends file-like bodies in blocks, so the file is streamed
+    from its own handle instead of being copied into one large bytes object.
+    The stream is seekable so a stale pooled connection can be retried.
+    """
+
+    def __init__(self, fields: dict, *, file_field: str, fileobj, filename: str, content_type: str):
+        self.boundary = f"----BondRoomBoundary{os.urandom(8).hex()}"
+        head = b"".join(
+            (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode("utf-8")
+            for name, value in fields.items()
+        )
+        head += (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._parts = [io.BytesIO(head), fileobj, io.BytesIO(f"\r\n--{self.boundary}--\r\n".encode("utf-8"))]
+        self._file_start = fileobj.tell()
+        fileobj.seek(0, io.SEEK_END)
+        self.length = len(head) + (fileobj.tell() - self._file_start) + len(self._parts[2].getvalue())
+        fileobj.seek(self._file_start)
+        self._index = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartBody only supports rewinding to the start.")
+        self._parts[0].seek(0)
+        self._parts[1].seek(self._file_start)
+        self._parts[2].seek(0)
+        self._index = 0
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        remaining = size
+        while self._index < len(self._parts) and remaining != 0:
+            chunk = self._parts[self._index].read(remaining if remaining > 0 else -1)
+            if not chunk:
+                self._index += 1
+                continue
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _send(conn, method: str, path: str, body, headers: dict, read_timeout: float):
+    if conn.sock is None:
+        conn.connect()
+    conn.sock.settimeout(read_timeout)
+    conn.request(method, path, body=body, headers=headers)
+    return conn.getresponse()
+
+
+def _rewind(body):
+    if hasattr(body, "seek"):
+        body.seek(0)
+
+
+def _is_provider_failure(status: int) -> bool:
+    # 4xx other than 429/408 means the provider answered; only overload and
+    # server-side errors count against the circuit.
+    return status >= 500 or status in {408, 429}
+
+
+def _record_outcome(provider: str, model: str, status: int, elapsed_ms: float, *, reused: bool, guarded: bool):
+    _record_latency(provider, elapsed_ms, ok=status < 400, reused=reused)
+    if guarded:
+        provider_health.record_result(provider, model, ok=not _is_provider_failure(status), elapsed_ms=elapsed_ms)
+        if status == 429:
+            provider_limits.mark_exhausted(provider, model)
+
+
+def _admit(request: urllib.request.Request, model: str, priority: str):
+    parsed = urllib.parse.urlsplit(request.full_url)
+    provider = provider_for_host(parsed.hostname)
+    guarded = provider in provider_health.LLM_PROVIDERS
+    if guarded and not provider_health.allow_request(provider, model):
+        raise provider_health.ProviderUnavailable(provider, model)
+    if guarded and priority:
+        provider_limits.acquire(provider, model, priority, provider_limits.estimate_tokens(request.data))
+    return parsed, provider, guarded
+
+
+def _open(request: urllib.request.Request, parsed, provider: str, model: str, timeout, *, guarded: bool, headers: dict):
+    if parsed.scheme.lower() not in {"http", "https"} or not parsed.hostname:
+        raise urllib.error.URLError(f"Unsupported provider URL: {request.full_url}")
+
+    key = _pool_key(parsed)
+    path = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+    method = request.get_method()
+    for name, value in request.header_items():
+        headers.setdefault(name, value)
+    headers.setdefault("Accept-Encoding", "gzip, deflate")
+    headers.setdefault("Connection", "keep-alive")
+    headers.setdefault("User-Agent", "BondRoom/1.0")
+    read_timeout = read_timeout_seconds(timeout)
+
+    started = time.perf_counter()
+    conn, reused = _checkout_connection(key)
+    try:
+        try:
+            response = _send(conn, method, path, request.data, headers, read_timeout)
+        except STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            # The pooled socket went stale while idle; retry once on a fresh one.
+            conn = _new_connection(key)
+            _rewind(request.data)
+            response = _send(conn, method, path, request.data, headers, read_timeout)
+    except (socket.timeout, TimeoutError):
+        conn.close()
+        _record_failure(provider, model, started, reused=reused, guarded=guarded)
+        raise
+    except (http.client.HTTPException, OSError) as exc:
+        conn.close()
+        _record_failure(provider, model, started, reused=reused, guarded=guarded)
+        raise urllib.error.URLError(exc) from exc
+    return key, conn, response, started, reused
+
+
+def _finish_connection(key, conn, response):
+    if response.will_close:
+        conn.close()
+    else:
+        _release_connection(key, conn)
+
+
+def urlopen(
+    request: urllib.request.Request,
+    timeout: float | None = None,
+    *,
+    model: str = "",
+    priority: str = "",
+):
+    parsed, provider, guarded = _admit(request, model, priority)
+
+    if not _env_flag("PROVIDER_HTTP_POOLING", True):
+        started = time.perf_counter()
+        try:
+            response = urllib.request.urlopen(request, timeout=read_timeout_seconds(timeout))
+        except urllib.error.HTTPError as exc:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            _record_outcome(provider, model, exc.code, elapsed_ms, reused=False, guarded=guarded)
+            raise
+        except Exception:
+            _record_failure(provider, model, started, reused=False, guarded=guarded)
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _record_outcome(provider, model, response.status, elapsed_ms, reused=False, guarded=guarded)
+        return response
+
+    key, conn, response, started, reused = _open(
+        request, parsed, provider, model, timeout, guarded=guarded, headers={}
+    )
+    try:
+        raw = response.read()
+    except (socket.timeout, TimeoutError):
+        conn.close()
+        _record_failure(provider, model, started, reused=reused, guarded=guarded)
+        raise
+    except (http.client.HTTPException, OSError) as exc:
+        conn.close()
+        _record_failure(provider, model, started, reused=reused, guarded=guarded)
+        raise urllib.error.URLError(exc) from exc
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    _finish_connection(key, conn, response)
+    body = _decode_body(raw, response.getheader("Content-Encoding", ""))
+    _record_outcome(provider, model, response.status, elapsed_ms, reused=reused, guarded=guarded)
+    logger.debug(
+        "provider_http %s %s %s status=%s %.1fms reused=%s",
+        provider,
+        request.get_method(),
+        parsed.path,
+        response.status,
+        elapsed_ms,
+        reused,
+    )
+    if response.status >= 400:
+        raise urllib.error.HTTPError(
+            request.full_url, response.status, response.reason, response.headers, io.BytesIO(body)
+        )
+    return ProviderResponse(request.full_url, response.status, response.reason, response.headers, body)
+
+
+def stream_lines(
+    request: urllib.request.Request,
+    timeout: float | None = None,
+    *,
+    model: str = "",
+    priority: str = "",
+):
+    """Yield response lines as they arrive, e.g. for server-sent event streams.
+
+    Errors before the body starts are raised exactly like ``urlopen``. The
+    connection returns to the pool only when the stream was read to the end.
+    """
+    parsed, provider, guarded = _admit(request, model, priority)
+    key, conn, response, started, reused = _open(
+        request,
+        parsed,
+        provider,
+        model,
+        timeout,
+        guarded=guarded,
+        headers={"Accept-Encoding": "identity", "Accept": "text/event-stream"},
+    )
+    if response.status >= 400:
+        raw = response.read()
+        _finish_connection(key, conn, response)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        _record_outcome(provider, model, response.status, elapsed_ms, reused=reused, guarded=guarded)
+        raise urllib.error.HTTPError(
+            request.full_url, response.status, response.reason, response.headers, io.BytesIO(raw)
+        )
+
+    completed = False
+    try:
+        for raw_line in response:
+            yield raw_line.decode("utf-8", errors="ignore").rstrip("\r\n")
+        # readline() leaves the response open; draining it frees the connection for reuse.
+        response.read()
+        completed = True
+    except (socket.timeout, TimeoutError):
+        _record_failure(provider, model, started, reused=reused, guarded=guarded)
+        raise
+    except (http.client.HTTPException, OSError) as exc:
+        _record_failure(provider, model, started, reused=reused, guarded=guarded)
+        raise urllib.error.URLError(exc) from exc
+    finally:
+        if completed:
+            _finish_connection(key, conn, response)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            _record_outcome(provider, model, response.status, elapsed_ms, reused=reused, guarded=guarded)
+        else:
+            conn.close()
@@ -0,0 +1,170 @@
+"""
+Shared request/token budgets for outbound LLM calls.
+
+Each provider/model gets a requests-per-minute and tokens-per-minute bucket
+that refills at the start of every minute. Counters live in the Django cache
+and are advanced with ``cache.incr`` so concurrent workers cannot overspend a
+window. Callers tag each call with a priority; lower priorities may only use a
+share of the bucket so moderation keeps headroom when dashboards spike.
+"""
+import json
+import os
+import time
+import urllib.error
+
+from django.core.cache import cache
+
+from .shared_cache import incr_counter
+
+PRIORITY_MODERATION = "moderation"
+PRIORITY_CHATBOT = "chatbot"
+PRIORITY_RECOMMENDATIONS = "recommendations"
+PRIORITY_SUMMARIES = "summaries"
+
+# Share of each bucket a priority class may consume, highest priority first.
+PRIORITY_SHARES = {
+    PRIORITY_MODERATION: 1.0,
+    PRIORITY_CHATBOT: 0.9,
+    PRIORITY_RECOMMENDATIONS: 0.7,
+    PRIORITY_SUMMARIES: 0.5,
+}
+
+DEFAULT_LIMITS = {
+    "openai": {"rpm": 500, "tpm": 200000},
+    "openrouter": {"rpm": 200, "tpm": 100000},
+}
+
+WINDOW_SECONDS = 60
+KNOWN_BUCKETS_KEY = "provider-limit:known"
+
+
+class ProviderRateLimited(urllib.error.URLError):
+    def __init__(self, provider: str, model: str, priority: str):
+        self.provider = provider
+        self.model = model
+        self.priority = priority
+        super().__init__(f"rate_limited:{provider}:{model or '*'}:{priority}")
+
+
+def _env_float(env_key: str, default: float) -> float:
+    try:
+        value = float(os.environ.get(env_key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value >= 0 else default
+
+
+def bucket_limits(provider: str, model: str = "") -> dict:
+    limits = dict(DEFAULT_LIMITS.get(provider, {"rpm": 120, "tpm": 60000}))
+    env_prefix = f"PROVIDER_LIMIT_{provider.upper()}"
+    limits["rpm"] = int(_env_float(f"{env_prefix}_RPM", limits["rpm"]))
+    limits["tpm"] = int(_env_float(f"{env_prefix}_TPM", limits["tpm"]))
+    # PROVIDER_LIMIT_MODELS='{"openai:gpt-4o-mini": {"rpm": 300, "tpm": 150000}}'
+    try:
+        overrides = json.loads(os.environ.get("PROVIDER_LIMIT_MODELS", "") or "{}")
+    except ValueError:
+        overrides = {}
+    model_override = overrides.get(f"{provider}:{model}") if isinstance(overrides, dict) else None
+    if isinstance(model_override, dict):
+        for field in ("rpm", "tpm"):
+            if field in model_override:
+                limits[field] = int(model_override[field])
+    return limits
+
+
+def estimate_prompt_tokens(body) -> int:
+    # Roughly four bytes per token.
+    size = len(body) if isinstance(body, (bytes, bytearray, str)) else 0
+    return size // 4
+
+
+def estimate_tokens(body) -> int:
+    # Prompt tokens plus an allowance for the reply.
+    return estimate_prompt_tokens(body) + int(_env_float("PROVIDER_LIMIT_OUTPUT_TOKEN_ESTIMATE", 500))
+
+
+def max_wait_seconds(priority: str) -> float:
+    return _env_float(f"PROVIDER_LIMIT_{priority.upper()}_MAX_WAIT_SECONDS", 0)
+
+
+def _window(now: float) -> int:
+    return int(now // WINDOW_SECONDS)
+
+
+def _counter_key(provider: str, model: str, window: int, field: str) -> str:
+    return f"provider-limit:{provider}:{model or '*'}:{window}:{field}"
+
+
+def _incr(key: str, amount: int) -> int:
+    return incr_counter(key, timeout=WINDOW_SECONDS * 2, amount=amount)
+
+
+def _remember_bucket(provider: str, model: str):
+    known = cache.get(KNOWN_BUCKETS_KEY) or []
+    label = f"{provider}:{model or '*'}"
+    if label not in known:
+        cache.set(KNOWN_BUCKETS_KEY, sorted(set(known) | {label}), timeout=None)
+
+
+def try_acquire(provider: str, model: str, priority: str, tokens: int, *, now: float | None = None) -> bool:
+    now = time.time() if now is None else now
+    limits = bucket_limits(provider, model)
+    share = PRIORITY_SHARES.get(priority, PRIORITY_SHARES[PRIORITY_SUMMARIES])
+    window = _window(now)
+    request_key = _counter_key(provider, model, window, "requests")
+    token_key = _counter_key(provider, model, window, "tokens")
+    _remember_bucket(provider, model)
+
+    used_requests = _incr(request_key, 1)
+    used_tokens = _incr(token_key, tokens)
+    if used_requests <= limits["rpm"] * share and used_tokens <= limits["tpm"] * share:
+        return True
+    # Give the reservation back so lower-priority rejections do not starve the window.
+    _incr(request_key, -1)
+    _incr(token_key, -tokens)
+    return False
+
+
+def acquire(provider: str, model: str, priority: str, tokens: int):
+    deadline = time.monotonic() + max_wait_seconds(priority)
+    while True:
+        if try_acquire(provider, model, priority, tokens):
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise ProviderRateLimited(provider, model, priority)
+        # Queue until the next window refills the bucket, bounded by the priority's wait budget.
+        until_refill = WINDOW_SECONDS - (time.time() % WINDOW_SECONDS)
+        time.sleep(min(remaining, until_refill, 1.0))
+
+
+def mark_exhausted(provider: str, model: str = ""):
+    # A provider 429 means our budget is stale; block the rest of this window.
+    limits = bucket_limits(provider, model)
+    window = _window(time.time())
+    cache.set(_counter_key(provider, model, window, "requests"), limits["rpm"], timeout=WINDOW_SECONDS * 2)
+
+
+def usage_snapshot() -> list:
+    window = _window(time.time())
+    rows = []
+    for label in cache.get(KNOWN_BUCKETS_KEY) or []:
+        provider, _, model = label.partition(":")
+        model = "" if model == "*" else model
+        limits = bucket_limits(provider, model)
+        used_requests = cache.get(_counter_key(provider, model, window, "requests")) or 0
+        used_tokens = cache.get(_counter_key(provider, model, window, "tokens")) or 0
+        rows.append(
+            {
+                "provider": provider,
+                "model": model,
+                "rpm_limit": limits["rpm"],
+                "tpm_limit": limits["tpm"],
+                "requests_used": used_requests,
+                "tokens_used": used_tokens,
+                "requests_remaining": max(0, limits["rpm"] - used_requests),
+                "tokens_remaining": max(0, limits["tpm"] - used_tokens),
+                "window_resets_in_seconds": round(WINDOW_SECONDS - (time.time() % WINDOW_SECONDS), 1),
+            }
+        )
+    return rows
@@ -1,4 +1,6 @@
+import hashlib
 import json
+import math
 import os
 import random
 import re
@@ -6,6 +8,13 @@ import urllib.request
 
 from django.conf import settings
 
+from . import provider_http, provider_limits
+from .models import TrainingQuizQuestionBank
+
+
+class QuestionBankUnavailable(RuntimeError):
+    pass
+
 
 def clean_question_text(value):
     text = str(value or "").strip()
@@ -191,7 +200,9 @@ def _generate_questions_with_openai(modules, total_questions):
         },
     )
 
-    with urllib.request.urlopen(request, timeout=25) as response:
+    with provider_http.urlopen(
+        request, timeout=25, model=model, priority=provider_limits.PRIORITY_RECOMMENDATIONS
+    ) as response:
         payload = json.loads(response.read().decode("utf-8"))
 
     output_text = payload.get("output_text", "") or ""
@@ -242,6 +253,83 @@ def generate_training_quiz_questions(modules, total_questions=15):
     )
 
 
+def training_modules_content_hash(modules):
+    payload = json.dumps(_module_summary_payload(modules), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_quiz_question_bank(modules, bank_size=60, max_rounds=None):
+    """
+    Generate and store a validated question pool for the current module set.
+
+    The pool is keyed by the modules' content hash, so editing a module's title,
+    description or outline makes quiz_start ignore the old pool until rebuilt.
+    """
+    modules = list(modules)
+    if not modules:
+        raise RuntimeError("No training modules available to generate quiz.")
+    per_module_target = math.ceil(bank_size / len(modules))
+    max_rounds = max_rounds or len(modules) * 3 + math.ceil(bank_size / 10)
+
+    candidates = []
+    seen_questions = set()
+    for _ in range(max_rounds):
+        per_module = {module.title: 0 for module in modules}
+        for item in candidates:
+            if item.get("module_title") in per_module:
+                per_module[item["module_title"]] += 1
+        request_modules = [module for module in modules if per_module[module.title] < per_module_target]
+        if not request_modules:
+            break
+        missing = sum(per_module_target - per_module[module.title] for module in request_modules)
+        request_count = min(20, max(6, missing))
+
+        generated = _generate_questions_with_openai(request_modules, request_count)
+        for item in _normalize_generated_questions(generated, modules):
+            question_key = item.get("question", "").lower()
+            if question_key in seen_questions:
+                continue
+            seen_questions.add(question_key)
+            candidates.append(item)
+
+    if not candidates:
+        raise RuntimeError("OpenAI did not return any valid quiz questions for the question bank.")
+    bank, _ = TrainingQuizQuestionBank.objects.update_or_create(
+        content_hash=training_modules_content_hash(modules),
+        defaults={
+            "module_ids": [module.id for module in modules],
+            "questions": candidates,
+            "question_count": len(candidates),
+            "generated_by": "openai",
+        },
+    )
+    return bank
+
+
+def assemble_quiz_from_bank(modules, total_questions=15, exclude_questions=None):
+    """Pick a fresh quiz from the stored pool, never reusing ``exclude_questions``."""
+    modules = list(modules)
+    bank = TrainingQuizQuestionBank.objects.filter(
+        content_hash=training_modules_content_hash(modules)
+    ).first()
+    if not bank:
+        raise QuestionBankUnavailable("No question bank for the current training modules.")
+
+    excluded = {clean_question_text(item.get("question", "")).lower() for item in exclude_questions or []}
+    candidates = [
+        dict(item)
+        for item in bank.questions or []
+        if clean_question_text(item.get("question", "")).lower() not in excluded
+    ]
+    random.shuffle(candidates)
+    try:
+        questions = _select_questions_for_quiz(candidates, modules, total_questions)
+    except RuntimeError as exc:
+        raise QuestionBankUnavailable(f"Question bank too small for a fresh quiz: {exc}") from exc
+    random.shuffle(questions)
+    return questions
+
+
 def evaluate_quiz_attempt(questions, selected_answers):
     if not isinstance(selected_answers, list):
         raise ValueError("selected_answers must be a list.")
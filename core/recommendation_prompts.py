@@ -0,0 +1,223 @@
+"""
+Prompts for LLM mentor recommendations.
+
+The full prompt sends every candidate's profile, raw availability JSON
+included, and asks the model to rank the whole pool, so its size grows with
+the pool. Re-rank mode (``RECOMMENDATION_RERANK``, on by default) ranks the
+pool with ``score_mentors`` first and sends only the top
+``RECOMMENDATION_RERANK_TOP_K`` as a small pipe-separated table: mentors get
+short ids (``m1``...), topics are listed once and referenced as ``t1``...,
+and availability is already reduced to an overlap flag. The model only
+reorders that shortlist and explains each pick; scores stay local. Estimated
+prompt tokens for both encodings are logged next to the provider's reported
+usage so the saving stays visible.
+"""
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .matching_logic import ScoredMentor, score_mentors
+from .provider_limits import estimate_prompt_tokens
+
+logger = logging.getLogger(__name__)
+
+FULL_SYSTEM_PROMPT = (
+    "You are a matching engine. "
+    "Use the rules: filter by availability+timezone, score by topic overlap, "
+    "boost strong ratings and quick responses, prefer local for in-person. "
+    "Return strict JSON only with: "
+    "{'recommendations': [{'mentor_id': int, 'score': number, 'explanation': str}]}"
+)
+
+RERANK_SYSTEM_PROMPT = (
+    "You re-rank a mentor shortlist that is already filtered and scored. "
+    "Mentor columns: id | topics (ids from the topic list) | avail (Y if free at the mentee's preferred times) "
+    "| rating | reply (typical reply minutes) | local (Y same city, N other city, - not in person) | fit (local score). "
+    "Order every mentor best first for this mentee, weighing access needs and safety notes, "
+    "and give each a one-sentence explanation addressed to the mentee. "
+    "Return strict JSON only with: "
+    "{'recommendations': [{'id': str, 'explanation': str}]}"
+)
+
+
+def rerank_enabled() -> bool:
+    raw = os.environ.get("RECOMMENDATION_RERANK", "")
+    return raw.strip().lower() in {"1", "true", "yes", "on"} if raw else True
+
+
+def rerank_top_k() -> int:
+    try:
+        return max(1, int(os.environ.get("RECOMMENDATION_RERANK_TOP_K", "8")))
+    except ValueError:
+        return 8
+
+
+@dataclass
+class RecommendationPrompt:
+    system: str
+    user: str
+    full_tokens: int
+    # Short id -> scored mentor, best local score first; empty for the full prompt.
+    shortlist: Dict[str, ScoredMentor] = field(default_factory=dict)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_prompt_tokens(self.system) + estimate_prompt_tokens(self.user)
+
+    def decode(self, recs) -> List[dict]:
+        """
+        Map the model's reply back to ``[{"mentor_id", "score", "explanation"}, ...]``.
+
+        In re-rank mode, unknown or repeated ids are dropped, and shortlisted
+        mentors the model left out follow in local order. The list is in the
+        model's order, and each mentor keeps its own local score, so callers
+        persist the position as the rank rather than sorting by score. A reply
+        that names no shortlisted mentor decodes to ``[]``.
+        """
+        if not self.shortlist:
+            return list(recs or [])
+        picked = []
+        explanations = {}
+        for rec in recs or []:
+            if not isinstance(rec, dict):
+                continue
+            short_id = str(rec.get("id") or rec.get("mentor_id") or "").strip()
+            if short_id in self.shortlist and short_id not in explanations:
+                picked.append(short_id)
+                explanations[short_id] = str(rec.get("explanation") or "").strip()
+        if not picked:
+            return []
+        picked.extend(short_id for short_id in self.shortlist if short_id not in explanations)
+        return [
+            {
+                "mentor_id": self.shortlist[short_id].mentor.id,
+                "score": self.shortlist[short_id].score,
+                "explanation": explanations.get(short_id) or self.shortlist[short_id].explanation,
+            }
+            for short_id in picked
+        ]
+
+
+def _full_prompt_user(req, mentors) -> str:
+    mentor_payload = [
+        {
+            "id": m.id,
+            "name": f"{m.first_name} {m.last_name}".strip(),
+            "care_areas": m.care_areas,
+            "languages": m.languages,
+            "preferred_formats": m.preferred_formats,
+            "availability": m.availability,
+            "timezone": m.timezone,
+            "average_rating": float(m.average_rating) if m.average_rating is not None else None,
+            "response_time_minutes": m.response_time_minutes,
+            "city_state": m.city_state,
+        }
+        for m in mentors
+    ]
+    return json.dumps(
+        {
+            "mentee_request": {
+                "topics": req.topics,
+                "preferred_times": req.preferred_times,
+                "preferred_format": req.preferred_format,
+                "language": req.language,
+                "timezone": req.timezone,
+                "access_needs": req.access_needs,
+                "safety_notes": req.safety_notes,
+                "session_mode": req.session_mode,
+                "mentee_city": req.mentee.city_state,
+            },
+            "mentors": mentor_payload,
+        }
+    )
+
+
+def _cell(value) -> str:
+    return " ".join(str(value or "").replace("|", "/").split())
+
+
+def _rerank_prompt_user(req, shortlist: Dict[str, ScoredMentor]) -> str:
+    vocabulary = {}
+    for topic in [*(req.topics or []), *(t for item in shortlist.values() for t in item.mentor.care_areas or [])]:
+        key = _cell(topic)
+        if key and key.lower() not in vocabulary:
+            vocabulary[key.lower()] = (f"t{len(vocabulary) + 1}", key)
+
+    def topic_ids(topics) -> str:
+        ids = dict.fromkeys(vocabulary[_cell(t).lower()][0] for t in topics or [] if _cell(t))
+        return ",".join(ids) or "-"
+
+    in_person = req.session_mode == "in_person"
+    mentee_city = _cell(req.mentee.city_state).lower() if req.mentee_id else ""
+    rows = []
+    for short_id, item in shortlist.items():
+        mentor_city = _cell(item.mentor.city_state).lower()
+        local = "-" if not in_person or not (mentee_city and mentor_city) else "Y" if mentee_city == mentor_city else "N"
+        rows.append(
+            "|".join(
+                [
+                    short_id,
+                    topic_ids(item.mentor.care_areas),
+                    "Y" if item.availability_overlap else "N",
+                    f"{item.rating_score:g}" if item.rating_score is not None else "-",
+                    str(item.mentor.response_time_minutes) if item.mentor.response_time_minutes is not None else "-",
+                    local,
+                    f"{item.score:g}",
+                ]
+            )
+        )
+    request_fields = [
+        f"topics={topic_ids(req.topics)}",
+        f"format={_cell(req.preferred_format) or '-'}",
+        f"language={_cell(req.language) or '-'}",
+        f"mode={_cell(req.session_mode) or '-'}",
+    ]
+    if _cell(req.access_needs):
+        request_fields.append(f"access_needs={_cell(req.access_needs)}")
+    if _cell(req.safety_notes):
+        request_fields.append(f"safety_notes={_cell(req.safety_notes)}")
+    return "\n".join(
+        [
+            "request: " + "; ".join(request_fields),
+            "topics: " + ("; ".join(f"{topic_id}={label}" for topic_id, label in vocabulary.values()) or "-"),
+            "mentors: id|topics|avail|rating|reply|local|fit",
+            *rows,
+        ]
+    )
+
+
+def build_recommendation_prompt(req, mentors, *, scored: Optional[List[ScoredMentor]] = None) -> RecommendationPrompt:
+    """Re-rank prompt over the local top K, or the full-pool prompt when re-rank mode is off."""
+    mentors = list(mentors)
+    full_user = _full_prompt_user(req, mentors)
+    full_tokens = estimate_prompt_tokens(FULL_SYSTEM_PROMPT) + estimate_prompt_tokens(full_user)
+    if not rerank_enabled():
+        return RecommendationPrompt(FULL_SYSTEM_PROMPT, full_user, full_tokens)
+    ranked = scored if scored is not None else score_mentors(req, mentors)
+    shortlist = {f"m{index}": item for index, item in enumerate(ranked[: rerank_top_k()], start=1)}
+    return RecommendationPrompt(RERANK_SYSTEM_PROMPT, _rerank_prompt_user(req, shortlist), full_tokens, shortlist)
+
+
+def usage_prompt_tokens(body) -> Optional[int]:
+    """Prompt tokens the provider reports (OpenAI ``input_tokens`` or chat-style ``prompt_tokens``)."""
+    usage = body.get("usage") if isinstance(body, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    value = usage.get("input_tokens", usage.get("prompt_tokens"))
+    return value if isinstance(value, int) else None
+
+
+def log_prompt_usage(provider: str, prompt: RecommendationPrompt, *, mentors: int, reported_tokens=None):
+    logger.info(
+        "recommendation prompt provider=%s mode=%s mentors=%d sent=%d full_tokens_est=%d prompt_tokens_est=%d "
+        "prompt_tokens_reported=%s",
+        provider,
+        "rerank" if prompt.shortlist else "full",
+        mentors,
+        len(prompt.shortlist) or mentors,
+        prompt.full_tokens,
+        prompt.tokens,
+        reported_tokens if reported_tokens is not None else "-",
+    )
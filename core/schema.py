@@ -36,6 +36,7 @@ PUBLIC_PATHS = {
     "/api/donations/razorpay/order/",
     "/api/donations/razorpay/verify/",
     "/api/chatbot/respond/",
+    "/api/cron/summary-jobs/",
     "/api/schema/",
     "/api/docs/",
 }
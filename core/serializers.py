@@ -4,7 +4,6 @@ from pathlib import Path
 from random import randint
 import json
 import re
-from urllib.parse import unquote, urlparse
 from uuid import uuid4
 
 from django.conf import settings
@@ -15,6 +14,9 @@ from django.core.files.storage import default_storage
 from django.utils import timezone
 from rest_framework import serializers
 
+from .availability import MAX_SLOT_LENGTH
+from .image_derivatives import DERIVATIVE_SIZES, storage_name_from_url
+from .media_access import media_s3_client, presigned_url, s3_available, s3_bucket_key_from_url
 from .models import (
     DonationTransaction,
     MatchRecommendation,
@@ -49,16 +51,6 @@ from .models import (
 
 User = get_user_model()
 
-try:
-    import boto3
-except Exception:  # pragma: no cover - optional dependency in some local setups
-    boto3 = None
-
-try:
-    from botocore.config import Config as BotoConfig
-except Exception:  # pragma: no cover
-    BotoConfig = None
-
 
 def generate_otp() -> str:
     return f"{randint(0, 999999):06d}"
@@ -166,62 +158,24 @@ def ensure_username(base: str) -> str:
     return candidate
 
 
-def _extract_s3_bucket_key_from_url(raw_url: str):
-    parsed = urlparse(str(raw_url or "").strip())
-    if parsed.scheme not in {"http", "https"}:
-        return None, None
-
-    host = (parsed.netloc or "").split(":")[0].lower()
-    path = (parsed.path or "").lstrip("/")
-    if not host or not path:
-        return None, None
-
-    configured_bucket = str(getattr(settings, "S3_MEDIA_BUCKET_NAME", "") or "").strip()
-    custom_domain = str(getattr(settings, "S3_MEDIA_CUSTOM_DOMAIN", "") or "").strip().lower()
-    if custom_domain and host == custom_domain and configured_bucket:
-        return configured_bucket, unquote(path)
-
-    virtual_match = re.match(
-        r"^(?P<bucket>[^.]+)\.s3(?:[.-][a-z0-9-]+)*\.amazonaws\.com$",
-        host,
-    )
-    if virtual_match:
-        return virtual_match.group("bucket"), unquote(path)
-
-    if host == "s3.amazonaws.com" or host.startswith("s3.") or host.startswith("s3-"):
-        parts = path.split("/", 1)
-        if len(parts) == 2 and parts[0] and parts[1]:
-            return parts[0], unquote(parts[1])
-
-    return None, None
-
-
 def _build_presigned_s3_get_url(raw_url: str) -> str:
-    if not boto3:
+    if not s3_available():
         return ""
 
-    bucket, key = _extract_s3_bucket_key_from_url(raw_url)
+    bucket, key = s3_bucket_key_from_url(raw_url)
     if not bucket or not key:
         return ""
 
-    region = str(getattr(settings, "AWS_S3_REGION_NAME", "") or "").strip() or "us-east-1"
-    endpoint = str(getattr(settings, "AWS_S3_ENDPOINT_URL", "") or "").strip()
     expires = int(getattr(settings, "S3_MEDIA_URL_EXPIRES", 3600) or 3600)
     if expires <= 0:
         expires = 3600
-    expires = min(expires, 604800)  # S3 max
 
     try:
-        client_kwargs = {"region_name": region}
-        if endpoint:
-            client_kwargs["endpoint_url"] = endpoint
-        if BotoConfig is not None:
-            client_kwargs["config"] = BotoConfig(signature_version="s3v4")
-        s3_client = boto3.client("s3", **client_kwargs)
-        return s3_client.generate_presigned_url(
+        return presigned_url(
+            media_s3_client(),
             "get_object",
-            Params={"Bucket": bucket, "Key": key},
-            ExpiresIn=expires,
+            {"Bucket": bucket, "Key": key},
+            expires_in=expires,
         )
     except Exception:
         return ""
@@ -247,6 +201,32 @@ def build_absolute_media_url(raw_url: str, request=None) -> str:
     return value
 
 
+def build_media_derivative_urls(entry, request=None) -> dict:
+    if not isinstance(entry, dict):
+        return {}
+    urls = {}
+    for label in DERIVATIVE_SIZES:
+        name = str(entry.get(label, "") or "")
+        if not name:
+            continue
+        try:
+            raw_url = default_storage.url(name)
+        except Exception:
+            raw_url = name
+        urls[label] = build_absolute_media_url(raw_url, request=request)
+    return urls
+
+
+def _file_derivative_urls(instance, field_name: str, request=None) -> dict:
+    derivatives = getattr(instance, "media_derivatives", None)
+    entry = derivatives.get(field_name) if isinstance(derivatives, dict) else None
+    source_name = str(getattr(getattr(instance, field_name, None), "name", "") or "")
+    # Derivatives rendered from a file that has since been replaced are ignored until refreshed.
+    if not source_name or not isinstance(entry, dict) or entry.get("source") != source_name:
+        return {}
+    return build_media_derivative_urls(entry, request=request)
+
+
 IDENTITY_PROOF_NUMBER_RULES = {
     "ration_card": {
         "pattern": re.compile(r"^[A-Z0-9]{6,12}$"),
@@ -340,12 +320,13 @@ def normalize_document_review_comments(value):
 class MenteeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Mentee
-        fields = "__all__"
+        exclude = ("media_derivatives",)
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get("request")
         data["avatar"] = build_absolute_media_url(data.get("avatar", ""), request=request)
+        data["avatar_derivatives"] = _file_derivative_urls(instance, "avatar", request=request)
         return data
 
 
@@ -370,9 +351,11 @@ class MentorSerializer(serializers.ModelSerializer):
         if profile_photo_url:
             data["profile_photo"] = profile_photo_url
             data["avatar"] = profile_photo_url
+            data["profile_photo_derivatives"] = _file_derivative_urls(profile, "profile_photo", request=request)
         else:
             data["profile_photo"] = ""
             data["avatar"] = build_absolute_media_url(data.get("avatar", ""), request=request)
+            data["profile_photo_derivatives"] = {}
 
         data["weekly_availability"] = data.get("availability") or []
         data["availability"] = MentorAvailabilitySlotSerializer(
@@ -397,7 +380,24 @@ class ParentConsentVerificationSerializer(serializers.ModelSerializer):
 class MentorAvailabilitySlotSerializer(serializers.ModelSerializer):
     class Meta:
         model = MentorAvailabilitySlot
-        fields = "__all__"
+        exclude = MentorAvailabilitySlot.BUCKET_FIELDS
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if "viewer_mentee_id" in self.context and data.get("held_by") != self.context["viewer_mentee_id"]:
+            # Mentees see that a slot is held, not which mentee holds it.
+            data["held_by"] = None
+        return data
+
+    def validate(self, attrs):
+        start_time = attrs.get("start_time", getattr(self.instance, "start_time", None))
+        end_time = attrs.get("end_time", getattr(self.instance, "end_time", None))
+        if start_time and end_time:
+            if end_time <= start_time:
+                raise serializers.ValidationError({"end_time": "End time must be after start time."})
+            if end_time - start_time > MAX_SLOT_LENGTH:
+                raise serializers.ValidationError({"end_time": "A slot cannot be longer than 24 hours."})
+        return attrs
 
 
 class SessionFeedbackSerializer(serializers.ModelSerializer):
@@ -433,6 +433,7 @@ class SessionSerializer(serializers.ModelSerializer):
     feedback = SessionFeedbackSerializer(read_only=True)
     mentee_name = serializers.SerializerMethodField()
     mentee_avatar = serializers.SerializerMethodField()
+    mentee_avatar_derivatives = serializers.SerializerMethodField()
     mentee_first_name = serializers.CharField(source="mentee.first_name", read_only=True)
     mentee_last_name = serializers.CharField(source="mentee.last_name", read_only=True)
 
@@ -465,6 +466,11 @@ class SessionSerializer(serializers.ModelSerializer):
         except ValueError:
             return ""
 
+    def get_mentee_avatar_derivatives(self, obj):
+        if not obj.mentee_id:
+            return {}
+        return _file_derivative_urls(obj.mentee, "avatar", request=self.context.get("request"))
+
     def validate(self, attrs):
         start = attrs.get("scheduled_start")
         end = attrs.get("scheduled_end")
@@ -479,6 +485,7 @@ class MentorIdentityVerificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = MentorIdentityVerification
         fields = "__all__"
+        read_only_fields = ("document_metadata",)
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
@@ -629,12 +636,13 @@ class TrainingQuizAbandonSerializer(serializers.Serializer):
 class MentorProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = MentorProfile
-        fields = "__all__"
+        exclude = ("media_derivatives",)
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
         request = self.context.get("request")
         data["profile_photo"] = build_absolute_media_url(data.get("profile_photo", ""), request=request)
+        data["profile_photo_derivatives"] = _file_derivative_urls(instance, "profile_photo", request=request)
         return data
 
 
@@ -707,7 +715,7 @@ class VolunteerEventSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = VolunteerEvent
-        fields = "__all__"
+        exclude = ("media_derivatives",)
 
     def validate_available_roles(self, value):
         if value in (None, ""):
@@ -805,12 +813,17 @@ class VolunteerEventSerializer(serializers.ModelSerializer):
             data["image"] = build_absolute_media_url(uploaded_file_url, request=request)
         else:
             data["image"] = build_absolute_media_url(data.get("image", ""), request=request)
+        data["image_derivatives"] = _file_derivative_urls(instance, "image_file", request=request)
         gallery_images = data.get("gallery_images", [])
         if isinstance(gallery_images, list):
-            data["gallery_images"] = [
-                build_absolute_media_url(str(item or "").strip(), request=request)
-                for item in gallery_images
-                if str(item or "").strip()
+            gallery_derivatives = (
+                instance.media_derivatives.get("gallery") if isinstance(instance.media_derivatives, dict) else None
+            ) or {}
+            stored_urls = [str(item or "").strip() for item in gallery_images if str(item or "").strip()]
+            data["gallery_images"] = [build_absolute_media_url(url, request=request) for url in stored_urls]
+            data["gallery_image_derivatives"] = [
+                build_media_derivative_urls(gallery_derivatives.get(storage_name_from_url(url)), request=request)
+                for url in stored_urls
             ]
         return data
 
@@ -1312,6 +1325,46 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         return attrs
 
 
+class PayoutSettlementRequestSerializer(serializers.Serializer):
+    payout_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=20000)
+    mentor_id = serializers.IntegerField(required=False, min_value=1)
+    statuses = serializers.ListField(
+        child=serializers.ChoiceField(choices=["pending", "processing"]),
+        required=False,
+    )
+    transaction_type = serializers.ChoiceField(choices=PayoutTransaction.TYPE_CHOICES, required=False)
+    created_before = serializers.DateTimeField(required=False)
+    reference_id = serializers.CharField(required=False, allow_blank=True, max_length=100)
+    note = serializers.CharField(required=False, allow_blank=True)
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+    def validate(self, attrs):
+        if not any(attrs.get(key) for key in ("payout_ids", "mentor_id", "transaction_type", "created_before")):
+            raise serializers.ValidationError("Provide payout_ids or at least one filter.")
+        return attrs
+
+
+class PayoutSettlementMentorSerializer(serializers.Serializer):
+    mentor_id = serializers.IntegerField()
+    payout_count = serializers.IntegerField()
+    amount = serializers.DecimalField(max_digits=12, decimal_places=2)
+    pending_payout = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+class PayoutSettlementSkipSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    reason = serializers.CharField()
+
+
+class PayoutSettlementReportSerializer(serializers.Serializer):
+    dry_run = serializers.BooleanField()
+    settled_count = serializers.IntegerField()
+    settled_amount = serializers.DecimalField(max_digits=14, decimal_places=2)
+    already_paid_count = serializers.IntegerField()
+    skipped = PayoutSettlementSkipSerializer(many=True)
+    mentors = PayoutSettlementMentorSerializer(many=True)
+
+
 class SessionDispositionActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=SessionDisposition.ACTION_CHOICES)
     amount = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
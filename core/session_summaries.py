@@ -0,0 +1,222 @@
+"""
+Post-session meeting summary jobs.
+
+Summaries are generated after a session completes or its recording stops,
+never inside a read endpoint. Each session has one ``SessionSummaryJob`` row;
+``enqueue_session_summary`` (re)arms it and ``process_due_summary_jobs`` claims
+due rows with a conditional update so concurrent workers never run the same
+job twice. Failures back off exponentially until the attempt limit is reached.
+A job whose session got new transcript lines while it ran goes back to
+pending instead of succeeding, so the stored summary catches up.
+
+Passes are driven by the Vercel cron entry in ``vercel.json``, which calls
+``SummaryJobsCronView``; ``process_summary_jobs`` runs the same pass from a
+shell or, with ``--loop``, as a standalone worker.
+"""
+import os
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import Session, SessionMeetingSignal, SessionRecording, SessionSummaryJob
+
+SUMMARY_SESSION_STATUSES = {"completed"}
+SUMMARY_RECORDING_STATUSES = {"stopped", "uploaded"}
+FINISHED_JOB_STATUSES = ("succeeded", "failed")
+TRANSCRIPT_SIGNAL_TYPES = (
+    "transcript",
+    "mentor_transcript",
+    "mentee_transcript",
+    "transcript_bundle",
+    "mentor_bundle",
+    "mentee_bundle",
+)
+
+
+def _env_int(env_key: str, default: int) -> int:
+    try:
+        value = int(os.environ.get(env_key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def max_attempts() -> int:
+    return _env_int("SESSION_SUMMARY_MAX_ATTEMPTS", 5)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    base_seconds = _env_int("SESSION_SUMMARY_RETRY_BASE_SECONDS", 60)
+    cap_seconds = _env_int("SESSION_SUMMARY_RETRY_MAX_SECONDS", 3600)
+    return timedelta(seconds=min(cap_seconds, base_seconds * 2 ** max(0, attempts - 1)))
+
+
+def _transcript_added_since(session, since) -> bool:
+    return SessionMeetingSignal.objects.filter(
+        session=session, signal_type__in=TRANSCRIPT_SIGNAL_TYPES, created_at__gt=since
+    ).exists()
+
+
+def enqueue_session_summary(session, *, trigger: str, rearm: bool = False) -> SessionSummaryJob:
+    """
+    Create the session's summary job, or with ``rearm`` re-queue a finished one.
+
+    A failed job is always re-queued; a succeeded one only when transcript
+    lines arrived after it ran, so repeated saves do not resummarize.
+    """
+    now = timezone.now()
+    job, created = SessionSummaryJob.objects.get_or_create(
+        session=session,
+        defaults={"trigger": trigger, "next_attempt_at": now},
+    )
+    if created or not rearm or job.status not in FINISHED_JOB_STATUSES:
+        return job
+    if job.status == "succeeded" and job.finished_at and not _transcript_added_since(session, job.finished_at):
+        return job
+    SessionSummaryJob.objects.filter(id=job.id, status__in=FINISHED_JOB_STATUSES).update(
+        status="pending",
+        trigger=trigger,
+        attempts=0,
+        next_attempt_at=now,
+        last_error="",
+        updated_at=now,
+    )
+    job.refresh_from_db()
+    return job
+
+
+def _claim(job_id: int) -> bool:
+    now = timezone.now()
+    return bool(
+        SessionSummaryJob.objects.filter(id=job_id, status="pending").update(
+            status="running",
+            started_at=now,
+            updated_at=now,
+        )
+    )
+
+
+def store_session_summary(session, summary_payload: dict):
+    recording, _ = SessionRecording.objects.get_or_create(session=session)
+    metadata = dict(recording.metadata) if isinstance(recording.metadata, dict) else {}
+    metadata.update(
+        {
+            "meeting_summary": summary_payload.get("summary", ""),
+            "meeting_highlights": summary_payload.get("highlights", []),
+            "meeting_action_items": summary_payload.get("action_items", []),
+            "summary_generated_at": timezone.now().isoformat(),
+            "summary_model": summary_payload.get("model", ""),
+            "summary_source": summary_payload.get("source", ""),
+        }
+    )
+    metadata.pop("summary_error", None)
+    metadata.pop("summary_error_at", None)
+    recording.metadata = metadata
+    recording.save(update_fields=["metadata", "updated_at"])
+
+
+def _store_error(session, error_text: str):
+    recording, _ = SessionRecording.objects.get_or_create(session=session)
+    metadata = dict(recording.metadata) if isinstance(recording.metadata, dict) else {}
+    metadata["summary_error"] = error_text
+    metadata["summary_error_at"] = timezone.now().isoformat()
+    recording.metadata = metadata
+    recording.save(update_fields=["metadata", "updated_at"])
+
+
+def run_summary_job(job: SessionSummaryJob) -> bool:
+    from .api_views import generate_meeting_summary_with_ai
+
+    session = job.session
+    try:
+        summary_payload = generate_meeting_summary_with_ai(session, "")
+    except Exception as exc:
+        attempts = job.attempts + 1
+        error_text = str(exc)[:600]
+        exhausted = attempts >= max_attempts()
+        now = timezone.now()
+        SessionSummaryJob.objects.filter(id=job.id).update(
+            status="failed" if exhausted else "pending",
+            attempts=attempts,
+            last_error=error_text,
+            next_attempt_at=None if exhausted else now + retry_delay(attempts),
+            finished_at=now if exhausted else None,
+            updated_at=now,
+        )
+        if exhausted:
+            _store_error(session, error_text)
+        return False
+
+    store_session_summary(session, summary_payload)
+    now = timezone.now()
+    if job.started_at and _transcript_added_since(session, job.started_at):
+        # Lines that arrived mid-run may be missing from this summary; run it again.
+        SessionSummaryJob.objects.filter(id=job.id).update(
+            status="pending",
+            trigger="transcript_updated",
+            attempts=0,
+            last_error="",
+            next_attempt_at=now,
+            started_at=None,
+            updated_at=now,
+        )
+        return True
+    SessionSummaryJob.objects.filter(id=job.id).update(
+        status="succeeded",
+        attempts=job.attempts + 1,
+        last_error="",
+        next_attempt_at=None,
+        finished_at=now,
+        updated_at=now,
+    )
+    return True
+
+
+def process_due_summary_jobs(limit: int = 20) -> dict:
+    now = timezone.now()
+    due_ids = list(
+        SessionSummaryJob.objects.filter(status="pending", next_attempt_at__lte=now)
+        .order_by("next_attempt_at", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+    counts = {"claimed": 0, "succeeded": 0, "failed": 0}
+    for job_id in due_ids:
+        if not _claim(job_id):
+            continue
+        counts["claimed"] += 1
+        job = SessionSummaryJob.objects.select_related("session").get(id=job_id)
+        if run_summary_job(job):
+            counts["succeeded"] += 1
+        else:
+            counts["failed"] += 1
+    return counts
+
+
+def run_summary_pass(*, limit: int, stale_after: timedelta) -> dict:
+    """Requeue stuck jobs, then run up to ``limit`` due ones; one cron tick or worker loop iteration."""
+    requeued = requeue_stale_jobs(stale_after)
+    counts = process_due_summary_jobs(limit=limit)
+    counts["requeued"] = requeued
+    return counts
+
+
+def enqueue_missing_summaries(limit: int = 500) -> int:
+    # Completed sessions from before the job table existed have no row yet.
+    sessions = (
+        Session.objects.filter(status__in=SUMMARY_SESSION_STATUSES, summary_job__isnull=True)
+        .order_by("id")[:limit]
+    )
+    count = 0
+    for session in sessions:
+        enqueue_session_summary(session, trigger="backfill")
+        count += 1
+    return count
+
+
+def requeue_stale_jobs(stale_after: timedelta) -> int:
+    # A worker that died mid-run leaves the row in "running"; put it back in the queue.
+    cutoff = timezone.now() - stale_after
+    return SessionSummaryJob.objects.filter(status="running", started_at__lt=cutoff).update(
+        status="pending",
+        next_attempt_at=timezone.now(),
+    )
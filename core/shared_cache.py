@@ -0,0 +1,188 @@
+"""
+Two-tier Django cache backend and atomic guard helpers.
+
+``TwoTierCache`` keeps a small in-process LRU in front of a shared backend
+(the ``core_shared_cache`` table or a file-based cache on one host), so
+cooldowns, dedupe keys and alert guards hold across gunicorn workers and
+serverless instances while hot reads stay in memory. Only hits are kept
+locally and only for ``LOCAL_TIMEOUT`` seconds; ``add``, ``incr`` and
+``delete`` always go to the shared tier, which is the source of truth for
+guards. ``incr`` takes a row lock (database tier) or an ``flock`` (file tier)
+so concurrent workers never lose an increment, and keeps the entry's TTL.
+"""
+import base64
+import os
+import pickle
+import time
+import zlib
+from contextlib import contextmanager
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import router, transaction
+from django.utils import timezone
+
+from .local_cache import TTLLRUCache
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX development machines
+    fcntl = None
+
+_MISSING = object()
+
+
+class TwoTierCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = location or options.get("SHARED_ALIAS", "shared")
+        self._local_timeout = float(options.get("LOCAL_TIMEOUT", 5))
+        self._local = TTLLRUCache(
+            max_entries=int(options.get("LOCAL_MAX_ENTRIES", 1000)),
+            ttl_seconds=self._local_timeout,
+        )
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    def _local_key(self, key, version):
+        return self.shared.make_and_validate_key(key, version=version)
+
+    def _remember(self, local_key, value, timeout=DEFAULT_TIMEOUT):
+        ttl = self._local_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            ttl = min(ttl, float(timeout))
+        if ttl <= 0:
+            self._local.delete(local_key)
+            return
+        # Stored pickled, like LocMemCache, so callers mutating a result cannot change the cached copy.
+        self._local.set(local_key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ttl_seconds=ttl)
+
+    def get(self, key, default=None, version=None):
+        local_key = self._local_key(key, version)
+        packed = self._local.get(local_key)
+        if packed is not None:
+            return pickle.loads(packed)
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self._remember(local_key, value)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self._remember(self._local_key(key, version), value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        shared = self.shared
+        if isinstance(shared, FileBasedCache):
+            # FileBasedCache.add is has_key() + set(); serialise it across processes.
+            with _file_lock(shared):
+                added = shared.add(key, value, timeout=timeout, version=version)
+        else:
+            added = shared.add(key, value, timeout=timeout, version=version)
+        if added:
+            self._remember(self._local_key(key, version), value, timeout)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._local.delete(self._local_key(key, version))
+        return self.shared.delete(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        shared = self.shared
+        if isinstance(shared, DatabaseCache):
+            value = _db_incr(shared, key, delta, version)
+        elif isinstance(shared, FileBasedCache):
+            with _file_lock(shared):
+                value = _file_incr(shared, key, delta, version)
+        else:
+            value = shared.incr(key, delta, version=version)
+        self._remember(self._local_key(key, version), value)
+        return value
+
+    def clear(self):
+        self._local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
+
+
+def _db_incr(shared: DatabaseCache, key, delta, version):
+    from .models import SharedCacheEntry
+
+    if shared._table != SharedCacheEntry._meta.db_table:
+        raise ImproperlyConfigured(
+            f"TwoTierCache needs the shared DatabaseCache LOCATION to be {SharedCacheEntry._meta.db_table!r}."
+        )
+    db_key = shared.make_and_validate_key(key, version=version)
+    using = router.db_for_write(SharedCacheEntry)
+    with transaction.atomic(using=using):
+        entry = (
+            SharedCacheEntry.objects.using(using)
+            .select_for_update()
+            .filter(cache_key=db_key, expires__gt=timezone.now())
+            .first()
+        )
+        if entry is None:
+            raise ValueError(f"Key '{key}' not found")
+        # Same encoding DatabaseCache uses; updating in place keeps the entry's expiry.
+        value = pickle.loads(base64.b64decode(entry.value.encode())) + delta
+        entry.value = base64.b64encode(pickle.dumps(value, shared.pickle_protocol)).decode("latin1")
+        entry.save(update_fields=["value"])
+    return value
+
+
+def _file_incr(shared: FileBasedCache, key, delta, version):
+    path = shared._key_to_file(key, version)
+    try:
+        with open(path, "rb") as handle:
+            expiry = pickle.load(handle)
+            value = pickle.loads(zlib.decompress(handle.read()))
+    except (FileNotFoundError, EOFError):
+        raise ValueError(f"Key '{key}' not found")
+    now = time.time()
+    if expiry is not None and expiry < now:
+        raise ValueError(f"Key '{key}' not found")
+    value += delta
+    shared.set(key, value, timeout=None if expiry is None else max(1.0, expiry - now), version=version)
+    return value
+
+
+@contextmanager
+def _file_lock(shared: FileBasedCache):
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(shared._dir, exist_ok=True)
+    with open(os.path.join(shared._dir, ".two-tier.lock"), "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def acquire_guard(key: str, timeout: float) -> bool:
+    """Atomically claim ``key`` for ``timeout`` seconds; False if another worker holds it."""
+    return cache.add(key, 1, timeout=timeout)
+
+
+def incr_counter(key: str, *, timeout: float, amount: int = 1) -> int:
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key, amount)
+    except ValueError:
+        # The counter expired between add and incr; start again.
+        cache.set(key, amount, timeout=timeout)
+        return amount
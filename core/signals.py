@@ -1,22 +1,58 @@
 import hashlib
 import json
+import logging
 import os
 import urllib.error
 import urllib.request
 
 from django.conf import settings
-from django.db.models.signals import post_delete, post_save
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .matching_logic import filter_mentors
+from . import provider_health, provider_http, provider_limits
+from .authentication import bump_token_version, forget_token_version
+from .availability import materialize_recurring_slots, sync_weekly_availability
+from .image_derivatives import IMAGE_SOURCE_FIELDS, refresh_image_derivatives
+from .matching_logic import filter_mentors, score_mentors
+from .mentor_index import (
+    INDEXED_MENTOR_FIELDS,
+    TEXT_MENTOR_FIELDS,
+    candidate_mentors,
+    refresh_mentor_text,
+    reindex_mentors,
+)
 from .models import (
+    AdminAccount,
     MatchRecommendation,
+    Mentee,
     MenteeRequest,
     Mentor,
+    MentorOnboardingStatus,
+    MentorProfile,
     MentorTrainingProgress,
     MentorTrainingQuizAttempt,
+    Session,
+    SessionRecording,
+    UserProfile,
+    UserTokenVersion,
+    VolunteerEvent,
 )
 from .onboarding import sync_mentor_onboarding_training_status
+from .recommendation_prompts import (
+    build_recommendation_prompt,
+    log_prompt_usage,
+    rerank_enabled,
+    usage_prompt_tokens,
+)
+from .session_summaries import (
+    SUMMARY_RECORDING_STATUSES,
+    SUMMARY_SESSION_STATUSES,
+    enqueue_session_summary,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def _get_max_int(env_key: str, default: int) -> int:
@@ -73,59 +109,22 @@ def _openrouter_message_text(message) -> str:
     return ""
 
 
-def _call_openai(req: MenteeRequest, mentors):
+def _call_openai(req: MenteeRequest, mentors, *, scored=None):
     api_key = settings.OPENAI_API_KEY
     if not api_key:
         return None, "missing_api_key"
 
-    mentor_payload = [
-        {
-            "id": m.id,
-            "name": f"{m.first_name} {m.last_name}".strip(),
-            "care_areas": m.care_areas,
-            "languages": m.languages,
-            "preferred_formats": m.preferred_formats,
-            "availability": m.availability,
-            "timezone": m.timezone,
-            "average_rating": float(m.average_rating) if m.average_rating is not None else None,
-            "response_time_minutes": m.response_time_minutes,
-            "city_state": m.city_state,
-        }
-        for m in mentors
-    ]
+    mentors = list(mentors)
+    prompt = build_recommendation_prompt(req, mentors, scored=scored)
 
     payload = {
         "model": os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
         "text": {"format": {"type": "json_object"}},
         "input": [
-            {
-                "role": "system",
-                "content": (
-                    "You are a matching engine. "
-                    "Use the rules: filter by availability+timezone, score by topic overlap, "
-                    "boost strong ratings and quick responses, prefer local for in-person. "
-                    "Return strict JSON only with: "
-                    "{'recommendations': [{'mentor_id': int, 'score': number, 'explanation': str}]}"
-                ),
-            },
+            {"role": "system", "content": prompt.system},
             {
                 "role": "user",
-                "content": json.dumps(
-                    {
-                        "mentee_request": {
-                            "topics": req.topics,
-                            "preferred_times": req.preferred_times,
-                            "preferred_format": req.preferred_format,
-                            "language": req.language,
-                            "timezone": req.timezone,
-                            "access_needs": req.access_needs,
-                            "safety_notes": req.safety_notes,
-                            "session_mode": req.session_mode,
-                            "mentee_city": req.mentee.city_state,
-                        },
-                        "mentors": mentor_payload,
-                    }
-                ),
+                "content": prompt.user,
             },
         ],
     }
@@ -145,7 +144,9 @@ def _call_openai(req: MenteeRequest, mentors):
         headers=req_headers,
     )
     try:
-        with urllib.request.urlopen(req_obj, timeout=20) as resp:
+        with provider_http.urlopen(
+            req_obj, timeout=20, model=payload["model"], priority=provider_limits.PRIORITY_RECOMMENDATIONS
+        ) as resp:
             body = json.loads(resp.read().decode("utf-8"))
         response_id = body.get("id", "")
         output_text = ""
@@ -159,7 +160,8 @@ def _call_openai(req: MenteeRequest, mentors):
 
         output_text = output_text.strip()
         result = json.loads(output_text) if output_text else {}
-        recs = result.get("recommendations", [])
+        log_prompt_usage("openai", prompt, mentors=len(mentors), reported_tokens=usage_prompt_tokens(body))
+        recs = prompt.decode(result.get("recommendations", []))
         return {
             "recs": recs,
             "model": payload["model"],
@@ -170,58 +172,22 @@ def _call_openai(req: MenteeRequest, mentors):
         return None, str(exc)
 
 
-def _call_openrouter(req: MenteeRequest, mentors):
+def _call_openrouter(req: MenteeRequest, mentors, *, scored=None):
     api_key = os.environ.get("OPENROUTER_API_KEY", "").strip()
     if not api_key:
         return None, "missing_api_key"
 
-    mentor_payload = [
-        {
-            "id": m.id,
-            "name": f"{m.first_name} {m.last_name}".strip(),
-            "care_areas": m.care_areas,
-            "languages": m.languages,
-            "preferred_formats": m.preferred_formats,
-            "availability": m.availability,
-            "timezone": m.timezone,
-            "average_rating": float(m.average_rating) if m.average_rating is not None else None,
-            "response_time_minutes": m.response_time_minutes,
-            "city_state": m.city_state,
-        }
-        for m in mentors
-    ]
-
-    system_prompt = (
-        "You are a matching engine. "
-        "Use the rules: filter by availability+timezone, score by topic overlap, "
-        "boost strong ratings and quick responses, prefer local for in-person. "
-        "Return strict JSON only with: "
-        "{'recommendations': [{'mentor_id': int, 'score': number, 'explanation': str}]}"
-    )
+    mentors = list(mentors)
+    prompt = build_recommendation_prompt(req, mentors, scored=scored)
 
     payload = {
         "model": os.environ.get("OPENROUTER_MODEL", "meta-llama/llama-3.2-3b-instruct"),
         "response_format": {"type": "json_object"},
         "messages": [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": prompt.system},
             {
                 "role": "user",
-                "content": json.dumps(
-                    {
-                        "mentee_request": {
-                            "topics": req.topics,
-                            "preferred_times": req.preferred_times,
-                            "preferred_format": req.preferred_format,
-                            "language": req.language,
-                            "timezone": req.timezone,
-                            "access_needs": req.access_needs,
-                            "safety_notes": req.safety_notes,
-                            "session_mode": req.session_mode,
-                            "mentee_city": req.mentee.city_state,
-                        },
-                        "mentors": mentor_payload,
-                    }
-                ),
+                "content": prompt.user,
             },
         ],
     }
@@ -242,7 +208,9 @@ def _call_openrouter(req: MenteeRequest, mentors):
             data=req_data,
             headers=req_headers,
         )
-        with urllib.request.urlopen(req_obj, timeout=20) as resp:
+        with provider_http.urlopen(
+            req_obj, timeout=20, model=request_payload["model"], priority=provider_limits.PRIORITY_RECOMMENDATIONS
+        ) as resp:
             return json.loads(resp.read().decode("utf-8"))
 
     try:
@@ -279,7 +247,8 @@ def _call_openrouter(req: MenteeRequest, mentors):
         except json.JSONDecodeError:
             snippet = json_text[:240].replace("\n", " ").strip()
             return None, f"non_json_response:{snippet}"
-        recs = result.get("recommendations", [])
+        log_prompt_usage("openrouter", prompt, mentors=len(mentors), reported_tokens=usage_prompt_tokens(body))
+        recs = prompt.decode(result.get("recommendations", []))
         return {
             "recs": recs,
             "model": payload["model"],
@@ -290,6 +259,33 @@ def _call_openrouter(req: MenteeRequest, mentors):
         return None, str(exc)
 
 
+def _generate_rule_based_recommendations(instance: MenteeRequest, mentors):
+    # Local fallback while every LLM provider is unavailable or out of budget.
+    max_recs = _get_max_int("OPENAI_MAX_RECOMMENDATIONS", 3)
+    scored = score_mentors(instance, mentors)[:max_recs]
+    for rank, item in enumerate(scored, start=1):
+        MatchRecommendation.objects.create(
+            mentee_request=instance,
+            mentor=item.mentor,
+            score=item.score,
+            rank=rank,
+            explanation=item.explanation,
+            matched_topics=item.matched_topics,
+            availability_overlap=item.availability_overlap,
+            rating_score=item.rating_score,
+            response_time_score=item.response_time_score,
+            status="suggested",
+            source="rules",
+        )
+    return {
+        "generated": bool(scored),
+        "count": len(scored),
+        "reason_code": "rules_fallback_provider_unavailable",
+        "detail": "AI providers are temporarily unavailable; recommendations were ranked locally.",
+        "source": "rules",
+    }
+
+
 def generate_recommendations_for_request(
     instance: MenteeRequest, *, replace_existing: bool = True
 ):
@@ -307,8 +303,11 @@ def generate_recommendations_for_request(
         ).delete()
 
     max_mentors = _get_max_int("OPENAI_MAX_MENTORS", 0)
-    mentor_qs = Mentor.objects.filter(onboarding_status__current_status="completed")
-    mentor_pool = list(mentor_qs[:max_mentors]) if max_mentors > 0 else list(mentor_qs[:25])
+    mentor_pool = candidate_mentors(
+        instance,
+        limit=max_mentors if max_mentors > 0 else 25,
+        accept=lambda page: filter_mentors(instance, page),
+    )
     if not mentor_pool:
         return {
             "generated": False,
@@ -322,9 +321,30 @@ def generate_recommendations_for_request(
 
     eligible_mentors_by_id = {mentor.id: mentor for mentor in mentors}
 
-    provider = _recommendation_provider()
-    call_fn = _call_openai if provider == "openai" else _call_openrouter
-    result, _error = call_fn(instance, mentors)
+    provider_order = provider_health.failover_order(
+        _recommendation_provider(),
+        {
+            "openai": os.environ.get("OPENAI_MODEL", "gpt-4o-mini"),
+            "openrouter": os.environ.get("OPENROUTER_MODEL", "meta-llama/llama-3.2-3b-instruct"),
+        },
+    )
+    if not provider_order:
+        return _generate_rule_based_recommendations(instance, mentors)
+
+    # Ranked once and shared by every provider attempt; the LLM only reorders the top of it.
+    scored = score_mentors(instance, mentors) if rerank_enabled() else None
+    throttled = True
+    for provider in provider_order:
+        call_fn = _call_openai if provider == "openai" else _call_openrouter
+        result, _error = call_fn(instance, mentors, scored=scored)
+        if result and result.get("recs"):
+            break
+        throttled = throttled and any(
+            marker in str(_error or "") for marker in ("rate_limited:", "circuit_open:")
+        )
+    if throttled and not (result and result.get("recs")):
+        # Every provider shed this low-priority call; degrade to local ranking.
+        return _generate_rule_based_recommendations(instance, mentors)
     created_count = 0
     if result and result.get("recs"):
         max_recs_env = "OPENAI_MAX_RECOMMENDATIONS" if provider == "openai" else "OPENROUTER_MAX_RECOMMENDATIONS"
@@ -337,6 +357,7 @@ def generate_recommendations_for_request(
                 mentee_request=instance,
                 mentor=mentor,
                 score=rec.get("score", 0) or 0,
+                rank=created_count + 1,
                 explanation=rec.get("explanation", ""),
                 matched_topics=list(set(instance.topics).intersection(set(mentor.care_areas))),
                 availability_overlap=instance.preferred_times,
@@ -406,6 +427,116 @@ def auto_recommend_on_request(sender, instance: MenteeRequest, created: bool, **
     generate_recommendations_for_request(instance)
 
 
+@receiver(post_save, sender=Session)
+def enqueue_summary_on_session_complete(sender, instance: Session, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if kwargs.get("raw") or (update_fields and "status" not in update_fields):
+        return
+    if str(instance.status or "").strip().lower() in SUMMARY_SESSION_STATUSES:
+        enqueue_session_summary(instance, trigger="session_completed", rearm=True)
+
+
+@receiver(post_save, sender=SessionRecording)
+def enqueue_summary_on_recording_stop(sender, instance: SessionRecording, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if kwargs.get("raw") or (update_fields and "status" not in update_fields):
+        return
+    if str(instance.status or "").strip().lower() in SUMMARY_RECORDING_STATUSES:
+        enqueue_session_summary(instance.session, trigger=f"recording_{instance.status}", rearm=True)
+
+
+@receiver(post_save, sender=Mentee)
+@receiver(post_save, sender=MentorProfile)
+@receiver(post_save, sender=VolunteerEvent)
+def refresh_image_derivatives_on_upload(sender, instance, **kwargs):
+    update_fields = kwargs.get("update_fields")
+    if kwargs.get("raw") or (update_fields and not IMAGE_SOURCE_FIELDS[sender] & set(update_fields)):
+        return
+    try:
+        refresh_image_derivatives(instance)
+    except Exception:
+        # Storage hiccups must not fail the upload; the stale entry is left for build_image_derivatives.
+        logger.exception("Image derivative generation failed for %s %s", sender.__name__, instance.pk)
+
+
+@receiver(pre_save, sender=UserProfile)
+def revoke_tokens_on_role_change(sender, instance: UserProfile, **kwargs):
+    if kwargs.get("raw") or not instance.pk:
+        return
+    previous_role = UserProfile.objects.filter(pk=instance.pk).values_list("role", flat=True).first()
+    if previous_role is None or previous_role == instance.role:
+        return
+    # Outstanding tokens carry the old role claim.
+    bump_token_version(instance.user_id)
+
+
+@receiver(pre_save, sender=AdminAccount)
+def revoke_tokens_on_admin_account_move(sender, instance: AdminAccount, **kwargs):
+    if kwargs.get("raw") or not instance.pk:
+        return
+    previous_user_id = AdminAccount.objects.filter(pk=instance.pk).values_list("user_id", flat=True).first()
+    if previous_user_id is not None and previous_user_id != instance.user_id:
+        # The previous owner's tokens still carry the admin role claim.
+        bump_token_version(previous_user_id)
+
+
+@receiver(post_delete, sender=AdminAccount)
+def revoke_tokens_on_admin_account_delete(sender, instance: AdminAccount, **kwargs):
+    origin = kwargs.get("origin")
+    # A cascade from deleting the user needs nothing: its tokens stop resolving with it.
+    if (origin.model if isinstance(origin, QuerySet) else type(origin)) is AdminAccount:
+        bump_token_version(instance.user_id)
+
+
+@receiver(post_save, sender=UserTokenVersion)
+@receiver(post_delete, sender=UserTokenVersion)
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def forget_cached_token_version(sender, instance, **kwargs):
+    forget_token_version(instance.user_id if sender is UserTokenVersion else instance.pk)
+
+
+@receiver(post_save, sender=Mentor)
+def sync_weekly_availability_on_mentor_save(sender, instance: Mentor, **kwargs):
+    if kwargs.get("raw"):
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not {"availability", "timezone"} & set(update_fields):
+        return
+    if sync_weekly_availability(instance):
+        materialize_recurring_slots([instance.pk])
+
+
+@receiver(post_save, sender=Mentor)
+def reindex_mentor_on_save(sender, instance: Mentor, **kwargs):
+    if kwargs.get("raw"):
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not set(INDEXED_MENTOR_FIELDS) & set(update_fields):
+        return
+    reindex_mentors([instance.pk])
+
+
+@receiver(post_save, sender=Mentor)
+@receiver(post_save, sender=MentorProfile)
+def refresh_mentor_text_on_save(sender, instance, **kwargs):
+    if kwargs.get("raw"):
+        return
+    watched = {"specialization"} if sender is MentorProfile else set(TEXT_MENTOR_FIELDS)
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not watched & set(update_fields):
+        return
+    refresh_mentor_text([instance.mentor_id if sender is MentorProfile else instance.pk])
+
+
+@receiver(post_save, sender=MentorOnboardingStatus)
+@receiver(post_delete, sender=MentorOnboardingStatus)
+def reindex_mentor_on_onboarding_change(sender, instance: MentorOnboardingStatus, **kwargs):
+    if kwargs.get("raw"):
+        return
+    reindex_mentors([instance.mentor_id])
+
+
 @receiver(post_save, sender=MentorTrainingProgress)
 def auto_sync_training_status_on_progress_save(
     sender, instance: MentorTrainingProgress, **kwargs
@@ -1,18 +1,56 @@
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from types import SimpleNamespace
+import csv
+import gzip
+import hashlib
+import json
+import math
+import shutil
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
 from decimal import Decimal
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+from PIL import Image
+
+from django.contrib.admin.sites import site as admin_site
 from django.core import mail
-from django.test import TestCase, override_settings
+from django.core.cache import cache, caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
-from rest_framework.test import APITestCase
-
-from core.abuse_monitoring import classify_behavior_signal, detect_abusive_terms
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from core import audio_vad, media_access, provider_health, provider_http, provider_limits
+from core.api_views import (
+    CHATBOT_ANSWER_CACHE,
+    MentorWalletViewSet,
+    PayoutTransactionViewSet,
+    _split_transcript_chunks,
+    generate_meeting_summary_with_ai,
+    transcribe_audio_chunk_with_openai,
+)
+from core.admin import MentorIdentityVerificationAdmin
+from core.availability import materialize_recurring_slots
+from core.booking import hold_slot, release_slot_hold
+from core.auth import BondRoomTokenObtainPairSerializer
+from core.authentication import StatelessJWTAuthentication
+from core.abuse_monitoring import classify_behavior_signal, classify_video_behavior_frame, detect_abusive_terms
 from core.models import (
     AdminAccount,
     MatchRecommendation,
     MenteeRequest,
     Mentor,
+    MentorAvailabilitySlot,
+    MentorIdentityVerification,
+    MentorWeeklyAvailability,
     MentorWallet,
     MentorOnboardingStatus,
     Mentee,
@@ -21,11 +59,27 @@ from core.models import (
     Session,
     SessionFeedback,
     SessionIssueReport,
+    SessionMeetingSignal,
+    SessionRecording,
+    SessionSummaryJob,
+    SharedCacheEntry,
     TrainingModule,
     UserProfile,
+    UserTokenVersion,
+    VolunteerEvent,
+    WalletLedgerEntry,
 )
+from core.matching_logic import filter_mentors, score_mentors
+from core.image_derivatives import rows_needing_derivatives
+from core.mentor_index import candidate_mentors, mentor_text_scores
+from core.payouts import settle_payouts
+from core.permissions import user_role
 from core.quiz import generate_training_quiz_questions
+from core.session_summaries import process_due_summary_jobs
+from core.serializers import MenteeSerializer, VolunteerEventSerializer, build_absolute_media_url
+from core.shared_cache import TwoTierCache, acquire_guard, incr_counter
 from core.signals import generate_recommendations_for_request
+from core.wallet_ledger import take_wallet_snapshots, wallet_balance
 from django.contrib.auth import get_user_model
 
 
@@ -140,6 +194,112 @@ class RecommendationEligibilityTests(TestCase):
         )
         self.assertEqual(rec_ids, [completed_mentor.id])
 
+    @patch.dict("os.environ", {"OPENAI": "true", "PROVIDER_BREAKER_MIN_REQUESTS": "2"}, clear=False)
+    @patch("core.signals._call_openai")
+    def test_generate_recommendations_uses_rules_when_provider_circuit_open(self, mock_call_openai):
+        completed_mentor = self._create_mentor(suffix="1", completed_onboarding=True)
+        model = "gpt-4o-mini"
+        self.addCleanup(provider_health.reset_circuit, "openai", model)
+        provider_health.record_result("openai", model, ok=False)
+        provider_health.record_result("openai", model, ok=False)
+
+        result = generate_recommendations_for_request(self.request)
+
+        mock_call_openai.assert_not_called()
+        self.assertEqual(result["source"], "rules")
+        rec = MatchRecommendation.objects.get(mentee_request=self.request)
+        self.assertEqual(rec.mentor_id, completed_mentor.id)
+        self.assertEqual(rec.source, "rules")
+
+    def test_candidate_index_ranks_whole_pool_and_follows_mentor_changes(self):
+        fillers = [self._create_mentor(suffix=str(index), completed_onboarding=True) for index in range(3)]
+        for mentor in fillers:
+            mentor.languages = ["Hindi"]
+            mentor.save(update_fields=["languages"])
+        best = self._create_mentor(suffix="9", completed_onboarding=True)
+
+        self.assertEqual(candidate_mentors(self.request, limit=1), [best])
+        self.assertIn(("language", "english"), set(best.search_terms.values_list("facet", "value")))
+
+        best.onboarding_status.delete()
+        self.assertFalse(best.search_terms.exists())
+        # Nobody passes the hard filters now, so the ranked pool is used instead.
+        self.assertEqual(len(candidate_mentors(self.request, limit=5)), 3)
+
+    def test_candidate_index_refills_past_mentors_that_fail_availability(self):
+        busy = self._create_mentor(suffix="1", completed_onboarding=True)
+        busy.care_areas = ["Anxiety", "Stress"]
+        busy.availability = [{"day": "Friday", "start": "18:00", "end": "19:00"}]
+        busy.save(update_fields=["care_areas", "availability"])
+        free = self._create_mentor(suffix="2", completed_onboarding=True)
+        self.request.topics = ["Anxiety", "Stress"]
+        self.request.save(update_fields=["topics"])
+
+        def accept(page):
+            return filter_mentors(self.request, page)
+
+        self.assertEqual(candidate_mentors(self.request, limit=1), [busy])
+        self.assertEqual(candidate_mentors(self.request, limit=1, accept=accept), [free])
+        free.availability = busy.availability
+        free.save(update_fields=["availability"])
+        # Nobody is available, so the best-ranked page is kept as before.
+        self.assertEqual(candidate_mentors(self.request, limit=1, accept=accept), [busy])
+
+    def test_score_mentors_blends_profile_text_similarity(self):
+        coach = self._create_mentor(suffix="1", completed_onboarding=True)
+        gardener = self._create_mentor(suffix="2", completed_onboarding=True)
+        coach.bio = "Retired maths teacher who coaches students through exam pressure and board exams."
+        coach.save(update_fields=["bio"])
+        gardener.bio = "Enjoys gardening and long walks."
+        gardener.save(update_fields=["bio"])
+        self.request.free_text = "Board exams are close and the pressure keeps me up at night."
+        self.request.save(update_fields=["free_text"])
+
+        scored = {item.mentor.id: item for item in score_mentors(self.request, [gardener, coach])}
+        self.assertGreater(scored[coach.id].score, scored[gardener.id].score)
+        self.assertIn("profile matches your description", scored[coach.id].explanation)
+
+        gardener.bio = "Former exam board examiner; helps with exam pressure."
+        gardener.save(update_fields=["bio"])
+        self.assertIn(gardener.id, mentor_text_scores(self.request, [gardener.id, coach.id]))
+
+    @override_settings(OPENAI_API_KEY="test-key")
+    @patch.dict("os.environ", {"OPENAI": "true", "RECOMMENDATION_RERANK_TOP_K": "2"}, clear=False)
+    @patch("core.provider_http.urlopen")
+    def test_generate_recommendations_reranks_compact_local_shortlist(self, mock_urlopen):
+        mentors = [self._create_mentor(suffix=str(index), completed_onboarding=True) for index in range(3)]
+        for mentor, rating in zip(mentors, ("4.9", "4.0", "3.0")):
+            mentor.average_rating = Decimal(rating)
+            mentor.save(update_fields=["average_rating"])
+        reply = {"recommendations": [{"id": "m2", "explanation": "Calm and close by."}, {"id": "m9"}]}
+        response = MagicMock()
+        response.read.return_value = json.dumps(
+            {"id": "resp-1", "output_text": json.dumps(reply), "usage": {"input_tokens": 120}}
+        ).encode("utf-8")
+        mock_urlopen.return_value.__enter__.return_value = response
+
+        with self.assertLogs("core.recommendation_prompts", level="INFO") as logs:
+            result = generate_recommendations_for_request(self.request)
+
+        sent = json.loads(mock_urlopen.call_args.args[0].data)["input"][1]["content"]
+        self.assertIn("t1=Anxiety", sent)
+        self.assertIn("m2|t1|Y|4|", sent)
+        self.assertNotIn("m3", sent)
+        self.assertNotIn("10:00", sent)
+        self.assertTrue(result["generated"])
+        recs = list(
+            MatchRecommendation.objects.filter(mentee_request=self.request)
+            .order_by("rank")
+            .values_list("mentor_id", "explanation", "rank", "score")
+        )
+        self.assertEqual(recs[0][:3], (mentors[1].id, "Calm and close by.", 1))
+        self.assertEqual([rec[0] for rec in recs], [mentors[1].id, mentors[0].id])
+        local = {item.mentor.id: Decimal(str(item.score)) for item in score_mentors(self.request, mentors)}
+        self.assertEqual({rec[0]: rec[3] for rec in recs}, {mentor.id: local[mentor.id] for mentor in mentors[:2]})
+        self.assertLess(recs[0][3], recs[1][3])
+        self.assertIn("mode=rerank mentors=3 sent=2", logs.output[0])
+        self.assertIn("prompt_tokens_reported=120", logs.output[0])
+
     def test_generate_recommendations_clears_existing_when_no_completed_mentors(self):
         pending_mentor = self._create_mentor(suffix="3", completed_onboarding=False)
         MatchRecommendation.objects.create(
@@ -286,6 +446,28 @@ class RoleBasedLoginRouteTests(APITestCase):
         protected_response = self.client.post("/api/auth/logout/", {}, format="json")
         self.assertEqual(protected_response.status_code, 200)
 
+    def test_removing_admin_account_revokes_tokens_for_reads(self):
+        User = get_user_model()
+        password = "AdminPass123!"
+        user = User.objects.create_user(
+            username="admin_account_only_user_removed",
+            email="admin.account.only.removed@test.com",
+            password=password,
+        )
+        admin_account = AdminAccount.objects.create(user=user, mobile="+10000000095")
+        login_response = self.client.post(
+            "/api/admin/login/",
+            {"email": user.email, "password": password},
+            format="json",
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {login_response.data['access']}")
+        self.assertEqual(self.client.get("/api/admin/exports/sessions/").status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            admin_account.delete()
+
+        self.assertEqual(self.client.get("/api/admin/exports/sessions/").status_code, 401)
+
     def test_admin_account_without_user_profile_is_blocked_on_standard_login(self):
         User = get_user_model()
         password = "AdminPass123!"
@@ -303,6 +485,50 @@ class RoleBasedLoginRouteTests(APITestCase):
         )
         self.assertEqual(response.status_code, 401)
 
+    def test_login_token_authenticates_from_claims(self):
+        response = self.client.post(
+            "/api/login/",
+            {"email": self.mentee_user.email, "password": self.mentee_password},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        request = APIRequestFactory().get("/api/mentees/", HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        authenticator = StatelessJWTAuthentication()
+        authenticator.authenticate(request)
+
+        with self.assertNumQueries(0):
+            user, _token = authenticator.authenticate(request)
+            self.assertEqual(user_role(user), "mentee")
+        self.assertEqual(user.email, self.mentee_user.email)
+
+    def test_superuser_without_profile_keeps_admin_role_in_claims(self):
+        superuser = get_user_model().objects.create_superuser(
+            username="claims_superuser", email="claims.superuser@test.com", password="x"
+        )
+        access = BondRoomTokenObtainPairSerializer.get_token(superuser).access_token
+        request = APIRequestFactory().get("/api/mentees/", HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        user, _token = StatelessJWTAuthentication().authenticate(request)
+
+        self.assertEqual(user_role(user), "admin")
+
+    def test_role_change_revokes_issued_tokens(self):
+        response = self.client.post(
+            "/api/login/",
+            {"email": self.mentee_user.email, "password": self.mentee_password},
+            format="json",
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.assertEqual(self.client.post("/api/auth/logout/", {}, format="json").status_code, 200)
+
+        profile = UserProfile.objects.get(user=self.mentee_user)
+        profile.role = "mentor"
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save(update_fields=["role"])
+
+        self.assertEqual(UserTokenVersion.objects.get(user=self.mentee_user).version, 1)
+        self.assertEqual(self.client.post("/api/auth/logout/", {}, format="json").status_code, 401)
+
     def test_admin_register_sets_admin_role(self):
         payload = {
             "first_name": "New",
@@ -637,6 +863,46 @@ class TrainingModuleVideoWorkflowTests(APITestCase):
         self.assertTrue(submit.data["passed"])
         self.assertEqual(submit.data["score"], 7)
 
+    @patch("core.api_views.generate_training_quiz_questions")
+    @patch("core.quiz._generate_questions_with_openai")
+    def test_quiz_start_assembles_from_bank_without_repeating_last_attempt(
+        self, mock_openai_generate, mock_generate_quiz
+    ):
+        def fake_generate(request_modules, request_count):
+            fake_generate.calls += 1
+            return [
+                {
+                    "question": f"{module.title} scenario {fake_generate.calls}-{index}",
+                    "options": ["A", "B", "C", "D"],
+                    "correct_option_index": 2,
+                    "module_title": module.title,
+                }
+                for module in request_modules
+                for index in range(request_count // len(request_modules))
+            ]
+
+        fake_generate.calls = 0
+        mock_openai_generate.side_effect = fake_generate
+        call_command("build_quiz_question_bank", "--size", "30", stdout=StringIO())
+        self._complete_all_modules()
+
+        first = self.client.post("/api/training-modules/quiz/start/", {}, format="json")
+        self.assertEqual(first.status_code, 201, first.data)
+        self.assertEqual(first.data["generated_by"], "question_bank")
+        self.client.post(
+            "/api/training-modules/quiz/submit/",
+            {"attempt_id": first.data["attempt"]["id"], "selected_answers": [0] * 15},
+            format="json",
+        )
+        second = self.client.post("/api/training-modules/quiz/start/", {}, format="json")
+
+        self.assertEqual(second.status_code, 201, second.data)
+        first_questions = {item["question"] for item in first.data["attempt"]["questions"]}
+        second_questions = {item["question"] for item in second.data["attempt"]["questions"]}
+        self.assertEqual(len(second_questions), 15)
+        self.assertFalse(first_questions & second_questions)
+        mock_generate_quiz.assert_not_called()
+
     @patch("core.api_views.generate_training_quiz_questions", side_effect=RuntimeError("OpenAI unavailable"))
     def test_quiz_start_returns_service_unavailable_when_openai_generation_fails(self, _mock_generate_quiz):
         self._complete_all_modules()
@@ -1151,6 +1417,29 @@ class PayoutSettlementTests(APITestCase):
         self.assertEqual(self.payout_tx.status, "paid")
         self.assertIsNotNone(self.payout_tx.processed_at)
 
+    def test_patch_to_paid_does_not_settle_a_payout_settled_after_load(self):
+        load_payout = PayoutTransactionViewSet.get_object
+        loaded = []
+
+        def load_then_settle(viewset):
+            # Every read in the request sees the row as it was before the settlement run.
+            if not loaded:
+                loaded.append(load_payout(viewset))
+                settle_payouts(payout_ids=[loaded[0].id])
+            return loaded[0]
+
+        with patch.object(PayoutTransactionViewSet, "get_object", autospec=True, side_effect=load_then_settle):
+            response = self.client.patch(
+                f"/api/payout-transactions/{self.payout_tx.id}/", {"status": "paid"}, format="json"
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_payout, Decimal("0.00"))
+        self.assertEqual(
+            WalletLedgerEntry.objects.filter(mentor=self.mentor, entry_type="payout_settled").count(), 1
+        )
+
     def test_mark_paid_fails_when_pending_payout_is_lower_than_amount(self):
         self.wallet.pending_payout = Decimal("50.00")
         self.wallet.save(update_fields=["pending_payout", "updated_at"])
@@ -1177,6 +1466,460 @@ class PayoutSettlementTests(APITestCase):
         self.assertEqual(self.wallet.pending_payout, Decimal("0.00"))
         self.assertEqual(self.payout_tx.status, "paid")
 
+    def test_bulk_settle_aggregates_wallet_deltas_and_skips_short_wallets(self):
+        second = PayoutTransaction.objects.create(
+            mentor=self.mentor,
+            transaction_type="bank_payout",
+            status="processing",
+            amount=Decimal("50.00"),
+        )
+        self.wallet.pending_payout = Decimal("300.00")
+        self.wallet.save(update_fields=["pending_payout", "updated_at"])
+        short_mentor = Mentor.objects.create(
+            first_name="Short",
+            last_name="Wallet",
+            email="payout.short@test.com",
+            mobile="+911111119998",
+            dob=date(1990, 3, 1),
+            gender="Female",
+            city_state="Chennai",
+        )
+        short_payout = PayoutTransaction.objects.create(
+            mentor=short_mentor,
+            transaction_type="session_claim",
+            status="pending",
+            amount=Decimal("80.00"),
+        )
+
+        response = self.client.post(
+            "/api/payout-transactions/settle/",
+            {"payout_ids": [self.payout_tx.id, second.id, short_payout.id], "reference_id": "RUN-2026-10"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["settled_count"], 2)
+        self.assertEqual(response.data["settled_amount"], "250.00")
+        self.assertEqual([item["id"] for item in response.data["skipped"]], [short_payout.id])
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_payout, Decimal("50.00"))
+        self.assertEqual(
+            set(PayoutTransaction.objects.filter(reference_id="RUN-2026-10").values_list("id", flat=True)),
+            {self.payout_tx.id, second.id},
+        )
+        short_payout.refresh_from_db()
+        self.assertEqual(short_payout.status, "pending")
+        self.assertEqual(MentorWallet.objects.get(mentor=short_mentor).pending_payout, Decimal("0.00"))
+
+    def test_wallet_ledger_tracks_claims_and_payouts_with_snapshots(self):
+        WalletLedgerEntry.objects.create(
+            mentor=self.mentor,
+            entry_type="opening",
+            pending_payout_delta=Decimal("200.00"),
+            total_claimed_delta=Decimal("200.00"),
+        )
+        before_claim = timezone.now()
+        response = self.client.post(
+            f"/api/sessions/{self.session.id}/disposition/",
+            {"action": "claim", "amount": "120.00"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        response = self.client.post(f"/api/payout-transactions/{self.payout_tx.id}/mark-paid/", {}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_payout, Decimal("120.00"))
+        self.assertEqual(self.wallet.total_claimed, Decimal("320.00"))
+        self.assertEqual(
+            list(WalletLedgerEntry.objects.filter(mentor=self.mentor).values_list("entry_type", flat=True)),
+            ["opening", "claim", "payout_settled"],
+        )
+        self.assertEqual(take_wallet_snapshots(now=timezone.now() + timedelta(hours=1)), 1)
+
+        current = wallet_balance(self.mentor.id)
+        self.assertEqual(current["pending_payout"], self.wallet.pending_payout)
+        self.assertEqual(current["total_claimed"], self.wallet.total_claimed)
+        self.assertEqual(wallet_balance(self.mentor.id, as_of=before_claim)["pending_payout"], Decimal("200.00"))
+
+        response = self.client.get(f"/api/mentor-wallets/{self.wallet.id}/balance/")
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["pending_payout"], Decimal("120.00"))
+
+    def test_wallet_edit_keeps_claim_committed_after_load(self):
+        load_wallet = MentorWalletViewSet.get_object
+
+        def load_then_claim(viewset):
+            wallet = load_wallet(viewset)
+            MentorWallet.objects.filter(pk=wallet.pk).update(total_claimed=F("total_claimed") + Decimal("50.00"))
+            return wallet
+
+        with patch.object(MentorWalletViewSet, "get_object", autospec=True, side_effect=load_then_claim):
+            response = self.client.patch(
+                f"/api/mentor-wallets/{self.wallet.id}/", {"pending_payout": "150.00"}, format="json"
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_payout, Decimal("150.00"))
+        self.assertEqual(self.wallet.total_claimed, Decimal("250.00"))
+        adjustment = WalletLedgerEntry.objects.get(mentor=self.mentor, entry_type="adjustment")
+        self.assertEqual(adjustment.pending_payout_delta, Decimal("-50.00"))
+        self.assertEqual(adjustment.total_claimed_delta, Decimal("0.00"))
+
+    def test_admin_export_streams_filtered_csv_and_gzipped_jsonl(self):
+        PayoutTransaction.objects.create(
+            mentor=self.mentor,
+            transaction_type="bank_payout",
+            status="paid",
+            amount=Decimal("75.00"),
+            note='Quarterly "bonus", split',
+        )
+
+        response = self.client.get("/api/admin/exports/payouts/", {"status": "paid"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode("utf-8"))))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["amount"], "75.00")
+        self.assertEqual(rows[0]["note"], 'Quarterly "bonus", split')
+
+        today = timezone.localdate().isoformat()
+        response = self.client.get(
+            "/api/admin/exports/payouts/",
+            {"output": "jsonl", "gzip": "1", "from": today, "to": today},
+        )
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        lines = gzip.decompress(b"".join(response.streaming_content)).decode("utf-8").splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual({json.loads(line)["status"] for line in lines}, {"pending", "paid"})
+
+        self.client.force_authenticate(user=self.mentor_user)
+        self.assertEqual(self.client.get("/api/admin/exports/payouts/").status_code, 403)
+
+    def test_admin_export_neutralizes_formula_cells_in_csv(self):
+        PayoutTransaction.objects.create(
+            mentor=self.mentor,
+            transaction_type="bank_payout",
+            status="paid",
+            amount=Decimal("-5.00"),
+            note='=HYPERLINK("http://evil.test","refund")',
+        )
+
+        response = self.client.get("/api/admin/exports/payouts/", {"status": "paid"})
+        rows = list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode("utf-8"))))
+
+        self.assertEqual(rows[0]["note"], '\'=HYPERLINK("http://evil.test","refund")')
+        self.assertEqual(rows[0]["amount"], "-5.00")
+
+    def test_settle_payouts_command_dry_run_changes_nothing(self):
+        stdout = StringIO()
+        call_command("settle_payouts", "--mentor-id", str(self.mentor.id), "--dry-run", stdout=stdout)
+
+        self.assertIn("Dry run: 1 payouts settled", stdout.getvalue())
+        self.payout_tx.refresh_from_db()
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.payout_tx.status, "pending")
+        self.assertEqual(self.wallet.pending_payout, Decimal("200.00"))
+
+
+class MentorAvailabilitySearchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.mentee_user = User.objects.create_user(
+            username="slot_mentee_user",
+            email="slot.mentee@test.com",
+            password="MenteePass123!",
+        )
+        UserProfile.objects.create(user=cls.mentee_user, role="mentee")
+        cls.mentor = Mentor.objects.create(
+            first_name="Slot",
+            last_name="Mentor",
+            email="slot.mentor@test.com",
+            mobile="+911111118888",
+            dob=date(1990, 4, 1),
+            gender="Female",
+            city_state="Chennai",
+            timezone="Asia/Kolkata",
+            availability=[
+                {"day": "Monday", "start": "17:00", "end": "19:00"},
+                {"day": "mon", "start": "18:30", "end": "20:00"},
+                {"day": "Funday", "start": "10:00", "end": "11:00"},
+            ],
+        )
+        cls.mentee = Mentee.objects.create(
+            first_name="Slot",
+            last_name="Mentee",
+            grade="10th Grade",
+            email=cls.mentee_user.email,
+            dob=date(2009, 4, 1),
+            gender="Male",
+            city_state="Chennai",
+            parent_guardian_consent=True,
+        )
+        cls.day = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=2)
+        # 22:00 to 02:00 crosses midnight, so it is bucketed on its start day only.
+        cls.slot = MentorAvailabilitySlot.objects.create(
+            mentor=cls.mentor,
+            start_time=cls.day + timedelta(hours=22),
+            end_time=cls.day + timedelta(hours=26),
+        )
+        Session.objects.create(
+            mentee=cls.mentee,
+            mentor=cls.mentor,
+            availability_slot=cls.slot,
+            scheduled_start=cls.day + timedelta(hours=23),
+            scheduled_end=cls.day + timedelta(hours=24, minutes=30),
+            duration_minutes=90,
+            timezone="UTC",
+            mode="online",
+            status="scheduled",
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.mentee_user)
+
+    def test_slot_buckets_and_weekly_rows_are_kept_in_sync(self):
+        self.assertEqual(self.slot.start_day, self.day.date())
+        self.assertEqual((self.slot.start_minute, self.slot.end_minute), (22 * 60, 26 * 60))
+        self.assertEqual(
+            list(self.mentor.weekly_availability.values_list("weekday", "start_minute", "end_minute")),
+            [(0, 17 * 60, 20 * 60)],
+        )
+
+        self.mentor.availability = [{"day": "Tuesday", "start": "09:00", "end": "10:00"}]
+        self.mentor.save(update_fields=["availability"])
+        self.assertEqual(list(self.mentor.weekly_availability.values_list("weekday", flat=True)), [1])
+
+    def test_recurring_slots_are_materialized_and_diffed(self):
+        now = datetime(2030, 1, 7, tzinfo=dt_timezone.utc)  # a Monday
+        future = MentorAvailabilitySlot.objects.filter(mentor=self.mentor, start_time__gte=now)
+
+        counts = materialize_recurring_slots([self.mentor.id], now=now, horizon=timedelta(days=14))
+        self.assertEqual(counts, {"created": 2, "updated": 0, "deleted": 0})
+        first = future.order_by("start_time").first()
+        # 17:00-20:00 in Asia/Kolkata.
+        self.assertEqual(first.start_time, datetime(2030, 1, 7, 11, 30, tzinfo=dt_timezone.utc))
+        self.assertEqual(first.end_time, datetime(2030, 1, 7, 14, 30, tzinfo=dt_timezone.utc))
+        self.assertEqual((first.source, first.timezone, first.start_minute), ("recurring", "Asia/Kolkata", 690))
+        self.assertEqual(
+            materialize_recurring_slots([self.mentor.id], now=now, horizon=timedelta(days=14))["created"], 0
+        )
+
+        MentorAvailabilitySlot.objects.filter(id=first.id).update(is_available=False)
+        MentorWeeklyAvailability.objects.filter(mentor=self.mentor).update(weekday=1)
+        counts = materialize_recurring_slots([self.mentor.id], now=now, horizon=timedelta(days=14))
+        self.assertEqual(counts, {"created": 2, "updated": 0, "deleted": 1})
+        self.assertEqual(sorted(future.values_list("start_time__day", flat=True)), [7, 8, 15])
+
+        stdout = StringIO()
+        call_command("materialize_availability_slots", "--mentor-id", str(self.mentor.id), stdout=stdout)
+        self.assertIn("Recurring slots for 1 mentors over 28 days", stdout.getvalue())
+
+    def test_free_slots_subtract_booked_sessions(self):
+        # The window starts after midnight; the slot is still found through the previous day's bucket.
+        response = self.client.get(
+            "/api/mentor-availability-slots/free-slots/",
+            {
+                "start": (self.day + timedelta(hours=24)).isoformat(),
+                "end": (self.day + timedelta(hours=30)).isoformat(),
+                "duration_minutes": 60,
+            },
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["count"], 1)
+        free = response.data["results"][0]
+        self.assertEqual(free["slot_id"], self.slot.id)
+        self.assertEqual(free["start"], self.day + timedelta(hours=24, minutes=30))
+        self.assertEqual(free["end"], self.day + timedelta(hours=26))
+
+        response = self.client.get(
+            "/api/mentor-availability-slots/free-slots/",
+            {"start": (self.day + timedelta(hours=20)).isoformat(), "end": (self.day + timedelta(hours=30)).isoformat()},
+        )
+        self.assertEqual(
+            [(item["start"], item["end"]) for item in response.data["results"]],
+            [
+                (self.day + timedelta(hours=22), self.day + timedelta(hours=23)),
+                (self.day + timedelta(hours=24, minutes=30), self.day + timedelta(hours=26)),
+            ],
+        )
+
+    def _book(self, slot, **overrides):
+        payload = {
+            "mentor": self.mentor.id,
+            "availability_slot": slot.id,
+            "scheduled_start": slot.start_time.isoformat(),
+            "scheduled_end": slot.end_time.isoformat(),
+            "duration_minutes": 60,
+            "mode": "online",
+        }
+        payload.update(overrides)
+        return self.client.post("/api/sessions/", payload, format="json")
+
+    def test_held_slot_can_only_be_booked_once_by_its_holder(self):
+        slot = MentorAvailabilitySlot.objects.create(
+            mentor=self.mentor,
+            start_time=self.day + timedelta(hours=10),
+            end_time=self.day + timedelta(hours=11),
+        )
+        other = Mentee.objects.create(
+            first_name="Other",
+            last_name="Mentee",
+            grade="10th Grade",
+            email="slot.other@test.com",
+            dob=date(2009, 5, 1),
+            gender="Female",
+            city_state="Chennai",
+            parent_guardian_consent=True,
+        )
+        response = self.client.post(f"/api/mentor-availability-slots/{slot.id}/hold/", format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+
+        admin_user = get_user_model().objects.create_user(username="slot_booking_admin", password="AdminPass123!")
+        UserProfile.objects.create(user=admin_user, role="admin")
+        self.client.force_authenticate(user=admin_user)
+        response = self._book(slot, mentee=other.id)
+        self.assertEqual(response.status_code, 409, response.data)
+
+        self.client.force_authenticate(user=self.mentee_user)
+        response = self._book(slot)
+        self.assertEqual(response.status_code, 201, response.data)
+        slot.refresh_from_db()
+        self.assertFalse(slot.is_available)
+        self.assertIsNone(slot.held_by_id)
+        self.assertEqual(self._book(slot).status_code, 409)
+        self.assertEqual(Session.objects.filter(availability_slot=slot).count(), 1)
+
+    def test_rescheduling_to_another_slot_frees_the_old_one(self):
+        first, second = (
+            MentorAvailabilitySlot.objects.create(
+                mentor=self.mentor,
+                start_time=self.day + timedelta(hours=hour),
+                end_time=self.day + timedelta(hours=hour + 1),
+            )
+            for hour in (10, 12)
+        )
+        booked = self._book(first)
+        self.assertEqual(booked.status_code, 201, booked.data)
+
+        response = self.client.patch(
+            f"/api/sessions/{booked.data['id']}/",
+            {
+                "availability_slot": second.id,
+                "scheduled_start": second.start_time.isoformat(),
+                "scheduled_end": second.end_time.isoformat(),
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertTrue(first.is_available)
+        self.assertFalse(second.is_available)
+
+    def test_cancelling_or_terminating_a_session_frees_its_slot(self):
+        first, second = (
+            MentorAvailabilitySlot.objects.create(
+                mentor=self.mentor,
+                start_time=self.day + timedelta(hours=hour),
+                end_time=self.day + timedelta(hours=hour + 1),
+            )
+            for hour in (10, 12)
+        )
+        canceled = self._book(first)
+        response = self.client.patch(f"/api/sessions/{canceled.data['id']}/", {"status": "canceled"}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        first.refresh_from_db()
+        self.assertTrue(first.is_available)
+
+        terminated = self._book(second)
+        admin_user = get_user_model().objects.create_user(username="slot_terminate_admin", password="AdminPass123!")
+        UserProfile.objects.create(user=admin_user, role="admin")
+        self.client.force_authenticate(user=admin_user)
+        response = self.client.post(f"/api/sessions/{terminated.data['id']}/terminate/", {}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        second.refresh_from_db()
+        self.assertTrue(second.is_available)
+
+    def test_moving_an_unbooked_session_takes_the_new_slot(self):
+        first, second = (
+            MentorAvailabilitySlot.objects.create(
+                mentor=self.mentor,
+                start_time=self.day + timedelta(hours=hour),
+                end_time=self.day + timedelta(hours=hour + 1),
+            )
+            for hour in (10, 12)
+        )
+        session_id = self._book(first).data["id"]
+        Session.objects.filter(id=session_id).update(status="in_progress")
+
+        response = self.client.patch(f"/api/sessions/{session_id}/", {"availability_slot": second.id}, format="json")
+
+        self.assertEqual(response.status_code, 200, response.data)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertTrue(first.is_available)
+        self.assertFalse(second.is_available)
+
+    def test_mentee_slot_listing_hides_other_mentees_holds(self):
+        slot = MentorAvailabilitySlot.objects.create(
+            mentor=self.mentor,
+            start_time=self.day + timedelta(hours=10),
+            end_time=self.day + timedelta(hours=11),
+        )
+        other = Mentee.objects.create(
+            first_name="Holding",
+            last_name="Mentee",
+            grade="10th Grade",
+            email="slot.holder@test.com",
+            dob=date(2009, 5, 1),
+            gender="Female",
+            city_state="Chennai",
+            parent_guardian_consent=True,
+        )
+        hold_slot(slot.id, other.id)
+
+        response = self.client.get(f"/api/mentor-availability-slots/{slot.id}/")
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertIsNone(response.data["held_by"])
+        self.assertIsNotNone(response.data["held_until"])
+
+        release_slot_hold(slot.id)
+        self.client.post(f"/api/mentor-availability-slots/{slot.id}/hold/", format="json")
+        response = self.client.get(f"/api/mentor-availability-slots/{slot.id}/")
+        self.assertEqual(response.data["held_by"], self.mentee.id)
+
+    def test_overlapping_session_for_mentor_is_rejected(self):
+        slot = MentorAvailabilitySlot.objects.create(
+            mentor=self.mentor,
+            start_time=self.day + timedelta(hours=23, minutes=30),
+            end_time=self.day + timedelta(hours=24, minutes=30),
+        )
+        response = self._book(slot)
+        self.assertEqual(response.status_code, 409, response.data)
+        self.assertEqual(len(response.data["conflicting_session_ids"]), 1)
+        slot.refresh_from_db()
+        self.assertTrue(slot.is_available)
+
+    def test_slot_longer_than_a_day_is_rejected(self):
+        admin_user = get_user_model().objects.create_user(username="slot_admin_user", password="AdminPass123!")
+        UserProfile.objects.create(user=admin_user, role="admin")
+        self.client.force_authenticate(user=admin_user)
+        response = self.client.post(
+            "/api/mentor-availability-slots/",
+            {
+                "mentor": self.mentor.id,
+                "start_time": self.day.isoformat(),
+                "end_time": (self.day + timedelta(hours=25)).isoformat(),
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("end_time", response.data)
+
 
 class SessionBehaviorMonitoringTests(APITestCase):
     @classmethod
@@ -1342,7 +2085,470 @@ class SessionBehaviorMonitoringTests(APITestCase):
         self.assertEqual(response.data["reason"], "low_confidence")
 
 
+class SessionRecordingFixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.mentor_user = User.objects.create_user(
+            username="summary_mentor_user",
+            email="summary.mentor@test.com",
+            password="MentorPass123!",
+        )
+        UserProfile.objects.create(user=cls.mentor_user, role="mentor")
+        cls.mentor = Mentor.objects.create(
+            first_name="Summary",
+            last_name="Mentor",
+            email=cls.mentor_user.email,
+            mobile="+911111110202",
+            dob=date(1978, 5, 1),
+            gender="Female",
+            city_state="Pune",
+        )
+        cls.mentee = Mentee.objects.create(
+            first_name="Summary",
+            last_name="Mentee",
+            grade="9th Grade",
+            email="summary.mentee@test.com",
+            dob=date(2011, 5, 1),
+            gender="Male",
+            city_state="Pune",
+            parent_guardian_consent=True,
+        )
+
+    def setUp(self):
+        now = timezone.now()
+        self.session = Session.objects.create(
+            mentee=self.mentee,
+            mentor=self.mentor,
+            scheduled_start=now - timedelta(hours=1),
+            scheduled_end=now,
+            duration_minutes=60,
+            timezone="Asia/Kolkata",
+            mode="online",
+            status="in_progress",
+        )
+
+
+class SessionSummaryJobTests(SessionRecordingFixtureMixin, APITestCase):
+    @patch("core.api_views.generate_meeting_summary_with_ai")
+    def test_recording_stop_enqueues_job_and_get_only_reads(self, mock_generate):
+        self.client.force_authenticate(user=self.mentor_user)
+        self.client.post(f"/api/sessions/{self.session.id}/recording/", {"status": "stopped"}, format="json")
+        response = self.client.get(f"/api/sessions/{self.session.id}/recording/")
+
+        self.assertEqual(response.status_code, 200, response.data)
+        job = SessionSummaryJob.objects.get(session=self.session)
+        self.assertEqual((job.status, job.trigger), ("pending", "recording_stopped"))
+        mock_generate.assert_not_called()
+
+    @patch("core.api_views.generate_meeting_summary_with_ai")
+    def test_failed_job_backs_off_then_stores_summary(self, mock_generate):
+        self.session.status = "completed"
+        self.session.save()
+        mock_generate.side_effect = RuntimeError("provider down")
+
+        self.assertEqual(process_due_summary_jobs()["failed"], 1)
+        job = SessionSummaryJob.objects.get(session=self.session)
+        self.assertEqual((job.status, job.attempts), ("pending", 1))
+        self.assertGreater(job.next_attempt_at, timezone.now())
+        self.assertEqual(process_due_summary_jobs()["claimed"], 0)
+
+        SessionSummaryJob.objects.filter(id=job.id).update(next_attempt_at=timezone.now())
+        mock_generate.side_effect = None
+        mock_generate.return_value = {"summary": "Planned revision.", "highlights": [], "action_items": []}
+        self.assertEqual(process_due_summary_jobs()["succeeded"], 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "succeeded")
+        recording = SessionRecording.objects.get(session=self.session)
+        self.assertEqual(recording.metadata["meeting_summary"], "Planned revision.")
+
+    @patch("core.api_views.generate_meeting_summary_with_ai")
+    def test_recording_stop_rearms_finished_job_when_transcript_grew(self, mock_generate):
+        mock_generate.return_value = {"summary": "Partial.", "highlights": [], "action_items": []}
+        self.session.status = "completed"
+        self.session.save()
+        self.assertEqual(process_due_summary_jobs()["succeeded"], 1)
+
+        self.session.save()
+        job = SessionSummaryJob.objects.get(session=self.session)
+        self.assertEqual(job.status, "succeeded")
+
+        SessionMeetingSignal.objects.create(
+            session=self.session, sender_role="mentee", signal_type="transcript", payload={"text": "One more thing."}
+        )
+        recording = SessionRecording.objects.get(session=self.session)
+        recording.status = "stopped"
+        recording.save()
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.trigger, job.attempts), ("pending", "recording_stopped", 0))
+
+    @patch("core.api_views.generate_meeting_summary_with_ai")
+    def test_transcript_added_during_run_requeues_job(self, mock_generate):
+        def summarize_while_mentee_speaks(session, _transcript):
+            SessionMeetingSignal.objects.create(
+                session=session, sender_role="mentee", signal_type="transcript", payload={"text": "Late line."}
+            )
+            return {"summary": "Partial.", "highlights": [], "action_items": []}
+
+        mock_generate.side_effect = summarize_while_mentee_speaks
+        self.session.status = "completed"
+        self.session.save()
+        process_due_summary_jobs()
+
+        job = SessionSummaryJob.objects.get(session=self.session)
+        self.assertEqual((job.status, job.trigger), ("pending", "transcript_updated"))
+        mock_generate.side_effect = None
+        mock_generate.return_value = {"summary": "Complete.", "highlights": [], "action_items": []}
+        self.assertEqual(process_due_summary_jobs()["succeeded"], 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "succeeded")
+
+    @patch.dict("os.environ", {"CRON_SECRET": "cron-test-secret"}, clear=False)
+    @patch("core.api_views.generate_meeting_summary_with_ai")
+    def test_cron_endpoint_runs_a_pass_only_with_the_secret(self, mock_generate):
+        mock_generate.return_value = {"summary": "Done.", "highlights": [], "action_items": []}
+        self.session.status = "completed"
+        self.session.save()
+
+        self.assertEqual(self.client.get("/api/cron/summary-jobs/").status_code, 403)
+        response = self.client.get("/api/cron/summary-jobs/", HTTP_AUTHORIZATION="Bearer cron-test-secret")
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["succeeded"], 1)
+        self.assertEqual(SessionSummaryJob.objects.get(session=self.session).status, "succeeded")
+
+
+@override_settings(S3_MEDIA_BUCKET_NAME="recordings-bucket", AWS_S3_REGION_NAME="ap-south-1")
+class RecordingMultipartUploadTests(SessionRecordingFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.s3 = MagicMock()
+        self.s3.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+        self.s3.generate_presigned_url.side_effect = lambda op, Params, **kwargs: (
+            f"https://s3.test/{Params['Key']}?partNumber={Params['PartNumber']}"
+        )
+        self.s3.list_parts.return_value = {
+            "Parts": [
+                {"PartNumber": 1, "ETag": '"a"', "Size": 16 * 1024 * 1024},
+                {"PartNumber": 2, "ETag": '"b"', "Size": 1024},
+            ],
+            "IsTruncated": False,
+        }
+        boto3_patch = patch("core.media_access.boto3")
+        boto3_patch.start().client.return_value = self.s3
+        self.addCleanup(boto3_patch.stop)
+        media_access.clear_caches()
+        self.addCleanup(media_access.clear_caches)
+        self.client.force_authenticate(user=self.mentor_user)
+        self.base_url = f"/api/sessions/{self.session.id}/recording-multipart"
+
+    def test_multipart_upload_flow_updates_recording(self):
+        initiate = self.client.post(
+            f"{self.base_url}/initiate/",
+            {"file_name": "call.webm", "file_size_bytes": 40 * 1024 * 1024},
+            format="json",
+        )
+        self.assertEqual(initiate.status_code, 200, initiate.data)
+        self.assertEqual(initiate.data["part_count"], 3)
+
+        signed = self.client.post(
+            f"{self.base_url}/sign-parts/", {"upload_id": "upload-1", "start_part": 1, "count": 3}, format="json"
+        )
+        self.assertEqual([item["part_number"] for item in signed.data["parts"]], [1, 2, 3])
+        listed = self.client.get(f"{self.base_url}/parts/?upload_id=upload-1")
+        self.assertEqual(len(listed.data["parts"]), 2)
+
+        payload = {"upload_id": "upload-1", "part_count": 3}
+        incomplete = self.client.post(f"{self.base_url}/complete/", payload, format="json")
+        self.assertEqual(incomplete.status_code, 409, incomplete.data)
+        self.assertEqual(incomplete.data["missing_parts"], [3])
+        self.s3.complete_multipart_upload.assert_not_called()
+
+        self.s3.list_parts.return_value["Parts"][1]["Size"] = 16 * 1024 * 1024
+        self.s3.list_parts.return_value["Parts"].append({"PartNumber": 3, "ETag": '"c"', "Size": 1024})
+        complete = self.client.post(f"{self.base_url}/complete/", payload, format="json")
+
+        self.assertEqual(complete.status_code, 200, complete.data)
+        recording = SessionRecording.objects.get(session=self.session)
+        self.assertEqual(recording.status, "uploaded")
+        self.assertEqual(recording.storage_key, initiate.data["storage_key"])
+        self.assertEqual(recording.file_size_bytes, 32 * 1024 * 1024 + 1024)
+        self.assertNotIn("multipart_upload", recording.metadata)
+        completed_parts = self.s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        self.assertEqual(
+            completed_parts,
+            [{"PartNumber": 1, "ETag": '"a"'}, {"PartNumber": 2, "ETag": '"b"'}, {"PartNumber": 3, "ETag": '"c"'}],
+        )
+        self.assertTrue(SessionSummaryJob.objects.filter(session=self.session).exists())
+
+    def test_initiate_aborts_the_upload_it_replaces(self):
+        first = self.client.post(f"{self.base_url}/initiate/", {"file_name": "call.webm"}, format="json")
+        self.s3.create_multipart_upload.return_value = {"UploadId": "upload-2"}
+        second = self.client.post(f"{self.base_url}/initiate/", {"file_name": "call.webm"}, format="json")
+
+        self.assertEqual(second.data["upload_id"], "upload-2")
+        self.s3.abort_multipart_upload.assert_called_once_with(
+            Bucket="recordings-bucket", Key=first.data["storage_key"], UploadId="upload-1"
+        )
+
+    def test_unknown_upload_id_is_rejected(self):
+        self.client.post(f"{self.base_url}/initiate/", {"file_name": "call.webm"}, format="json")
+        response = self.client.post(
+            f"{self.base_url}/sign-parts/", {"upload_id": "someone-else", "part_numbers": [1]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.s3.generate_presigned_url.assert_not_called()
+
+
+@override_settings(S3_MEDIA_BUCKET_NAME="media-bucket", AWS_S3_REGION_NAME="ap-south-1", S3_MEDIA_URL_EXPIRES=3600)
+class MediaAccessCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.s3 = MagicMock()
+        self.s3.generate_presigned_url.side_effect = lambda op, Params, **kwargs: (
+            f"https://media-bucket.s3.ap-south-1.amazonaws.com/{Params['Key']}?signature=1"
+        )
+        boto3_patch = patch("core.media_access.boto3")
+        self.boto3 = boto3_patch.start()
+        self.boto3.client.return_value = self.s3
+        self.addCleanup(boto3_patch.stop)
+        media_access.clear_caches()
+        self.addCleanup(media_access.clear_caches)
+
+    def test_clients_are_reused_per_endpoint_and_credentials(self):
+        first = media_access.s3_client(region="ap-south-1", access_key="AKIA1", secret_key="secret")
+        second = media_access.s3_client(region="ap-south-1", access_key="AKIA1", secret_key="secret")
+        media_access.s3_client(region="ap-south-1", access_key="AKIA1", secret_key="rotated")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.boto3.client.call_count, 2)
+
+    def test_media_urls_are_signed_once_per_object(self):
+        raw_url = "https://media-bucket.s3.ap-south-1.amazonaws.com/avatars/mentor-1.png"
+
+        urls = {build_absolute_media_url(raw_url) for _ in range(5)}
+        build_absolute_media_url("https://media-bucket.s3.ap-south-1.amazonaws.com/avatars/mentor-2.png")
+
+        self.assertEqual(urls, {f"{raw_url}?signature=1"})
+        self.assertEqual(self.boto3.client.call_count, 1)
+        self.assertEqual(self.s3.generate_presigned_url.call_count, 2)
+
+
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root, MEDIA_URL="/media/")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    @staticmethod
+    def _photo(name="photo.jpg", size=(2400, 1800)):
+        exif = Image.Exif()
+        exif[0x010F] = "PhoneMaker"
+        buffer = BytesIO()
+        Image.new("RGB", size, (200, 120, 40)).save(buffer, format="JPEG", exif=exif)
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+    def test_event_upload_stores_resized_derivatives_without_exif(self):
+        event = VolunteerEvent.objects.create(title="Beach cleanup", image_file=self._photo())
+        event.refresh_from_db()
+
+        entry = event.media_derivatives["image_file"]
+        self.assertEqual(entry["source"], event.image_file.name)
+        with event.image_file.storage.open(entry["thumb"]) as handle:
+            thumb = Image.open(handle)
+            thumb.load()
+        self.assertEqual(max(thumb.size), 160)
+        self.assertFalse(thumb.getexif())
+
+        data = VolunteerEventSerializer(event).data
+        self.assertEqual(set(data["image_derivatives"]), {"thumb", "medium", "large"})
+        self.assertNotIn("media_derivatives", data)
+
+    def test_upload_strips_exif_from_the_stored_original(self):
+        event = VolunteerEvent.objects.create(title="Park walk", image_file=self._photo())
+        event.refresh_from_db()
+
+        with event.image_file.storage.open(event.image_file.name) as handle:
+            original = Image.open(handle)
+            original.load()
+        self.assertEqual(original.size, (2400, 1800))
+        self.assertFalse(original.getexif())
+
+    def test_replacing_an_image_deletes_its_old_derivatives(self):
+        event = VolunteerEvent.objects.create(title="River cleanup", image_file=self._photo("first.jpg"))
+        event.refresh_from_db()
+        storage = event.image_file.storage
+        old_names = {event.media_derivatives["image_file"][label] for label in ("thumb", "medium", "large")}
+        self.assertTrue(all(storage.exists(name) for name in old_names))
+
+        event.image_file = self._photo("second.jpg")
+        event.save()
+
+        event.refresh_from_db()
+        entry = event.media_derivatives["image_file"]
+        self.assertEqual(entry["source"], event.image_file.name)
+        self.assertTrue(storage.exists(entry["thumb"]))
+        self.assertFalse(any(storage.exists(name) for name in old_names))
+
+    def test_backfill_command_renders_missing_avatar_derivatives(self):
+        mentee = Mentee.objects.create(
+            first_name="Avatar",
+            last_name="Mentee",
+            grade="10th Grade",
+            email="avatar.mentee@test.com",
+            dob=date(2008, 1, 1),
+            gender="Female",
+            avatar=self._photo("avatar.jpg", size=(300, 300)),
+        )
+        Mentee.objects.filter(id=mentee.id).update(media_derivatives={})
+
+        stdout = StringIO()
+        call_command("build_image_derivatives", stdout=stdout)
+
+        self.assertIn("Mentee: 1 rows, 1 images rendered", stdout.getvalue())
+        mentee.refresh_from_db()
+        entry = mentee.media_derivatives["avatar"]
+        # A 300px source needs only thumb and medium renditions; large reuses medium.
+        self.assertEqual(entry["large"], entry["medium"])
+        self.assertEqual(set(MenteeSerializer(mentee).data["avatar_derivatives"]), {"thumb", "medium", "large"})
+
+        # Current rows are not visited again.
+        stdout = StringIO()
+        call_command("build_image_derivatives", stdout=stdout)
+        self.assertIn("Mentee: 0 rows", stdout.getvalue())
+        Mentee.objects.filter(id=mentee.id).update(media_derivatives={"avatar": {**entry, "source": "old.jpg"}})
+        self.assertEqual(list(rows_needing_derivatives(Mentee)), [mentee])
+
+
+class IdentityDocumentMetadataTests(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.mentor_user = get_user_model().objects.create_user(
+            username="identity_mentor_user",
+            email="identity.mentor@test.com",
+            password="MentorPass123!",
+        )
+        UserProfile.objects.create(user=self.mentor_user, role="mentor")
+        self.mentor = Mentor.objects.create(
+            first_name="Identity",
+            last_name="Mentor",
+            email=self.mentor_user.email,
+            mobile="+911111110303",
+            dob=date(1980, 2, 1),
+            gender="Male",
+            city_state="Delhi",
+        )
+        self.verification = MentorIdentityVerification.objects.create(mentor=self.mentor)
+        buffer = BytesIO()
+        Image.new("RGB", (640, 400), (10, 20, 30)).save(buffer, format="PNG")
+        self.document_bytes = buffer.getvalue()
+
+    def test_upload_records_document_metadata(self):
+        self.client.force_authenticate(user=self.mentor_user)
+        response = self.client.patch(
+            f"/api/mentor-identity-verifications/{self.verification.id}/",
+            {"id_proof_document": SimpleUploadedFile("id.png", self.document_bytes, content_type="image/png")},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        entry = response.data["document_metadata"]["id_proof_document"]
+        self.assertEqual(entry["sha256"], hashlib.sha256(self.document_bytes).hexdigest())
+        self.assertEqual(entry["size"], len(self.document_bytes))
+        self.assertEqual((entry["content_type"], entry["width"], entry["height"]), ("image/png", 640, 400))
+        self.assertFalse(entry["duplicate"])
+
+    def test_backfill_flags_duplicate_documents_across_mentors(self):
+        other_mentor = Mentor.objects.create(
+            first_name="Other",
+            last_name="Mentor",
+            email="other.identity@test.com",
+            mobile="+911111110404",
+            dob=date(1981, 2, 1),
+            gender="Female",
+            city_state="Delhi",
+        )
+        MentorIdentityVerification.objects.create(
+            mentor=other_mentor,
+            aadhaar_front=SimpleUploadedFile("front.png", self.document_bytes, content_type="image/png"),
+        )
+        self.verification.id_proof_document = SimpleUploadedFile("id.png", self.document_bytes)
+        self.verification.save()
+
+        call_command("capture_identity_document_metadata", stdout=StringIO())
+
+        self.verification.refresh_from_db()
+        self.assertTrue(self.verification.document_metadata["id_proof_document"]["duplicate"])
+        model_admin = MentorIdentityVerificationAdmin(MentorIdentityVerification, admin_site)
+        self.assertIn("Other Mentor", model_admin.duplicate_documents(self.verification))
+
+
+class TwoTierCacheTests(TestCase):
+    @staticmethod
+    def _caches(shared):
+        return {
+            "default": {"BACKEND": "core.shared_cache.TwoTierCache", "LOCATION": "shared"},
+            "shared": shared,
+        }
+
+    def _shared_backends(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        yield "database", {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "core_shared_cache"}
+        yield "file", {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": cache_dir}
+
+    def test_guards_and_counters_are_shared_between_workers(self):
+        for label, shared in self._shared_backends():
+            with self.subTest(label), override_settings(CACHES=self._caches(shared)):
+                # A second backend instance has its own local tier, like another worker process.
+                other_worker = TwoTierCache("shared", {})
+
+                self.assertTrue(acquire_guard("session:1:warning-alert", timeout=60))
+                self.assertFalse(other_worker.add("session:1:warning-alert", 1, timeout=60))
+
+                self.assertEqual(incr_counter("provider-limit:test", timeout=60), 1)
+                self.assertEqual(other_worker.incr("provider-limit:test", 2), 3)
+                self.assertEqual(incr_counter("provider-limit:test", timeout=60), 4)
+
+                cache.set("summary:chunk", {"summary": "ok"}, timeout=60)
+                self.assertEqual(other_worker.get("summary:chunk"), {"summary": "ok"})
+                caches["shared"].clear()
+
+    def test_incr_keeps_the_shared_entry_expiry(self):
+        shared = {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "core_shared_cache"}
+        with override_settings(CACHES=self._caches(shared)):
+            cache.add("streak", 0, timeout=40)
+            expires = SharedCacheEntry.objects.get().expires
+
+            self.assertEqual(cache.incr("streak", 5), 5)
+
+            self.assertEqual(SharedCacheEntry.objects.get().expires, expires)
+
+
 class AbuseMonitoringClassificationTests(TestCase):
+    @override_settings(OPENAI_API_KEY="test-key")
+    @patch.dict("os.environ", {"OPENAI": "true", "OPENROUTER_API_KEY": "router-key"}, clear=False)
+    @patch("core.abuse_monitoring._openrouter_vision_text")
+    @patch("core.abuse_monitoring._openai_vision_text", return_value=("", "gpt-4.1-mini:URLError:timed out"))
+    def test_video_frame_classification_fails_over_to_next_provider(self, mock_openai, mock_openrouter):
+        mock_openrouter.return_value = (
+            json.dumps({"flagged": True, "incident_type": "inappropriate_gesture", "confidence_score": 0.9}),
+            "",
+        )
+
+        result = classify_video_behavior_frame(frame_data_url="data:image/png;base64,AAAA")
+
+        mock_openai.assert_called_once()
+        self.assertEqual(mock_openrouter.call_args.args[0], "router-key")
+        self.assertTrue(result["flagged"])
+        self.assertEqual(result["incident_type"], "inappropriate_gesture")
+
     def test_detect_abusive_terms_matches_obfuscated_wording(self):
         matches = detect_abusive_terms("You are f u c k i n g rude.")
         self.assertIn("fuck", matches)
@@ -1364,3 +2570,393 @@ class AbuseMonitoringClassificationTests(TestCase):
         )
         self.assertTrue(result["flagged"])
         self.assertEqual(result["incident_type"], "inappropriate_gesture")
+
+
+class BulkSeedDataCommandTests(TestCase):
+    def test_bulk_seed_creates_rows_without_recommendation_signal(self):
+        call_command("seed_data", bulk=True, count=6, seed=7, batch_size=4, stdout=StringIO())
+
+        self.assertEqual(Mentor.objects.filter(email__endswith="@bondroom.local").count(), 6)
+        self.assertEqual(Mentee.objects.filter(email__endswith="@bondroom.local").count(), 6)
+        self.assertEqual(MenteeRequest.objects.count(), 6)
+        self.assertEqual(Session.objects.count(), 12)
+        self.assertEqual(MentorOnboardingStatus.objects.count(), 6)
+        self.assertFalse(MatchRecommendation.objects.exists())
+
+    def test_bulk_seed_is_deterministic_for_same_seed(self):
+        def snapshot():
+            return list(Mentor.objects.order_by("email").values_list("email", "languages", "care_areas"))
+
+        call_command("seed_data", bulk=True, count=4, seed=11, stdout=StringIO())
+        first = snapshot()
+        call_command("seed_data", bulk=True, count=4, seed=11, stdout=StringIO())
+
+        self.assertEqual(snapshot(), first)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/missing":
+            body = b'{"error": "missing"}'
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        body = gzip.compress(b'{"ok": true}')
+        self.send_response(200)
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        body = b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\ndata: [DONE]\n\n'
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ProviderHttpClientTests(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        provider_http.close_idle_connections()
+        provider_http.reset_latency_metrics()
+
+    def tearDown(self):
+        provider_http.close_idle_connections()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_connection_and_decodes_gzip(self):
+        for _ in range(3):
+            with provider_http.urlopen(urllib.request.Request(f"{self.base_url}/ok"), timeout=5) as response:
+                self.assertEqual(response.read(), b'{"ok": true}')
+
+        metrics = provider_http.latency_snapshot()["127.0.0.1"]
+        self.assertEqual(metrics["requests"], 3)
+        self.assertEqual(metrics["reused_connections"], 2)
+
+    def test_stream_lines_yields_events_and_returns_connection_to_pool(self):
+        for _ in range(2):
+            request = urllib.request.Request(f"{self.base_url}/stream", data=b"{}")
+            lines = list(provider_http.stream_lines(request, timeout=5))
+            self.assertIn("data: [DONE]", lines)
+
+        self.assertEqual(provider_http.latency_snapshot()["127.0.0.1"]["reused_connections"], 1)
+
+    @patch.dict("os.environ", {"PROVIDER_HTTP_READ_TIMEOUT_SECONDS": "90"}, clear=False)
+    def test_read_timeout_env_only_applies_when_caller_passes_none(self):
+        self.assertEqual(provider_http.read_timeout_seconds(25), 25)
+        self.assertEqual(provider_http.read_timeout_seconds(), 90.0)
+
+    def test_error_status_raises_http_error_with_body(self):
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            provider_http.urlopen(urllib.request.Request(f"{self.base_url}/missing"), timeout=5)
+
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertIn(b"missing", ctx.exception.read())
+
+
+@patch.dict(
+    "os.environ",
+    {"PROVIDER_BREAKER_MIN_REQUESTS": "3", "PROVIDER_BREAKER_FAILURE_RATE": "0.5"},
+    clear=False,
+)
+class ProviderCircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        provider_health.reset_circuit("openai", "test-model")
+        self.addCleanup(provider_health.reset_circuit, "openai", "test-model")
+
+    def test_circuit_opens_after_failure_rate_and_fails_fast(self):
+        provider_health.record_result("openai", "test-model", ok=True)
+        provider_health.record_result("openai", "test-model", ok=False)
+        self.assertEqual(provider_health.circuit_state("openai", "test-model"), provider_health.CLOSED)
+        provider_health.record_result("openai", "test-model", ok=False)
+
+        self.assertTrue(provider_health.is_open("openai", "test-model"))
+        with self.assertRaises(provider_health.ProviderUnavailable):
+            provider_http.urlopen(
+                urllib.request.Request("https://api.openai.com/v1/responses"), timeout=1, model="test-model"
+            )
+
+    @patch.dict("os.environ", {"PROVIDER_BREAKER_MIN_REQUESTS": "8", "PROVIDER_BREAKER_FAILURE_RATE": "1"})
+    @patch("core.provider_health.time.time", return_value=1_000_000.0)
+    def test_concurrent_failures_are_all_counted(self, _now):
+        barrier = threading.Barrier(8)
+
+        def fail():
+            barrier.wait()
+            provider_health.record_result("openai", "test-model", ok=False)
+
+        workers = [threading.Thread(target=fail) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertTrue(provider_health.is_open("openai", "test-model"))
+
+    def test_half_open_allows_single_probe_and_closes_on_success(self):
+        for _ in range(3):
+            provider_health.record_result("openai", "test-model", ok=False)
+
+        with patch.dict("os.environ", {"PROVIDER_BREAKER_OPEN_SECONDS": "0.01"}):
+            threading.Event().wait(0.02)
+            self.assertTrue(provider_health.allow_request("openai", "test-model"))
+            self.assertFalse(provider_health.allow_request("openai", "test-model"))
+            provider_health.record_result("openai", "test-model", ok=True)
+
+        self.assertEqual(provider_health.circuit_state("openai", "test-model"), provider_health.CLOSED)
+
+    @patch.dict("os.environ", {"OPENROUTER_API_KEY": "test-key"}, clear=False)
+    def test_failover_order_skips_open_provider(self):
+        for _ in range(3):
+            provider_health.record_result("openai", "test-model", ok=False)
+
+        order = provider_health.failover_order("openai", {"openai": "test-model", "openrouter": "other-model"})
+
+        self.assertEqual(order, ["openrouter"])
+
+
+@patch.dict("os.environ", {"PROVIDER_LIMIT_OPENAI_RPM": "10", "PROVIDER_LIMIT_OPENAI_TPM": "100000"}, clear=False)
+class ProviderRateLimitTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_low_priority_is_capped_while_moderation_keeps_headroom(self):
+        now = 1_000_000.0
+        granted = [
+            provider_limits.try_acquire("openai", "m", provider_limits.PRIORITY_SUMMARIES, 10, now=now)
+            for _ in range(6)
+        ]
+        self.assertEqual(granted.count(True), 5)
+        self.assertTrue(
+            provider_limits.try_acquire("openai", "m", provider_limits.PRIORITY_MODERATION, 10, now=now)
+        )
+
+    def test_acquire_raises_when_budget_exhausted_without_wait(self):
+        provider_limits.mark_exhausted("openai", "m")
+
+        with self.assertRaises(provider_limits.ProviderRateLimited):
+            provider_limits.acquire("openai", "m", provider_limits.PRIORITY_CHATBOT, 10)
+
+    def test_usage_view_is_admin_only(self):
+        User = get_user_model()
+        admin_user = User.objects.create_user(username="usage_admin", email="usage.admin@test.com", password="x")
+        UserProfile.objects.create(user=admin_user, role="admin")
+        mentor_user = User.objects.create_user(username="usage_mentor", email="usage.mentor@test.com", password="x")
+        UserProfile.objects.create(user=mentor_user, role="mentor")
+        provider_limits.try_acquire("openai", "m", provider_limits.PRIORITY_CHATBOT, 10)
+
+        self.client.force_authenticate(mentor_user)
+        self.assertEqual(self.client.get("/api/providers/usage/").status_code, 403)
+
+        self.client.force_authenticate(admin_user)
+        response = self.client.get("/api/providers/usage/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["budgets"][0]["requests_used"], 1)
+        self.assertEqual(response.data["budgets"][0]["circuit_state"], "closed")
+
+
+class MeetingSummaryChunkingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.session = SimpleNamespace(id=7, scheduled_start=None, scheduled_end=None, mentor_id=1, mentee_id=2)
+        self.lines = [
+            f"{'Mentor' if index % 2 else 'Mentee'}: line {index} " + "about study plans" * 12
+            for index in range(60)
+        ]
+
+    def test_chunks_keep_speaker_turns_whole_and_stable_when_appending(self):
+        chunks = _split_transcript_chunks("\n".join(self.lines), 2000)
+        extended = _split_transcript_chunks("\n".join(self.lines + ["Mentee: thanks, see you next week"]), 2000)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 2000 for chunk in chunks))
+        self.assertTrue(all(line in self.lines for chunk in chunks for line in chunk.splitlines()))
+        self.assertEqual(extended[:-1], chunks[:-1])
+
+    @patch.dict("os.environ", {"OPENAI": "true", "MEETING_SUMMARY_CHUNK_CHARS": "2000"}, clear=False)
+    @patch("core.api_views._build_transcript_from_session_signals", return_value="")
+    @patch("core.api_views._request_meeting_summary")
+    def test_resummarizing_after_new_lines_only_sends_changed_chunk(self, mock_request, _signals):
+        mock_request.side_effect = lambda provider, system_prompt, payload: {
+            "summary": f"part {mock_request.call_count}",
+            "highlights": ["plan"],
+            "action_items": [],
+            "model": "gpt-test",
+            "source": provider,
+        }
+
+        first = generate_meeting_summary_with_ai(self.session, "\n".join(self.lines))
+        first_calls = mock_request.call_count
+        mock_request.reset_mock()
+        second = generate_meeting_summary_with_ai(self.session, "\n".join(self.lines + ["Mentee: one more thing"]))
+
+        self.assertGreater(first["chunk_count"], 2)
+        self.assertGreater(first_calls, first["chunk_count"])
+        chunk_calls = [call for call in mock_request.call_args_list if "transcript" in call.args[2]]
+        self.assertEqual(len(chunk_calls), 1)
+        self.assertIn("one more thing", chunk_calls[0].args[2]["transcript"])
+        self.assertTrue(second["summary"])
+
+
+    @patch.dict("os.environ", {"OPENAI": "true", "OPENROUTER_API_KEY": "router-key"}, clear=False)
+    @override_settings(OPENAI_API_KEY="test-key")
+    @patch("core.api_views._build_transcript_from_session_signals", return_value="")
+    @patch("core.api_views._request_meeting_summary")
+    def test_summary_fails_over_to_next_provider(self, mock_request, _signals):
+        def request(provider, system_prompt, payload):
+            if provider == "openai":
+                raise urllib.error.URLError("timed out")
+            return {"summary": "Planned revision.", "highlights": [], "action_items": [], "source": provider}
+
+        mock_request.side_effect = request
+
+        result = generate_meeting_summary_with_ai(self.session, "Mentee: I keep putting off revision.")
+
+        self.assertEqual(result["source"], "openrouter")
+        self.assertEqual(result["summary"], "Planned revision.")
+        self.assertEqual([call.args[0] for call in mock_request.call_args_list], ["openai", "openrouter"])
+
+
+def _sine_wav(seconds, amplitude):
+    frame_rate = 8000
+    pcm = b"".join(
+        int(amplitude * math.sin(2 * math.pi * 220 * index / frame_rate)).to_bytes(2, "little", signed=True)
+        for index in range(int(seconds * frame_rate))
+    )
+    return SimpleUploadedFile("chunk.wav", audio_vad.encode_wav(pcm, (1, 2, frame_rate)), content_type="audio/wav")
+
+
+class AudioChunkPreprocessingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _wav(self, seconds, amplitude):
+        return _sine_wav(seconds, amplitude)
+
+    @override_settings(OPENAI_API_KEY="test-key")
+    @patch("core.api_views.provider_http.urlopen")
+    def test_silent_chunk_is_dropped_without_upload(self, mock_urlopen):
+        text, error = transcribe_audio_chunk_with_openai(self._wav(2, amplitude=20))
+
+        self.assertEqual((text, error), ("", "silent_audio_chunk"))
+        mock_urlopen.assert_not_called()
+
+    @override_settings(OPENAI_API_KEY="test-key")
+    @patch.dict("os.environ", {"AUDIO_COALESCE_MIN_SECONDS": "3"}, clear=False)
+    @patch("core.api_views.provider_http.urlopen")
+    def test_short_voiced_chunks_are_coalesced_into_one_streamed_upload(self, mock_urlopen):
+        uploads = []
+
+        def fake_urlopen(request, **kwargs):
+            uploads.append(request.data.read())
+            response = mock_urlopen.return_value.__enter__.return_value
+            response.read.return_value = b'{"text": "hello there"}'
+            return mock_urlopen.return_value
+
+        mock_urlopen.side_effect = fake_urlopen
+        first = transcribe_audio_chunk_with_openai(self._wav(2, amplitude=8000), session_id=5, speaker_role="mentor")
+        second = transcribe_audio_chunk_with_openai(self._wav(2, amplitude=8000), session_id=5, speaker_role="mentor")
+
+        self.assertEqual(first, ("", "buffered_audio_chunk"))
+        self.assertEqual(second, ("hello there", ""))
+        self.assertEqual(len(uploads), 1)
+        # Two 2s chunks of 8 kHz 16-bit mono audio in one WAV part.
+        self.assertGreater(len(uploads[0]), 2 * 2 * 8000 * 2)
+
+
+@override_settings(OPENAI_API_KEY="test-key")
+class RealtimeTranscriptAudioTests(SessionRecordingFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.client.force_authenticate(user=self.mentor_user)
+        self.url = f"/api/sessions/{self.session.id}/realtime-transcript-chunk/"
+
+    @patch.dict("os.environ", {"AUDIO_COALESCE_MIN_SECONDS": "30"}, clear=False)
+    @patch("core.api_views.provider_http.urlopen")
+    def test_audio_chunks_are_buffered_then_flushed_on_final(self, mock_urlopen):
+        mock_urlopen.return_value.__enter__.return_value.read.return_value = b'{"text": "we planned revision"}'
+
+        buffered = self.client.post(self.url, {"audio_chunk": _sine_wav(2, amplitude=8000)}, format="multipart")
+        self.assertEqual(buffered.status_code, 200, buffered.data)
+        self.assertEqual(buffered.data["reason"], "buffered_audio_chunk")
+        mock_urlopen.assert_not_called()
+
+        flushed = self.client.post(self.url, {"final": "true"}, format="multipart")
+
+        self.assertEqual(flushed.status_code, 201, flushed.data)
+        self.assertEqual(flushed.data["transcript_excerpt"], "we planned revision")
+        self.assertEqual(mock_urlopen.call_count, 1)
+        signal = SessionMeetingSignal.objects.get(session=self.session, signal_type="mentor_transcript")
+        self.assertEqual(signal.payload["source"], "openai_transcription")
+        self.assertIsNone(audio_vad.flush_coalesced(self.session.id, "mentor"))
+
+
+class ChatbotLocalAnswerTests(APITestCase):
+    def setUp(self):
+        CHATBOT_ANSWER_CACHE.clear()
+        self.addCleanup(CHATBOT_ANSWER_CACHE.clear)
+
+    @patch("core.api_views._openai_chatbot_reply")
+    def test_faq_index_answers_paraphrased_question_locally(self, mock_reply):
+        response = self.client.post("/api/chatbot/respond/", {"message": "Is it free?"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["provider"], "faq")
+        mock_reply.assert_not_called()
+
+    @patch.dict("os.environ", {"OPENAI": "true"}, clear=False)
+    @patch("core.api_views._openai_chatbot_reply")
+    def test_repeated_question_is_served_from_answer_cache(self, mock_reply):
+        mock_reply.return_value = {"answer": "Book from your dashboard.", "provider": "openai", "model": "gpt-test"}
+
+        first = self.client.post("/api/chatbot/respond/", {"message": "How do I book a session?"}, format="json")
+        second = self.client.post("/api/chatbot/respond/", {"message": "how do i book a session"}, format="json")
+
+        self.assertEqual(first.data["answer"], "Book from your dashboard.")
+        self.assertTrue(second.data["cached"])
+        self.assertEqual(mock_reply.call_count, 1)
+
+    def test_stream_mode_relays_faq_answer_as_events(self):
+        response = self.client.post(
+            "/api/chatbot/respond/", {"message": "How are mentors verified?", "stream": True}, format="json"
+        )
+
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        body = b"".join(response.streaming_content).decode("utf-8")
+        self.assertIn("event: token", body)
+        self.assertIn('"provider": "faq"', body)
+
+    @patch.dict("os.environ", {"OPENAI": "true"}, clear=False)
+    @patch("core.api_views._stream_chatbot_reply")
+    def test_stream_mode_relays_provider_tokens_and_caches_answer(self, mock_stream):
+        mock_stream.return_value = iter(["Book ", "from your dashboard."])
+
+        response = self.client.post(
+            "/api/chatbot/respond/?stream=1", {"message": "How do I book a session?"}, format="json"
+        )
+        body = b"".join(response.streaming_content).decode("utf-8")
+
+        self.assertEqual(body.count("event: token"), 2)
+        self.assertIn('"provider": "openai"', body)
+        self.assertEqual(
+            CHATBOT_ANSWER_CACHE.get("how do i book a session")["answer"], "Book from your dashboard."
+        )
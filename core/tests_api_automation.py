@@ -59,12 +59,18 @@ POST_ONLY_PUBLIC_PATHS = {
 
 POST_ONLY_AUTHENTICATED_PATHS = {
     "/api/auth/logout/",
+    "/api/mentor-availability-slots/{id}/hold/",
+    "/api/mentor-availability-slots/{id}/release/",
     "/api/mentors/{id}/admin-decision/",
     "/api/sessions/{id}/disposition/",
     "/api/sessions/{id}/join-link/",
     "/api/sessions/{id}/analyze-transcript/",
     "/api/sessions/{id}/recording/",
     "/api/sessions/{id}/recording-upload-signature/",
+    "/api/sessions/{id}/recording-multipart/initiate/",
+    "/api/sessions/{id}/recording-multipart/sign-parts/",
+    "/api/sessions/{id}/recording-multipart/complete/",
+    "/api/sessions/{id}/recording-multipart/abort/",
     "/api/training-modules/{id}/watch-video/",
     "/api/training-modules/quiz/start/",
     "/api/training-modules/quiz/submit/",
@@ -369,6 +375,8 @@ class ApiAutomationCoverageTests(APITestCase):
             "/api/mentees/{id}/dashboard/": self.mentee.id,
             "/api/mentees/{id}/preferences/": self.mentee.id,
             "/api/mentor-availability-slots/{id}/": self.slot.id,
+            "/api/mentor-availability-slots/{id}/hold/": self.slot.id,
+            "/api/mentor-availability-slots/{id}/release/": self.slot.id,
             "/api/mentor-contact-verifications/{id}/": self.contact.id,
             "/api/mentor-identity-verifications/{id}/": self.identity.id,
             "/api/mentor-identity-verifications/{id}/document-decision/": self.identity.id,
@@ -376,6 +384,7 @@ class ApiAutomationCoverageTests(APITestCase):
             "/api/mentor-profiles/{id}/": self.mentor_profile.id,
             "/api/mentor-training-progress/{id}/": self.training_progress.id,
             "/api/mentor-wallets/{id}/": self.wallet.id,
+            "/api/mentor-wallets/{id}/balance/": self.wallet.id,
             "/api/mentors/{id}/": self.mentor.id,
             "/api/mentors/{id}/admin-decision/": self.mentor.id,
             "/api/mentors/{id}/impact-dashboard/": self.mentor.id,
@@ -395,6 +404,11 @@ class ApiAutomationCoverageTests(APITestCase):
             "/api/sessions/{id}/meeting-signals/": self.session.id,
             "/api/sessions/{id}/recording/": self.session.id,
             "/api/sessions/{id}/recording-upload-signature/": self.session.id,
+            "/api/sessions/{id}/recording-multipart/initiate/": self.session.id,
+            "/api/sessions/{id}/recording-multipart/sign-parts/": self.session.id,
+            "/api/sessions/{id}/recording-multipart/parts/": self.session.id,
+            "/api/sessions/{id}/recording-multipart/complete/": self.session.id,
+            "/api/sessions/{id}/recording-multipart/abort/": self.session.id,
             "/api/sessions/{id}/analyze-transcript/": self.session.id,
             "/api/sessions/{id}/analyze-video-frame/": self.session.id,
             "/api/sessions/{id}/report-behavior/": self.session.id,
@@ -411,6 +425,11 @@ class ApiAutomationCoverageTests(APITestCase):
         }
 
     def _resolve_path(self, schema_path):
+        if schema_path == "/api/admin/exports/{dataset}/":
+            return "/api/admin/exports/payouts/?output=jsonl"
+        if schema_path == "/api/mentor-availability-slots/free-slots/":
+            today = timezone.localdate()
+            return f"/api/mentor-availability-slots/free-slots/?start={today}&end={today + timedelta(days=7)}"
         if schema_path == "/api/locations/cities/":
             return "/api/locations/cities/?state=Tamil%20Nadu"
         if schema_path == "/api/mentors/recommended/":
@@ -513,6 +532,8 @@ class ApiAutomationCoverageTests(APITestCase):
             )
             self.assertEqual(send.status_code, 200, send.data)
             return {"mentee_id": self.mentee.id, "otp": send.data["otp"]}
+        if schema_path == "/api/mentor-availability-slots/{id}/hold/":
+            return {"mentee": self.mentee.id}
         if schema_path == "/api/auth/mentor-contact/send-otp/":
             return {"mentor_id": self.mentor.id, "channel": "email"}
         if schema_path == "/api/auth/mentor-contact/verify-otp/":
@@ -614,6 +635,8 @@ class ApiAutomationCoverageTests(APITestCase):
             return {"training_status": "completed"}
         if schema_path == "/api/mentor-identity-verifications/{id}/document-decision/":
             return {"document_key": "id_front", "decision": "approved"}
+        if schema_path == "/api/payout-transactions/settle/":
+            return {"payout_ids": [self.payout.id], "dry_run": True}
         if schema_path == "/api/sessions/{id}/disposition/":
             return {"action": "claim", "amount": "120.00", "note": "Automation claim"}
         if schema_path == "/api/sessions/{id}/join-link/":
@@ -701,6 +724,8 @@ class ApiAutomationCoverageTests(APITestCase):
             return "GET", "/api/locations/cities/", {}, {400}
         if schema_path == "/api/schema/":
             return "POST", "/api/schema/", {}, {405}
+        if schema_path == "/api/cron/summary-jobs/":
+            return "POST", "/api/cron/summary-jobs/", {}, {405}
         if schema_path == "/api/site-settings/public/donate-link/":
             return "POST", "/api/site-settings/public/donate-link/", {}, {405}
         if schema_path == "/api/login/":
@@ -781,12 +806,17 @@ class ApiAutomationCoverageTests(APITestCase):
                 return_value=(mock_questions, "openai"),
             ):
                 return client_method(path, payload or {}, format="json")
+        if schema_path == "/api/cron/summary-jobs/" and method == "GET":
+            with patch.dict("os.environ", {"CRON_SECRET": "cron-secret"}):
+                return client_method(path, format="json", HTTP_AUTHORIZATION="Bearer cron-secret")
         if method in {"POST", "PUT", "PATCH"}:
             return client_method(path, payload or {}, format="json")
         return client_method(path, format="json")
 
     def _expected_positive_status(self, schema_path):
-        if schema_path == "/api/sessions/{id}/recording-upload-signature/":
+        if schema_path == "/api/sessions/{id}/recording-upload-signature/" or schema_path.startswith(
+            "/api/sessions/{id}/recording-multipart/"
+        ):
             # Local/test environments may intentionally omit S3 credentials/config.
             return {200, 503}
         if schema_path == "/api/sessions/{id}/realtime-transcript-chunk/":
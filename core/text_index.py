@@ -0,0 +1,147 @@
+"""
+Small in-memory BM25 index for local text retrieval.
+
+Used for short, mostly static corpora (chatbot FAQ entries, mentor bios) where
+a remote model round trip is not worth it. Documents are tokenized once when
+the index is built; queries are scored against the cached term statistics.
+``IncrementalBM25Index`` keeps postings per term and accepts per-document
+updates, for corpora that change one document at a time.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by can do does for from have how i if in is it its
+    me my of on or our so that the their them there they this to was we what
+    when where which who why will with you your yours
+    """.split()
+)
+
+
+def tokenize(text: str) -> list:
+    tokens = []
+    for raw in re.findall(r"[a-z0-9]+", str(text or "").lower()):
+        if raw in STOPWORDS:
+            continue
+        # Light plural folding so "mentors"/"sessions" match "mentor"/"session".
+        if len(raw) > 3 and raw.endswith("s") and not raw.endswith("ss"):
+            raw = raw[:-1]
+        tokens.append(raw)
+    return tokens
+
+
+class BM25Index:
+    def __init__(self, documents, *, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_terms = [Counter(tokenize(doc)) for doc in documents]
+        self.doc_lengths = [sum(terms.values()) for terms in self.doc_terms]
+        self.avg_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if self.doc_lengths else 0.0
+        document_frequency = Counter()
+        for terms in self.doc_terms:
+            document_frequency.update(terms.keys())
+        self.document_frequency = document_frequency
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def idf(self, term: str) -> float:
+        total = len(self.doc_terms)
+        df = self.document_frequency.get(term, 0)
+        return math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+    def score(self, query_terms, index: int) -> float:
+        terms = self.doc_terms[index]
+        length_norm = 1 - self.b + self.b * (self.doc_lengths[index] / self.avg_length if self.avg_length else 0)
+        total = 0.0
+        for term in query_terms:
+            tf = terms.get(term, 0)
+            if not tf:
+                continue
+            total += self.idf(term) * (tf * (self.k1 + 1)) / (tf + self.k1 * length_norm)
+        return total
+
+    def search(self, query: str, limit: int = 5) -> list:
+        """Return ``(index, score, coverage)`` tuples, best first.
+
+        ``coverage`` is the idf-weighted share of query terms present in the
+        document, which is comparable across queries unlike the raw score.
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms or not self.doc_terms:
+            return []
+        query_weight = sum(self.idf(term) for term in query_terms)
+        results = []
+        for index, terms in enumerate(self.doc_terms):
+            score = self.score(query_terms, index)
+            if score <= 0:
+                continue
+            matched_weight = sum(self.idf(term) for term in query_terms if term in terms)
+            results.append((index, score, matched_weight / query_weight if query_weight else 0.0))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results[:limit]
+
+
+class IncrementalBM25Index:
+    """BM25 over ``{doc_id: {term: count}}`` with postings, so a query only touches documents sharing a term."""
+
+    def __init__(self, *, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_terms = {}
+        self.doc_lengths = {}
+        self.total_length = 0
+        self.postings = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def remove(self, doc_id):
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        for term in terms:
+            posting = self.postings[term]
+            posting.discard(doc_id)
+            if not posting:
+                del self.postings[term]
+
+    def set(self, doc_id, term_counts: dict):
+        self.remove(doc_id)
+        terms = {term: count for term, count in term_counts.items() if count > 0}
+        self.doc_terms[doc_id] = terms
+        self.doc_lengths[doc_id] = sum(terms.values())
+        self.total_length += self.doc_lengths[doc_id]
+        for term in terms:
+            self.postings[term].add(doc_id)
+
+    def idf(self, term: str) -> float:
+        total = len(self.doc_terms)
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (total - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, doc_ids=None) -> dict:
+        """``{doc_id: (score, coverage)}`` for documents sharing a query term, optionally limited to ``doc_ids``."""
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms or not self.doc_terms:
+            return {}
+        avg_length = self.total_length / len(self.doc_terms)
+        weights = {term: self.idf(term) for term in query_terms}
+        query_weight = sum(weights.values())
+        allowed = set(doc_ids) if doc_ids is not None else None
+        scores = defaultdict(float)
+        matched = defaultdict(float)
+        for term in query_terms:
+            posting = self.postings.get(term, set())
+            for doc_id in posting if allowed is None else posting & allowed:
+                tf = self.doc_terms[doc_id][term]
+                length_norm = 1 - self.b + self.b * (self.doc_lengths[doc_id] / avg_length if avg_length else 0)
+                scores[doc_id] += weights[term] * (tf * (self.k1 + 1)) / (tf + self.k1 * length_norm)
+                matched[doc_id] += weights[term]
+        return {
+            doc_id: (score, matched[doc_id] / query_weight if query_weight else 0.0)
+            for doc_id, score in scores.items()
+        }
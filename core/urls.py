@@ -2,6 +2,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .api_views import (
+    AdminExportView,
     AdminRegisterView,
     BondRoomChatbotView,
     AdminDonateLinkSettingView,
@@ -34,12 +35,14 @@ from .api_views import (
     PasswordResetVerifyOtpView,
     PublicDonateLinkSettingView,
     PayoutTransactionViewSet,
+    ProviderUsageView,
     RazorpayDonationOrderView,
     RazorpayDonationVerifyView,
     SessionDispositionViewSet,
     SessionFeedbackViewSet,
     SessionIssueReportViewSet,
     SessionViewSet,
+    SummaryJobsCronView,
     TrainingModuleViewSet,
     VolunteerEventRegistrationViewSet,
     VolunteerEventViewSet,
@@ -79,6 +82,9 @@ urlpatterns = [
     path("donations/razorpay/verify/", RazorpayDonationVerifyView.as_view(), name="donations-razorpay-verify"),
     path("auth/mobile-login/verify-otp/", MobileLoginOtpVerifyView.as_view(), name="mobile-login-verify-otp"),
     path("chatbot/respond/", BondRoomChatbotView.as_view(), name="chatbot-respond"),
+    path("providers/usage/", ProviderUsageView.as_view(), name="provider-usage"),
+    path("admin/exports/<slug:dataset>/", AdminExportView.as_view(), name="admin-export"),
+    path("cron/summary-jobs/", SummaryJobsCronView.as_view(), name="cron-summary-jobs"),
     path("auth/register/admin/", AdminRegisterView.as_view(), name="register-admin"),
     path("auth/register/mentee/", MenteeRegisterView.as_view(), name="register-mentee"),
     path("auth/register/mentor/", MentorRegisterView.as_view(), name="register-mentor"),
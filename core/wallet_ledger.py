@@ -0,0 +1,146 @@
+"""
+Append-only wallet ledger.
+
+Every change to a mentor's wallet balances is written as a ``WalletLedgerEntry``
+in the same transaction as the disposition or payout that caused it.
+``MentorWallet`` stays as the running total that API reads and payout guards
+use, but it is only ever moved by F-expression deltas derived from the posted
+entries, so concurrent claims cannot lose each other's updates. Historical
+balances come from the latest ``WalletBalanceSnapshot`` plus the entries
+after it, so a balance-as-of query never scans a mentor's full history.
+"""
+import os
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db.models import Case, DecimalField, F, Sum, Value, When
+from django.utils import timezone
+
+from .models import MentorWallet, WalletBalanceSnapshot, WalletLedgerEntry
+
+BALANCE_FIELDS = ("current_balance", "pending_payout", "total_claimed", "total_donated")
+UPDATE_BATCH_SIZE = 500
+ZERO = Decimal("0.00")
+
+
+def _snapshot_lag() -> timedelta:
+    # Entries are only folded into a snapshot once they are older than this, so a
+    # slow transaction that committed a lower id late is never skipped.
+    return timedelta(seconds=int(os.environ.get("WALLET_SNAPSHOT_LAG_SECONDS", "300")))
+
+
+def ensure_wallets(mentor_ids):
+    mentor_ids = set(mentor_ids)
+    existing = set(MentorWallet.objects.filter(mentor_id__in=mentor_ids).values_list("mentor_id", flat=True))
+    missing = [MentorWallet(mentor_id=mentor_id) for mentor_id in sorted(mentor_ids - existing)]
+    if missing:
+        MentorWallet.objects.bulk_create(missing, ignore_conflicts=True)
+
+
+def _apply_wallet_deltas(totals: dict, now):
+    """Add ``{mentor_id: {field: delta}}`` to ``MentorWallet`` with one UPDATE per batch."""
+    items = sorted(totals.items())
+    for start in range(0, len(items), UPDATE_BATCH_SIZE):
+        chunk = items[start : start + UPDATE_BATCH_SIZE]
+        updates = {}
+        for field_name in BALANCE_FIELDS:
+            whens = [
+                When(mentor_id=mentor_id, then=Value(deltas[field_name]))
+                for mentor_id, deltas in chunk
+                if deltas[field_name]
+            ]
+            if whens:
+                updates[field_name] = F(field_name) + Case(
+                    *whens,
+                    default=Value(ZERO),
+                    output_field=DecimalField(max_digits=10, decimal_places=2),
+                )
+        if updates:
+            MentorWallet.objects.filter(mentor_id__in=[mentor_id for mentor_id, _ in chunk]).update(
+                updated_at=now, **updates
+            )
+
+
+def post_wallet_entries(entries, *, update_wallets: bool = True):
+    """
+    Append ``entries`` (unsaved ``WalletLedgerEntry`` objects) and move the wallets by their sum.
+
+    Must run inside the caller's transaction so the entries commit or roll back
+    with the change they describe. Pass ``update_wallets=False`` when the wallet
+    row was already written directly (admin edits).
+    """
+    entries = [entry for entry in entries if any(getattr(entry, f"{name}_delta") for name in BALANCE_FIELDS)]
+    if not entries:
+        return []
+    WalletLedgerEntry.objects.bulk_create(entries, batch_size=UPDATE_BATCH_SIZE)
+    if update_wallets:
+        totals = defaultdict(lambda: dict.fromkeys(BALANCE_FIELDS, ZERO))
+        for entry in entries:
+            for field_name in BALANCE_FIELDS:
+                totals[entry.mentor_id][field_name] += getattr(entry, f"{field_name}_delta")
+        ensure_wallets(totals)
+        _apply_wallet_deltas(totals, timezone.now())
+    return entries
+
+
+def record_wallet_adjustment(wallet, previous: dict, *, note: str = ""):
+    """Ledger the difference between ``previous`` balances and a wallet row that was saved directly."""
+    entry = WalletLedgerEntry(mentor_id=wallet.mentor_id, entry_type="adjustment", note=note)
+    for field_name in BALANCE_FIELDS:
+        setattr(entry, f"{field_name}_delta", getattr(wallet, field_name) - previous[field_name])
+    return post_wallet_entries([entry], update_wallets=False)
+
+
+def _entry_totals(queryset) -> dict:
+    sums = queryset.aggregate(**{field_name: Sum(f"{field_name}_delta") for field_name in BALANCE_FIELDS})
+    return {field_name: sums[field_name] or ZERO for field_name in BALANCE_FIELDS}
+
+
+def wallet_balance(mentor_id, *, as_of=None) -> dict:
+    """Wallet balances for ``mentor_id`` at ``as_of`` (default: now) from the newest usable snapshot."""
+    snapshots = WalletBalanceSnapshot.objects.filter(mentor_id=mentor_id)
+    entries = WalletLedgerEntry.objects.filter(mentor_id=mentor_id)
+    if as_of is not None:
+        snapshots = snapshots.filter(covered_until__lte=as_of)
+        entries = entries.filter(created_at__lte=as_of)
+    snapshot = snapshots.order_by("-covered_until", "-id").first()
+    balances = dict.fromkeys(BALANCE_FIELDS, ZERO)
+    if snapshot is not None:
+        balances = {field_name: getattr(snapshot, field_name) for field_name in BALANCE_FIELDS}
+        entries = entries.filter(id__gt=snapshot.last_entry_id)
+    for field_name, delta in _entry_totals(entries).items():
+        balances[field_name] += delta
+    return balances
+
+
+def take_wallet_snapshots(mentor_ids=None, *, now=None) -> int:
+    """Fold settled ledger entries into a new snapshot per mentor; returns snapshots written."""
+    covered_until = (now or timezone.now()) - _snapshot_lag()
+    entries = WalletLedgerEntry.objects.filter(created_at__lte=covered_until)
+    if mentor_ids is not None:
+        entries = entries.filter(mentor_id__in=list(mentor_ids))
+
+    written = 0
+    for mentor_id in entries.values_list("mentor_id", flat=True).distinct().order_by("mentor_id"):
+        previous = (
+            WalletBalanceSnapshot.objects.filter(mentor_id=mentor_id).order_by("-covered_until", "-id").first()
+        )
+        pending = entries.filter(mentor_id=mentor_id)
+        balances = dict.fromkeys(BALANCE_FIELDS, ZERO)
+        if previous is not None:
+            pending = pending.filter(id__gt=previous.last_entry_id)
+            balances = {field_name: getattr(previous, field_name) for field_name in BALANCE_FIELDS}
+        last_entry_id = pending.order_by("-id").values_list("id", flat=True).first()
+        if last_entry_id is None:
+            continue
+        for field_name, delta in _entry_totals(pending.filter(id__lte=last_entry_id)).items():
+            balances[field_name] += delta
+        WalletBalanceSnapshot.objects.create(
+            mentor_id=mentor_id,
+            last_entry_id=last_entry_id,
+            covered_until=covered_until,
+            **balances,
+        )
+        written += 1
+    return written